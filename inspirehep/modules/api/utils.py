@@ -24,59 +24,220 @@
 
 from __future__ import absolute_import, division, print_function
 
+import json
+from itertools import islice
+
+from flask import current_app, stream_with_context
+
+from invenio_cache import current_cache
+
+from inspire_dojson.utils import get_recid_from_ref
 from inspire_utils.helpers import force_list
 from inspire_utils.record import get_value
+from inspirehep.modules.records.citations import (
+    get_citers_by_recid,
+    is_hep,
+    is_self_citation,
+)
+from inspirehep.modules.records.utils import get_endpoint_from_record
 from inspirehep.modules.search import LiteratureSearch
 from inspirehep.utils.record import get_title
 
 
-def build_citesummary(search):
-    citesummary = []
-
-    for i, el in enumerate(search.scan()):
-        result = el.to_dict()
-
-        citesummary.append({
-            'citations': [],
-            'collaboration': is_collaboration(result),
-            'core': is_core(result),
-            'date': get_date(result),
-            'document_type': get_document_type(result),
-            'id': get_id(result),
-            'subject': get_subject(result),
-            'title': get_title(result),
-        })
-
-        search_by_literature = LiteratureSearch().query(
-            'match', references__recid=get_id(result)
+CITESUMMARY_SOURCE = [
+    'authors.recid',
+    'collaborations.value',
+    'control_number',
+    'earliest_date',
+    'facet_inspire_doc_type',
+    'inspire_categories',
+    'titles.title',
+]
+
+CITESUMMARY_CHUNK_SIZE = 500
+"""Number of records whose citers are looked up together."""
+
+CITESUMMARY_ENDPOINTS = ('authors', 'experiments', 'institutions', 'journals')
+"""Endpoints of the records which have a citesummary."""
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    chunk = list(islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, size))
+
+
+def get_literature_by_recids(recids, source=CITESUMMARY_SOURCE):
+    """Fetch literature records with ``terms`` queries, indexed by recid."""
+    result = {}
+
+    for chunk in _chunks(sorted(recids), CITESUMMARY_CHUNK_SIZE):
+        search = LiteratureSearch().filter(
+            'terms', control_number=chunk
         ).params(
-            _source=[
-                'authors.recid',
-                'collaborations.value',
-                'control_number',
-                'earliest_date',
-                'facet_inspire_doc_type',
-                'inspire_categories',
-                'titles.title',
-            ]
+            _source=source,
         )
 
-        for el in search_by_literature.scan():
-            literature_result = el.to_dict()
+        for el in search.scan():
+            record = el.to_dict()
+            result[get_id(record)] = record
+
+    return result
+
+
+def build_citesummary_entry(record):
+    return {
+        'collaboration': is_collaboration(record),
+        'core': is_core(record),
+        'date': get_date(record),
+        'document_type': get_document_type(record),
+        'id': get_id(record),
+        'subject': get_subject(record),
+        'title': get_title(record),
+    }
+
+
+def build_citesummary(search):
+    """Yield the citesummary of every record matched by ``search``.
+
+    The search is paged through only once. Its results are processed
+    ``CITESUMMARY_CHUNK_SIZE`` at a time: the citers of a whole chunk are
+    looked up together in the citations table and fetched in batches.
+    """
+    results = (
+        el.to_dict() for el in
+        search.params(_source=CITESUMMARY_SOURCE).scan()
+    )
+
+    for chunk in _chunks(results, CITESUMMARY_CHUNK_SIZE):
+        citers_by_recid = get_citers_by_recid([get_id(result) for result in chunk])
+        citers = get_literature_by_recids(set().union(*citers_by_recid.values()))
+
+        for result in chunk:
+            citesummary = build_citesummary_entry(result)
+            citesummary['citations'] = []
+
+            for citer_recid in sorted(citers_by_recid[get_id(result)]):
+                if citer_recid not in citers:
+                    continue
+                citation = build_citesummary_entry(citers[citer_recid])
+                citation['selfcite'] = is_selfcite(result, citers[citer_recid])
+                citesummary['citations'].append(citation)
+
+            yield citesummary
+
+
+def _stream_citesummary(cache_key, search):
+    parts = []
 
-            citesummary[i]['citations'].append({
-                'collaboration': is_collaboration(literature_result),
-                'core': is_core(literature_result),
-                'date': get_date(literature_result),
-                'document_type': get_document_type(literature_result),
-                'id': get_id(literature_result),
-                'selfcite': is_selfcite(
-                    result, literature_result),
-                'subject': get_subject(literature_result),
-                'title': get_title(literature_result),
-            })
+    def _emit(part):
+        parts.append(part)
+        return part
 
-    return citesummary
+    yield _emit('[')
+    for i, citesummary in enumerate(build_citesummary(search)):
+        if i:
+            yield _emit(',')
+        yield _emit(json.dumps(citesummary))
+    yield _emit(']')
+
+    current_cache.set(
+        cache_key,
+        ''.join(parts),
+        timeout=current_app.config['API_CITESUMMARY_CACHE_TIMEOUT'],
+    )
+
+
+def get_citesummary_cache_key(endpoint, recid):
+    """Return the cache key of the citesummary of a record."""
+    return 'citesummary:{}:{}'.format(endpoint, recid)
+
+
+def stream_citesummary(record, search):
+    """Stream the citesummary of the records matched by ``search``.
+
+    The output is cached for ``record``, the author, experiment, institution
+    or journal the citesummary is about, until it is invalidated by the
+    indexing of a record it shows, see ``invalidate_citesummaries``.
+    """
+    cache_key = get_citesummary_cache_key(
+        get_endpoint_from_record(record), get_id(record))
+
+    citesummary = current_cache.get(cache_key)
+    if citesummary is not None:
+        return [citesummary]
+
+    return stream_with_context(_stream_citesummary(cache_key, search))
+
+
+def get_citesummary_cache_keys(record):
+    """Return the cache keys of the citesummaries affected by a record.
+
+    A HEP record is part of the citesummaries of its authors, their
+    institutions, its experiments and its journals, while the other records
+    only affect their own citesummary.
+    """
+    if not is_hep(record):
+        if '$schema' not in record or 'control_number' not in record:
+            return set()
+        endpoint = get_endpoint_from_record(record)
+        if endpoint not in CITESUMMARY_ENDPOINTS:
+            return set()
+        return {get_citesummary_cache_key(endpoint, record['control_number'])}
+
+    refs = []
+    for author in force_list(record.get('authors')):
+        refs.append(('authors', author.get('record')))
+        refs.extend(
+            ('institutions', affiliation.get('record'))
+            for affiliation in force_list(author.get('affiliations')))
+    refs.extend(
+        ('experiments', experiment.get('record'))
+        for experiment in force_list(record.get('accelerator_experiments')))
+    refs.extend(
+        ('journals', publication_info.get('journal_record'))
+        for publication_info in force_list(record.get('publication_info')))
+
+    keys = set()
+    for endpoint, ref in refs:
+        recid = get_recid_from_ref(ref)
+        if recid is not None:
+            keys.add(get_citesummary_cache_key(endpoint, recid))
+
+    return keys
+
+
+def invalidate_citesummaries(records):
+    """Drop the cached citesummaries affected by some records.
+
+    Citesummaries also show the records citing the papers they are about,
+    so the records cited by an indexed record must be given as well.
+    As searches only see the indexed records once the index is refreshed,
+    the citesummaries are dropped again a bit later.
+
+    :param records: the JSON of the records.
+    """
+    if not current_app.config.get('API_CITESUMMARY_CACHE_TIMEOUT'):
+        return
+
+    keys = set()
+    for record in records:
+        if record:
+            keys.update(get_citesummary_cache_keys(record))
+    if not keys:
+        return
+
+    # Imported here, as the tasks use this module.
+    from .tasks import invalidate_citesummaries_later
+
+    keys = sorted(keys)
+    current_cache.delete_many(*keys)
+    invalidate_citesummaries_later.apply_async(
+        args=[keys],
+        countdown=current_app.config['API_CITESUMMARY_INVALIDATION_DELAY'],
+    )
 
 
 def get_date(record):
@@ -108,10 +269,4 @@ def is_core(record):
 
 
 def is_selfcite(citee, citer):
-    def _get_authors_recids(record):
-        return set(force_list(get_value(record, 'authors.recid')))
-
-    citee_authors_recids = _get_authors_recids(citee)
-    citer_authors_recids = _get_authors_recids(citer)
-
-    return len(citee_authors_recids & citer_authors_recids) > 0
+    return is_self_citation(citee, citer)
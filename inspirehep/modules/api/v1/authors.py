@@ -24,14 +24,12 @@
 
 from __future__ import absolute_import, division, print_function
 
-import json
-
 from inspirehep.modules.records.serializers.response import (
     record_responsify_nocache,
 )
 from inspirehep.modules.search import LiteratureSearch
 
-from ..utils import build_citesummary, get_id
+from ..utils import get_id, stream_citesummary
 
 
 class APIAuthorsCitesummary(object):
@@ -41,19 +39,9 @@ class APIAuthorsCitesummary(object):
     def serialize(self, pid, record, links_factory=None):
         search_by_author = LiteratureSearch().query(
             'match', authors__recid=get_id(record)
-        ).params(
-            _source=[
-                'authors.recid',
-                'collaborations.value',
-                'control_number',
-                'earliest_date',
-                'facet_inspire_doc_type',
-                'inspire_categories',
-                'titles.title',
-            ],
         )
 
-        return json.dumps(build_citesummary(search_by_author))
+        return stream_citesummary(record, search_by_author)
 
 
 citesummary = APIAuthorsCitesummary()
@@ -24,14 +24,12 @@
 
 from __future__ import absolute_import, division, print_function
 
-import json
-
 from inspirehep.modules.records.serializers.response import (
     record_responsify_nocache,
 )
 from inspirehep.modules.search import LiteratureSearch
 
-from ..utils import build_citesummary, get_id
+from ..utils import get_id, stream_citesummary
 
 
 class APIInstitutionsCitesummary(object):
@@ -41,30 +39,9 @@ class APIInstitutionsCitesummary(object):
     def serialize(self, pid, record, links_factory=None):
         search_by_institution = LiteratureSearch().query(
             'match', authors__affiliations__recid=get_id(record)
-        ).params(
-            _source=[
-                'control_number',
-            ],
-        )
-
-        literature_recids = [
-            get_id(el.to_dict()) for el in search_by_institution.scan()]
-
-        search_by_recids = LiteratureSearch().filter(
-            'terms', control_number=literature_recids
-        ).params(
-            _source=[
-                'authors.recid',
-                'collaborations.value',
-                'control_number',
-                'earliest_date',
-                'facet_inspire_doc_type',
-                'inspire_categories',
-                'titles.title',
-            ],
         )
 
-        return json.dumps(build_citesummary(search_by_recids))
+        return stream_citesummary(record, search_by_institution)
 
 
 citesummary = APIInstitutionsCitesummary()
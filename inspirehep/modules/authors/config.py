@@ -38,3 +38,21 @@ AUTHORS_NAME_TITLES = ['Sir']
 
 AUTHORS_AFFILIATION_RANKS = ['senior', 'junior', 'staff', 'visitor', 'postdoc',
                              'phd', 'masters', 'undergrad']
+
+AUTHORS_METRICS_CACHE_TIMEOUT = 60 * 60 * 24
+"""Seconds the metrics of an author are cached.
+
+Metrics are invalidated whenever a paper of the author, or its citation
+count, is indexed, or the author is removed from a paper, this only bounds
+the memory taken by the unused ones.
+"""
+
+AUTHORS_METRICS_LOCK_TIMEOUT = 60
+"""Seconds requests wait for the metrics computed by another request."""
+
+AUTHORS_METRICS_INVALIDATION_DELAY = 5
+"""Seconds after which the metrics are invalidated a second time.
+
+It must be longer than the refresh interval of ``records-hep``, so that the
+second invalidation happens once the indexed papers are visible to searches.
+"""
@@ -0,0 +1,317 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of INSPIRE.
+# Copyright (C) 2014-2017 CERN.
+#
+# INSPIRE is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# INSPIRE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with INSPIRE. If not, see <http://www.gnu.org/licenses/>.
+#
+# In applying this license, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as an Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+"""Metrics shared by the REST endpoints of author profiles."""
+
+from __future__ import absolute_import, division, print_function
+
+import json
+import time
+from collections import Counter
+from hashlib import sha1
+
+from flask import current_app
+
+from invenio_cache import current_cache
+
+from inspire_dojson.utils import get_recid_from_ref
+from inspire_utils.helpers import force_list
+from inspire_utils.record import get_value
+from inspirehep.modules.records.citations import is_hep
+from inspirehep.modules.search import LiteratureSearch
+from inspirehep.modules.search.api import inspire_filter
+from inspirehep.utils.record import get_title
+from inspirehep.utils.stats import calculate_h_index, calculate_i10_index
+
+
+PUBLICATIONS_SOURCE = [
+    'accelerator_experiments',
+    'authors.full_name',
+    'authors.recid',
+    'authors.record',
+    'citation_count',
+    'control_number',
+    'earliest_date',
+    'facet_inspire_doc_type',
+    'keywords',
+    'publication_info',
+    'self',
+    'titles',
+]
+
+
+METRICS_POLL_INTERVAL = 0.1
+"""Seconds between the checks for metrics computed by another request."""
+
+
+def _get_generation_key(recid):
+    return 'author_metrics_generation:{}'.format(recid)
+
+
+def _get_cache_key(recid, generation, filter_key):
+    return 'author_metrics:{}:{}:{}'.format(
+        recid, generation, sha1(filter_key).hexdigest())
+
+
+def _get_filter_key():
+    """Identify the collections visible by the current user."""
+    query = inspire_filter()
+
+    return json.dumps(query.to_dict() if query else None, sort_keys=True)
+
+
+def _wait_for_metrics(cache_key, lock_key, timeout):
+    """Wait for the metrics computed by the holder of the lock."""
+    cache = current_cache.cache
+    deadline = time.time() + timeout
+
+    while time.time() < deadline:
+        metrics = current_cache.get(cache_key)
+        if metrics is not None or not cache._client.exists(lock_key):
+            return metrics
+        time.sleep(METRICS_POLL_INTERVAL)
+
+
+def get_author_metrics(recid):
+    """Return the metrics of the author with the given recid.
+
+    Metrics are cached per author and set of visible collections, so that
+    the four endpoints of a profile page share the results of a single
+    computation. The request computing them holds a lock meanwhile, which
+    the others wait on, for at most ``AUTHORS_METRICS_LOCK_TIMEOUT`` seconds.
+    """
+    recid = int(recid)
+    generation = current_cache.get(_get_generation_key(recid)) or 0
+    cache_key = _get_cache_key(recid, generation, _get_filter_key())
+
+    metrics = current_cache.get(cache_key)
+    if metrics is not None:
+        return metrics
+
+    cache = current_cache.cache
+    lock_key = cache.key_prefix + cache_key + ':lock'
+    lock_timeout = current_app.config['AUTHORS_METRICS_LOCK_TIMEOUT']
+    locked = cache._client.set(lock_key, 1, nx=True, ex=lock_timeout)
+    if not locked:
+        metrics = _wait_for_metrics(cache_key, lock_key, lock_timeout)
+        if metrics is not None:
+            return metrics
+
+    try:
+        metrics = compute_author_metrics(recid)
+        current_cache.set(
+            cache_key,
+            metrics,
+            timeout=current_app.config['AUTHORS_METRICS_CACHE_TIMEOUT'],
+        )
+    finally:
+        if locked:
+            cache._client.delete(lock_key)
+
+    return metrics
+
+
+def invalidate_author_metrics(recids):
+    """Drop the cached metrics of the authors with the given recids.
+
+    The generation of each author is incremented, so the metrics cached
+    for every set of visible collections are dropped at once. Generations
+    expire with the metrics, which are all dropped by then.
+    """
+    if not recids:
+        return
+
+    cache = current_cache.cache
+    timeout = current_app.config['AUTHORS_METRICS_CACHE_TIMEOUT']
+    pipeline = cache._client.pipeline(transaction=False)
+    for recid in recids:
+        generation_key = cache.key_prefix + _get_generation_key(recid)
+        pipeline.incr(generation_key)
+        if timeout:
+            pipeline.expire(generation_key, timeout)
+    pipeline.execute()
+
+
+def get_authors_recids(json):
+    """Return the recids of the authors of a HEP record."""
+    if not json or not is_hep(json):
+        return set()
+
+    recids = set(
+        get_recid_from_ref(ref)
+        for ref in force_list(get_value(json, 'authors.record')))
+    recids.discard(None)
+    return recids
+
+
+def _get_aggregations(recid):
+    search = LiteratureSearch().query('match', authors__recid=recid)
+    search.aggs.metric('citations', 'sum', field='citation_count')
+    search.aggs.bucket('fields', 'terms', field='facet_inspire_subjects', size=0)
+
+    return search[0:0].execute()
+
+
+def _build_publication(result_source):
+    publication = {}
+    publication['id'] = int(result_source['control_number'])
+    publication['record'] = result_source['self']
+    publication['title'] = get_title(result_source)
+
+    # Get the earliest date.
+    try:
+        publication['date'] = result_source['earliest_date']
+    except KeyError:
+        pass
+
+    # Get publication type.
+    try:
+        publication['type'] = result_source.get(
+            'facet_inspire_doc_type', [])[0]
+    except IndexError:
+        pass
+
+    # Get citation count.
+    try:
+        publication['citations'] = result_source['citation_count']
+    except KeyError:
+        pass
+
+    # Get journal.
+    try:
+        publication['journal'] = {}
+        publication['journal']['title'] = result_source.get(
+            'publication_info', [])[0]['journal_title']
+
+        # Get journal id and $self.
+        try:
+            publication['journal']['id'] = result_source.get(
+                'publication_info', [])[0]['journal_recid']
+            publication['journal']['record'] = result_source.get(
+                'publication_info', [])[0]['journal_record']
+        except KeyError:
+            pass
+    except (IndexError, KeyError):
+        del publication['journal']
+
+    # Get collaborations.
+    collaborations = set()
+
+    for experiment in result_source.get('accelerator_experiments', []):
+        collaborations.add(experiment.get('experiment'))
+
+    if collaborations:
+        publication['collaborations'] = list(collaborations)
+
+    return publication
+
+
+def compute_author_metrics(recid):
+    """Compute the metrics of the author with the given recid.
+
+    Totals and fields come from aggregations, while everything that needs
+    the individual papers (publication list, co-authors, h-index, types
+    and keywords) is collected during a single ``_source``-limited scroll.
+    """
+    aggregations = _get_aggregations(recid)
+
+    publications = []
+    citing_sources = []
+    coauthors = {}
+    citations = {}
+    types = Counter()
+    keywords = Counter()
+
+    search = LiteratureSearch().query(
+        'match', authors__recid=recid
+    ).params(
+        _source=PUBLICATIONS_SOURCE,
+    )
+
+    for result in search.scan():
+        result_source = result.to_dict()
+        control_number = result_source['control_number']
+
+        publications.append(_build_publication(result_source))
+        citing_sources.append({
+            'authors': [
+                {'recid': author['recid']}
+                for author in result_source.get('authors', [])
+                if 'recid' in author
+            ],
+            'control_number': control_number,
+            'self': result_source['self'],
+        })
+
+        citations[control_number] = result_source.get('citation_count', 0)
+
+        # Count the publications by their main type.
+        publication_type = get_value(result_source, 'facet_inspire_doc_type[0]')
+        if publication_type:
+            types[publication_type] += 1
+
+        keywords.update(
+            keyword for keyword in force_list(get_value(result_source, 'keywords.value'))
+            if keyword != '* Automatic Keywords *')
+
+        for author in result_source.get('authors', []):
+            try:
+                # Don't add the reference author.
+                if author['recid'] == recid:
+                    continue
+                if author['recid'] in coauthors:
+                    coauthors[author['recid']]['count'] += 1
+                else:
+                    coauthors[author['recid']] = dict(
+                        count=1,
+                        full_name=author['full_name'],
+                        id=author['recid'],
+                        record=author['record'],
+                    )
+            except KeyError:
+                pass
+
+    statistics = {
+        'citations': int(aggregations.aggregations.citations.value or 0),
+        'hindex': calculate_h_index(citations),
+        'i10index': calculate_i10_index(citations),
+        'publications': aggregations.hits.total,
+        'types': dict(types),
+    }
+
+    fields = [bucket['key'] for bucket in aggregations.aggregations.fields.buckets]
+    if fields:
+        statistics['fields'] = fields
+
+    # Return the top 25 keywords.
+    if keywords:
+        statistics['keywords'] = [{
+            'count': count,
+            'keyword': keyword,
+        } for keyword, count in keywords.most_common(25)]
+
+    return {
+        'coauthors': list(coauthors.values()),
+        'publications': publications,
+        'publications_for_citations': citing_sources,
+        'statistics': statistics,
+    }
@@ -28,10 +28,15 @@ from flask import current_app
 
 from invenio_indexer.signals import before_record_index
 from invenio_records.signals import (
+    before_record_delete,
     before_record_insert,
     before_record_update,
 )
 
+from inspirehep.modules.records.signals import after_records_indexed
+
+from .metrics import get_authors_recids, invalidate_author_metrics
+from .tasks import invalidate_authors_metrics_later
 from .utils import author_tokenize, phonetic_blocks
 
 
@@ -105,3 +110,53 @@ def generate_name_variations(recid, json, *args, **kwargs):
                     "output": name,
                     "payload": {"bai": bai[0] if bai else None}
                 }})
+
+
+def _invalidate_authors_metrics(recids):
+    """Invalidate the metrics of some authors now and once searches see it.
+
+    As searches only see the indexed records once the index is refreshed,
+    the metrics are invalidated again a bit later.
+    """
+    if recids:
+        invalidate_author_metrics(recids)
+        invalidate_authors_metrics_later.apply_async(
+            args=[sorted(recids)],
+            countdown=current_app.config['AUTHORS_METRICS_INVALIDATION_DELAY'],
+        )
+
+
+@before_record_update.connect
+def invalidate_removed_authors_metrics(sender, *args, **kwargs):
+    """Invalidate the metrics of the authors removed from a record.
+
+    They are taken from the previous version of the record, which is still
+    in its model. The authors it has now are handled once it is indexed.
+    """
+    model = getattr(sender, 'model', None)
+    if model is not None:
+        _invalidate_authors_metrics(
+            get_authors_recids(model.json) - get_authors_recids(sender))
+
+
+@before_record_delete.connect
+def invalidate_deleted_authors_metrics(sender, *args, **kwargs):
+    """Invalidate the metrics of the authors of a deleted record."""
+    _invalidate_authors_metrics(get_authors_recids(sender))
+
+
+@after_records_indexed.connect
+def invalidate_authors_metrics(sender, uuids, records=(), *args, **kwargs):
+    """Invalidate the cached metrics of the authors of the indexed records.
+
+    The authors are taken from the JSON of the records, so records indexed
+    without it, like deleted records, are handled by the other receivers.
+
+    :param uuids: The UUIDs of the records that were indexed.
+    :param records: The JSON of the records that were indexed.
+    """
+    recids = set()
+    for record in records:
+        recids.update(get_authors_recids(record))
+
+    _invalidate_authors_metrics(recids)
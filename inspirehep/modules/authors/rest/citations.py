@@ -24,8 +24,20 @@ from __future__ import absolute_import, division, print_function
 
 import json
 
+from six.moves import range
+
+from inspirehep.modules.records.citations import (
+    get_citers_by_recid,
+    is_self_citation,
+)
 from inspirehep.modules.search import LiteratureSearch
 
+from ..metrics import get_author_metrics
+
+
+CITERS_CHUNK_SIZE = 1000
+"""Maximum number of recids sent in a single ``terms`` query."""
+
 
 class AuthorAPICitations(object):
     """API endpoint for author collection returning citations."""
@@ -33,6 +45,10 @@ class AuthorAPICitations(object):
     def serialize(self, pid, record, links_factory=None):
         """Return a list of citations for a given author recid.
 
+        The citers of all the publications of the author are fetched
+        together, in batches of ``CITERS_CHUNK_SIZE``, and the response
+        is streamed.
+
         :param pid:
             Persistent identifier instance.
 
@@ -43,34 +59,25 @@ class AuthorAPICitations(object):
             Factory function for the link generation, which are added to
             the response.
         """
-        author_pid = pid.pid_value
-        citations = {}
+        publications = get_author_metrics(pid.pid_value)[
+            'publications_for_citations']
 
-        search = LiteratureSearch().query({
-            "match": {
-                "authors.recid": author_pid
-            }
-        }).params(
-            _source=[
-                "authors.recid",
-                "control_number",
-                "self",
-            ]
-        )
+        citers_by_recid = get_citers_by_recid(
+            [publication['control_number'] for publication in publications])
+        citers = self._get_citers(set().union(*citers_by_recid.values()))
 
-        # For each publication co-authored by a given author...
-        for result in search.scan():
-            result_source = result.to_dict()
+        return self._stream(publications, citers_by_recid, citers)
 
-            recid = result_source['control_number']
-            authors = set([i['recid'] for i in result_source['authors']])
-            citations[recid] = {}
+    @staticmethod
+    def _get_citers(recids):
+        """Fetch the citing records, indexed by recid."""
+        recids = sorted(recids)
+        citers = {}
 
-            nested_search = LiteratureSearch().query({
-                "match": {
-                    "references.recid": recid
-                }
-            }).params(
+        for i in range(0, len(recids), CITERS_CHUNK_SIZE):
+            search = LiteratureSearch().filter(
+                'terms', control_number=recids[i:i + CITERS_CHUNK_SIZE]
+            ).params(
                 _source=[
                     "authors.recid",
                     "collections",
@@ -80,50 +87,60 @@ class AuthorAPICitations(object):
                 ]
             )
 
-            # The source record that is being cited.
-            citations[recid]['citee'] = dict(
-                id=recid,
-                record=result_source['self'],
-            )
-            citations[recid]['citers'] = []
-
-            # Check all publications, which cite the parent record.
-            for nested_result in nested_search.scan():
-                nested_result_source = nested_result.to_dict()
-
-                # Not every signature has a recid (at least for demo records).
-                try:
-                    nested_authors = set(
-                        [i['recid'] for i in nested_result_source['authors']]
-                    )
-                except KeyError:
-                    nested_authors = set()
-
-                citation = dict(
-                    citer=dict(
-                        id=int(nested_result_source['control_number']),
-                        record=nested_result_source['self']
-                    ),
-                    # If at least one author is shared, it's a self-citation.
-                    self_citation=len(authors & nested_authors) > 0,
-                )
-
-                # Get the earliest date of a citer.
-                try:
-                    citation['date'] = nested_result_source['earliest_date']
-                except KeyError:
-                    pass
-
-                # Get status if a citer is published.
-                # FIXME: As discussed with Sam, we should have a boolean flag
-                #        for this type of information.
-                try:
-                    citation['published_paper'] = "Published" in [
-                        i['primary'] for i in nested_result_source[
-                            'collections']]
-                except KeyError:
-                    citation['published_paper'] = False
-
-                citations[recid]['citers'].append(citation)
-
-        return json.dumps(citations.values())
+            for result in search.scan():
+                result_source = result.to_dict()
+                citers[result_source['control_number']] = result_source
+
+        return citers
+
+    @staticmethod
+    def _build_citation(citee, citer):
+        citation = dict(
+            citer=dict(
+                id=int(citer['control_number']),
+                record=citer['self']
+            ),
+            # If at least one author is shared, it's a self-citation.
+            self_citation=is_self_citation(citee, citer),
+        )
+
+        # Get the earliest date of a citer.
+        try:
+            citation['date'] = citer['earliest_date']
+        except KeyError:
+            pass
+
+        # Get status if a citer is published.
+        # FIXME: As discussed with Sam, we should have a boolean flag
+        #        for this type of information.
+        try:
+            citation['published_paper'] = "Published" in [
+                i['primary'] for i in citer['collections']]
+        except KeyError:
+            citation['published_paper'] = False
+
+        return citation
+
+    def _stream(self, publications, citers_by_recid, citers):
+        yield '['
+
+        for i, publication in enumerate(publications):
+            recid = publication['control_number']
+            citations = {
+                # The source record that is being cited.
+                'citee': dict(
+                    id=recid,
+                    record=publication['self'],
+                ),
+                'citers': [
+                    self._build_citation(publication, citers[citer_recid])
+                    for citer_recid in sorted(citers_by_recid[recid])
+                    if citer_recid in citers
+                ],
+            }
+
+            if i:
+                yield ','
+            yield json.dumps(citations)
+
+        yield ']'
@@ -24,7 +24,7 @@ from __future__ import absolute_import, division, print_function
 
 import json
 
-from inspirehep.modules.search import LiteratureSearch
+from ..metrics import get_author_metrics
 
 
 class AuthorAPICoauthors(object):
@@ -43,38 +43,4 @@ class AuthorAPICoauthors(object):
             Factory function for the link generation, which are added to
             the response.
         """
-        author_pid = pid.pid_value
-        coauthors = {}
-
-        search = LiteratureSearch().query({
-            "match": {
-                "authors.recid": author_pid
-            }
-        }).params(
-            _source=[
-                "authors.full_name",
-                "authors.recid",
-                "authors.record",
-            ]
-        )
-
-        for result in search.scan():
-            result_source = result.to_dict()['authors']
-
-            for author in result_source:
-                try:
-                    # Don't add the reference author.
-                    if author['recid'] != author_pid:
-                        if author['recid'] in coauthors:
-                            coauthors[author['recid']]['count'] += 1
-                        else:
-                            coauthors[author['recid']] = dict(
-                                count=1,
-                                full_name=author['full_name'],
-                                id=author['recid'],
-                                record=author['record'],
-                            )
-                except KeyError:
-                    pass
-
-        return json.dumps(coauthors.values())
+        return json.dumps(get_author_metrics(pid.pid_value)['coauthors'])
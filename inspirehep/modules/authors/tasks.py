@@ -26,6 +26,7 @@ import copy
 import datetime
 import os
 
+from celery import shared_task
 from flask import current_app, url_for
 from sqlalchemy.orm.exc import NoResultFound
 
@@ -38,6 +39,7 @@ from inspirehep.modules.forms.utils import filter_empty_elements
 from inspirehep.modules.workflows.utils import with_debug_logging
 
 from .dojson.model import updateform
+from .metrics import invalidate_author_metrics
 
 
 def formdata_to_model(obj, formdata):
@@ -177,3 +179,13 @@ def curation_ticket_context(user, obj):
         record_url=record_url,
         user_comment=obj.extra_data.get('formdata', {}).get('extra_comments', ''),
     )
+
+
+@shared_task(ignore_result=True)
+def invalidate_authors_metrics_later(recids):
+    """Invalidate the cached metrics of some authors once more.
+
+    This drops the metrics computed between the indexing of their papers and
+    the following refresh of the index.
+    """
+    invalidate_author_metrics(recids)
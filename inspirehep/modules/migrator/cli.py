@@ -29,9 +29,24 @@ import os
 import click
 import requests
 
+from inspirehep.modules.records.benchmark import (
+    benchmark_dates,
+    benchmark_enhancers,
+    get_dates,
+    get_largest_records,
+)
+from inspirehep.modules.records.experiments import build_experiments_index
+from inspirehep.modules.records.indexer import get_queue_stats
+
 from .tasks import (
+    REINDEX_BATCH_SIZE,
+    REINDEX_PARTITIONS,
     add_citation_counts,
+    get_migration_progress,
+    get_ranged_source,
     migrate,
+    migrate_ranges,
+    reindex,
     remigrate_records,
     migrate_chunk,
     split_blob,
@@ -52,13 +67,22 @@ def migrator():
               default=False, help='Remigrate all records')
 @click.option('--wait', '-w', type=bool, default=False,
               help='Wait for migrator to complete.')
+@click.option('--parallel', '-p', is_flag=True, default=False,
+              help='Split the file in ranges migrated in parallel.')
+@click.option('--resume', '-r', is_flag=True, default=False,
+              help='Resume a previous parallel migration of the file.')
 def populate(file_input=None,
              remigrate_broken=False,
              remigrate_all=False,
-             wait=False):
+             wait=False,
+             parallel=False,
+             resume=False):
     """Populates the system with records from migrator files.
 
     Usage: inveniomanage migrator populate -f prodsync20151117173222.xml.gz
+
+    With ``--parallel`` the file is split in ranges whose progress is kept in
+    the database, so that ``--resume`` only migrates what is left.
     """
     if remigrate_broken:
         click.echo("Remigrate broken records...")
@@ -71,7 +95,97 @@ def populate(file_input=None,
     elif file_input:
         click.echo("Migrating records from file: {0}".format(file_input))
 
-        migrate(os.path.abspath(file_input), wait_for_results=wait)
+        if parallel or resume:
+            migrate_ranges(os.path.abspath(file_input), resume=resume, wait_for_results=wait)
+        else:
+            migrate(os.path.abspath(file_input), wait_for_results=wait)
+
+
+@migrator.command()
+@click.option('--file-input', '-f', required=True,
+              help='File being migrated in parallel.')
+def progress(file_input):
+    """Shows the progress of a parallel migration."""
+    status = get_migration_progress(
+        get_ranged_source(os.path.abspath(file_input)))
+    click.echo(
+        '{done}/{ranges} ranges done, {records} records migrated '
+        '({throughput:.1f} records/s).'.format(**status))
+
+
+@migrator.command('reindex')
+@click.option('--index', '-i', 'indices', multiple=True,
+              help='Index to rebuild, all the records indices by default.')
+@click.option('--partitions', '-p', type=int, default=REINDEX_PARTITIONS,
+              help='Number of ranges of records indexed in parallel.')
+@click.option('--batch-size', '-b', type=int, default=REINDEX_BATCH_SIZE,
+              help='Number of records sent in each bulk request.')
+@click.option('--allow-downtime', is_flag=True,
+              help='Replace indices which are not aliases yet.')
+def reindex_records(indices, partitions, batch_size, allow_downtime):
+    """Rebuilds the records indices from the database without downtime.
+
+    The first rebuild of an index replaces it by an alias, which makes
+    searches fail for a moment, so it needs --allow-downtime.
+
+    Usage: inspirehep migrator reindex -i records-hep -p 64
+    """
+    reindex(indices, partitions=partitions, batch_size=batch_size,
+            allow_downtime=allow_downtime)
+
+
+@migrator.command('indexing-status')
+def indexing_status():
+    """Shows the records waiting to be indexed."""
+    stats = get_queue_stats()
+    click.echo(
+        '{backlog} records queued, the oldest for {lag:.1f}s.'.format(**stats))
+
+
+@migrator.command('build-experiments-index')
+def build_experiments():
+    """Rebuilds the index used to normalize experiment names.
+
+    It is updated whenever an experiment is indexed, and rebuilt by reindex,
+    so it only needs to be rebuilt on a new instance, or to forget the names
+    no longer used.
+    """
+    count = build_experiments_index()
+    click.echo('{} experiment names indexed.'.format(count))
+
+
+@migrator.command('benchmark-enhancers')
+@click.option('--limit', '-l', default=20,
+              help='Number of records, starting from the largest.')
+@click.option('--repeat', default=10, help='Number of runs per record.')
+def benchmark_records_enhancers(limit, repeat):
+    """Compares the compiled and the full walk of the references.
+
+    Usage: inspirehep migrator benchmark-enhancers -l 20
+    """
+    records = get_largest_records(limit)
+
+    click.echo('{:>14} {:>10}  {}'.format('compiled (ms)', 'walk (ms)', 'recid'))
+    for recid, compiled, walk in benchmark_enhancers(records, repeat):
+        compiled = '-' if compiled is None else '{:.2f}'.format(compiled * 1e3)
+        click.echo('{:>14} {:>10.2f}  {}'.format(compiled, walk * 1e3, recid))
+
+
+@migrator.command('benchmark-dates')
+@click.option('--limit', '-l', default=1000,
+              help='Number of records, starting from the largest.')
+@click.option('--repeat', default=10, help='Number of runs.')
+def benchmark_records_dates(limit, repeat):
+    """Compares the validation of dates with strptime and with the parser.
+
+    Usage: inspirehep migrator benchmark-dates -l 1000
+    """
+    dates = get_dates(get_largest_records(limit))
+    results = benchmark_dates(dates, repeat)
+
+    click.echo('{} dates validated in:'.format(len(dates)))
+    for name in ('strptime', 'uncached', 'cached'):
+        click.echo('{:>10}: {:.2f} ms'.format(name, results[name] * 1e3))
 
 
 @migrator.command()
@@ -52,3 +52,23 @@ class InspireProdRecords(db.Model):
     @marcxml.setter
     def marcxml(self, value):
         self._marcxml = compress(value)
+
+
+class InspireMigrationRange(db.Model):
+    """Byte range of a legacy dump, used to resume interrupted migrations.
+
+    ``start`` and ``end`` are offsets in the (decompressed) dump aligned on
+    ``<record>`` boundaries, while ``position`` points just past the last
+    record that has been committed.
+    """
+    __tablename__ = 'inspire_migrator_ranges'
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    source = db.Column(db.Text(), nullable=False, index=True)
+    start = db.Column(db.BigInteger, nullable=False)
+    end = db.Column(db.BigInteger, nullable=False)
+    position = db.Column(db.BigInteger, nullable=False)
+    records = db.Column(db.Integer, default=0, nullable=False)
+    done = db.Column(db.Boolean, default=False, nullable=False, index=True)
+    started = db.Column(db.DateTime, nullable=True)
+    last_updated = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
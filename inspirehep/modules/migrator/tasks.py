@@ -25,51 +25,76 @@
 from __future__ import absolute_import, division, print_function
 
 import gzip
+import mmap
+import os
 import re
+import shutil
+import time
 import zlib
-from collections import Counter
-from itertools import chain
+from collections import defaultdict
+from contextlib import closing
+from datetime import datetime
+from json import load
+from uuid import UUID, uuid4
 
 import click
 from celery import group, shared_task
 from celery.utils.log import get_task_logger
-from elasticsearch.helpers import bulk as es_bulk
-from elasticsearch.helpers import scan as es_scan
+from elasticsearch.helpers import bulk as es_bulk, scan
 from flask import current_app, url_for
 from flask_sqlalchemy import models_committed
 from jsonschema import ValidationError
 from redis import StrictRedis
 from redis_lock import Lock
-from six import text_type
+from six import iteritems, itervalues, text_type
+from sqlalchemy.orm.attributes import flag_modified
 
 from dojson.contrib.marc21.utils import create_record as marc_create_record
 from invenio_collections import current_collections
 from invenio_db import db
 from invenio_indexer.api import RecordIndexer, current_record_to_index
 from invenio_pidstore.errors import PIDDoesNotExistError
-from invenio_pidstore.models import PersistentIdentifier
-from invenio_search import current_search_client as es
-from invenio_search.utils import schema_to_index
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
+from invenio_records.models import RecordMetadata
+from invenio_records.signals import (
+    after_record_insert,
+    after_record_update,
+    before_record_insert,
+    before_record_update,
+)
+from invenio_search import current_search, current_search_client as es
 
 from inspire_dojson.processors import overdo_marc_dict
 from inspire_dojson.utils import get_recid_from_ref
-from inspire_utils.dedupers import dedupe_list
-from inspire_utils.helpers import force_list
-from inspire_utils.record import get_value
 from inspirehep.modules.pidstore.minters import inspire_recid_minter
 from inspirehep.modules.pidstore.utils import get_pid_type_from_schema
 from inspirehep.modules.records.api import InspireRecord
+from inspirehep.modules.records.citations import (
+    get_changed_cited_recids,
+    prefetched_citation_counts,
+    push_all_citation_counts,
+    rebuild_citations,
+)
+from inspirehep.modules.records.experiments import build_experiments_index
 from inspirehep.modules.records.receivers import receive_after_model_commit
+from inspirehep.modules.records.tasks import update_citation_counts
+from inspirehep.modules.records.utils import indexing_records
+from inspirehep.modules.search.cache import bump_generations
 
-from .models import InspireProdRecords
+from .models import InspireMigrationRange, InspireProdRecords
 
 
 logger = get_task_logger(__name__)
 
 CHUNK_SIZE = 100
 LARGE_CHUNK_SIZE = 2000
+REINDEX_PARTITIONS = 64
+REINDEX_BATCH_SIZE = 1000
+RANGE_SIZE = 64 * 1024 * 1024
+READ_SIZE = 1024 * 1024
 
 split_marc = re.compile('<record.*?>.*?</record>', re.DOTALL)
+record_start = re.compile(r'<record[\s>]')
 
 
 def chunker(iterable, chunksize=CHUNK_SIZE):
@@ -104,6 +129,189 @@ def split_stream(stream):
             buf.append(row)
 
 
+def open_source(source):
+    """Open a legacy dump, transparently decompressing it if gzipped."""
+    if source.endswith('.gz'):
+        return gzip.open(source, 'rb')
+    return open(source, 'rb')
+
+
+def iter_records(fd, start=0, end=None):
+    """Yield ``(offset, end_offset, record)`` for every record in a range.
+
+    Only the records starting in ``[start, end)`` are returned. Unlike
+    ``split_stream`` the dump is read in fixed-size blocks and the pattern
+    is only run on the part of the buffer that contains complete records.
+    """
+    fd.seek(start)
+    base = start
+    buf = b''
+
+    while end is None or base < end:
+        block = fd.read(READ_SIZE)
+        if not block:
+            break
+        buf += block
+
+        index = buf.rfind(b'</record>')
+        if index < 0:
+            continue
+        index += 9
+
+        for match in split_marc.finditer(buf, 0, index):
+            offset = base + match.start()
+            if end is not None and offset >= end:
+                return
+            yield offset, base + match.end(), match.group()
+
+        buf = buf[index:]
+        base += index
+
+
+def get_ranged_source(source):
+    """Return the uncompressed dump the ranges of ``source`` refer to."""
+    if source.endswith('.gz'):
+        return source[:-3]
+    return source
+
+
+def decompress_source(source):
+    """Decompress a gzipped dump next to it, unless it already was.
+
+    Seeking in a gzipped file decompresses everything before the offset, so
+    every range would first inflate the ranges before it. The dump is thus
+    decompressed once, before it is split.
+    """
+    target = get_ranged_source(source)
+    if target != source and not os.path.exists(target):
+        partial = target + '.partial'
+        with closing(gzip.open(source, 'rb')) as src, open(partial, 'wb') as dst:
+            shutil.copyfileobj(src, dst, READ_SIZE)
+        os.rename(partial, target)
+
+    return target
+
+
+def split_ranges(source, range_size=RANGE_SIZE):
+    """Split an uncompressed legacy dump into byte ranges aligned on
+    ``<record>`` boundaries, scanning it through a memory map.
+    """
+    with open(source, 'rb') as fd, \
+            closing(mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)) as mm:
+        size = len(mm)
+        match = record_start.search(mm)
+        boundaries = [match.start() if match else size]
+        while boundaries[-1] + range_size < size:
+            match = record_start.search(mm, boundaries[-1] + range_size)
+            if not match:
+                break
+            boundaries.append(match.start())
+        boundaries.append(size)
+
+    return [
+        (start, end) for start, end in zip(boundaries, boundaries[1:])
+        if end > start
+    ]
+
+
+def create_migration_ranges(source, range_size=RANGE_SIZE):
+    """Split ``source`` and store its ranges so that the migration can resume."""
+    InspireMigrationRange.query.filter_by(source=source).delete()
+    for start, end in split_ranges(source, range_size):
+        db.session.add(InspireMigrationRange(
+            source=source, start=start, end=end, position=start))
+    db.session.commit()
+
+
+def get_migration_progress(source):
+    """Return the progress of the ranged migration of ``source``.
+
+    The throughput is computed between the moment the first range was
+    picked up by a worker and the last update of any range.
+    """
+    ranges = InspireMigrationRange.query.filter_by(source=source).all()
+    records = sum(migration_range.records for migration_range in ranges)
+    started = [migration_range.started for migration_range in ranges if migration_range.started]
+    elapsed = 0
+    if started:
+        last_updated = max(migration_range.last_updated for migration_range in ranges)
+        elapsed = (last_updated - min(started)).total_seconds()
+
+    return {
+        'ranges': len(ranges),
+        'done': sum(1 for migration_range in ranges if migration_range.done),
+        'records': records,
+        'throughput': records / elapsed if elapsed > 0 else 0,
+    }
+
+
+@shared_task(ignore_result=False, acks_late=True)
+def migrate_range(range_id):
+    """Migrate the records of a range, checkpointing after every chunk."""
+    migration_range = InspireMigrationRange.query.get(range_id)
+    source, end = migration_range.source, migration_range.end
+    position = migration_range.position
+    if not migration_range.started:
+        migration_range.started = datetime.utcnow()
+        db.session.commit()
+
+    migrated = 0
+    start_time = time.time()
+    with closing(open_source(source)) as fd:
+        for chunk in chunker(iter_records(fd, position, end), CHUNK_SIZE):
+            migrate_chunk([raw_record for _, _, raw_record in chunk])
+            InspireMigrationRange.query.filter_by(id=range_id).update({
+                'position': chunk[-1][1],
+                'records': InspireMigrationRange.records + len(chunk),
+                'last_updated': datetime.utcnow(),
+            }, synchronize_session=False)
+            db.session.commit()
+            migrated += len(chunk)
+
+    InspireMigrationRange.query.filter_by(id=range_id).update({
+        'position': end,
+        'done': True,
+        'last_updated': datetime.utcnow(),
+    }, synchronize_session=False)
+    db.session.commit()
+
+    elapsed = time.time() - start_time
+    logger.info('Migrated {} records of range {} in {:.0f}s ({:.1f} records/s)'.format(
+        migrated, range_id, elapsed, migrated / elapsed if elapsed else 0))
+
+    return migrated
+
+
+def migrate_ranges(source, resume=False, wait_for_results=False,
+                   range_size=RANGE_SIZE):
+    """Migrate a dump by spreading its byte ranges across the workers.
+
+    When ``resume`` is set the ranges of a previous run are reused and only
+    the unfinished ones are sent again, each continuing from its last
+    checkpoint. Gzipped dumps are decompressed next to the original first.
+    """
+    source = decompress_source(source)
+    if not resume or not InspireMigrationRange.query.filter_by(source=source).count():
+        create_migration_ranges(source, range_size)
+
+    range_ids = [
+        range_id for (range_id,) in db.session.query(InspireMigrationRange.id).filter_by(
+            source=source, done=False).order_by(InspireMigrationRange.start)
+    ]
+    print('Migrating {} ranges of {}'.format(len(range_ids), source))
+
+    job = group(migrate_range.s(range_id) for range_id in range_ids)
+    if not wait_for_results:
+        job.apply_async()
+        return
+
+    start_time = time.time()
+    migrated = sum(job.apply_async().join())
+    elapsed = time.time() - start_time
+    print('All migration tasks have been completed: {} records in {:.0f}s ({:.1f} records/s).'.format(
+        migrated, elapsed, migrated / elapsed if elapsed else 0))
+
+
 @shared_task(ignore_result=True)
 def remigrate_records(only_broken=True):
     """Remigrate records.
@@ -188,24 +396,34 @@ def migrate_chunk(chunk):
     current_collections.unregister_signals()
 
     index_queue = []
+    cited_recids = set()
+
+    def collect_cited_recids(sender, changes):
+        cited_recids.update(get_changed_cited_recids(changes))
 
     try:
-        for raw_record in chunk:
-            with db.session.begin_nested():
-                record = migrate_and_insert_record(raw_record)
-                if record:
-                    index_queue.append(create_index_op(record))
-        db.session.commit()
+        with models_committed.connected_to(collect_cited_recids):
+            records = bulk_migrate_and_insert_records(chunk)
+            with prefetched_citation_counts(records):
+                index_queue = [create_index_op(record) for record in records]
+            db.session.commit()
     finally:
         db.session.close()
 
     req_timeout = current_app.config['INDEXER_BULK_REQUEST_TIMEOUT']
-    es_bulk(
-        es,
-        index_queue,
-        stats_only=True,
-        request_timeout=req_timeout,
-    )
+    with indexing_records((op['_id'] for op in index_queue), records):
+        es_bulk(
+            es,
+            index_queue,
+            stats_only=True,
+            request_timeout=req_timeout,
+        )
+    bump_generations(op['_index'] for op in index_queue)
+
+    # The records of the chunk already carry their count, the records they
+    # cite are updated like on any other commit.
+    if cited_recids:
+        update_citation_counts.delay(sorted(cited_recids))
 
     models_committed.connect(receive_after_model_commit)
     current_collections.register_signals()
@@ -213,69 +431,298 @@ def migrate_chunk(chunk):
 
 @shared_task()
 def add_citation_counts(chunk_size=500, request_timeout=120):
-    def _build_recid_to_uuid_map(citations_lookup):
-        pids = PersistentIdentifier.query.filter(
-            PersistentIdentifier.object_type == 'rec').yield_per(1000)
-
-        with click.progressbar(pids) as bar:
-            return {
-                pid.object_uuid: citations_lookup[int(pid.pid_value)]
-                for pid in bar if int(pid.pid_value) in citations_lookup
-            }
-
-    def _get_records_to_update_generator(citations_lookup):
-        with click.progressbar(citations_lookup.iteritems()) as bar:
-            for uuid, citation_count in bar:
+    """Rebuild the citations table and push every citation count to ES.
+
+    Both steps stream the records, so this can be used to reconcile the
+    counts maintained incrementally on record commit.
+    """
+    click.echo('Rebuilding citations...')
+    rebuild_citations(chunk_size=LARGE_CHUNK_SIZE)
+    click.echo('... DONE.')
+
+    click.echo('Adding citation numbers...')
+    success, failed = push_all_citation_counts(
+        chunk_size=chunk_size, request_timeout=request_timeout)
+    click.echo('... DONE: {} records updated with success. {} failures.'.format(
+        success, failed))
+
+
+def get_reindex_indices(indices=None):
+    """Return the mapping file of each records index to rebuild."""
+    return dict(
+        (index, filename)
+        for index, filename in iteritems(current_search.mappings)
+        if index.startswith('records-') and (not indices or index in indices)
+    )
+
+
+def split_uuid_range(partitions):
+    """Split the UUIDs in ``partitions`` ranges of the same size.
+
+    ``None`` stands for the lower bound of the first range and the upper
+    bound of the last one.
+    """
+    boundaries = [
+        str(UUID(int=i * 2 ** 128 // partitions)) for i in range(1, partitions)
+    ]
+
+    return list(zip([None] + boundaries, boundaries + [None]))
+
+
+def create_reindex_indices(indices, suffix):
+    """Create a versioned copy of each index, tuned for bulk indexing.
+
+    :returns: the name of the copy of each index.
+    :rtype: dict
+    """
+    new_indices = {}
+    for index, filename in iteritems(indices):
+        with open(filename) as fd:
+            body = load(fd)
+        body.setdefault('settings', {}).update({
+            'number_of_replicas': 0,
+            'refresh_interval': '-1',
+        })
+
+        new_indices[index] = '{}-{}'.format(index, suffix)
+        es.indices.create(index=new_indices[index], body=body)
+
+    return new_indices
+
+
+def get_reindex_actions(query, new_indices, batch_size=REINDEX_BATCH_SIZE):
+    """Yield the bulk actions indexing the records matched by ``query``.
+
+    The records are loaded ``batch_size`` at a time, in order of UUID, and
+    sent to the copy of their index.
+    """
+    last_id = None
+    while True:
+        batch = query
+        if last_id is not None:
+            batch = batch.filter(RecordMetadata.id > last_id)
+        batch = batch.order_by(RecordMetadata.id).limit(batch_size).all()
+        if not batch:
+            return
+
+        records = [
+            InspireRecord(model.json, model=model)
+            for model in batch if model.json is not None
+        ]
+        with prefetched_citation_counts(records):
+            for record in records:
+                index, doc_type = current_record_to_index(record)
+                if index not in new_indices:
+                    continue
                 yield {
-                    '_op_type': 'update',
-                    '_index': index,
+                    '_op_type': 'index',
+                    '_index': new_indices[index],
                     '_type': doc_type,
-                    '_id': str(uuid),
-                    'doc': {'citation_count': citation_count}
+                    '_id': str(record.id),
+                    '_version': record.revision_id,
+                    '_version_type': 'external_gte',
+                    '_source': RecordIndexer._prepare_record(
+                        record, index, doc_type),
+                }
+
+        last_id = batch[-1].id
+        db.session.expunge_all()
+
+
+def get_reindex_deletions(new_indices, batch_size=REINDEX_BATCH_SIZE):
+    """Yield the bulk actions deleting the records removed from the database.
+
+    All the documents of the copies are checked against the database, so
+    that the records deleted while they were built are deleted too.
+    """
+    for new_index in sorted(itervalues(new_indices)):
+        hits = scan(es, index=new_index, _source=False, size=batch_size)
+        for chunk in chunker(hits, batch_size):
+            doc_types = dict((hit['_id'], hit['_type']) for hit in chunk)
+            existing = set(
+                str(uuid) for uuid, in db.session.query(RecordMetadata.id).filter(
+                    RecordMetadata.id.in_(list(doc_types)),
+                    RecordMetadata.json.isnot(None),
+                )
+            )
+            for uuid in sorted(set(doc_types) - existing):
+                yield {
+                    '_op_type': 'delete',
+                    '_index': new_index,
+                    '_type': doc_types[uuid],
+                    '_id': uuid,
                 }
 
-    index, doc_type = schema_to_index('records/hep.json')
-    citations_lookup = Counter()
 
-    click.echo('Extracting all citations...')
-    with click.progressbar(es_scan(
+@shared_task(bind=True, ignore_result=False, acks_late=True,
+             max_retries=3, default_retry_delay=30)
+def reindex_partition(self, start, end, new_indices, batch_size=REINDEX_BATCH_SIZE):
+    """Index the records whose UUID is in ``[start, end)`` in bulk.
+
+    A failed partition is retried from scratch, which is harmless as the
+    records keep their version.
+
+    :returns: the number of records indexed.
+    """
+    query = RecordMetadata.query
+    if start is not None:
+        query = query.filter(RecordMetadata.id >= start)
+    if end is not None:
+        query = query.filter(RecordMetadata.id < end)
+
+    start_time = time.time()
+    try:
+        indexed, _ = es_bulk(
             es,
-            query={
-                '_source': 'references.recid',
-                'filter': {
-                    'exists': {
-                        'field': 'references.recid'
-                    }
-                },
-                'size': LARGE_CHUNK_SIZE
-            },
-            scroll=u'2m',
-            index=index,
-            doc_type=doc_type)) as records:
-        for record in records:
-            unique_refs_ids = dedupe_list(list(chain.from_iterable(map(
-                force_list, get_value(record, '_source.references.recid')))))
-
-            for unique_refs_id in unique_refs_ids:
-                citations_lookup[unique_refs_id] += 1
-    click.echo('... DONE.')
+            get_reindex_actions(query, new_indices, batch_size),
+            chunk_size=batch_size,
+            request_timeout=current_app.config['INDEXER_BULK_REQUEST_TIMEOUT'],
+        )
+    except Exception as exc:
+        logger.warning('Retrying partition {}-{} ({} retries so far): {}'.format(
+            start, end, self.request.retries, exc))
+        raise self.retry(exc=exc)
+    finally:
+        db.session.close()
 
-    click.echo('Mapping recids to UUIDs...')
-    citations_lookup = _build_recid_to_uuid_map(citations_lookup)
-    click.echo('... DONE.')
+    elapsed = time.time() - start_time
+    logger.info('Indexed {} records of partition {}-{} in {:.0f}s ({:.1f} records/s)'.format(
+        indexed, start, end, elapsed, indexed / elapsed if elapsed else 0))
 
-    click.echo('Adding citation numbers...')
-    success, failed = es_bulk(
+    return indexed
+
+
+def get_replicas(index):
+    """Return the number of replicas of an index, 1 if it does not exist."""
+    if not es.indices.exists(index=index):
+        return 1
+
+    settings = es.indices.get_settings(index=index, name='index.number_of_replicas')
+    return int(next(itervalues(settings))['settings']['index']['number_of_replicas'])
+
+
+def get_concrete_indices(indices):
+    """Return the names which are actual indices, rather than aliases."""
+    return [
+        index for index in indices
+        if es.indices.exists(index=index) and
+        index in es.indices.get_alias(index=index)
+    ]
+
+
+def swap_index(index, new_index):
+    """Point ``index`` and the aliases of the index behind it to ``new_index``.
+
+    The aliases are moved atomically, then the old indices are deleted.
+    The first time, ``index`` is an actual index, which has to be deleted
+    before an alias can take its name, so searches fail until the alias is
+    created.
+    """
+    old_indices = {}
+    if es.indices.exists(index=index):
+        old_indices = es.indices.get_alias(index=index)
+
+    actions = [{'add': {'index': new_index, 'alias': index}}]
+    for old_index, info in iteritems(old_indices):
+        for alias in info.get('aliases', {}):
+            if alias != index:
+                actions.append({'add': {'index': new_index, 'alias': alias}})
+            if old_index != index:
+                actions.append({'remove': {'index': old_index, 'alias': alias}})
+
+    if index in old_indices:
+        es.indices.delete(index=index)
+    es.indices.update_aliases(body={'actions': actions})
+
+    for old_index in old_indices:
+        if old_index != index:
+            es.indices.delete(index=old_index)
+
+
+def reindex(indices=None, partitions=REINDEX_PARTITIONS,
+            batch_size=REINDEX_BATCH_SIZE, poll_interval=5,
+            allow_downtime=False):
+    """Rebuild the records indices from the database without downtime.
+
+    Every index is rebuilt in a versioned copy, with the records split in
+    ranges of UUIDs indexed in parallel by the workers. The copies then
+    replace the indices behind their aliases. Finally the records which
+    were committed in the meantime are indexed again, and the ones which
+    were deleted are removed.
+
+    :param indices: names of the indices to rebuild, all the records
+        indices by default.
+    :param allow_downtime: whether indices which are not aliases yet may be
+        replaced, which makes searches on them fail for a moment.
+    """
+    started = datetime.utcnow()
+    indices = get_reindex_indices(indices)
+
+    concrete_indices = get_concrete_indices(indices)
+    if concrete_indices and not allow_downtime:
+        raise click.ClickException(
+            '{} are not aliases yet, so they have to be deleted before being '
+            'replaced. Run again with --allow-downtime during a maintenance '
+            'window.'.format(', '.join(sorted(concrete_indices))))
+
+    # Experiment names are normalized with it while indexing.
+    click.echo('{} experiment names indexed.'.format(build_experiments_index()))
+
+    new_indices = create_reindex_indices(
+        indices, started.strftime('%Y%m%d%H%M%S'))
+    click.echo('Indexing into {}'.format(', '.join(sorted(itervalues(new_indices)))))
+
+    ranges = split_uuid_range(partitions)
+    job = group(
+        reindex_partition.s(start, end, new_indices, batch_size)
+        for start, end in ranges
+    )
+    result = job.apply_async()
+
+    start_time = time.time()
+    while True:
+        done = [r for r in result.results if r.ready()]
+        indexed = sum(r.result for r in done if r.successful())
+        elapsed = time.time() - start_time
+        click.echo('{}/{} partitions done, {} records indexed ({:.1f} records/s).'.format(
+            len(done), len(ranges), indexed, indexed / elapsed if elapsed else 0))
+        if len(done) == len(ranges):
+            break
+        time.sleep(poll_interval)
+
+    failed = [r for r in result.results if r.failed()]
+    if failed:
+        raise click.ClickException(
+            '{} partitions failed, the indices were left untouched.'.format(len(failed)))
+
+    for index, new_index in iteritems(new_indices):
+        es.indices.put_settings(index=new_index, body={
+            'index': {
+                'number_of_replicas': get_replicas(index),
+                'refresh_interval': '1s',
+            },
+        })
+        es.indices.refresh(index=new_index)
+        swap_index(index, new_index)
+
+    updated, _ = es_bulk(
+        es,
+        get_reindex_actions(
+            RecordMetadata.query.filter(RecordMetadata.updated >= started),
+            new_indices, batch_size),
+        chunk_size=batch_size,
+        request_timeout=current_app.config['INDEXER_BULK_REQUEST_TIMEOUT'],
+    )
+    deleted, _ = es_bulk(
         es,
-        _get_records_to_update_generator(citations_lookup),
-        chunk_size=chunk_size,
-        raise_on_exception=False,
+        get_reindex_deletions(new_indices, batch_size),
+        chunk_size=batch_size,
         raise_on_error=False,
-        request_timeout=request_timeout,
-        stats_only=True,
+        request_timeout=current_app.config['INDEXER_BULK_REQUEST_TIMEOUT'],
     )
-    click.echo('... DONE: {} records updated with success. {} failures.'.format(
-        success, failed))
+    bump_generations(new_indices)
+    click.echo('Indices swapped, {} records updated meanwhile indexed again, '
+               '{} deleted meanwhile removed.'.format(updated, deleted))
 
 
 def create_record(record):
@@ -315,24 +762,191 @@ def record_insert_or_replace(json):
         return record
 
 
-def migrate_and_insert_record(raw_record):
-    """Convert a marc21 record to JSON and insert it into the DB."""
+def convert_record(raw_record):
+    """Convert a marc21 record to JSON.
+
+    Returns a ``(recid, json_record, error)`` tuple, or ``None`` when the
+    MARCXML cannot be read at all.
+    """
     try:
         record = marc_create_record(raw_record, keep_singletons=False)
-    except Exception as e:
+    except Exception:
         logger.exception('Migrator MARC 21 read Error')
         return None
 
     recid = int(record['001'])
-    prod_record = InspireProdRecords(recid=recid)
-    prod_record.marcxml = raw_record
-    error = None
 
     try:
-        json_record = create_record(record)
+        return recid, create_record(record), None
     except Exception as e:
         logger.exception('Migrator DoJSON Error')
-        error = e
+        return recid, None, e
+
+
+def store_prod_record(recid, raw_record, error=None, merge=True):
+    """Keep the original MARCXML of a record along with its migration status."""
+    prod_record = InspireProdRecords(recid=recid)
+    prod_record.marcxml = raw_record
+
+    if error:
+        # Invalid record, will not get indexed.
+        prod_record.valid = False
+        prod_record.errors = u'{0}: Record {1}: {2}'.format(type(error), recid, error)
+    else:
+        prod_record.valid = True
+
+    if merge:
+        db.session.merge(prod_record)
+    else:
+        db.session.add(prod_record)
+
+
+def _get_pids(json_records):
+    """Fetch with a single query the PIDs of the given records."""
+    control_numbers = defaultdict(set)
+    for json in json_records:
+        control_numbers[get_pid_type_from_schema(json['$schema'])].add(
+            text_type(json['control_number']))
+
+    if not control_numbers:
+        return {}
+
+    pids = PersistentIdentifier.query.filter(db.or_(*[
+        db.and_(
+            PersistentIdentifier.pid_type == pid_type,
+            PersistentIdentifier.pid_value.in_(pid_values),
+        ) for pid_type, pid_values in iteritems(control_numbers)
+    ]))
+
+    return {(pid.pid_type, pid.pid_value): pid for pid in pids}
+
+
+def _bulk_insert_or_replace(converted):
+    """Insert or replace the converted records of a chunk in one flush.
+
+    The PIDs, the existing records and the existing ``InspireProdRecords``
+    are fetched with one query each. Records failing validation are only
+    stored as invalid, while the ones needing more than a plain insert or
+    update are returned to be migrated one by one.
+    """
+    prod_records = InspireProdRecords.query.filter(
+        InspireProdRecords.recid.in_([recid for _, recid, _, _ in converted])).all()
+    known_recids = set(prod_record.recid for prod_record in prod_records)
+
+    def _store_prod_record(recid, raw_record, error=None):
+        store_prod_record(recid, raw_record, error, merge=recid in known_recids)
+        known_recids.add(recid)
+
+    candidates, leftovers = [], []
+    for raw_record, recid, json, error in converted:
+        if error:
+            _store_prod_record(recid, raw_record, error)
+        elif json.get('control_number') and not json.get('deleted'):
+            candidates.append((raw_record, recid, json))
+        else:
+            leftovers.append(raw_record)
+
+    pids = _get_pids([json for _, _, json in candidates])
+    uuids = [pid.object_uuid for pid in itervalues(pids) if pid.object_uuid]
+    models = {}
+    if uuids:
+        models = {
+            model.id: model for model in
+            RecordMetadata.query.filter(RecordMetadata.id.in_(uuids))
+        }
+
+    created, updated = [], []
+    seen = set()
+    for raw_record, recid, json in candidates:
+        pid_type = get_pid_type_from_schema(json['$schema'])
+        key = (pid_type, text_type(json['control_number']))
+        pid = pids.get(key)
+        model = models.get(pid.object_uuid) if pid else None
+        if key in seen or (pid and (model is None or model.json is None)):
+            leftovers.append(raw_record)
+            continue
+        seen.add(key)
+
+        try:
+            if model:
+                record = InspireRecord(json, model=model)
+                before_record_update.send(record)
+                record.validate()
+                model.json = dict(record)
+                flag_modified(model, 'json')
+                updated.append(record)
+            else:
+                record = InspireRecord(json)
+                before_record_insert.send(record)
+                record.validate()
+                record.model = RecordMetadata(id=uuid4(), json=record)
+                db.session.add(record.model)
+                db.session.add(PersistentIdentifier(
+                    pid_type=pid_type,
+                    pid_value=key[1],
+                    object_type='rec',
+                    object_uuid=record.id,
+                    status=PIDStatus.REGISTERED,
+                ))
+                created.append(record)
+        except ValidationError as e:
+            pattern = u'Migrator Validator Error: {}, Value: %r, Record: %r'
+            logger.error(pattern.format('.'.join(e.schema_path)), e.instance, recid)
+            _store_prod_record(recid, raw_record, e)
+        except Exception as e:
+            logger.exception('Migrator Record Insert Error')
+            _store_prod_record(recid, raw_record, e)
+        else:
+            _store_prod_record(recid, raw_record)
+
+    db.session.flush()
+
+    for record in created:
+        after_record_insert.send(record)
+    for record in updated:
+        after_record_update.send(record)
+
+    return created + updated, leftovers
+
+
+def bulk_migrate_and_insert_records(raw_records):
+    """Convert a chunk of marc21 records to JSON and insert them into the DB.
+
+    All the records that can be written as plain inserts or updates go
+    through ``_bulk_insert_or_replace``, the others (deleted records,
+    control numbers repeated in the chunk...) are migrated one by one, each
+    in its own savepoint. If the bulk write fails, the whole chunk falls
+    back to the single record path.
+    """
+    converted = []
+    for raw_record in raw_records:
+        result = convert_record(raw_record)
+        if result:
+            converted.append((raw_record,) + result)
+
+    try:
+        with db.session.begin_nested():
+            records, leftovers = _bulk_insert_or_replace(converted)
+    except Exception:
+        logger.exception('Migrator Bulk Insert Error')
+        records, leftovers = [], [raw_record for raw_record, _, _, _ in converted]
+
+    for raw_record in leftovers:
+        with db.session.begin_nested():
+            record = migrate_and_insert_record(raw_record)
+            if record:
+                records.append(record)
+
+    return records
+
+
+def migrate_and_insert_record(raw_record):
+    """Convert a marc21 record to JSON and insert it into the DB."""
+    converted = convert_record(raw_record)
+    if not converted:
+        return None
+
+    recid, json_record, error = converted
 
     try:
         if not error:
@@ -348,14 +962,8 @@ def migrate_and_insert_record(raw_record):
         logger.exception('Migrator Record Insert Error')
         error = e
 
+    store_prod_record(recid, raw_record, error)
+
     if error:
-        # Invalid record, will not get indexed.
-        error_str = u'{0}: Record {1}: {2}'.format(type(error), recid, e)
-        prod_record.valid = False
-        prod_record.errors = error_str
-        db.session.merge(prod_record)
         return None
-    else:
-        prod_record.valid = True
-        db.session.merge(prod_record)
-        return record
+    return record
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of INSPIRE.
+# Copyright (C) 2014-2017 CERN.
+#
+# INSPIRE is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# INSPIRE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with INSPIRE. If not, see <http://www.gnu.org/licenses/>.
+#
+# In applying this license, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as an Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+"""Measure the time taken by the enhancers of records."""
+
+from __future__ import absolute_import, division, print_function
+
+from copy import deepcopy
+from itertools import chain
+from timeit import default_timer
+
+from sqlalchemy import String, cast, func
+
+from invenio_records.models import RecordMetadata
+
+from inspire_utils.helpers import force_list
+from inspire_utils.record import get_value
+from inspirehep.modules.search.benchmark import measure, percentile
+from inspirehep.utils.date import (
+    clear_valid_date_cache,
+    create_valid_date,
+    create_valid_date_with_strptime,
+)
+
+from .enhancers import get_ref_tree, populate_all_recids, populate_recids
+from .receivers import EARLIEST_DATE_PATHS
+
+
+def get_largest_records(limit):
+    """Return the ``limit`` records with the largest JSON."""
+    size = func.length(cast(RecordMetadata.json, String))
+    query = RecordMetadata.query.filter(
+        RecordMetadata.json.isnot(None)).order_by(size.desc()).limit(limit)
+
+    return [record.json for record in query]
+
+
+def time_enhancer(enhancer, args, record, repeat):
+    """Return the median time, in seconds, taken to enhance a record.
+
+    The record is copied before every run, outside of the timings.
+    """
+    timings = []
+    for _ in range(repeat):
+        data = deepcopy(record)
+        start = default_timer()
+        enhancer(*(args + (data,)))
+        timings.append(default_timer() - start)
+
+    return percentile(sorted(timings), 50)
+
+
+def benchmark_enhancers(records, repeat=10):
+    """Time the compiled and the full walk of the references of records.
+
+    Returns a list of ``(control_number, compiled, walk)`` tuples, where
+    ``compiled`` is ``None`` if the schema of the record is not known.
+    """
+    results = []
+    for record in records:
+        tree = get_ref_tree(record['$schema']) \
+            if '$schema' in record else None
+        if tree is None:
+            compiled = None
+        else:
+            compiled = time_enhancer(populate_recids, (tree,), record, repeat)
+        walk = time_enhancer(populate_all_recids, (), record, repeat)
+        results.append((record.get('control_number'), compiled, walk))
+
+    return results
+
+
+def get_dates(records):
+    """Return the dates of records used to compute their earliest date."""
+    return list(chain.from_iterable(
+        force_list(get_value(record, path))
+        for record in records for path in EARLIEST_DATE_PATHS
+    ))
+
+
+def _validate_dates(validate, dates):
+    for date in dates:
+        validate(date)
+
+
+def _validate_dates_uncached(dates):
+    clear_valid_date_cache()
+    _validate_dates(create_valid_date, dates)
+
+
+def benchmark_dates(dates, repeat=10):
+    """Time the validation of dates with ``strptime`` and with the parser.
+
+    Returns a dictionary with the median time, in seconds, taken to validate
+    all the dates with ``strptime``, and with the parser starting with an
+    empty and with a full cache.
+    """
+    _validate_dates(create_valid_date, dates)
+
+    return {
+        'strptime': percentile(measure(
+            _validate_dates, (create_valid_date_with_strptime, dates),
+            repeat), 50),
+        'uncached': percentile(measure(
+            _validate_dates_uncached, (dates,), repeat), 50),
+        'cached': percentile(measure(
+            _validate_dates, (create_valid_date, dates), repeat), 50),
+    }
@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of INSPIRE.
+# Copyright (C) 2014-2017 CERN.
+#
+# INSPIRE is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# INSPIRE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with INSPIRE. If not, see <http://www.gnu.org/licenses/>.
+#
+# In applying this license, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as an Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+"""Citations between records."""
+
+from __future__ import absolute_import, division, print_function
+
+from contextlib import contextmanager
+
+from elasticsearch.helpers import bulk as es_bulk
+from flask import current_app, g
+from sqlalchemy import inspect
+
+from invenio_db import db
+from invenio_pidstore.models import PersistentIdentifier
+from invenio_records.models import RecordMetadata
+from invenio_search import current_search_client as es
+from invenio_search.utils import schema_to_index
+
+from inspire_dojson.utils import get_recid_from_ref
+from inspire_utils.helpers import force_list
+from inspire_utils.record import get_value
+from inspirehep.modules.search.cache import bump_generations
+
+from .models import RecordCitations
+from .utils import indexing_records
+
+
+def is_hep(json):
+    # FIXME: Use a dedicated method when #1355 will be resolved.
+    return 'hep.json' in json.get('$schema', '')
+
+
+def get_cited_recids(json):
+    """Return the recids of the records cited by a HEP record."""
+    if not is_hep(json) or json.get('deleted'):
+        return set()
+
+    refs = force_list(get_value(json, 'references.record'))
+    recids = set(get_recid_from_ref(ref) for ref in refs)
+    recids.discard(None)
+
+    return recids
+
+
+def update_citations(record):
+    """Synchronize the citations of ``record`` with its references.
+
+    Only the difference between the stored citations and the current
+    references is written. Returns the recids of the records whose number
+    of citations changed.
+    """
+    if not record.id or 'control_number' not in record:
+        # Records get their control number right after being created, the
+        # following commit will take care of them.
+        return set()
+
+    cited_recids = get_cited_recids(record)
+    citations = {
+        citation.cited_recid: citation for citation in
+        RecordCitations.query.filter_by(citer_id=record.id)
+    }
+
+    for recid in set(citations) - cited_recids:
+        db.session.delete(citations[recid])
+
+    for recid in cited_recids - set(citations):
+        db.session.add(RecordCitations(
+            citer_id=record.id,
+            citer_recid=int(record['control_number']),
+            cited_recid=recid,
+        ))
+
+    return cited_recids.symmetric_difference(citations)
+
+
+def delete_citations(record):
+    """Remove the citations made by ``record``."""
+    cited_recids = set()
+    for citation in RecordCitations.query.filter_by(citer_id=record.id):
+        cited_recids.add(citation.cited_recid)
+        db.session.delete(citation)
+
+    return cited_recids
+
+
+def get_changed_cited_recids(changes):
+    """Return the recids whose citations changed in a commit."""
+    # Read the primary key from the identity to avoid a query per citation,
+    # as committed instances are expired.
+    return set(
+        inspect(model_instance).identity[1]
+        for model_instance, change in changes
+        if isinstance(model_instance, RecordCitations)
+    )
+
+
+def get_citers(recid):
+    """Return the recids of the records citing ``recid``."""
+    query = db.session.query(RecordCitations.citer_recid).filter(
+        RecordCitations.cited_recid == recid)
+
+    return sorted(citer_recid for (citer_recid,) in query)
+
+
+def get_references(recid):
+    """Return the recids of the records cited by ``recid``."""
+    query = db.session.query(RecordCitations.cited_recid).filter(
+        RecordCitations.citer_recid == recid)
+
+    return sorted(cited_recid for (cited_recid,) in query)
+
+
+def get_citers_by_recid(recids, chunk_size=1000):
+    """Return a mapping from each of ``recids`` to the recids citing it.
+
+    The lookups are done ``chunk_size`` recids at a time, to keep the
+    queries of big collaborations within reasonable bounds.
+    """
+    result = dict((recid, set()) for recid in recids)
+    recids = list(result)
+
+    for i in range(0, len(recids), chunk_size):
+        query = db.session.query(
+            RecordCitations.cited_recid,
+            RecordCitations.citer_recid,
+        ).filter(RecordCitations.cited_recid.in_(recids[i:i + chunk_size]))
+
+        for cited_recid, citer_recid in query:
+            result[cited_recid].add(citer_recid)
+
+    return result
+
+
+def is_self_citation(citee, citer):
+    """Tell whether two records share at least one author."""
+    def _get_authors_recids(record):
+        return set(force_list(get_value(record, 'authors.recid')))
+
+    return bool(_get_authors_recids(citee) & _get_authors_recids(citer))
+
+
+def get_citation_count(recid):
+    """Return the number of records citing ``recid``.
+
+    The counts prefetched by ``prefetched_citation_counts`` are used when
+    available.
+    """
+    counts = g.get('citation_counts') or {}
+    if recid in counts:
+        return counts[recid]
+
+    return RecordCitations.query.filter_by(cited_recid=recid).count()
+
+
+def get_citation_counts(recids):
+    """Return a mapping from each of ``recids`` to its number of citations."""
+    counts = db.session.query(
+        RecordCitations.cited_recid,
+        db.func.count(RecordCitations.citer_id),
+    ).filter(
+        RecordCitations.cited_recid.in_(recids),
+    ).group_by(RecordCitations.cited_recid)
+
+    result = dict.fromkeys(recids, 0)
+    result.update(counts)
+
+    return result
+
+
+@contextmanager
+def prefetched_citation_counts(records):
+    """Fetch the citation counts of a batch of records with one query.
+
+    Meant to wrap the bulk indexing of ``records``, so that populating
+    their ``citation_count`` does not take one query per record.
+    """
+    recids = [
+        int(record['control_number']) for record in records
+        if is_hep(record) and 'control_number' in record
+    ]
+    previous = g.get('citation_counts')
+    g.citation_counts = get_citation_counts(recids) if recids else {}
+    try:
+        yield
+    finally:
+        g.citation_counts = previous
+
+
+def _get_citation_count_updates(rows):
+    index, doc_type = schema_to_index('records/hep.json')
+
+    for uuid, citation_count in rows:
+        yield {
+            '_op_type': 'update',
+            '_index': index,
+            '_type': doc_type,
+            '_id': str(uuid),
+            'doc': {'citation_count': citation_count},
+        }
+
+
+def push_citation_counts(recids, chunk_size=1000):
+    """Update the ``citation_count`` of some HEP records in Elasticsearch.
+
+    The counts are absolute values taken from the citations table, so that
+    pushing them twice or out of order never makes them drift. They are
+    fetched and pushed ``chunk_size`` recids at a time.
+    """
+    if not recids:
+        return 0, 0
+
+    recids = list(recids)
+    success = failed = 0
+    for i in range(0, len(recids), chunk_size):
+        chunk = recids[i:i + chunk_size]
+        counts = get_citation_counts(chunk)
+        models = db.session.query(
+            PersistentIdentifier.pid_value,
+            RecordMetadata.id,
+            RecordMetadata.json,
+        ).join(
+            RecordMetadata,
+            RecordMetadata.id == PersistentIdentifier.object_uuid,
+        ).filter(
+            PersistentIdentifier.pid_type == 'lit',
+            PersistentIdentifier.object_type == 'rec',
+            PersistentIdentifier.pid_value.in_([str(recid) for recid in chunk]),
+        ).all()
+        rows = [(uuid, counts[int(recid)]) for recid, uuid, _ in models]
+
+        with indexing_records((uuid for uuid, _ in rows),
+                              (json for _, _, json in models)):
+            chunk_success, chunk_failed = es_bulk(
+                es,
+                _get_citation_count_updates(rows),
+                raise_on_exception=False,
+                raise_on_error=False,
+                request_timeout=current_app.config['INDEXER_BULK_REQUEST_TIMEOUT'],
+                stats_only=True,
+            )
+        success += chunk_success
+        failed += chunk_failed
+
+    bump_generations([schema_to_index('records/hep.json')[0]])
+    return success, failed
+
+
+def rebuild_citations(chunk_size=1000):
+    """Rebuild the whole citations table from the records in the database.
+
+    Records are streamed ``chunk_size`` at a time and their citations are
+    written with bulk inserts, so memory usage does not depend on the size
+    of the database.
+    """
+    RecordCitations.query.delete(synchronize_session=False)
+
+    query = db.session.query(RecordMetadata.id, RecordMetadata.json).filter(
+        RecordMetadata.json.isnot(None)).yield_per(chunk_size)
+
+    citations = []
+    for uuid, json in query:
+        if 'control_number' not in json:
+            continue
+        citations.extend({
+            'citer_id': uuid,
+            'citer_recid': int(json['control_number']),
+            'cited_recid': recid,
+        } for recid in get_cited_recids(json))
+
+        if len(citations) >= chunk_size:
+            db.session.bulk_insert_mappings(RecordCitations, citations)
+            citations = []
+
+    db.session.bulk_insert_mappings(RecordCitations, citations)
+    db.session.commit()
+
+
+def push_all_citation_counts(chunk_size=500, request_timeout=120):
+    """Update the ``citation_count`` of every HEP record in Elasticsearch.
+
+    The counts are computed by the database and streamed to Elasticsearch,
+    records without citations get a ``citation_count`` of 0.
+    """
+    citation_count = db.func.count(RecordCitations.citer_id)
+    rows = db.session.query(
+        PersistentIdentifier.object_uuid,
+        citation_count,
+    ).outerjoin(
+        RecordCitations,
+        RecordCitations.cited_recid == db.cast(PersistentIdentifier.pid_value, db.Integer),
+    ).filter(
+        PersistentIdentifier.pid_type == 'lit',
+        PersistentIdentifier.object_type == 'rec',
+    ).group_by(PersistentIdentifier.object_uuid).yield_per(chunk_size)
+
+    return es_bulk(
+        es,
+        _get_citation_count_updates(rows),
+        chunk_size=chunk_size,
+        raise_on_exception=False,
+        raise_on_error=False,
+        request_timeout=request_timeout,
+        stats_only=True,
+    )
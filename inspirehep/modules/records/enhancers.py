@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of INSPIRE.
+# Copyright (C) 2014-2017 CERN.
+#
+# INSPIRE is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# INSPIRE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with INSPIRE. If not, see <http://www.gnu.org/licenses/>.
+#
+# In applying this license, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as an Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+"""Record enhancers compiled from the JSON schemas.
+
+Walking the whole record to find the references to other records is slow
+for big records, such as collaboration papers with thousands of authors.
+The places where a reference can occur are known from the JSON schema of
+the record, so they are compiled once per schema into a tree of keys which
+is walked instead.
+
+Only the recids of the references are derived this way. The other fields
+added before indexing only depend on a few top-level keys, so they are still
+computed by their own receivers.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import posixpath
+
+from six import iteritems, string_types
+from six.moves.urllib.parse import urlsplit
+
+from inspire_dojson.utils import get_recid_from_ref
+from inspire_schemas.api import load_schema
+from inspire_schemas.errors import SchemaNotFound
+
+try:
+    from functools import lru_cache
+except ImportError:
+    from functools32 import lru_cache
+
+
+LIST_REF_FIELDS_TRANSLATIONS = {
+    'deleted_records': 'deleted_recids',
+}
+"""Lists of references whose recids are gathered in a sibling list."""
+
+SCHEMA_COMBINATORS = ('allOf', 'anyOf', 'oneOf')
+
+ANY_KEY = '*'
+"""Key of the tree matching the keys which are not listed in the schema."""
+
+
+def get_recid_key(key):
+    """Name the sibling holding the recid of the reference under ``key``.
+
+    ``record`` occurrences are removed and ``_recid`` is appended, without
+    doubling or prepending underscores.
+    """
+    key_basename = key.replace('record', '').rstrip('_')
+    return '{}_recid'.format(key_basename).lstrip('_')
+
+
+def _resolve_schema(schema, name, resolving=()):
+    """Follow the ``$ref`` of a subschema, relative to the schema ``name``.
+
+    :returns: the resolved subschema and the name of the schema holding it,
+        or ``None`` if it was already being resolved.
+    """
+    while isinstance(schema.get('$ref'), string_types):
+        name = posixpath.normpath(posixpath.join(
+            posixpath.dirname(name), schema['$ref']))
+        if name in resolving:
+            return None, name
+        resolving += (name,)
+        schema = _load_schema(name)
+    return schema, name
+
+
+def _load_schema(name):
+    schema = load_schema(name)
+    # Schemas without a ``$schema`` are wrapped in one.
+    if isinstance(schema.get('$schema'), dict):
+        schema = schema['$schema']
+    return schema
+
+
+def _is_json_reference(schema):
+    return schema.get('type') == 'object' and \
+        '$ref' in schema.get('properties', {})
+
+
+def _merge_ref_trees(tree, other):
+    """Merge the tree ``other`` into ``tree``.
+
+    A key mapped to a subtree is also checked for references, so it takes
+    precedence over the same key mapped to ``None``.
+    """
+    for key, subtree in iteritems(other):
+        if tree.get(key) is None:
+            tree[key] = subtree if key not in tree else subtree or None
+        elif subtree:
+            _merge_ref_trees(tree[key], subtree)
+
+
+def _compile_ref_tree(schema, name, resolving=()):
+    """Compile the tree of keys leading to references in ``schema``.
+
+    Arrays are transparent: the tree of an array is the tree of its items.
+    A key mapped to ``None`` holds a reference, or a list of references. Any
+    key may also hold a reference if a combinator allows it. The keys allowed
+    by ``additionalProperties`` or ``patternProperties`` are matched by
+    ``ANY_KEY``.
+
+    :returns: the tree, or ``None`` if ``schema`` is itself a reference.
+    """
+    schema, name = _resolve_schema(schema, name, resolving)
+    if schema is None:
+        return {}
+    resolving += (name,)
+
+    if _is_json_reference(schema):
+        return None
+
+    if 'items' in schema and isinstance(schema['items'], dict):
+        return _compile_ref_tree(schema['items'], name, resolving)
+
+    tree = {}
+    for key, subschema in iteritems(schema.get('properties', {})):
+        if not isinstance(subschema, dict):
+            continue
+        subtree = _compile_ref_tree(subschema, name, resolving)
+        if subtree is None or subtree:
+            tree[key] = subtree
+
+    other_subschemas = list(schema.get('patternProperties', {}).values())
+    if isinstance(schema.get('additionalProperties'), dict):
+        other_subschemas.append(schema['additionalProperties'])
+    for subschema in other_subschemas:
+        if not isinstance(subschema, dict):
+            continue
+        subtree = _compile_ref_tree(subschema, name, resolving)
+        if subtree is None or subtree:
+            _merge_ref_trees(tree, {ANY_KEY: subtree})
+
+    is_reference = False
+    for combinator in SCHEMA_COMBINATORS:
+        for subschema in schema.get(combinator, []):
+            subtree = _compile_ref_tree(subschema, name, resolving)
+            if subtree is None:
+                is_reference = True
+            else:
+                _merge_ref_trees(tree, subtree)
+
+    if is_reference and not tree:
+        return None
+    return tree
+
+
+@lru_cache(maxsize=32)
+def get_ref_tree(schema_url):
+    """Return the compiled tree of references of a schema.
+
+    :param schema_url: the ``$schema`` of a record.
+    :returns: the tree, or ``None`` if the schema can't be loaded.
+    """
+    name = posixpath.basename(urlsplit(schema_url).path)
+    try:
+        return _compile_ref_tree(_load_schema(name), name) or {}
+    except (IOError, SchemaNotFound):
+        return None
+
+
+def _populate_recid(key, subtree, data):
+    value = data.get(key)
+    if isinstance(value, dict) and '$ref' in value:
+        data[get_recid_key(key)] = get_recid_from_ref(value)
+    elif isinstance(value, list) and key in LIST_REF_FIELDS_TRANSLATIONS:
+        data[LIST_REF_FIELDS_TRANSLATIONS[key]] = [
+            get_recid_from_ref(item) for item in value
+        ]
+    elif subtree:
+        populate_recids(subtree, value)
+
+
+def populate_recids(tree, data):
+    """Add the recid of every reference of ``data`` listed in ``tree``."""
+    if isinstance(data, list):
+        for item in data:
+            populate_recids(tree, item)
+        return
+    elif not isinstance(data, dict):
+        return
+
+    # Recids are added to ``data``, so its keys are listed beforehand.
+    other_keys = [key for key in data if key not in tree] \
+        if ANY_KEY in tree else []
+    for key, subtree in iteritems(tree):
+        if key != ANY_KEY:
+            _populate_recid(key, subtree, data)
+    for key in other_keys:
+        _populate_recid(key, tree[ANY_KEY], data)
+
+
+def populate_all_recids(data):
+    """Add the recid of every reference of ``data``, wherever it occurs."""
+    if isinstance(data, list):
+        items = enumerate(data)
+    elif isinstance(data, dict):
+        # Note that items have to be generated before altering the dict.
+        # In this case, iteritems might break during iteration.
+        items = data.items()
+    else:
+        items = []
+
+    for key, value in items:
+        if (isinstance(data, dict) and isinstance(value, dict) and
+                '$ref' in value):
+            data[get_recid_key(key)] = get_recid_from_ref(value)
+        elif (isinstance(data, dict) and isinstance(value, list) and
+                key in LIST_REF_FIELDS_TRANSLATIONS):
+            data[LIST_REF_FIELDS_TRANSLATIONS[key]] = [
+                get_recid_from_ref(item) for item in value
+            ]
+        else:
+            populate_all_recids(value)
@@ -20,2836 +20,195 @@
 # granted to it by virtue of its status as an Intergovernmental Organization
 # or submit itself to any jurisdiction.
 
-"""Dictionary used when normalizing experiment names.
+"""Index used when normalizing experiment names.
 
-FIXME: this is currently a static Python dictionary, but it should be replaced
-by a query on the dynamic state of the Experiments collection.
+Experiment names are normalized to the legacy name of the matching record
+of the Experiments collection. Names are looked up by their lowercased form
+without spaces, both for the legacy names and for the name variants.
+
+The index is snapshotted in a Redis hash, built from the experiment records
+of the database by ``inspirehep migrator build-experiments-index``, or before
+a reindex, and updated whenever an experiment is indexed. Every process keeps
+a copy of it in memory, which is reloaded when the snapshot changed, at most
+every ``RECORDS_EXPERIMENTS_INDEX_REFRESH`` seconds.
 """
 
 from __future__ import absolute_import, division, print_function
 
+import logging
+import time
+
+from flask import current_app
+from redis import StrictRedis
+
+from invenio_db import db
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
+from invenio_records.models import RecordMetadata
+
+from inspire_utils.helpers import force_list
+
+
+logger = logging.getLogger(__name__)
+
+EXPERIMENTS_INDEX_KEY = 'experiments_index'
+"""Redis hash mapping the key of each experiment name to its legacy name."""
+
+EXPERIMENTS_INDEX_VERSION_KEY = 'experiments_index_version'
+"""Redis counter incremented whenever the experiments index changes."""
+
+
+def get_redis():
+    return StrictRedis.from_url(current_app.config['CACHE_REDIS_URL'])
+
+
+def get_experiment_key(name):
+    """Return the key under which an experiment name is looked up."""
+    return name.lower().replace(' ', '')
+
+
+def get_experiment_names(record):
+    """Return the legacy name of an experiment and the keys of its variants.
+
+    :returns: the legacy name, or ``None`` if the experiment has none, and
+        the keys of its name variants.
+    """
+    legacy_name = record.get('legacy_name')
+    if not legacy_name:
+        return None, []
+
+    variants = [
+        get_experiment_key(name)
+        for name in force_list(record.get('name_variants'))
+        if name
+    ]
+    return legacy_name, variants
+
+
+def _add_experiment(names, legacy_name, variants):
+    # A legacy name takes precedence over the name variants of others.
+    names[get_experiment_key(legacy_name)] = legacy_name
+    for variant in variants:
+        names.setdefault(variant, legacy_name)
+
+
+class ExperimentsIndex(object):
+
+    """In-process copy of the experiments index."""
+
+    def __init__(self):
+        self.names = None
+        self.version = None
+        self.checked_at = 0
+
+    def refresh(self):
+        """Reload the index if its snapshot changed since it was loaded."""
+        now = time.time()
+        timeout = current_app.config['RECORDS_EXPERIMENTS_INDEX_REFRESH']
+        if self.names is not None and now - self.checked_at < timeout:
+            return
+        self.checked_at = now
+
+        redis = get_redis()
+        version = redis.get(EXPERIMENTS_INDEX_VERSION_KEY)
+        if self.names is not None and version == self.version:
+            return
+
+        # Legacy names are shared by all their keys, to save memory.
+        legacy_names = {}
+        names = {}
+        for key, legacy_name in redis.hgetall(EXPERIMENTS_INDEX_KEY).items():
+            legacy_name = legacy_name.decode('utf-8')
+            names[key.decode('utf-8')] = legacy_names.setdefault(
+                legacy_name, legacy_name)
+
+        if not names:
+            logger.warning(
+                'The experiments index is empty, experiment names will not '
+                'be normalized until it is built.')
+
+        self.names = names
+        self.version = version
+
+    def normalize(self, name):
+        """Return the legacy name of an experiment, or the name if unknown."""
+        self.refresh()
+        return self.names.get(get_experiment_key(name), name)
+
+    def add(self, legacy_name, variants):
+        """Add the names of an experiment to the in-process copy."""
+        if self.names is not None:
+            _add_experiment(self.names, legacy_name, variants)
+
+
+experiments_index = ExperimentsIndex()
+
+
+def get_experiments_index_version():
+    """Return the version of the experiments index loaded by this process.
+
+    It is ``None`` until an experiment name is first normalized.
+    """
+    if experiments_index.names is not None:
+        experiments_index.refresh()
+    return experiments_index.version
+
+
+def normalize_experiment_name(name):
+    """Return the legacy name of an experiment, or the name if unknown."""
+    return experiments_index.normalize(name)
+
+
+def update_experiments_index(record):
+    """Add the names of an experiment record to the experiments index.
+
+    Names which are no longer used by the experiment are only removed when
+    the index is rebuilt.
+    """
+    legacy_name, variants = get_experiment_names(record)
+    if not legacy_name:
+        return
+
+    with get_redis().pipeline() as pipe:
+        pipe.hset(
+            EXPERIMENTS_INDEX_KEY, get_experiment_key(legacy_name),
+            legacy_name)
+        for variant in variants:
+            pipe.hsetnx(EXPERIMENTS_INDEX_KEY, variant, legacy_name)
+        pipe.incr(EXPERIMENTS_INDEX_VERSION_KEY)
+        pipe.execute()
+
+    experiments_index.add(legacy_name, variants)
+
+
+def build_experiments_index():
+    """Snapshot the names of all the experiments in Redis.
+
+    The names are read from the database, so that the index can be built
+    before the experiments are indexed.
+
+    :returns: the number of names in the index.
+    :rtype: int
+    """
+    experiments = db.session.query(RecordMetadata.json).join(
+        PersistentIdentifier,
+        PersistentIdentifier.object_uuid == RecordMetadata.id,
+    ).filter(
+        PersistentIdentifier.pid_type == 'exp',
+        PersistentIdentifier.status == PIDStatus.REGISTERED,
+        RecordMetadata.json.isnot(None),
+    ).yield_per(1000)
+
+    names = {}
+    for json, in experiments:
+        legacy_name, variants = get_experiment_names(json)
+        if legacy_name:
+            _add_experiment(names, legacy_name, variants)
+
+    with get_redis().pipeline() as pipe:
+        pipe.delete(EXPERIMENTS_INDEX_KEY)
+        if names:
+            pipe.hmset(EXPERIMENTS_INDEX_KEY, names)
+        pipe.incr(EXPERIMENTS_INDEX_VERSION_KEY)
+        pipe.execute()
 
-EXPERIMENTS_MAP = {
-    '2dfgrs': '2dFGRS',
-    '2qz': '2QZ',
-    'access': 'ACCESS',
-    'ace': 'ACE',
-    'acme': 'ACME',
-    'act': 'ACT',
-    'admx': 'ADMX',
-    'advligo': 'AdvLIGO',
-    'agasa': 'AGASA',
-    'agile': 'AGILE',
-    'aiace': 'AIACE',
-    'aigo': 'AIGO',
-    'alia': 'ALIA',
-    'alma': 'ALMA',
-    'alpaca': 'ALPACA',
-    'amiga': 'AMIGA',
-    'ams': 'AMS',
-    'ams-02': 'AMS-02',
-    'anais': 'ANAIS',
-    'ani': 'ANI',
-    'anita': 'ANITA',
-    'anl-atlas-apex': 'ANL-ATLAS-APEX',
-    'anl-e-289-292': 'ANL-E-289-292',
-    'anl-e-303': 'ANL-E-303',
-    'anl-e-333': 'ANL-E-333',
-    'anl-e-337': 'ANL-E-337',
-    'anl-e-339': 'ANL-E-339',
-    'anl-e-342': 'ANL-E-342',
-    'anl-e-347': 'ANL-E-347',
-    'anl-e-351': 'ANL-E-351',
-    'anl-e-354': 'ANL-E-354',
-    'anl-e-358': 'ANL-E-358',
-    'anl-e-360': 'ANL-E-360',
-    'anl-e-363': 'ANL-E-363',
-    'anl-e-365': 'ANL-E-365',
-    'anl-e-366': 'ANL-E-366',
-    'anl-e-367': 'ANL-E-367',
-    'anl-e-368': 'ANL-E-368',
-    'anl-e-371': 'ANL-E-371',
-    'anl-e-372': 'ANL-E-372',
-    'anl-e-377': 'ANL-E-377',
-    'anl-e-379': 'ANL-E-379',
-    'anl-e-380': 'ANL-E-380',
-    'anl-e-381': 'ANL-E-381',
-    'anl-e-384': 'ANL-E-384',
-    'anl-e-385': 'ANL-E-385',
-    'anl-e-386': 'ANL-E-386',
-    'anl-e-391': 'ANL-E-391',
-    'anl-e-393': 'ANL-E-393',
-    'anl-e-395': 'ANL-E-395',
-    'anl-e-397': 'ANL-E-397',
-    'anl-e-399': 'ANL-E-399',
-    'anl-e-400': 'ANL-E-400',
-    'anl-e-401': 'ANL-E-401',
-    'anl-e-402': 'ANL-E-402',
-    'anl-e-403': 'ANL-E-403',
-    'anl-e-406': 'ANL-E-406',
-    'anl-e-407': 'ANL-E-407',
-    'anl-e-408': 'ANL-E-408',
-    'anl-e-409': 'ANL-E-409',
-    'anl-e-411': 'ANL-E-411',
-    'anl-e-412': 'ANL-E-412',
-    'anl-e-413': 'ANL-E-413',
-    'anl-e-414': 'ANL-E-414',
-    'anl-e-415': 'ANL-E-415',
-    'anl-e-416': 'ANL-E-416',
-    'anl-e-418': 'ANL-E-418',
-    'anl-e-419': 'ANL-E-419',
-    'anl-e-420': 'ANL-E-420',
-    'anl-e-421': 'ANL-E-421',
-    'anl-e-422': 'ANL-E-422',
-    'anl-e-424': 'ANL-E-424',
-    'anl-e-425': 'ANL-E-425',
-    'anl-e-426': 'ANL-E-426',
-    'anl-e-427': 'ANL-E-427',
-    'anl-e-428': 'ANL-E-428',
-    'anl-e-429': 'ANL-E-429',
-    'anl-e-431': 'ANL-E-431',
-    'anl-e-432': 'ANL-E-432',
-    'anl-e-433': 'ANL-E-433',
-    'anl-e-434': 'ANL-E-434',
-    'anl-e-435': 'ANL-E-435',
-    'anl-e-436': 'ANL-E-436',
-    'anl-e-437': 'ANL-E-437',
-    'anl-e-438': 'ANL-E-438',
-    'anl-e-439': 'ANL-E-439',
-    'anl-e-441': 'ANL-E-441',
-    'anl-e-442': 'ANL-E-442',
-    'anl-e-443': 'ANL-E-443',
-    'anl-e-444': 'ANL-E-444',
-    'anl-e-445': 'ANL-E-445',
-    'anl-e-446': 'ANL-E-446',
-    'anl-e-447': 'ANL-E-447',
-    'anl-e-449': 'ANL-E-449',
-    'anl-e-450': 'ANL-E-450',
-    'anl-e-451': 'ANL-E-451',
-    'anl-e-452': 'ANL-E-452',
-    'anl-e-453': 'ANL-E-453',
-    'anl-e-458': 'ANL-E-458',
-    'anl-e-460': 'ANL-E-460',
-    'anl-e-462': 'ANL-E-462',
-    'anl-e-590x': 'ANL-E-590x',
-    'anl-e-603': 'ANL-E-603',
-    'anl-e-613': 'ANL-E-613',
-    'anl-e-636': 'ANL-E-636',
-    'anl-e-714x': 'ANL-E-714x',
-    'anl-e-855x': 'ANL-E-855x',
-    'anl-e-866': 'ANL-E-866',
-    'anl-e-872': 'ANL-E-872',
-    'anl-e-874': 'ANL-E-874',
-    'anl-e-917': 'ANL-E-917',
-    'anl-gammasphere': 'ANL-GAMMASPHERE',
-    'anl-leppex': 'ANL-LEPPEX',
-    'antares': 'ANTARES',
-    'apex': 'APEX',
-    'archeops': 'ARCHEOPS',
-    'ardm': 'ArDM',
-    'argo-ybj': 'ARGO-YBJ',
-    'arianna': 'ARIANNA',
-    'asas': 'ASAS',
-    'asca': 'ASCA',
-    'ashra': 'ASHRA',
-    'ast/ro': 'AST/RO',
-    'jlab-e-04-001': 'JLAB-E-04-001',
-    'jeffersonlab': 'Jefferson Lab',
-    'astro': 'Astro',
-    'cro': 'CRO',
-    'astrod': 'ASTROD',
-    'astrod-gw': 'ASTROD-GW',
-    'atca': 'ATCA',
-    'atic': 'ATIC',
-    'auger': 'AUGER',
-    'auriga': 'AURIGA',
-    'baikal': 'BAIKAL',
-    'baikal-gvd': 'BAIKAL-GVD',
-    'baobab': 'BAOBAB',
-    'barsport': 'BARSPORT',
-    'bates-blast': 'BATES-BLAST',
-    'bates-e-94-11': 'BATES-E-94-11',
-    'bates-oops': 'BATES-OOPS',
-    'batse': 'BATSE',
-    'bbo': 'BBO',
-    'bepc-bes': 'BEPC-BES',
-    'bepc-bes-i': 'BEPC-BES-I',
-    'bepc-bes-ii': 'BEPC-BES-II',
-    'bepc-bes-iii': 'BEPC-BES-III',
-    'bepposax': 'BEPPOSAX',
-    'bess': 'BESS',
-    'bess-polar': 'BESS-Polar',
-    'bicep1': 'BICEP1',
-    'bicep2': 'BICEP2',
-    'bigboss': 'BigBoss',
-    'bima': 'BIMA',
-    'bingo': 'BINGO',
-    'bnl-atf-visa': 'BNL-ATF-VISA',
-    'bnl-e-0427': 'BNL-E-0427',
-    'bnl-e-0524': 'BNL-E-0524',
-    'bnl-e-0532': 'BNL-E-0532',
-    'bnl-e-0546': 'BNL-E-0546',
-    'bnl-e-0557': 'BNL-E-0557',
-    'bnl-e-0594': 'BNL-E-0594',
-    'bnl-e-0596': 'BNL-E-0596',
-    'bnl-e-0597': 'BNL-E-0597',
-    'bnl-e-0598': 'BNL-E-0598',
-    'bnl-e-0601': 'BNL-E-0601',
-    'bnl-e-0605': 'BNL-E-0605',
-    'bnl-e-0613': 'BNL-E-0613',
-    'bnl-e-0614': 'BNL-E-0614',
-    'bnl-e-0615': 'BNL-E-0615',
-    'bnl-e-0618': 'BNL-E-0618',
-    'bnl-e-0626': 'BNL-E-0626',
-    'bnl-e-0629': 'BNL-E-0629',
-    'bnl-e-0631': 'BNL-E-0631',
-    'bnl-e-0632': 'BNL-E-0632',
-    'bnl-e-0634': 'BNL-E-0634',
-    'bnl-e-0639': 'BNL-E-0639',
-    'bnl-e-0641': 'BNL-E-0641',
-    'bnl-e-0643': 'BNL-E-0643',
-    'bnl-e-0644': 'BNL-E-0644',
-    'bnl-e-0646': 'BNL-E-0646',
-    'bnl-e-0647': 'BNL-E-0647',
-    'bnl-e-0650': 'BNL-E-0650',
-    'bnl-e-0652': 'BNL-E-0652',
-    'bnl-e-0654': 'BNL-E-0654',
-    'bnl-e-0656': 'BNL-E-0656',
-    'bnl-e-0658': 'BNL-E-0658',
-    'bnl-e-0660': 'BNL-E-0660',
-    'bnl-e-0661': 'BNL-E-0661',
-    'bnl-e-0662': 'BNL-E-0662',
-    'bnl-e-0664': 'BNL-E-0664',
-    'bnl-e-0666': 'BNL-E-0666',
-    'bnl-e-0669': 'BNL-E-0669',
-    'bnl-e-0673/593': 'BNL-E-0673/593',
-    'bnl-e-0675': 'BNL-E-0675',
-    'bnl-e-0676': 'BNL-E-0676',
-    'bnl-e-0679': 'BNL-E-0679',
-    'bnl-e-0682': 'BNL-E-0682',
-    'bnl-e-0686': 'BNL-E-0686',
-    'bnl-e-0687': 'BNL-E-0687',
-    'bnl-e-0688': 'BNL-E-0688',
-    'bnl-e-0691': 'BNL-E-0691',
-    'bnl-e-0692': 'BNL-E-0692',
-    'bnl-e-0693': 'BNL-E-0693',
-    'bnl-e-0694': 'BNL-E-0694',
-    'bnl-e-0696': 'BNL-E-0696',
-    'bnl-e-0698': 'BNL-E-0698',
-    'bnl-e-0701': 'BNL-E-0701',
-    'bnl-e-0702': 'BNL-E-0702',
-    'bnl-e-0703': 'BNL-E-0703',
-    'bnl-e-0704': 'BNL-E-0704',
-    'bnl-e-0705': 'BNL-E-0705',
-    'bnl-e-0706': 'BNL-E-0706',
-    'bnl-e-0708': 'BNL-E-0708',
-    'bnl-e-0712': 'BNL-E-0712',
-    'bnl-e-0715': 'BNL-E-0715',
-    'bnl-e-0716': 'BNL-E-0716',
-    'bnl-e-0717': 'BNL-E-0717',
-    'bnl-e-0718': 'BNL-E-0718',
-    'bnl-e-0719': 'BNL-E-0719',
-    'bnl-e-0720': 'BNL-E-0720',
-    'bnl-e-0721': 'BNL-E-0721',
-    'bnl-e-0722': 'BNL-E-0722',
-    'bnl-e-0723': 'BNL-E-0723',
-    'bnl-e-0726': 'BNL-E-0726',
-    'bnl-e-0728': 'BNL-E-0728',
-    'bnl-e-0730': 'BNL-E-0730',
-    'bnl-e-0732': 'BNL-E-0732',
-    'bnl-e-0733': 'BNL-E-0733',
-    'bnl-e-0734': 'BNL-E-0734',
-    'bnl-e-0735': 'BNL-E-0735',
-    'bnl-e-0737': 'BNL-E-0737',
-    'bnl-e-0738': 'BNL-E-0738',
-    'bnl-e-0739': 'BNL-E-0739',
-    'bnl-e-0742': 'BNL-E-0742',
-    'bnl-e-0744': 'BNL-E-0744',
-    'bnl-e-0745': 'BNL-E-0745',
-    'bnl-e-0746': 'BNL-E-0746',
-    'bnl-e-0747': 'BNL-E-0747',
-    'bnl-e-0748': 'BNL-E-0748',
-    'bnl-e-0749': 'BNL-E-0749',
-    'bnl-e-0751': 'BNL-E-0751',
-    'bnl-e-0752': 'BNL-E-0752',
-    'bnl-e-0754': 'BNL-E-0754',
-    'bnl-e-0755': 'BNL-E-0755',
-    'bnl-e-0758': 'BNL-E-0758',
-    'bnl-e-0759': 'BNL-E-0759',
-    'bnl-e-0760': 'BNL-E-0760',
-    'bnl-e-0762': 'BNL-E-0762',
-    'bnl-e-0766': 'BNL-E-0766',
-    'bnl-e-0767': 'BNL-E-0767',
-    'bnl-e-0769': 'BNL-E-0769',
-    'bnl-e-0771': 'BNL-E-0771',
-    'bnl-e-0772': 'BNL-E-0772',
-    'bnl-e-0773': 'BNL-E-0773',
-    'bnl-e-0774': 'BNL-E-0774',
-    'bnl-e-0775': 'BNL-E-0775',
-    'bnl-e-0776': 'BNL-E-0776',
-    'bnl-e-0777': 'BNL-E-0777',
-    'bnl-e-0778': 'BNL-E-0778',
-    'bnl-e-0779': 'BNL-E-0779',
-    'bnl-e-0780': 'BNL-E-0780',
-    'bnl-e-0781': 'BNL-E-0781',
-    'bnl-e-0782': 'BNL-E-0782',
-    'bnl-e-0785': 'BNL-E-0785',
-    'bnl-e-0787': 'BNL-E-0787',
-    'bnl-e-0788': 'BNL-E-0788',
-    'bnl-e-0789': 'BNL-E-0789',
-    'bnl-e-0790': 'BNL-E-0790',
-    'bnl-e-0791': 'BNL-E-0791',
-    'bnl-e-0793': 'BNL-E-0793',
-    'bnl-e-0794': 'BNL-E-0794',
-    'bnl-e-0795': 'BNL-E-0795',
-    'bnl-e-0798': 'BNL-E-0798',
-    'bnl-e-0801': 'BNL-E-0801',
-    'bnl-e-0802': 'BNL-E-0802',
-    'bnl-e-0804': 'BNL-E-0804',
-    'bnl-e-0805': 'BNL-E-0805',
-    'bnl-e-0806': 'BNL-E-0806',
-    'bnl-e-0808': 'BNL-E-0808',
-    'bnl-e-0810': 'BNL-E-0810',
-    'bnl-e-0811': 'BNL-E-0811',
-    'bnl-e-0813': 'BNL-E-0813',
-    'bnl-e-0814': 'BNL-E-0814',
-    'bnl-e-0815': 'BNL-E-0815',
-    'bnl-e-0816': 'BNL-E-0816',
-    'bnl-e-0817': 'BNL-E-0817',
-    'bnl-e-0818': 'BNL-E-0818',
-    'bnl-e-0820': 'BNL-E-0820',
-    'bnl-e-0821': 'BNL-E-0821',
-    'bnl-e-0825': 'BNL-E-0825',
-    'bnl-e-0826': 'BNL-E-0826',
-    'bnl-e-0828': 'BNL-E-0828',
-    'bnl-e-0829': 'BNL-E-0829',
-    'bnl-e-0831': 'BNL-E-0831',
-    'bnl-e-0834': 'BNL-E-0834',
-    'bnl-e-0835': 'BNL-E-0835',
-    'bnl-e-0836': 'BNL-E-0836',
-    'bnl-e-0838': 'BNL-E-0838',
-    'bnl-e-0839': 'BNL-E-0839',
-    'bnl-e-0840': 'BNL-E-0840',
-    'bnl-e-0841': 'BNL-E-0841',
-    'bnl-e-0842': 'BNL-E-0842',
-    'bnl-e-0844': 'BNL-E-0844',
-    'bnl-e-0845': 'BNL-E-0845',
-    'bnl-e-0847': 'BNL-E-0847',
-    'bnl-e-0849': 'BNL-E-0849',
-    'bnl-e-0850': 'BNL-E-0850',
-    'bnl-e-0851': 'BNL-E-0851',
-    'bnl-e-0852': 'BNL-E-0852',
-    'bnl-e-0854': 'BNL-E-0854',
-    'bnl-e-0855': 'BNL-E-0855',
-    'bnl-e-0856': 'BNL-E-0856',
-    'bnl-e-0857': 'BNL-E-0857',
-    'bnl-e-0858': 'BNL-E-0858',
-    'bnl-e-0859': 'BNL-E-0859',
-    'bnl-e-0863': 'BNL-E-0863',
-    'bnl-e-0864': 'BNL-E-0864',
-    'bnl-e-0865': 'BNL-E-0865',
-    'bnl-e-0866': 'BNL-E-0866',
-    'bnl-e-0868': 'BNL-E-0868',
-    'bnl-e-0869': 'BNL-E-0869',
-    'bnl-e-0871': 'BNL-E-0871',
-    'bnl-e-0874': 'BNL-E-0874',
-    'bnl-e-0875': 'BNL-E-0875',
-    'bnl-e-0876': 'BNL-E-0876',
-    'bnl-e-0877': 'BNL-E-0877',
-    'bnl-e-0878': 'BNL-E-0878',
-    'bnl-e-0880': 'BNL-E-0880',
-    'bnl-e-0881': 'BNL-E-0881',
-    'bnl-e-0882': 'BNL-E-0882',
-    'bnl-e-0885': 'BNL-E-0885',
-    'bnl-e-0886': 'BNL-E-0886',
-    'bnl-e-0887': 'BNL-E-0887',
-    'bnl-e-0888': 'BNL-E-0888',
-    'bnl-e-0889': 'BNL-E-0889',
-    'bnl-e-0890': 'BNL-E-0890',
-    'bnl-e-0891': 'BNL-E-0891',
-    'bnl-e-0892': 'BNL-E-0892',
-    'bnl-e-0893': 'BNL-E-0893',
-    'bnl-e-0895': 'BNL-E-0895',
-    'bnl-e-0896': 'BNL-E-0896',
-    'bnl-e-0898': 'BNL-E-0898',
-    'bnl-e-0900': 'BNL-E-0900',
-    'bnl-e-0903': 'BNL-E-0903',
-    'bnl-e-0904': 'BNL-E-0904',
-    'bnl-e-0905': 'BNL-E-0905',
-    'bnl-e-0906': 'BNL-E-0906',
-    'bnl-e-0907': 'BNL-E-0907',
-    'bnl-e-0909': 'BNL-E-0909',
-    'bnl-e-0910': 'BNL-E-0910',
-    'bnl-e-0913-914': 'BNL-E-0913-914',
-    'bnl-e-0917': 'BNL-E-0917',
-    'bnl-e-0923': 'BNL-E-0923',
-    'bnl-e-0924': 'BNL-E-0924',
-    'bnl-e-0926': 'BNL-E-0926',
-    'bnl-e-0931': 'BNL-E-0931',
-    'bnl-e-0935': 'BNL-E-0935',
-    'bnl-e-0940': 'BNL-E-0940',
-    'bnl-e-0941': 'BNL-E-0941',
-    'bnl-e-0949': 'BNL-E-0949',
-    'bnl-e-0952': 'BNL-E-0952',
-    'bnl-edm': 'BNL-EDM',
-    'bnl-ifel': 'BNL-IFEL',
-    'bnl-legs': 'BNL-LEGS',
-    'bnl-rhic-andy': 'BNL-RHIC-ANDY',
-    'bnl-rhic-brahms': 'BNL-RHIC-BRAHMS',
-    'bnl-rhic-phenix': 'BNL-RHIC-PHENIX',
-    'bnl-rhic-phobos': 'BNL-RHIC-PHOBOS',
-    'bnl-rhic-pp2pp': 'BNL-RHIC-PP2PP',
-    'bnl-rhic-star': 'BNL-RHIC-STAR',
-    'bnl-rhic-zcal': 'BNL-RHIC-ZCAL',
-    'bnl-smith-purcell': 'BNL-SMITH-PURCELL',
-    'bnl-stella': 'BNL-STELLA',
-    'bnl-us-atlas': 'BNL-US-ATLAS',
-    'bonn-elsa-crystal-barrel': 'BONN-ELSA-CRYSTAL-BARREL',
-    'bonn-elsa-gdh': 'BONN-ELSA-GDH',
-    'bonn-elsa-saphir': 'BONN-ELSA-SAPHIR',
-    'boomerang': 'BOOMERANG',
-    'borexino': 'BOREXINO',
-    'boss': 'BOSS',
-    'calet': 'CALET',
-    'calice': 'CALICE',
-    'canada-france-hawaiitelescopelegacysurvey': 'Canada-France-Hawaii Telescope Legacy Survey',
-    'candels': 'CANDELS',
-    'cangaroo': 'CANGAROO',
-    'caprice': 'CAPRICE',
-    'caprice-2': 'CAPRICE-2',
-    'captain': 'CAPTAIN',
-    'carnegiesupernovaproject': 'Carnegie Supernova Project',
-    'carnegiesupernovaprojectii': 'Carnegie Supernova Project II',
-    'casa-mia': 'CASA-MIA',
-    'cat': 'CAT',
-    'cbi': 'CBI',
-    'ccat': 'CCAT',
-    'cdex': 'CDEX',
-    'cdms': 'CDMS',
-    'cdms-ii': 'CDMS-II',
-    'celeste': 'CELESTE',
-    'celsius/wasa': 'CELSIUS/WASA',
-    'cern-aegis': 'CERN-AEgIS',
-    'cern-alpha': 'CERN-ALPHA',
-    'cern-asacusa': 'CERN-ASACUSA',
-    'cern-athena': 'CERN-ATHENA',
-    'cern-atrap': 'CERN-ATRAP',
-    'cern-base': 'CERN-BASE',
-    'cern-cast': 'CERN-CAST',
-    'cern-cngs': 'CERN-CNGS',
-    'cern-cosmolep': 'CERN-COSMOLEP',
-    'cern-emu-001': 'CERN-EMU-001',
-    'cern-emu-002': 'CERN-EMU-002',
-    'cern-emu-003': 'CERN-EMU-003',
-    'cern-emu-004': 'CERN-EMU-004',
-    'cern-emu-005': 'CERN-EMU-005',
-    'cern-emu-006': 'CERN-EMU-006',
-    'cern-emu-007': 'CERN-EMU-007',
-    'cern-emu-008': 'CERN-EMU-008',
-    'cern-emu-009': 'CERN-EMU-009',
-    'cern-emu-010': 'CERN-EMU-010',
-    'cern-emu-011': 'CERN-EMU-011',
-    'cern-emu-012': 'CERN-EMU-012',
-    'cern-emu-013': 'CERN-EMU-013',
-    'cern-emu-014': 'CERN-EMU-014',
-    'cern-emu-015': 'CERN-EMU-015',
-    'cern-emu-016': 'CERN-EMU-016',
-    'cern-emu-017': 'CERN-EMU-017',
-    'cern-emu-018': 'CERN-EMU-018',
-    'cern-emu-019': 'CERN-EMU-019',
-    'cern-emu-020': 'CERN-EMU-020',
-    'cern-is-010': 'CERN-IS-010',
-    'cern-is-021': 'CERN-IS-021',
-    'cern-is-300': 'CERN-IS-300',
-    'cern-is-301': 'CERN-IS-301',
-    'cern-is-346': 'CERN-IS-346',
-    'cern-is-378': 'CERN-IS-378',
-    'cern-isolde': 'CERN-ISOLDE',
-    'cern-isolde-rex': 'CERN-ISOLDE-REX',
-    'cern-isoltrap': 'CERN-ISOLTRAP',
-    'cern-lep-05': 'CERN-LEP-05',
-    'cern-lep-06': 'CERN-LEP-06',
-    'cern-lep-aleph': 'CERN-LEP-ALEPH',
-    'cern-lep-delphi': 'CERN-LEP-DELPHI',
-    'cern-lep-l3': 'CERN-LEP-L3',
-    'cern-lep-opal': 'CERN-LEP-OPAL',
-    'cern-lhc-alice': 'CERN-LHC-ALICE',
-    'cern-lhc-atlas': 'CERN-LHC-ATLAS',
-    'cern-lhc-cms': 'CERN-LHC-CMS',
-    'cern-lhc-felix': 'CERN-LHC-FELIX',
-    'cern-lhc-fp420': 'CERN-LHC-FP420',
-    'cern-lhc-hv-qf': 'CERN-LHC-HV-QF',
-    'cern-lhc-lhcb': 'CERN-LHC-LHCb',
-    'cern-lhc-lhcf': 'CERN-LHC-LHCf',
-    'cern-lhc-moedal': 'CERN-LHC-MOEDAL',
-    'cern-lhc-totem': 'CERN-LHC-TOTEM',
-    'cern-mistral': 'CERN-MISTRAL',
-    'cern-na-001': 'CERN-NA-001',
-    'cern-na-002': 'CERN-NA-002',
-    'cern-na-003': 'CERN-NA-003',
-    'cern-na-004': 'CERN-NA-004',
-    'cern-na-005': 'CERN-NA-005',
-    'cern-na-006': 'CERN-NA-006',
-    'cern-na-007': 'CERN-NA-007',
-    'cern-na-008': 'CERN-NA-008',
-    'cern-na-009': 'CERN-NA-009',
-    'cern-na-010': 'CERN-NA-010',
-    'cern-na-011': 'CERN-NA-011',
-    'cern-na-012': 'CERN-NA-012',
-    'cern-na-012-2': 'CERN-NA-012-2',
-    'cern-na-013': 'CERN-NA-013',
-    'cern-na-014': 'CERN-NA-014',
-    'cern-na-014-2': 'CERN-NA-014-2',
-    'cern-na-015': 'CERN-NA-015',
-    'cern-na-016': 'CERN-NA-016',
-    'cern-na-017': 'CERN-NA-017',
-    'cern-na-018': 'CERN-NA-018',
-    'cern-na-019': 'CERN-NA-019',
-    'cern-na-020': 'CERN-NA-020',
-    'cern-na-022': 'CERN-NA-022',
-    'cern-na-023': 'CERN-NA-023',
-    'cern-na-024': 'CERN-NA-024',
-    'cern-na-025': 'CERN-NA-025',
-    'cern-na-027': 'CERN-NA-027',
-    'cern-na-028': 'CERN-NA-028',
-    'cern-na-029': 'CERN-NA-029',
-    'cern-na-030': 'CERN-NA-030',
-    'cern-na-031': 'CERN-NA-031',
-    'cern-na-031-2': 'CERN-NA-031-2',
-    'cern-na-032': 'CERN-NA-032',
-    'cern-na-033': 'CERN-NA-033',
-    'cern-na-034': 'CERN-NA-034',
-    'cern-na-034-2': 'CERN-NA-034-2',
-    'cern-na-034-3': 'CERN-NA-034-3',
-    'cern-na-035': 'CERN-NA-035',
-    'cern-na-036': 'CERN-NA-036',
-    'cern-na-037': 'CERN-NA-037',
-    'cern-na-038': 'CERN-NA-038',
-    'cern-na-039': 'CERN-NA-039',
-    'cern-na-040': 'CERN-NA-040',
-    'cern-na-041': 'CERN-NA-041',
-    'cern-na-042': 'CERN-NA-042',
-    'cern-na-043': 'CERN-NA-043',
-    'cern-na-043-2': 'CERN-NA-043-2',
-    'cern-na-044': 'CERN-NA-044',
-    'cern-na-045': 'CERN-NA-045',
-    'cern-na-045-2': 'CERN-NA-045-2',
-    'cern-na-046': 'CERN-NA-046',
-    'cern-na-047': 'CERN-NA-047',
-    'cern-na-048': 'CERN-NA-048',
-    'cern-na-048-1': 'CERN-NA-048-1',
-    'cern-na-048-2': 'CERN-NA-048-2',
-    'cern-na-049': 'CERN-NA-049',
-    'cern-na-050': 'CERN-NA-050',
-    'cern-na-051': 'CERN-NA-051',
-    'cern-na-052': 'CERN-NA-052',
-    'cern-na-053': 'CERN-NA-053',
-    'cern-na-054': 'CERN-NA-054',
-    'cern-na-055': 'CERN-NA-055',
-    'cern-na-056': 'CERN-NA-056',
-    'cern-na-057': 'CERN-NA-057',
-    'cern-na-058': 'CERN-NA-058',
-    'cern-na-059': 'CERN-NA-059',
-    'cern-na-060': 'CERN-NA-060',
-    'cern-na-061': 'CERN-NA-061',
-    'cern-na-062': 'CERN-NA-062',
-    'cern-ntof': 'CERN-nTOF',
-    'cern-ps-097': 'CERN-PS-097',
-    'cern-ps-130': 'CERN-PS-130',
-    'cern-ps-131': 'CERN-PS-131',
-    'cern-ps-132': 'CERN-PS-132',
-    'cern-ps-134': 'CERN-PS-134',
-    'cern-ps-135': 'CERN-PS-135',
-    'cern-ps-136': 'CERN-PS-136',
-    'cern-ps-137': 'CERN-PS-137',
-    'cern-ps-140': 'CERN-PS-140',
-    'cern-ps-141': 'CERN-PS-141',
-    'cern-ps-142': 'CERN-PS-142',
-    'cern-ps-143': 'CERN-PS-143',
-    'cern-ps-144': 'CERN-PS-144',
-    'cern-ps-147': 'CERN-PS-147',
-    'cern-ps-149': 'CERN-PS-149',
-    'cern-ps-150': 'CERN-PS-150',
-    'cern-ps-151': 'CERN-PS-151',
-    'cern-ps-152': 'CERN-PS-152',
-    'cern-ps-153': 'CERN-PS-153',
-    'cern-ps-154': 'CERN-PS-154',
-    'cern-ps-155': 'CERN-PS-155',
-    'cern-ps-156': 'CERN-PS-156',
-    'cern-ps-157': 'CERN-PS-157',
-    'cern-ps-158': 'CERN-PS-158',
-    'cern-ps-159': 'CERN-PS-159',
-    'cern-ps-160': 'CERN-PS-160',
-    'cern-ps-161': 'CERN-PS-161',
-    'cern-ps-162': 'CERN-PS-162',
-    'cern-ps-163-1': 'CERN-PS-163-1',
-    'cern-ps-163-2': 'CERN-PS-163-2',
-    'cern-ps-164': 'CERN-PS-164',
-    'cern-ps-165': 'CERN-PS-165',
-    'cern-ps-166': 'CERN-PS-166',
-    'cern-ps-167': 'CERN-PS-167',
-    'cern-ps-168': 'CERN-PS-168',
-    'cern-ps-169': 'CERN-PS-169',
-    'cern-ps-170': 'CERN-PS-170',
-    'cern-ps-171': 'CERN-PS-171',
-    'cern-ps-172': 'CERN-PS-172',
-    'cern-ps-173': 'CERN-PS-173',
-    'cern-ps-174': 'CERN-PS-174',
-    'cern-ps-175': 'CERN-PS-175',
-    'cern-ps-176': 'CERN-PS-176',
-    'cern-ps-177': 'CERN-PS-177',
-    'cern-ps-178': 'CERN-PS-178',
-    'cern-ps-179': 'CERN-PS-179',
-    'cern-ps-180': 'CERN-PS-180',
-    'cern-ps-181': 'CERN-PS-181',
-    'cern-ps-182': 'CERN-PS-182',
-    'cern-ps-183': 'CERN-PS-183',
-    'cern-ps-184': 'CERN-PS-184',
-    'cern-ps-185': 'CERN-PS-185',
-    'cern-ps-185-2': 'CERN-PS-185-2',
-    'cern-ps-185-3': 'CERN-PS-185-3',
-    'cern-ps-186': 'CERN-PS-186',
-    'cern-ps-187': 'CERN-PS-187',
-    'cern-ps-188': 'CERN-PS-188',
-    'cern-ps-189': 'CERN-PS-189',
-    'cern-ps-191': 'CERN-PS-191',
-    'cern-ps-192': 'CERN-PS-192',
-    'cern-ps-194': 'CERN-PS-194',
-    'cern-ps-194-2': 'CERN-PS-194-2',
-    'cern-ps-194-3': 'CERN-PS-194-3',
-    'cern-ps-195': 'CERN-PS-195',
-    'cern-ps-196': 'CERN-PS-196',
-    'cern-ps-197': 'CERN-PS-197',
-    'cern-ps-198': 'CERN-PS-198',
-    'cern-ps-199': 'CERN-PS-199',
-    'cern-ps-200': 'CERN-PS-200',
-    'cern-ps-201': 'CERN-PS-201',
-    'cern-ps-202': 'CERN-PS-202',
-    'cern-ps-203': 'CERN-PS-203',
-    'cern-ps-204': 'CERN-PS-204',
-    'cern-ps-205': 'CERN-PS-205',
-    'cern-ps-206': 'CERN-PS-206',
-    'cern-ps-207': 'CERN-PS-207',
-    'cern-ps-208': 'CERN-PS-208',
-    'cern-ps-209': 'CERN-PS-209',
-    'cern-ps-210': 'CERN-PS-210',
-    'cern-ps-211': 'CERN-PS-211',
-    'cern-ps-212': 'CERN-PS-212',
-    'cern-ps-214': 'CERN-PS-214',
-    'cern-r-107': 'CERN-R-107',
-    'cern-r-108': 'CERN-R-108',
-    'cern-r-109': 'CERN-R-109',
-    'cern-r-110': 'CERN-R-110',
-    'cern-r-207': 'CERN-R-207',
-    'cern-r-208': 'CERN-R-208',
-    'cern-r-209': 'CERN-R-209',
-    'cern-r-210': 'CERN-R-210',
-    'cern-r-211': 'CERN-R-211',
-    'cern-r-301': 'CERN-R-301',
-    'cern-r-401': 'CERN-R-401',
-    'cern-r-406': 'CERN-R-406',
-    'cern-r-407/408': 'CERN-R-407/408',
-    'cern-r-410/413': 'CERN-R-410/413',
-    'cern-r-411': 'CERN-R-411',
-    'cern-r-414': 'CERN-R-414',
-    'cern-r-415': 'CERN-R-415',
-    'cern-r-416': 'CERN-R-416',
-    'cern-r-417': 'CERN-R-417',
-    'cern-r-418': 'CERN-R-418',
-    'cern-r-419': 'CERN-R-419',
-    'cern-r-420': 'CERN-R-420',
-    'cern-r-421': 'CERN-R-421',
-    'cern-r-422': 'CERN-R-422',
-    'cern-r-501': 'CERN-R-501',
-    'cern-r-605': 'CERN-R-605',
-    'cern-r-606': 'CERN-R-606',
-    'cern-r-607': 'CERN-R-607',
-    'cern-r-608': 'CERN-R-608',
-    'cern-r-702': 'CERN-R-702',
-    'cern-r-703': 'CERN-R-703',
-    'cern-r-704': 'CERN-R-704',
-    'cern-r-804': 'CERN-R-804',
-    'cern-r-805': 'CERN-R-805',
-    'cern-r-806': 'CERN-R-806',
-    'cern-r-807': 'CERN-R-807',
-    'cern-r-808': 'CERN-R-808',
-    'cern-rd-008': 'CERN-RD-008',
-    'cern-rd-011': 'CERN-RD-011',
-    'cern-rd-012': 'CERN-RD-012',
-    'cern-rd-013': 'CERN-RD-013',
-    'cern-rd-018': 'CERN-RD-018',
-    'cern-rd-027': 'CERN-RD-027',
-    'cern-rd-039': 'CERN-RD-039',
-    'cern-rd-042': 'CERN-RD-042',
-    'cern-rd-044': 'CERN-RD-044',
-    'cern-rd-045': 'CERN-RD-045',
-    'cern-rd-046': 'CERN-RD-046',
-    'cern-rd-048': 'CERN-RD-048',
-    'cern-rd-049': 'CERN-RD-049',
-    'cern-rd-050': 'CERN-RD-050',
-    'cern-sc-065': 'CERN-SC-065',
-    'cern-sc-076': 'CERN-SC-076',
-    'cern-sc-077': 'CERN-SC-077',
-    'cern-sc-093': 'CERN-SC-093',
-    'cern-sc-094': 'CERN-SC-094',
-    'cern-sps-ship': 'CERN-SPS-SHIP',
-    'cern-t-209': 'CERN-T-209',
-    'cern-t-224': 'CERN-T-224',
-    'cern-t-227': 'CERN-T-227',
-    'cern-t-237': 'CERN-T-237',
-    'cern-t-239': 'CERN-T-239',
-    'cern-t-243': 'CERN-T-243',
-    'cern-t-245': 'CERN-T-245',
-    'cern-t-246/248': 'CERN-T-246/248',
-    'cern-t-250': 'CERN-T-250',
-    'cern-tosca': 'CERN-TOSCA',
-    'cern-ua-001': 'CERN-UA-001',
-    'cern-ua-002': 'CERN-UA-002',
-    'cern-ua-003': 'CERN-UA-003',
-    'cern-ua-004': 'CERN-UA-004',
-    'cern-ua-004-2': 'CERN-UA-004-2',
-    'cern-ua-005': 'CERN-UA-005',
-    'cern-ua-005-2': 'CERN-UA-005-2',
-    'cern-ua-006': 'CERN-UA-006',
-    'cern-ua-007': 'CERN-UA-007',
-    'cern-ua-008': 'CERN-UA-008',
-    'cern-wa-001': 'CERN-WA-001',
-    'cern-wa-001-2': 'CERN-WA-001-2',
-    'cern-wa-002': 'CERN-WA-002',
-    'cern-wa-003': 'CERN-WA-003',
-    'cern-wa-004': 'CERN-WA-004',
-    'cern-wa-006': 'CERN-WA-006',
-    'cern-wa-007': 'CERN-WA-007',
-    'cern-wa-009': 'CERN-WA-009',
-    'cern-wa-010': 'CERN-WA-010',
-    'cern-wa-011': 'CERN-WA-011',
-    'cern-wa-012': 'CERN-WA-012',
-    'cern-wa-013': 'CERN-WA-013',
-    'cern-wa-014': 'CERN-WA-014',
-    'cern-wa-016': 'CERN-WA-016',
-    'cern-wa-017': 'CERN-WA-017',
-    'cern-wa-018': 'CERN-WA-018',
-    'cern-wa-018-2': 'CERN-WA-018-2',
-    'cern-wa-019': 'CERN-WA-019',
-    'cern-wa-020': 'CERN-WA-020',
-    'cern-wa-021': 'CERN-WA-021',
-    'cern-wa-024': 'CERN-WA-024',
-    'cern-wa-025': 'CERN-WA-025',
-    'cern-wa-026': 'CERN-WA-026',
-    'cern-wa-027': 'CERN-WA-027',
-    'cern-wa-028': 'CERN-WA-028',
-    'cern-wa-029': 'CERN-WA-029',
-    'cern-wa-030': 'CERN-WA-030',
-    'cern-wa-031': 'CERN-WA-031',
-    'cern-wa-032': 'CERN-WA-032',
-    'cern-wa-033': 'CERN-WA-033',
-    'cern-wa-034': 'CERN-WA-034',
-    'cern-wa-035': 'CERN-WA-035',
-    'cern-wa-038': 'CERN-WA-038',
-    'cern-wa-039': 'CERN-WA-039',
-    'cern-wa-040': 'CERN-WA-040',
-    'cern-wa-041': 'CERN-WA-041',
-    'cern-wa-042': 'CERN-WA-042',
-    'cern-wa-043': 'CERN-WA-043',
-    'cern-wa-044': 'CERN-WA-044',
-    'cern-wa-045': 'CERN-WA-045',
-    'cern-wa-046': 'CERN-WA-046',
-    'cern-wa-047': 'CERN-WA-047',
-    'cern-wa-048': 'CERN-WA-048',
-    'cern-wa-049': 'CERN-WA-049',
-    'cern-wa-051': 'CERN-WA-051',
-    'cern-wa-052': 'CERN-WA-052',
-    'cern-wa-054': 'CERN-WA-054',
-    'cern-wa-055': 'CERN-WA-055',
-    'cern-wa-056': 'CERN-WA-056',
-    'cern-wa-057': 'CERN-WA-057',
-    'cern-wa-058': 'CERN-WA-058',
-    'cern-wa-059': 'CERN-WA-059',
-    'cern-wa-060': 'CERN-WA-060',
-    'cern-wa-061': 'CERN-WA-061',
-    'cern-wa-062': 'CERN-WA-062',
-    'cern-wa-063': 'CERN-WA-063',
-    'cern-wa-064': 'CERN-WA-064',
-    'cern-wa-065': 'CERN-WA-065',
-    'cern-wa-066': 'CERN-WA-066',
-    'cern-wa-067': 'CERN-WA-067',
-    'cern-wa-068': 'CERN-WA-068',
-    'cern-wa-069': 'CERN-WA-069',
-    'cern-wa-070': 'CERN-WA-070',
-    'cern-wa-071': 'CERN-WA-071',
-    'cern-wa-072': 'CERN-WA-072',
-    'cern-wa-074': 'CERN-WA-074',
-    'cern-wa-075': 'CERN-WA-075',
-    'cern-wa-076': 'CERN-WA-076',
-    'cern-wa-077': 'CERN-WA-077',
-    'cern-wa-078': 'CERN-WA-078',
-    'cern-wa-079': 'CERN-WA-079',
-    'cern-wa-080': 'CERN-WA-080',
-    'cern-wa-081': 'CERN-WA-081',
-    'cern-wa-082': 'CERN-WA-082',
-    'cern-wa-083': 'CERN-WA-083',
-    'cern-wa-084': 'CERN-WA-084',
-    'cern-wa-085': 'CERN-WA-085',
-    'cern-wa-086': 'CERN-WA-086',
-    'cern-wa-087': 'CERN-WA-087',
-    'cern-wa-088': 'CERN-WA-088',
-    'cern-wa-089': 'CERN-WA-089',
-    'cern-wa-090': 'CERN-WA-090',
-    'cern-wa-091': 'CERN-WA-091',
-    'cern-wa-092': 'CERN-WA-092',
-    'cern-wa-093': 'CERN-WA-093',
-    'cern-wa-094': 'CERN-WA-094',
-    'cern-wa-095': 'CERN-WA-095',
-    'cern-wa-096': 'CERN-WA-096',
-    'cern-wa-097': 'CERN-WA-097',
-    'cern-wa-098': 'CERN-WA-098',
-    'cern-wa-099': 'CERN-WA-099',
-    'cern-wa-099-2': 'CERN-WA-099-2',
-    'cern-wa-100': 'CERN-WA-100',
-    'cern-wa-101': 'CERN-WA-101',
-    'cern-wa-102': 'CERN-WA-102',
-    'cesr-cleo': 'CESR-CLEO',
-    'cesr-cleo-ii': 'CESR-CLEO-II',
-    'cesr-cusb': 'CESR-CUSB',
-    'cesr-cusb-ii': 'CESR-CUSB-II',
-    'cgps': 'CGPS',
-    'chandra': 'CHANDRA',
-    'charissa': 'CHARISSA',
-    'chicos': 'CHICOS',
-    'chime': 'CHIME',
-    'chimera': 'CHIMERA',
-    'chooz': 'CHOOZ',
-    'cloud': 'CLOUD',
-    'cmb-s4': 'CMB-S4',
-    'cobe': 'COBE',
-    'cobra': 'COBRA',
-    'codalema': 'CODALEMA',
-    'cogent': 'CoGeNT',
-    'comet': 'COMET',
-    'comptel': 'COMPTEL',
-    'constellationx': 'Constellation X',
-    'corot': 'COROT',
-    'cosmos': 'COSMOS',
-    'cosy-11': 'COSY-11',
-    'cosy-anke': 'COSY-ANKE',
-    'cosy-edda': 'COSY-EDDA',
-    'cosy-gem': 'COSY-GEM',
-    'cosy-hires': 'COSY-HIRES',
-    'cosy-momo': 'COSY-MOMO',
-    'cosy-nessi': 'COSY-NESSI',
-    'cosy-pisa': 'COSY-PISA',
-    'cosy-tof': 'COSY-TOF',
-    'coup': 'COUP',
-    'coupp-500': 'COUPP-500',
-    'cream': 'CREAM',
-    'cresst': 'CRESST',
-    'cresst-ii': 'CRESST-II',
-    'cryoedm': 'CryoEDM',
-    'cta': 'CTA',
-    'ctiopi': 'CTIOPI',
-    'cuore': 'CUORE',
-    'cuoricino': 'CUORICINO',
-    'dama': 'DAMA',
-    'damic': 'DAMIC',
-    'dampe': 'DAMPE',
-    'darkside': 'DARKSIDE',
-    'darwin': 'DARWIN',
-    'dasi': 'DASI',
-    'daya-bay': 'DAYA-BAY',
-    'dcba': 'DCBA',
-    'deap-3600': 'DEAP-3600',
-    'dec': 'DEC',
-    'decigo': 'DECIGO',
-    'deep2': 'DEEP2',
-    'demon': 'DEMON',
-    'des': 'DES',
-    'desi': 'DESI',
-    'desy-094': 'DESY-094',
-    'desy-114': 'DESY-114',
-    'desy-115': 'DESY-115',
-    'desy-119': 'DESY-119',
-    'desy-125': 'DESY-125',
-    'desy-126': 'DESY-126',
-    'desy-129': 'DESY-129',
-    'desy-136': 'DESY-136',
-    'desy-137': 'DESY-137',
-    'desy-138': 'DESY-138',
-    'desy-139': 'DESY-139',
-    'desy-140': 'DESY-140',
-    'desy-141': 'DESY-141',
-    'desy-142': 'DESY-142',
-    'desy-143': 'DESY-143',
-    'desy-144': 'DESY-144',
-    'desy-145': 'DESY-145',
-    'desy-146': 'DESY-146',
-    'desy-147': 'DESY-147',
-    'desy-alps': 'DESY-ALPS',
-    'desy-doris-argus': 'DESY-DORIS-ARGUS',
-    'desy-doris-crystal-ball': 'DESY-DORIS-CRYSTAL-BALL',
-    'desy-doris-lena': 'DESY-DORIS-LENA',
-    'desy-hera-b': 'DESY-HERA-B',
-    'desy-hera-h1': 'DESY-HERA-H1',
-    'desy-hera-hermes': 'DESY-HERA-HERMES',
-    'desy-hera-zeus': 'DESY-HERA-ZEUS',
-    'desy-petra-cello': 'DESY-PETRA-CELLO',
-    'desy-petra-jade': 'DESY-PETRA-JADE',
-    'desy-petra-mark-j': 'DESY-PETRA-MARK-J',
-    'desy-petra-pluto': 'DESY-PETRA-PLUTO',
-    'desy-petra-pluto-2': 'DESY-PETRA-PLUTO-2',
-    'desy-petra-tasso': 'DESY-PETRA-TASSO',
-    'dios': 'DIOS',
-    'dls': 'DLS',
-    'dm-ice': 'DM-ICE',
-    'double-chooz': 'DOUBLE-CHOOZ',
-    'drift': 'DRIFT',
-    'dumand': 'DUMAND',
-    'dune': 'DUNE',
-    'eas-top': 'EAS-TOP',
-    'echo': 'ECHO',
-    'edelweiss': 'EDELWEISS',
-    'edelweiss-ii': 'EDELWEISS-II',
-    'edelweiss-iii': 'EDELWEISS-III',
-    'egret': 'EGRET',
-    'elais': 'ELAIS',
-    'elisa': 'eLISA',
-    'emma': 'EMMA',
-    'eros': 'EROS',
-    'essence': 'ESSENCE',
-    'et': 'ET',
-    'euclid': 'EUCLID',
-    'eureca': 'EURECA',
-    'euso': 'EUSO',
-    'exo-200': 'EXO-200',
-    'explorer': 'EXPLORER',
-    'fazia': 'FAZIA',
-    'fermi-lat': 'FERMI-LAT',
-    'figaro': 'FIGARO',
-    'fnal-e-0001': 'FNAL-E-0001',
-    'fnal-e-0002': 'FNAL-E-0002',
-    'fnal-e-0003': 'FNAL-E-0003',
-    'fnal-e-0004': 'FNAL-E-0004',
-    'fnal-e-0007': 'FNAL-E-0007',
-    'fnal-e-0008': 'FNAL-E-0008',
-    'fnal-e-0012': 'FNAL-E-0012',
-    'fnal-e-0014': 'FNAL-E-0014',
-    'fnal-e-0021': 'FNAL-E-0021',
-    'fnal-e-0022': 'FNAL-E-0022',
-    'fnal-e-0025': 'FNAL-E-0025',
-    'fnal-e-0026': 'FNAL-E-0026',
-    'fnal-e-0027': 'FNAL-E-0027',
-    'fnal-e-0028': 'FNAL-E-0028',
-    'fnal-e-0031': 'FNAL-E-0031',
-    'fnal-e-0034': 'FNAL-E-0034',
-    'fnal-e-0036': 'FNAL-E-0036',
-    'fnal-e-0045': 'FNAL-E-0045',
-    'fnal-e-0048': 'FNAL-E-0048',
-    'fnal-e-0051': 'FNAL-E-0051',
-    'fnal-e-0053': 'FNAL-E-0053',
-    'fnal-e-0061': 'FNAL-E-0061',
-    'fnal-e-0063': 'FNAL-E-0063',
-    'fnal-e-0067': 'FNAL-E-0067',
-    'fnal-e-0069': 'FNAL-E-0069',
-    'fnal-e-0070': 'FNAL-E-0070',
-    'fnal-e-0072': 'FNAL-E-0072',
-    'fnal-e-0075': 'FNAL-E-0075',
-    'fnal-e-0076': 'FNAL-E-0076',
-    'fnal-e-0081': 'FNAL-E-0081',
-    'fnal-e-0082': 'FNAL-E-0082',
-    'fnal-e-0086': 'FNAL-E-0086',
-    'fnal-e-0087': 'FNAL-E-0087',
-    'fnal-e-0090': 'FNAL-E-0090',
-    'fnal-e-0095': 'FNAL-E-0095',
-    'fnal-e-0096': 'FNAL-E-0096',
-    'fnal-e-0098': 'FNAL-E-0098',
-    'fnal-e-0099': 'FNAL-E-0099',
-    'fnal-e-0100': 'FNAL-E-0100',
-    'fnal-e-0103': 'FNAL-E-0103',
-    'fnal-e-0104': 'FNAL-E-0104',
-    'fnal-e-0105': 'FNAL-E-0105',
-    'fnal-e-0108': 'FNAL-E-0108',
-    'fnal-e-0110': 'FNAL-E-0110',
-    'fnal-e-0111': 'FNAL-E-0111',
-    'fnal-e-0114': 'FNAL-E-0114',
-    'fnal-e-0115': 'FNAL-E-0115',
-    'fnal-e-0116': 'FNAL-E-0116',
-    'fnal-e-0117': 'FNAL-E-0117',
-    'fnal-e-0118': 'FNAL-E-0118',
-    'fnal-e-0120': 'FNAL-E-0120',
-    'fnal-e-0121': 'FNAL-E-0121',
-    'fnal-e-0125': 'FNAL-E-0125',
-    'fnal-e-0137': 'FNAL-E-0137',
-    'fnal-e-0138': 'FNAL-E-0138',
-    'fnal-e-0141': 'FNAL-E-0141',
-    'fnal-e-0142': 'FNAL-E-0142',
-    'fnal-e-0143': 'FNAL-E-0143',
-    'fnal-e-0147': 'FNAL-E-0147',
-    'fnal-e-0152': 'FNAL-E-0152',
-    'fnal-e-0154': 'FNAL-E-0154',
-    'fnal-e-0155': 'FNAL-E-0155',
-    'fnal-e-0156': 'FNAL-E-0156',
-    'fnal-e-0161': 'FNAL-E-0161',
-    'fnal-e-0163': 'FNAL-E-0163',
-    'fnal-e-0171': 'FNAL-E-0171',
-    'fnal-e-0172': 'FNAL-E-0172',
-    'fnal-e-0177': 'FNAL-E-0177',
-    'fnal-e-0178': 'FNAL-E-0178',
-    'fnal-e-0180': 'FNAL-E-0180',
-    'fnal-e-0181': 'FNAL-E-0181',
-    'fnal-e-0183': 'FNAL-E-0183',
-    'fnal-e-0184': 'FNAL-E-0184',
-    'fnal-e-0186': 'FNAL-E-0186',
-    'fnal-e-0187': 'FNAL-E-0187',
-    'fnal-e-0188': 'FNAL-E-0188',
-    'fnal-e-0189': 'FNAL-E-0189',
-    'fnal-e-0194': 'FNAL-E-0194',
-    'fnal-e-0195': 'FNAL-E-0195',
-    'fnal-e-0196': 'FNAL-E-0196',
-    'fnal-e-0198': 'FNAL-E-0198',
-    'fnal-e-0199': 'FNAL-E-0199',
-    'fnal-e-0202': 'FNAL-E-0202',
-    'fnal-e-0203': 'FNAL-E-0203',
-    'fnal-e-0205': 'FNAL-E-0205',
-    'fnal-e-0209': 'FNAL-E-0209',
-    'fnal-e-0211': 'FNAL-E-0211',
-    'fnal-e-0216': 'FNAL-E-0216',
-    'fnal-e-0217': 'FNAL-E-0217',
-    'fnal-e-0218': 'FNAL-E-0218',
-    'fnal-e-0221': 'FNAL-E-0221',
-    'fnal-e-0226': 'FNAL-E-0226',
-    'fnal-e-0228': 'FNAL-E-0228',
-    'fnal-e-0229': 'FNAL-E-0229',
-    'fnal-e-0230': 'FNAL-E-0230',
-    'fnal-e-0232': 'FNAL-E-0232',
-    'fnal-e-0233': 'FNAL-E-0233',
-    'fnal-e-0234': 'FNAL-E-0234',
-    'fnal-e-0236': 'FNAL-E-0236',
-    'fnal-e-0237': 'FNAL-E-0237',
-    'fnal-e-0238': 'FNAL-E-0238',
-    'fnal-e-0239': 'FNAL-E-0239',
-    'fnal-e-0242': 'FNAL-E-0242',
-    'fnal-e-0243': 'FNAL-E-0243',
-    'fnal-e-0244': 'FNAL-E-0244',
-    'fnal-e-0245': 'FNAL-E-0245',
-    'fnal-e-0247': 'FNAL-E-0247',
-    'fnal-e-0248': 'FNAL-E-0248',
-    'fnal-e-0249': 'FNAL-E-0249',
-    'fnal-e-0250': 'FNAL-E-0250',
-    'fnal-e-0251': 'FNAL-E-0251',
-    'fnal-e-0252': 'FNAL-E-0252',
-    'fnal-e-0253': 'FNAL-E-0253',
-    'fnal-e-0254': 'FNAL-E-0254',
-    'fnal-e-0255': 'FNAL-E-0255',
-    'fnal-e-0258': 'FNAL-E-0258',
-    'fnal-e-0260': 'FNAL-E-0260',
-    'fnal-e-0261': 'FNAL-E-0261',
-    'fnal-e-0262': 'FNAL-E-0262',
-    'fnal-e-0264': 'FNAL-E-0264',
-    'fnal-e-0265': 'FNAL-E-0265',
-    'fnal-e-0268': 'FNAL-E-0268',
-    'fnal-e-0271': 'FNAL-E-0271',
-    'fnal-e-0272': 'FNAL-E-0272',
-    'fnal-e-0275': 'FNAL-E-0275',
-    'fnal-e-0276': 'FNAL-E-0276',
-    'fnal-e-0279': 'FNAL-E-0279',
-    'fnal-e-0280': 'FNAL-E-0280',
-    'fnal-e-0281': 'FNAL-E-0281',
-    'fnal-e-0284': 'FNAL-E-0284',
-    'fnal-e-0285': 'FNAL-E-0285',
-    'fnal-e-0288': 'FNAL-E-0288',
-    'fnal-e-0289': 'FNAL-E-0289',
-    'fnal-e-0290': 'FNAL-E-0290',
-    'fnal-e-0292': 'FNAL-E-0292',
-    'fnal-e-0295': 'FNAL-E-0295',
-    'fnal-e-0297': 'FNAL-E-0297',
-    'fnal-e-0299': 'FNAL-E-0299',
-    'fnal-e-0300': 'FNAL-E-0300',
-    'fnal-e-0305': 'FNAL-E-0305',
-    'fnal-e-0310': 'FNAL-E-0310',
-    'fnal-e-0311': 'FNAL-E-0311',
-    'fnal-e-0313': 'FNAL-E-0313',
-    'fnal-e-0317': 'FNAL-E-0317',
-    'fnal-e-0319': 'FNAL-E-0319',
-    'fnal-e-0320': 'FNAL-E-0320',
-    'fnal-e-0321': 'FNAL-E-0321',
-    'fnal-e-0324': 'FNAL-E-0324',
-    'fnal-e-0325': 'FNAL-E-0325',
-    'fnal-e-0326': 'FNAL-E-0326',
-    'fnal-e-0327': 'FNAL-E-0327',
-    'fnal-e-0328': 'FNAL-E-0328',
-    'fnal-e-0329': 'FNAL-E-0329',
-    'fnal-e-0330': 'FNAL-E-0330',
-    'fnal-e-0331': 'FNAL-E-0331',
-    'fnal-e-0335': 'FNAL-E-0335',
-    'fnal-e-0336': 'FNAL-E-0336',
-    'fnal-e-0337': 'FNAL-E-0337',
-    'fnal-e-0338': 'FNAL-E-0338',
-    'fnal-e-0339': 'FNAL-E-0339',
-    'fnal-e-0340': 'FNAL-E-0340',
-    'fnal-e-0341': 'FNAL-E-0341',
-    'fnal-e-0343': 'FNAL-E-0343',
-    'fnal-e-0344': 'FNAL-E-0344',
-    'fnal-e-0345': 'FNAL-E-0345',
-    'fnal-e-0346': 'FNAL-E-0346',
-    'fnal-e-0350': 'FNAL-E-0350',
-    'fnal-e-0356': 'FNAL-E-0356',
-    'fnal-e-0357': 'FNAL-E-0357',
-    'fnal-e-0358': 'FNAL-E-0358',
-    'fnal-e-0361': 'FNAL-E-0361',
-    'fnal-e-0362': 'FNAL-E-0362',
-    'fnal-e-0363': 'FNAL-E-0363',
-    'fnal-e-0365': 'FNAL-E-0365',
-    'fnal-e-0366': 'FNAL-E-0366',
-    'fnal-e-0369': 'FNAL-E-0369',
-    'fnal-e-0370': 'FNAL-E-0370',
-    'fnal-e-0371': 'FNAL-E-0371',
-    'fnal-e-0373': 'FNAL-E-0373',
-    'fnal-e-0374': 'FNAL-E-0374',
-    'fnal-e-0379': 'FNAL-E-0379',
-    'fnal-e-0380': 'FNAL-E-0380',
-    'fnal-e-0381': 'FNAL-E-0381',
-    'fnal-e-0382': 'FNAL-E-0382',
-    'fnal-e-0383': 'FNAL-E-0383',
-    'fnal-e-0385': 'FNAL-E-0385',
-    'fnal-e-0386': 'FNAL-E-0386',
-    'fnal-e-0387': 'FNAL-E-0387',
-    'fnal-e-0388': 'FNAL-E-0388',
-    'fnal-e-0390': 'FNAL-E-0390',
-    'fnal-e-0391': 'FNAL-E-0391',
-    'fnal-e-0395': 'FNAL-E-0395',
-    'fnal-e-0396': 'FNAL-E-0396',
-    'fnal-e-0397': 'FNAL-E-0397',
-    'fnal-e-0398': 'FNAL-E-0398',
-    'fnal-e-0399': 'FNAL-E-0399',
-    'fnal-e-0400': 'FNAL-E-0400',
-    'fnal-e-0401': 'FNAL-E-0401',
-    'fnal-e-0404': 'FNAL-E-0404',
-    'fnal-e-0415': 'FNAL-E-0415',
-    'fnal-e-0416': 'FNAL-E-0416',
-    'fnal-e-0418': 'FNAL-E-0418',
-    'fnal-e-0419': 'FNAL-E-0419',
-    'fnal-e-0421': 'FNAL-E-0421',
-    'fnal-e-0423': 'FNAL-E-0423',
-    'fnal-e-0424': 'FNAL-E-0424',
-    'fnal-e-0425': 'FNAL-E-0425',
-    'fnal-e-0426': 'FNAL-E-0426',
-    'fnal-e-0427': 'FNAL-E-0427',
-    'fnal-e-0428': 'FNAL-E-0428',
-    'fnal-e-0434': 'FNAL-E-0434',
-    'fnal-e-0435': 'FNAL-E-0435',
-    'fnal-e-0436': 'FNAL-E-0436',
-    'fnal-e-0438': 'FNAL-E-0438',
-    'fnal-e-0439': 'FNAL-E-0439',
-    'fnal-e-0440': 'FNAL-E-0440',
-    'fnal-e-0441': 'FNAL-E-0441',
-    'fnal-e-0442': 'FNAL-E-0442',
-    'fnal-e-0444': 'FNAL-E-0444',
-    'fnal-e-0448': 'FNAL-E-0448',
-    'fnal-e-0451': 'FNAL-E-0451',
-    'fnal-e-0456': 'FNAL-E-0456',
-    'fnal-e-0458': 'FNAL-E-0458',
-    'fnal-e-0461': 'FNAL-E-0461',
-    'fnal-e-0462': 'FNAL-E-0462',
-    'fnal-e-0463': 'FNAL-E-0463',
-    'fnal-e-0466': 'FNAL-E-0466',
-    'fnal-e-0467': 'FNAL-E-0467',
-    'fnal-e-0468': 'FNAL-E-0468',
-    'fnal-e-0469': 'FNAL-E-0469',
-    'fnal-e-0472': 'FNAL-E-0472',
-    'fnal-e-0481': 'FNAL-E-0481',
-    'fnal-e-0482': 'FNAL-E-0482',
-    'fnal-e-0486': 'FNAL-E-0486',
-    'fnal-e-0490': 'FNAL-E-0490',
-    'fnal-e-0494': 'FNAL-E-0494',
-    'fnal-e-0495': 'FNAL-E-0495',
-    'fnal-e-0497': 'FNAL-E-0497',
-    'fnal-e-0498': 'FNAL-E-0498',
-    'fnal-e-0499': 'FNAL-E-0499',
-    'fnal-e-0501': 'FNAL-E-0501',
-    'fnal-e-0502': 'FNAL-E-0502',
-    'fnal-e-0503': 'FNAL-E-0503',
-    'fnal-e-0505': 'FNAL-E-0505',
-    'fnal-e-0506': 'FNAL-E-0506',
-    'fnal-e-0507': 'FNAL-E-0507',
-    'fnal-e-0508': 'FNAL-E-0508',
-    'fnal-e-0509': 'FNAL-E-0509',
-    'fnal-e-0510': 'FNAL-E-0510',
-    'fnal-e-0515': 'FNAL-E-0515',
-    'fnal-e-0516': 'FNAL-E-0516',
-    'fnal-e-0522': 'FNAL-E-0522',
-    'fnal-e-0524': 'FNAL-E-0524',
-    'fnal-e-0525': 'FNAL-E-0525',
-    'fnal-e-0531': 'FNAL-E-0531',
-    'fnal-e-0533': 'FNAL-E-0533',
-    'fnal-e-0536': 'FNAL-E-0536',
-    'fnal-e-0537': 'FNAL-E-0537',
-    'fnal-e-0540': 'FNAL-E-0540',
-    'fnal-e-0545': 'FNAL-E-0545',
-    'fnal-e-0546': 'FNAL-E-0546',
-    'fnal-e-0547': 'FNAL-E-0547',
-    'fnal-e-0549': 'FNAL-E-0549',
-    'fnal-e-0552': 'FNAL-E-0552',
-    'fnal-e-0553': 'FNAL-E-0553',
-    'fnal-e-0555': 'FNAL-E-0555',
-    'fnal-e-0557': 'FNAL-E-0557',
-    'fnal-e-0564': 'FNAL-E-0564',
-    'fnal-e-0565': 'FNAL-E-0565',
-    'fnal-e-0567': 'FNAL-E-0567',
-    'fnal-e-0568': 'FNAL-E-0568',
-    'fnal-e-0570': 'FNAL-E-0570',
-    'fnal-e-0573': 'FNAL-E-0573',
-    'fnal-e-0574': 'FNAL-E-0574',
-    'fnal-e-0575': 'FNAL-E-0575',
-    'fnal-e-0576': 'FNAL-E-0576',
-    'fnal-e-0577': 'FNAL-E-0577',
-    'fnal-e-0580': 'FNAL-E-0580',
-    'fnal-e-0581': 'FNAL-E-0581',
-    'fnal-e-0584': 'FNAL-E-0584',
-    'fnal-e-0585': 'FNAL-E-0585',
-    'fnal-e-0591': 'FNAL-E-0591',
-    'fnal-e-0592': 'FNAL-E-0592',
-    'fnal-e-0594': 'FNAL-E-0594',
-    'fnal-e-0595': 'FNAL-E-0595',
-    'fnal-e-0596': 'FNAL-E-0596',
-    'fnal-e-0597': 'FNAL-E-0597',
-    'fnal-e-0605': 'FNAL-E-0605',
-    'fnal-e-0608': 'FNAL-E-0608',
-    'fnal-e-0609': 'FNAL-E-0609',
-    'fnal-e-0610': 'FNAL-E-0610',
-    'fnal-e-0612': 'FNAL-E-0612',
-    'fnal-e-0613': 'FNAL-E-0613',
-    'fnal-e-0615': 'FNAL-E-0615',
-    'fnal-e-0616': 'FNAL-E-0616',
-    'fnal-e-0617': 'FNAL-E-0617',
-    'fnal-e-0619': 'FNAL-E-0619',
-    'fnal-e-0620': 'FNAL-E-0620',
-    'fnal-e-0621': 'FNAL-E-0621',
-    'fnal-e-0622': 'FNAL-E-0622',
-    'fnal-e-0623': 'FNAL-E-0623',
-    'fnal-e-0629': 'FNAL-E-0629',
-    'fnal-e-0630': 'FNAL-E-0630',
-    'fnal-e-0631': 'FNAL-E-0631',
-    'fnal-e-0632': 'FNAL-E-0632',
-    'fnal-e-0635': 'FNAL-E-0635',
-    'fnal-e-0636': 'FNAL-E-0636',
-    'fnal-e-0646': 'FNAL-E-0646',
-    'fnal-e-0650': 'FNAL-E-0650',
-    'fnal-e-0653': 'FNAL-E-0653',
-    'fnal-e-0660': 'FNAL-E-0660',
-    'fnal-e-0663': 'FNAL-E-0663',
-    'fnal-e-0665': 'FNAL-E-0665',
-    'fnal-e-0666': 'FNAL-E-0666',
-    'fnal-e-0667': 'FNAL-E-0667',
-    'fnal-e-0668': 'FNAL-E-0668',
-    'fnal-e-0672': 'FNAL-E-0672',
-    'fnal-e-0673': 'FNAL-E-0673',
-    'fnal-e-0683': 'FNAL-E-0683',
-    'fnal-e-0687': 'FNAL-E-0687',
-    'fnal-e-0690': 'FNAL-E-0690',
-    'fnal-e-0691': 'FNAL-E-0691',
-    'fnal-e-0700': 'FNAL-E-0700',
-    'fnal-e-0701': 'FNAL-E-0701',
-    'fnal-e-0704': 'FNAL-E-0704',
-    'fnal-e-0705': 'FNAL-E-0705',
-    'fnal-e-0706': 'FNAL-E-0706',
-    'fnal-e-0710': 'FNAL-E-0710',
-    'fnal-e-0711': 'FNAL-E-0711',
-    'fnal-e-0713': 'FNAL-E-0713',
-    'fnal-e-0715': 'FNAL-E-0715',
-    'fnal-e-0715': 'FNAL-E-0715',
-    'fnal-e-0720': 'FNAL-E-0720',
-    'fnal-e-0723': 'FNAL-E-0723',
-    'fnal-e-0729': 'FNAL-E-0729',
-    'fnal-e-0730': 'FNAL-E-0730',
-    'fnal-e-0731': 'FNAL-E-0731',
-    'fnal-e-0733': 'FNAL-E-0733',
-    'fnal-e-0735': 'FNAL-E-0735',
-    'fnal-e-0740': 'FNAL-E-0740',
-    'fnal-e-0741': 'FNAL-E-0741',
-    'fnal-e-0743': 'FNAL-E-0743',
-    'fnal-e-0744': 'FNAL-E-0744',
-    'fnal-e-0745': 'FNAL-E-0745',
-    'fnal-e-0747': 'FNAL-E-0747',
-    'fnal-e-0750': 'FNAL-E-0750',
-    'fnal-e-0751': 'FNAL-E-0751',
-    'fnal-e-0753': 'FNAL-E-0753',
-    'fnal-e-0754': 'FNAL-E-0754',
-    'fnal-e-0755': 'FNAL-E-0755',
-    'fnal-e-0756': 'FNAL-E-0756',
-    'fnal-e-0758': 'FNAL-E-0758',
-    'fnal-e-0759': 'FNAL-E-0759',
-    'fnal-e-0760': 'FNAL-E-0760',
-    'fnal-e-0761': 'FNAL-E-0761',
-    'fnal-e-0762': 'FNAL-E-0762',
-    'fnal-e-0763': 'FNAL-E-0763',
-    'fnal-e-0764': 'FNAL-E-0764',
-    'fnal-e-0765': 'FNAL-E-0765',
-    'fnal-e-0766': 'FNAL-E-0766',
-    'fnal-e-0769': 'FNAL-E-0769',
-    'fnal-e-0770': 'FNAL-E-0770',
-    'fnal-e-0771': 'FNAL-E-0771',
-    'fnal-e-0772': 'FNAL-E-0772',
-    'fnal-e-0773': 'FNAL-E-0773',
-    'fnal-e-0774': 'FNAL-E-0774',
-    'fnal-e-0775': 'FNAL-E-0775',
-    'fnal-e-0776': 'FNAL-E-0776',
-    'fnal-e-0777': 'FNAL-E-0777',
-    'fnal-e-0778': 'FNAL-E-0778',
-    'fnal-e-0781': 'FNAL-E-0781',
-    'fnal-e-0782': 'FNAL-E-0782',
-    'fnal-e-0784': 'FNAL-E-0784',
-    'fnal-e-0789': 'FNAL-E-0789',
-    'fnal-e-0790': 'FNAL-E-0790',
-    'fnal-e-0791': 'FNAL-E-0791',
-    'fnal-e-0792': 'FNAL-E-0792',
-    'fnal-e-0793': 'FNAL-E-0793',
-    'fnal-e-0795': 'FNAL-E-0795',
-    'fnal-e-0797': 'FNAL-E-0797',
-    'fnal-e-0798': 'FNAL-E-0798',
-    'fnal-e-0799': 'FNAL-E-0799',
-    'fnal-e-0800': 'FNAL-E-0800',
-    'fnal-e-0802': 'FNAL-E-0802',
-    'fnal-e-0803': 'FNAL-E-0803',
-    'fnal-e-0804': 'FNAL-E-0804',
-    'fnal-e-0807': 'FNAL-E-0807',
-    'fnal-e-0811': 'FNAL-E-0811',
-    'fnal-e-0815': 'FNAL-E-0815',
-    'fnal-e-0816': 'FNAL-E-0816',
-    'fnal-e-0817': 'FNAL-E-0817',
-    'fnal-e-0819': 'FNAL-E-0819',
-    'fnal-e-0821': 'FNAL-E-0821',
-    'fnal-e-0823': 'FNAL-E-0823',
-    'fnal-e-0830': 'FNAL-E-0830',
-    'fnal-e-0831': 'FNAL-E-0831',
-    'fnal-e-0832': 'FNAL-E-0832',
-    'fnal-e-0835': 'FNAL-E-0835',
-    'fnal-e-0839': 'FNAL-E-0839',
-    'fnal-e-0840': 'FNAL-E-0840',
-    'fnal-e-0841': 'FNAL-E-0841',
-    'fnal-e-0842': 'FNAL-E-0842',
-    'fnal-e-0843': 'FNAL-E-0843',
-    'fnal-e-0844': 'FNAL-E-0844',
-    'fnal-e-0847': 'FNAL-E-0847',
-    'fnal-e-0848': 'FNAL-E-0848',
-    'fnal-e-0849': 'FNAL-E-0849',
-    'fnal-e-0850': 'FNAL-E-0850',
-    'fnal-e-0851': 'FNAL-E-0851',
-    'fnal-e-0852': 'FNAL-E-0852',
-    'fnal-e-0853': 'FNAL-E-0853',
-    'fnal-e-0854': 'FNAL-E-0854',
-    'fnal-e-0855': 'FNAL-E-0855',
-    'fnal-e-0856': 'FNAL-E-0856',
-    'fnal-e-0861': 'FNAL-E-0861',
-    'fnal-e-0862': 'FNAL-E-0862',
-    'fnal-e-0864': 'FNAL-E-0864',
-    'fnal-e-0866': 'FNAL-E-0866',
-    'fnal-e-0868': 'FNAL-E-0868',
-    'fnal-e-0871': 'FNAL-E-0871',
-    'fnal-e-0872': 'FNAL-E-0872',
-    'fnal-e-0875': 'FNAL-E-0875',
-    'fnal-e-0876': 'FNAL-E-0876',
-    'fnal-e-0880': 'FNAL-E-0880',
-    'fnal-e-0882': 'FNAL-E-0882',
-    'fnal-e-0883': 'FNAL-E-0883',
-    'fnal-e-0886': 'FNAL-E-0886',
-    'fnal-e-0887': 'FNAL-E-0887',
-    'fnal-e-0890': 'FNAL-E-0890',
-    'fnal-e-0892': 'FNAL-E-0892',
-    'fnal-e-0893': 'FNAL-E-0893',
-    'fnal-e-0897': 'FNAL-E-0897',
-    'fnal-e-0898': 'FNAL-E-0898',
-    'fnal-e-0900': 'FNAL-E-0900',
-    'fnal-e-0901': 'FNAL-E-0901',
-    'fnal-e-0903': 'FNAL-E-0903',
-    'fnal-e-0904': 'FNAL-E-0904',
-    'fnal-e-0905': 'FNAL-E-0905',
-    'fnal-e-0906': 'FNAL-E-0906',
-    'fnal-e-0907': 'FNAL-E-0907',
-    'fnal-e-0908': 'FNAL-E-0908',
-    'fnal-e-0909': 'FNAL-E-0909',
-    'fnal-e-0911': 'FNAL-E-0911',
-    'fnal-e-0912': 'FNAL-E-0912',
-    'fnal-e-0913': 'FNAL-E-0913',
-    'fnal-e-0916': 'FNAL-E-0916',
-    'fnal-e-0917': 'FNAL-E-0917',
-    'fnal-e-0918': 'FNAL-E-0918',
-    'fnal-e-0921': 'FNAL-E-0921',
-    'fnal-e-0924': 'FNAL-E-0924',
-    'fnal-e-0925': 'FNAL-E-0925',
-    'fnal-e-0928': 'FNAL-E-0928',
-    'fnal-e-0929': 'FNAL-E-0929',
-    'fnal-e-0937': 'FNAL-E-0937',
-    'fnal-e-0938': 'FNAL-E-0938',
-    'fnal-e-0944': 'FNAL-E-0944',
-    'fnal-e-0952': 'FNAL-E-0952',
-    'fnal-e-0954': 'FNAL-E-0954',
-    'fnal-e-0961': 'FNAL-E-0961',
-    'fnal-e-0973': 'FNAL-E-0973',
-    'fnal-e-0974': 'FNAL-E-0974',
-    'fnal-e-0986': 'FNAL-E-0986',
-    'fnal-e-0989': 'FNAL-E-0989',
-    'fnal-e-0990': 'FNAL-E-0990',
-    'fnal-e-1007': 'FNAL-E-1007',
-    'fnal-e-1016': 'FNAL-E-1016',
-    'fnal-e-1027': 'FNAL-E-1027',
-    'fnal-lc': 'FNAL-LC',
-    'fnal-muon-collider': 'FNAL-MUON-COLLIDER',
-    'fnal-p-0899': 'FNAL-P-0899',
-    'fnal-p-0996': 'FNAL-P-0996',
-    'fnal-p-1021': 'FNAL-P-1021',
-    'fnal-p-1028': 'FNAL-P-1028',
-    'fnal-p-1063': 'FNAL-P-1063',
-    'fnal-t-0926': 'FNAL-T-0926',
-    'fnal-t-0927': 'FNAL-T-0927',
-    'fnal-t-0930': 'FNAL-T-0930',
-    'fnal-t-0931': 'FNAL-T-0931',
-    'fnal-t-0932': 'FNAL-T-0932',
-    'fnal-t-0933': 'FNAL-T-0933',
-    'fnal-t-0935': 'FNAL-T-0935',
-    'fnal-t-0936': 'FNAL-T-0936',
-    'fnal-t-0941': 'FNAL-T-0941',
-    'fnal-t-0943': 'FNAL-T-0943',
-    'fnal-t-0945': 'FNAL-T-0945',
-    'fnal-t-0950': 'FNAL-T-0950',
-    'fnal-t-0951': 'FNAL-T-0951',
-    'fnal-t-0953': 'FNAL-T-0953',
-    'fnal-t-0955': 'FNAL-T-0955',
-    'fnal-t-0956': 'FNAL-T-0956',
-    'fnal-t-0957': 'FNAL-T-0957',
-    'fnal-t-0958': 'FNAL-T-0958',
-    'fnal-t-0959': 'FNAL-T-0959',
-    'fnal-t-0962': 'FNAL-T-0962',
-    'fnal-t-0963': 'FNAL-T-0963',
-    'fnal-t-0964': 'FNAL-T-0964',
-    'fnal-t-0965': 'FNAL-T-0965',
-    'fnal-t-0966': 'FNAL-T-0966',
-    'fnal-t-0967': 'FNAL-T-0967',
-    'fnal-t-0968': 'FNAL-T-0968',
-    'fnal-t-0969': 'FNAL-T-0969',
-    'fnal-t-0970': 'FNAL-T-0970',
-    'fnal-t-0971': 'FNAL-T-0971',
-    'fnal-t-0972': 'FNAL-T-0972',
-    'fnal-t-0976': 'FNAL-T-0976',
-    'fnal-t-0977': 'FNAL-T-0977',
-    'fnal-t-0978': 'FNAL-T-0978',
-    'fnal-t-0979': 'FNAL-T-0979',
-    'fnal-t-0980': 'FNAL-T-0980',
-    'fnal-t-0984': 'FNAL-T-0984',
-    'fnal-t-0987': 'FNAL-T-0987',
-    'fnal-t-0988': 'FNAL-T-0988',
-    'fnal-t-0991': 'FNAL-T-0991',
-    'fnal-t-0992': 'FNAL-T-0992',
-    'fnal-t-0993': 'FNAL-T-0993',
-    'fnal-t-0994': 'FNAL-T-0994',
-    'fnal-t-0995': 'FNAL-T-0995',
-    'fnal-t-1004': 'FNAL-T-1004',
-    'fnal-t-1005': 'FNAL-T-1005',
-    'fnal-t-1006': 'FNAL-T-1006',
-    'fnal-t-1008': 'FNAL-T-1008',
-    'fnal-t-1010': 'FNAL-T-1010',
-    'fnal-t-1011': 'FNAL-T-1011',
-    'fnal-t-1012': 'FNAL-T-1012',
-    'fnal-t-1013': 'FNAL-T-1013',
-    'fnal-t-1014': 'FNAL-T-1014',
-    'fnal-t-1015': 'FNAL-T-1015',
-    'fnal-t-1017': 'FNAL-T-1017',
-    'fnal-t-1018': 'FNAL-T-1018',
-    'fnal-t-1019': 'FNAL-T-1019',
-    'fnal-t-1020': 'FNAL-T-1020',
-    'fnal-t-1025': 'FNAL-T-1025',
-    'fnal-t-1031': 'FNAL-T-1031',
-    'fnal-t-1034': 'FNAL-T-1034',
-    'fnal-t-1036': 'FNAL-T-1036',
-    'frascati-dafne-amadeus': 'FRASCATI-DAFNE-AMADEUS',
-    'frascati-dafne-dear': 'FRASCATI-DAFNE-DEAR',
-    'frascati-dafne-finuda': 'FRASCATI-DAFNE-FINUDA',
-    'frascati-dafne-kloe': 'FRASCATI-DAFNE-KLOE',
-    'frascati-dafne-l': 'FRASCATI-DAFNE-L',
-    'frascati-dafne-siddharta': 'FRASCATI-DAFNE-SIDDHARTA',
-    'frascati-irsr': 'FRASCATI-IRSR',
-    'frascati-puls': 'FRASCATI-PULS',
-    'frascati-rog': 'FRASCATI-ROG',
-    'frejus': 'FREJUS',
-    'frejus-nemo-2': 'FREJUS-NEMO-2',
-    'frejus-nemo-3': 'FREJUS-NEMO-3',
-    'fribs': 'FRIBs',
-    'fuse': 'FUSE',
-    'gaia': 'GAIA',
-    'galex': 'GALEX',
-    'gallex': 'GALLEX',
-    'gamma': 'GAMMA',
-    'gams': 'GAMS',
-    'gbar': 'GBAR',
-    'gems': 'GEMS',
-    'genie': 'GENIE',
-    'genius': 'GENIUS',
-    'genius-solar': 'GENIUS-SOLAR',
-    'geo600': 'GEO600',
-    'geodm': 'GEODM',
-    'gerda': 'GERDA',
-    'glast': 'GLAST',
-    'gluex': 'GlueX',
-    'gno': 'GNO',
-    'goldstone': 'GOLDSTONE',
-    'graal': 'GRAAL',
-    'grapes-3': 'GRAPES-3',
-    'gravity-probe-b': 'GRAVITY-PROBE-B',
-    'grocse': 'GROCSE',
-    'gsi-fair-cbm': 'GSI-FAIR-CBM',
-    'gsi-fair-panda': 'GSI-FAIR-PANDA',
-    'gsi-frs': 'GSI-FRS',
-    'gsi-hades': 'GSI-HADES',
-    'gsi-kaos': 'GSI-KAOS',
-    'gsi-land': 'GSI-LAND',
-    'gsi-rising': 'GSI-RISING',
-    'gsi-ship': 'GSI-SHIP',
-    'gsi-sis-aladin': 'GSI-SIS-ALADIN',
-    'gsi-sis-fopi': 'GSI-SIS-FOPI',
-    'gsi-sis-indra': 'GSI-SIS-INDRA',
-    'gsi-taps': 'GSI-TAPS',
-    'gsi-vega-euroball': 'GSI-VEGA-Euroball',
-    'harps': 'HARPS',
-    'hdms': 'HDMS',
-    'he-6': 'He-6',
-    'heat': 'HEAT',
-    'heavyflavoraveraginggroup(hfag)': 'Heavy Flavor Averaging Group (HFAG)',
-    'hegra': 'HEGRA',
-    'heidelberg-moscow': 'HEIDELBERG-MOSCOW',
-    'hellaz': 'HELLAZ',
-    'hera': 'HERA',
-    'heron': 'HERON',
-    'hess': 'HESS',
-    'hess-ii': 'HESS-II',
-    'hetdex': 'HETDEX',
-    'hete': 'HETE',
-    'hexte': 'HEXTE',
-    'high-z': 'HIGH-Z',
-    'higher-z': 'HIGHER-Z',
-    'hiregs': 'HIREGS',
-    'hires': 'HIRES',
-    'holmes': 'HOLMES',
-    'homestake-chlorine': 'HOMESTAKE-CHLORINE',
-    'homestake-iodine': 'HOMESTAKE-IODINE',
-    'hps': 'HPS',
-    'hpw': 'HPW',
-    'hyper-kamiokande': 'HYPER-KAMIOKANDE',
-    'ibex': 'IBEX',
-    'icanoe': 'ICANOE',
-    'icarus': 'ICARUS',
-    'icecube': 'ICECUBE',
-    'icecube-pingu': 'ICECUBE-PINGU',
-    'igec': 'IGEC',
-    'ilc': 'ILC',
-    'imax': 'IMAX',
-    'imb': 'IMB',
-    'inca': 'INCA',
-    'infn-underseis': 'INFN-UNDERSEIS',
-    'ino': 'INO',
-    'ins-11-1': 'INS-11-1',
-    'ins-11-2': 'INS-11-2',
-    'ins-11-3': 'INS-11-3',
-    'ins-11-4': 'INS-11-4',
-    'ins-11-5': 'INS-11-5',
-    'ins-12-1': 'INS-12-1',
-    'ins-12-2': 'INS-12-2',
-    'ins-13-1': 'INS-13-1',
-    'ins-13-2': 'INS-13-2',
-    'ins-14-1': 'INS-14-1',
-    'ins-14-2': 'INS-14-2',
-    'ins-14-3': 'INS-14-3',
-    'ins-14-4': 'INS-14-4',
-    'ins-15-1': 'INS-15-1',
-    'ins-15-2': 'INS-15-2',
-    'ins-15-3': 'INS-15-3',
-    'ins-15-4': 'INS-15-4',
-    'ins-16-1': 'INS-16-1',
-    'ins-16-2': 'INS-16-2',
-    'ins-17-1': 'INS-17-1',
-    'ins-17-2': 'INS-17-2',
-    'ins-18-1': 'INS-18-1',
-    'ins-18-3': 'INS-18-3',
-    'ins-19-1': 'INS-19-1',
-    'ins-19-2': 'INS-19-2',
-    'ins-es-101': 'INS-ES-101',
-    'ins-es-102': 'INS-ES-102',
-    'ins-es-103': 'INS-ES-103',
-    'ins-es-105': 'INS-ES-105',
-    'ins-es-107': 'INS-ES-107',
-    'ins-es-110': 'INS-ES-110',
-    'ins-es-111': 'INS-ES-111',
-    'ins-es-112': 'INS-ES-112',
-    'ins-es-113': 'INS-ES-113',
-    'ins-es-116': 'INS-ES-116',
-    'ins-es-117': 'INS-ES-117',
-    'ins-es-118': 'INS-ES-118',
-    'ins-es-119': 'INS-ES-119',
-    'ins-es-120': 'INS-ES-120',
-    'ins-es-121': 'INS-ES-121',
-    'ins-es-122': 'INS-ES-122',
-    'ins-es-123': 'INS-ES-123',
-    'ins-es-124': 'INS-ES-124',
-    'ins-es-125': 'INS-ES-125',
-    'ins-es-126': 'INS-ES-126',
-    'ins-es-127': 'INS-ES-127',
-    'ins-es-128': 'INS-ES-128',
-    'ins-es-129': 'INS-ES-129',
-    'ins-es-130': 'INS-ES-130',
-    'ins-es-132': 'INS-ES-132',
-    'ins-es-133': 'INS-ES-133',
-    'ins-es-134': 'INS-ES-134',
-    'ins-es-135': 'INS-ES-135',
-    'ins-es-136': 'INS-ES-136',
-    'ins-es-137': 'INS-ES-137',
-    'ins-es-144': 'INS-ES-144',
-    'integral': 'INTEGRAL',
-    'ipta': 'IPTA',
-    'isomax': 'ISOMAX',
-    'isospin': 'ISOSPIN',
-    'istra': 'ISTRA',
-    'itep-741': 'ITEP-741',
-    'itep-751': 'ITEP-751',
-    'itep-761': 'ITEP-761',
-    'itep-762': 'ITEP-762',
-    'itep-763': 'ITEP-763',
-    'itep-764': 'ITEP-764',
-    'itep-771': 'ITEP-771',
-    'itep-781': 'ITEP-781',
-    'itep-782': 'ITEP-782',
-    'itep-783': 'ITEP-783',
-    'itep-784': 'ITEP-784',
-    'itep-791': 'ITEP-791',
-    'itep-792': 'ITEP-792',
-    'itep-801': 'ITEP-801',
-    'itep-802': 'ITEP-802',
-    'itep-803': 'ITEP-803',
-    'itep-804': 'ITEP-804',
-    'itep-811': 'ITEP-811',
-    'itep-812': 'ITEP-812',
-    'itep-813': 'ITEP-813',
-    'itep-814': 'ITEP-814',
-    'itep-821': 'ITEP-821',
-    'itep-822': 'ITEP-822',
-    'itep-823': 'ITEP-823',
-    'itep-824': 'ITEP-824',
-    'itep-825': 'ITEP-825',
-    'itep-826': 'ITEP-826',
-    'itep-827': 'ITEP-827',
-    'itep-828': 'ITEP-828',
-    'itep-829': 'ITEP-829',
-    'itep-831': 'ITEP-831',
-    'itep-832': 'ITEP-832',
-    'itep-833': 'ITEP-833',
-    'itep-841': 'ITEP-841',
-    'itep-842': 'ITEP-842',
-    'itep-843': 'ITEP-843',
-    'itep-851': 'ITEP-851',
-    'itep-852': 'ITEP-852',
-    'itep-853': 'ITEP-853',
-    'itep-861': 'ITEP-861',
-    'itep-862': 'ITEP-862',
-    'itep-863': 'ITEP-863',
-    'itep-864': 'ITEP-864',
-    'itep-865': 'ITEP-865',
-    'itep-871': 'ITEP-871',
-    'itep-872': 'ITEP-872',
-    'itep-873': 'ITEP-873',
-    'itep-874': 'ITEP-874',
-    'itep-875': 'ITEP-875',
-    'itep-876': 'ITEP-876',
-    'itep-891': 'ITEP-891',
-    'itep-892': 'ITEP-892',
-    'itep-893': 'ITEP-893',
-    'itep-894': 'ITEP-894',
-    'itep-895': 'ITEP-895',
-    'itep-896': 'ITEP-896',
-    'itep-897': 'ITEP-897',
-    'itep-901': 'ITEP-901',
-    'itep-911': 'ITEP-911',
-    'itep-912': 'ITEP-912',
-    'itep-913': 'ITEP-913',
-    'itep-914': 'ITEP-914',
-    'itep-921': 'ITEP-921',
-    'itep-922': 'ITEP-922',
-    'itep-923': 'ITEP-923',
-    'itep-941': 'ITEP-941',
-    'itep-942': 'ITEP-942',
-    'itep-951': 'ITEP-951',
-    'iucf-ce-01': 'IUCF-CE-01',
-    'iucf-ce-03': 'IUCF-CE-03',
-    'iucf-ce-08': 'IUCF-CE-08',
-    'iucf-ce-21': 'IUCF-CE-21',
-    'iucf-ce-22': 'IUCF-CE-22',
-    'iucf-ce-23': 'IUCF-CE-23',
-    'iucf-ce-25': 'IUCF-CE-25',
-    'iucf-ce-31': 'IUCF-CE-31',
-    'iucf-ce-34': 'IUCF-CE-34',
-    'iucf-ce-35': 'IUCF-CE-35',
-    'iucf-ce-37': 'IUCF-CE-37',
-    'iucf-ce-38': 'IUCF-CE-38',
-    'iucf-ce-42': 'IUCF-CE-42',
-    'iucf-ce-44': 'IUCF-CE-44',
-    'iucf-ce-45': 'IUCF-CE-45',
-    'iucf-ce-47': 'IUCF-CE-47',
-    'iucf-ce-48': 'IUCF-CE-48',
-    'iucf-ce-49': 'IUCF-CE-49',
-    'iucf-ce-63': 'IUCF-CE-63',
-    'iucf-e-080': 'IUCF-E-080',
-    'iucf-e-323': 'IUCF-E-323',
-    'iucf-e-328': 'IUCF-E-328',
-    'iucf-e-367': 'IUCF-E-367',
-    'j-parckoto': 'J-PARC KOTO',
-    'j-parctrek': 'J-PARC TREK',
-    'j-pas': 'J-PAS',
-    'j-pet': 'J-PET',
-    'jacee': 'JACEE',
-    'jem-euso': 'JEM-EUSO',
-    'jinr-86-01': 'JINR-86-01',
-    'jinr-86-02': 'JINR-86-02',
-    'jinr-86-03': 'JINR-86-03',
-    'jinr-86-04': 'JINR-86-04',
-    'jinr-86-05': 'JINR-86-05',
-    'jinr-lhe-0936-3': 'JINR-LHE-0936-3',
-    'jinr-lhe-0941-1a': 'JINR-LHE-0941-1A',
-    'jinr-lhe-0941-1b': 'JINR-LHE-0941-1B',
-    'jinr-lhe-0941-1c': 'JINR-LHE-0941-1C',
-    'jinr-lhe-0941-1d': 'JINR-LHE-0941-1D',
-    'jinr-lhe-0941-1e': 'JINR-LHE-0941-1E',
-    'jinr-lhe-0941-3': 'JINR-LHE-0941-3',
-    'jinr-lhe-0941-4': 'JINR-LHE-0941-4',
-    'jinr-lhe-0941-5': 'JINR-LHE-0941-5',
-    'jinr-lhe-0969': 'JINR-LHE-0969',
-    'jinr-lhe-0971-1': 'JINR-LHE-0971-1',
-    'jinr-lhe-0971-2': 'JINR-LHE-0971-2',
-    'jinr-lhe-0983-4': 'JINR-LHE-0983-4',
-    'jinr-lhe-0983-4b': 'JINR-LHE-0983-4B',
-    'jinr-lhe-0983-4c': 'JINR-LHE-0983-4C',
-    'jinr-lhe-0983-5a': 'JINR-LHE-0983-5A',
-    'jinr-lhe-0983-9': 'JINR-LHE-0983-9',
-    'jinr-lhe-1010': 'JINR-LHE-1010',
-    'jinr-lhe-1011-1': 'JINR-LHE-1011-1',
-    'jinr-lithium': 'JINR-LITHIUM',
-    'jinr-lnp-09': 'JINR-LNP-09',
-    'jinr-lnp-23': 'JINR-LNP-23',
-    'jinr-troitsk': 'JINR-TROITSK',
-    'jlab-e-00-006': 'JLAB-E-00-006',
-    'jlab-e-00-102': 'JLAB-E-00-102',
-    'jlab-e-00-110': 'JLAB-E-00-110',
-    'jlab-e-00-114': 'JLAB-E-00-114',
-    'jlab-e-01-004': 'JLAB-E-01-004',
-    'jlab-e-01-006': 'JLAB-E-01-006',
-    'jlab-e-01-011': 'JLAB-E-01-011',
-    'jlab-e-01-012': 'JLAB-E-01-012',
-    'jlab-e-01-015': 'JLAB-E-01-015',
-    'jlab-e-01-104': 'JLAB-E-01-104',
-    'jlab-e-01-113': 'JLAB-E-01-113',
-    'jlab-e-02-013': 'JLAB-E-02-013',
-    'jlab-e-02-020': 'JLAB-E-02-020',
-    'jlab-e-02-103': 'JLAB-E-02-103',
-    'jlab-e-03-004': 'JLAB-E-03-004',
-    'jlab-e-03-006': 'JLAB-E-03-006',
-    'jlab-e-03-105': 'JLAB-E-03-105',
-    'jlab-e-03-106': 'JLAB-E-03-106',
-    'jlab-e-04-115-101': 'JLAB-E-04-115-101',
-    'jlab-e-05-008': 'JLAB-E-05-008',
-    'jlab-e-12-10-009': 'JLAB-E-12-10-009',
-    'jlab-e-89-003': 'JLAB-E-89-003',
-    'jlab-e-89-004': 'JLAB-E-89-004',
-    'jlab-e-89-008': 'JLAB-E-89-008',
-    'jlab-e-89-009': 'JLAB-E-89-009',
-    'jlab-e-89-012': 'JLAB-E-89-012',
-    'jlab-e-89-015': 'JLAB-E-89-015',
-    'jlab-e-89-017': 'JLAB-E-89-017',
-    'jlab-e-89-019': 'JLAB-E-89-019',
-    'jlab-e-89-021': 'JLAB-E-89-021',
-    'jlab-e-89-024': 'JLAB-E-89-024',
-    'jlab-e-89-027': 'JLAB-E-89-027',
-    'jlab-e-89-028': 'JLAB-E-89-028',
-    'jlab-e-89-031': 'JLAB-E-89-031',
-    'jlab-e-89-032': 'JLAB-E-89-032',
-    'jlab-e-89-033': 'JLAB-E-89-033',
-    'jlab-e-89-036': 'JLAB-E-89-036',
-    'jlab-e-89-037': 'JLAB-E-89-037',
-    'jlab-e-89-038': 'JLAB-E-89-038',
-    'jlab-e-89-039': 'JLAB-E-89-039',
-    'jlab-e-89-042': 'JLAB-E-89-042',
-    'jlab-e-89-043': 'JLAB-E-89-043',
-    'jlab-e-89-044': 'JLAB-E-89-044',
-    'jlab-e-89-045': 'JLAB-E-89-045',
-    'jlab-e-89-046': 'JLAB-E-89-046',
-    'jlab-e-89-047': 'JLAB-E-89-047',
-    'jlab-e-91-002': 'JLAB-E-91-002',
-    'jlab-e-91-003': 'JLAB-E-91-003',
-    'jlab-e-91-004': 'JLAB-E-91-004',
-    'jlab-e-91-006': 'JLAB-E-91-006',
-    'jlab-e-91-007': 'JLAB-E-91-007',
-    'jlab-e-91-008': 'JLAB-E-91-008',
-    'jlab-e-91-010': 'JLAB-E-91-010',
-    'jlab-e-91-011': 'JLAB-E-91-011',
-    'jlab-e-91-013': 'JLAB-E-91-013',
-    'jlab-e-91-014': 'JLAB-E-91-014',
-    'jlab-e-91-015': 'JLAB-E-91-015',
-    'jlab-e-91-016': 'JLAB-E-91-016',
-    'jlab-e-91-017': 'JLAB-E-91-017',
-    'jlab-e-91-020': 'JLAB-E-91-020',
-    'jlab-e-91-023': 'JLAB-E-91-023',
-    'jlab-e-91-024': 'JLAB-E-91-024',
-    'jlab-e-91-026': 'JLAB-E-91-026',
-    'jlab-e-93-006': 'JLAB-E-93-006',
-    'jlab-e-93-008': 'JLAB-E-93-008',
-    'jlab-e-93-009': 'JLAB-E-93-009',
-    'jlab-e-93-012': 'JLAB-E-93-012',
-    'jlab-e-93-016': 'JLAB-E-93-016',
-    'jlab-e-93-017': 'JLAB-E-93-017',
-    'jlab-e-93-018': 'JLAB-E-93-018',
-    'jlab-e-93-019': 'JLAB-E-93-019',
-    'jlab-e-93-021': 'JLAB-E-93-021',
-    'jlab-e-93-022': 'JLAB-E-93-022',
-    'jlab-e-93-024': 'JLAB-E-93-024',
-    'jlab-e-93-026': 'JLAB-E-93-026',
-    'jlab-e-93-027': 'JLAB-E-93-027',
-    'jlab-e-93-028': 'JLAB-E-93-028',
-    'jlab-e-93-030': 'JLAB-E-93-030',
-    'jlab-e-93-031': 'JLAB-E-93-031',
-    'jlab-e-93-033': 'JLAB-E-93-033',
-    'jlab-e-93-036': 'JLAB-E-93-036',
-    'jlab-e-93-038': 'JLAB-E-93-038',
-    'jlab-e-93-043': 'JLAB-E-93-043',
-    'jlab-e-93-044': 'JLAB-E-93-044',
-    'jlab-e-93-049': 'JLAB-E-93-049',
-    'jlab-e-93-050': 'JLAB-E-93-050',
-    'jlab-e-94-002': 'JLAB-E-94-002',
-    'jlab-e-94-003': 'JLAB-E-94-003',
-    'jlab-e-94-004': 'JLAB-E-94-004',
-    'jlab-e-94-005': 'JLAB-E-94-005',
-    'jlab-e-94-008': 'JLAB-E-94-008',
-    'jlab-e-94-010': 'JLAB-E-94-010',
-    'jlab-e-94-011': 'JLAB-E-94-011',
-    'jlab-e-94-012': 'JLAB-E-94-012',
-    'jlab-e-94-013': 'JLAB-E-94-013',
-    'jlab-e-94-014': 'JLAB-E-94-014',
-    'jlab-e-94-015': 'JLAB-E-94-015',
-    'jlab-e-94-016': 'JLAB-E-94-016',
-    'jlab-e-94-017': 'JLAB-E-94-017',
-    'jlab-e-94-018': 'JLAB-E-94-018',
-    'jlab-e-94-019': 'JLAB-E-94-019',
-    'jlab-e-94-021': 'JLAB-E-94-021',
-    'jlab-e-94-101': 'JLAB-E-94-101',
-    'jlab-e-94-102': 'JLAB-E-94-102',
-    'jlab-e-94-103': 'JLAB-E-94-103',
-    'jlab-e-94-104': 'JLAB-E-94-104',
-    'jlab-e-94-106': 'JLAB-E-94-106',
-    'jlab-e-94-107': 'JLAB-E-94-107',
-    'jlab-e-94-109': 'JLAB-E-94-109',
-    'jlab-e-94-110': 'JLAB-E-94-110',
-    'jlab-e-94-117': 'JLAB-E-94-117',
-    'jlab-e-94-118': 'JLAB-E-94-118',
-    'jlab-e-95-001': 'JLAB-E-95-001',
-    'jlab-e-95-002': 'JLAB-E-95-002',
-    'jlab-e-95-003': 'JLAB-E-95-003',
-    'jlab-e-96-001': 'JLAB-E-96-001',
-    'jlab-e-96-002': 'JLAB-E-96-002',
-    'jlab-e-96-003': 'JLAB-E-96-003',
-    'jlab-e-97-001': 'JLAB-E-97-001',
-    'jlab-e-97-006': 'JLAB-E-97-006',
-    'jlab-e-97-009': 'JLAB-E-97-009',
-    'jlab-e-97-103': 'JLAB-E-97-103',
-    'jlab-e-97-110': 'JLAB-E-97-110',
-    'jlab-e-97-111': 'JLAB-E-97-111',
-    'jlab-e-98-108': 'JLAB-E-98-108',
-    'jlab-e-99-007': 'JLAB-E-99-007',
-    'jlab-e-99-105': 'JLAB-E-99-105',
-    'jlab-e-99-114': 'JLAB-E-99-114',
-    'jlab-e-99-115': 'JLAB-E-99-115',
-    'jlab-e-99-117': 'JLAB-E-99-117',
-    'jodrell-bank': 'JODRELL-BANK',
-    'jparc-e-003': 'JPARC-E-003',
-    'jparc-e-005': 'JPARC-E-005',
-    'jparc-e-006': 'JPARC-E-006',
-    'jparc-e-007': 'JPARC-E-007',
-    'jparc-e-008': 'JPARC-E-008',
-    'jparc-e-010': 'JPARC-E-010',
-    'jparc-e-011': 'JPARC-E-011',
-    'jparc-e-013': 'JPARC-E-013',
-    'jparc-e-014': 'JPARC-E-014',
-    'jparc-e-015': 'JPARC-E-015',
-    'jparc-e-016': 'JPARC-E-016',
-    'jparc-e-017': 'JPARC-E-017',
-    'jparc-e-018': 'JPARC-E-018',
-    'jparc-e-019': 'JPARC-E-019',
-    'jparc-e-021': 'JPARC-E-021',
-    'jparc-e-022': 'JPARC-E-022',
-    'jparc-e-026': 'JPARC-E-026',
-    'jparc-e-027': 'JPARC-E-027',
-    'jparc-e-029': 'JPARC-E-029',
-    'jparc-e-031': 'JPARC-E-031',
-    'jparc-e-034': 'JPARC-E-034',
-    'jparc-e-040': 'JPARC-E-040',
-    'jparc-e-056': 'JPARC-E-056',
-    'juno': 'JUNO',
-    'kagra': 'KAGRA',
-    'kait': 'KAIT',
-    'kami': 'KAMI',
-    'kamiokande': 'KAMIOKANDE',
-    'kamiokande-old': 'KAMIOKANDE-OLD',
-    'kamland': 'KamLAND',
-    'karmen': 'KARMEN',
-    'kascade': 'KASCADE',
-    'kascade-grande': 'KASCADE-GRANDE',
-    'kaska': 'KASKA',
-    'katrin': 'KATRIN',
-    'keck-array': 'KECK-ARRAY',
-    'kek-006': 'KEK-006',
-    'kek-010': 'KEK-010',
-    'kek-012': 'KEK-012',
-    'kek-019': 'KEK-019',
-    'kek-021': 'KEK-021',
-    'kek-033': 'KEK-033',
-    'kek-034': 'KEK-034',
-    'kek-045': 'KEK-045',
-    'kek-049': 'KEK-049',
-    'kek-050': 'KEK-050',
-    'kek-053': 'KEK-053',
-    'kek-057': 'KEK-057',
-    'kek-062': 'KEK-062',
-    'kek-063': 'KEK-063',
-    'kek-064': 'KEK-064',
-    'kek-066': 'KEK-066',
-    'kek-068': 'KEK-068',
-    'kek-074': 'KEK-074',
-    'kek-074a': 'KEK-074A',
-    'kek-075': 'KEK-075',
-    'kek-079': 'KEK-079',
-    'kek-080': 'KEK-080',
-    'kek-081': 'KEK-081',
-    'kek-082': 'KEK-082',
-    'kek-083': 'KEK-083',
-    'kek-084': 'KEK-084',
-    'kek-089': 'KEK-089',
-    'kek-090': 'KEK-090',
-    'kek-092': 'KEK-092',
-    'kek-094': 'KEK-094',
-    'kek-099': 'KEK-099',
-    'kek-104': 'KEK-104',
-    'kek-113': 'KEK-113',
-    'kek-117': 'KEK-117',
-    'kek-121': 'KEK-121',
-    'kek-125': 'KEK-125',
-    'kek-131': 'KEK-131',
-    'kek-132': 'KEK-132',
-    'kek-133': 'KEK-133',
-    'kek-135': 'KEK-135',
-    'kek-136': 'KEK-136',
-    'kek-137': 'KEK-137',
-    'kek-140a': 'KEK-140A',
-    'kek-150': 'KEK-150',
-    'kek-157': 'KEK-157',
-    'kek-159': 'KEK-159',
-    'kek-160': 'KEK-160',
-    'kek-162': 'KEK-162',
-    'kek-166': 'KEK-166',
-    'kek-167b': 'KEK-167B',
-    'kek-173': 'KEK-173',
-    'kek-174': 'KEK-174',
-    'kek-175': 'KEK-175',
-    'kek-176': 'KEK-176',
-    'kek-179': 'KEK-179',
-    'kek-187': 'KEK-187',
-    'kek-195': 'KEK-195',
-    'kek-215': 'KEK-215',
-    'kek-217': 'KEK-217',
-    'kek-218': 'KEK-218',
-    'kek-224': 'KEK-224',
-    'kek-228': 'KEK-228',
-    'kek-231': 'KEK-231',
-    'kek-235': 'KEK-235',
-    'kek-246': 'KEK-246',
-    'kek-248': 'KEK-248',
-    'kek-251': 'KEK-251',
-    'kek-257': 'KEK-257',
-    'kek-261a': 'KEK-261A',
-    'kek-262': 'KEK-262',
-    'kek-269': 'KEK-269',
-    'kek-278': 'KEK-278',
-    'kek-287': 'KEK-287',
-    'kek-289': 'KEK-289',
-    'kek-304': 'KEK-304',
-    'kek-307': 'KEK-307',
-    'kek-325': 'KEK-325',
-    'kek-326': 'KEK-326',
-    'kek-336': 'KEK-336',
-    'kek-337': 'KEK-337',
-    'kek-352': 'KEK-352',
-    'kek-373': 'KEK-373',
-    'kek-391a': 'KEK-391a',
-    'kek-419': 'KEK-419',
-    'kek-470': 'KEK-470',
-    'kek-518': 'KEK-518',
-    'kek-549': 'KEK-549',
-    'kek-bf-belle': 'KEK-BF-BELLE',
-    'kek-bf-belle-ii': 'KEK-BF-BELLE-II',
-    'kek-glc': 'KEK-GLC',
-    'kek-k2k': 'KEK-K2K',
-    'kek-pf-000': 'KEK-PF-000',
-    'kek-t2k': 'KEK-T2K',
-    'kek-te-001': 'KEK-TE-001',
-    'kek-te-002': 'KEK-TE-002',
-    'kek-te-003': 'KEK-TE-003',
-    'kek-te-004': 'KEK-TE-004',
-    'kekb': 'KEKB',
-    'kgf': 'KGF',
-    'kids': 'KiDS',
-    'kims': 'KIMS',
-    'km3net': 'KM3Net',
-    'kvi-agor': 'KVI-AGOR',
-    'lageos': 'LAGEOS',
-    'laguna-lbno': 'LAGUNA-LBNO',
-    'lampf-0015': 'LAMPF-0015',
-    'lampf-0031': 'LAMPF-0031',
-    'lampf-0032': 'LAMPF-0032',
-    'lampf-0058-0120': 'LAMPF-0058-0120',
-    'lampf-0066': 'LAMPF-0066',
-    'lampf-0085': 'LAMPF-0085',
-    'lampf-0131': 'LAMPF-0131',
-    'lampf-0190': 'LAMPF-0190',
-    'lampf-0194': 'LAMPF-0194',
-    'lampf-0225': 'LAMPF-0225',
-    'lampf-0336': 'LAMPF-0336',
-    'lampf-0337': 'LAMPF-0337',
-    'lampf-0358': 'LAMPF-0358',
-    'lampf-0360': 'LAMPF-0360',
-    'lampf-0363': 'LAMPF-0363',
-    'lampf-0366': 'LAMPF-0366',
-    'lampf-0385': 'LAMPF-0385',
-    'lampf-0388': 'LAMPF-0388',
-    'lampf-0392': 'LAMPF-0392',
-    'lampf-0400-445': 'LAMPF-0400-445',
-    'lampf-0402': 'LAMPF-0402',
-    'lampf-0403': 'LAMPF-0403',
-    'lampf-0455': 'LAMPF-0455',
-    'lampf-0457': 'LAMPF-0457',
-    'lampf-0462': 'LAMPF-0462',
-    'lampf-0478': 'LAMPF-0478',
-    'lampf-0492': 'LAMPF-0492',
-    'lampf-0498': 'LAMPF-0498',
-    'lampf-0504': 'LAMPF-0504',
-    'lampf-0508': 'LAMPF-0508',
-    'lampf-0517': 'LAMPF-0517',
-    'lampf-0518': 'LAMPF-0518',
-    'lampf-0546': 'LAMPF-0546',
-    'lampf-0563': 'LAMPF-0563',
-    'lampf-0567': 'LAMPF-0567',
-    'lampf-0581': 'LAMPF-0581',
-    'lampf-0583': 'LAMPF-0583',
-    'lampf-0585': 'LAMPF-0585',
-    'lampf-0589': 'LAMPF-0589',
-    'lampf-0590': 'LAMPF-0590',
-    'lampf-0605': 'LAMPF-0605',
-    'lampf-0634': 'LAMPF-0634',
-    'lampf-0635': 'LAMPF-0635',
-    'lampf-0636': 'LAMPF-0636',
-    'lampf-0637': 'LAMPF-0637',
-    'lampf-0645': 'LAMPF-0645',
-    'lampf-0650': 'LAMPF-0650',
-    'lampf-0651': 'LAMPF-0651',
-    'lampf-0664': 'LAMPF-0664',
-    'lampf-0665': 'LAMPF-0665',
-    'lampf-0685': 'LAMPF-0685',
-    'lampf-0689': 'LAMPF-0689',
-    'lampf-0708': 'LAMPF-0708',
-    'lampf-0709': 'LAMPF-0709',
-    'lampf-0726': 'LAMPF-0726',
-    'lampf-0764': 'LAMPF-0764',
-    'lampf-0767': 'LAMPF-0767',
-    'lampf-0770': 'LAMPF-0770',
-    'lampf-0783': 'LAMPF-0783',
-    'lampf-0790': 'LAMPF-0790',
-    'lampf-0792': 'LAMPF-0792',
-    'lampf-0795': 'LAMPF-0795',
-    'lampf-0804': 'LAMPF-0804',
-    'lampf-0806': 'LAMPF-0806',
-    'lampf-0808': 'LAMPF-0808',
-    'lampf-0815': 'LAMPF-0815',
-    'lampf-0818': 'LAMPF-0818',
-    'lampf-0825': 'LAMPF-0825',
-    'lampf-0828': 'LAMPF-0828',
-    'lampf-0849': 'LAMPF-0849',
-    'lampf-0853': 'LAMPF-0853',
-    'lampf-0869': 'LAMPF-0869',
-    'lampf-0876': 'LAMPF-0876',
-    'lampf-0885': 'LAMPF-0885',
-    'lampf-0888': 'LAMPF-0888',
-    'lampf-0898': 'LAMPF-0898',
-    'lampf-0905': 'LAMPF-0905',
-    'lampf-0951': 'LAMPF-0951',
-    'lampf-0960': 'LAMPF-0960',
-    'lampf-0961': 'LAMPF-0961',
-    'lampf-0969': 'LAMPF-0969',
-    'lampf-0973': 'LAMPF-0973',
-    'lampf-0979': 'LAMPF-0979',
-    'lampf-0981': 'LAMPF-0981',
-    'lampf-0985': 'LAMPF-0985',
-    'lampf-0998': 'LAMPF-0998',
-    'lampf-1015': 'LAMPF-1015',
-    'lampf-1027': 'LAMPF-1027',
-    'lampf-1035': 'LAMPF-1035',
-    'lampf-1054': 'LAMPF-1054',
-    'lampf-1072': 'LAMPF-1072',
-    'lampf-1073': 'LAMPF-1073',
-    'lampf-1085': 'LAMPF-1085',
-    'lampf-1096': 'LAMPF-1096',
-    'lampf-1119': 'LAMPF-1119',
-    'lampf-1135': 'LAMPF-1135',
-    'lampf-1173': 'LAMPF-1173',
-    'lampf-1178': 'LAMPF-1178',
-    'lampf-1179': 'LAMPF-1179',
-    'lampf-1182': 'LAMPF-1182',
-    'lampf-1188': 'LAMPF-1188',
-    'lampf-1189': 'LAMPF-1189',
-    'lampf-1190': 'LAMPF-1190',
-    'lampf-1208': 'LAMPF-1208',
-    'lampf-1213': 'LAMPF-1213',
-    'lampf-1231': 'LAMPF-1231',
-    'lampf-1234': 'LAMPF-1234',
-    'lampf-1240': 'LAMPF-1240',
-    'lampf-1256': 'LAMPF-1256',
-    'lampf-1267': 'LAMPF-1267',
-    'lampf-1268': 'LAMPF-1268',
-    'lampf-1286': 'LAMPF-1286',
-    'lampf-1293': 'LAMPF-1293',
-    'lampf-1309': 'LAMPF-1309',
-    'lampf-1310': 'LAMPF-1310',
-    'lattice-alpha': 'LATTICE-ALPHA',
-    'lattice-bmw': 'LATTICE-BMW',
-    'lattice-fermilab': 'LATTICE-FERMILAB',
-    'lattice-halqcd': 'LATTICE-HALQCD',
-    'lattice-hpqcd': 'LATTICE-HPQCD',
-    'lattice-jlqcd': 'LATTICE-JLQCD',
-    'lattice-milc': 'LATTICE-MILC',
-    'lattice-rbc': 'LATTICE-RBC',
-    'lattice-ukqcd': 'LATTICE-UKQCD',
-    'lattice-zn': 'LATTICE-ZN',
-    'lbl-dls': 'LBL-DLS',
-    'lbl-e-0938': 'LBL-E-0938',
-    'lbl-e-0987': 'LBL-E-0987',
-    'lbl-gc5': 'LBL-GC5',
-    'lbne': 'LBNE',
-    'lbt': 'LBT',
-    'lcfi': 'LCFI',
-    'lena': 'LENA',
-    'lena-tng': 'LENA-TNG',
-    'leni-sc-021': 'LENI-SC-021',
-    'leni-sc-029': 'LENI-SC-029',
-    'leni-sc-042': 'LENI-SC-042',
-    'leni-sc-052': 'LENI-SC-052',
-    'leni-sc-056': 'LENI-SC-056',
-    'leni-sc-062': 'LENI-SC-062',
-    'leni-sc-063': 'LENI-SC-063',
-    'leni-sc-066': 'LENI-SC-066',
-    'leni-sc-067': 'LENI-SC-067',
-    'leni-sc-067-2': 'LENI-SC-067-2',
-    'leni-sc-074': 'LENI-SC-074',
-    'leni-sc-078': 'LENI-SC-078',
-    'leni-sc-079': 'LENI-SC-079',
-    'leni-sc-085': 'LENI-SC-085',
-    'leni-sc-086': 'LENI-SC-086',
-    'leni-sc-087': 'LENI-SC-087',
-    'leni-sc-088': 'LENI-SC-088',
-    'leni-sc-096': 'LENI-SC-096',
-    'leni-sc-097': 'LENI-SC-097',
-    'leni-sc-104': 'LENI-SC-104',
-    'leni-sc-108': 'LENI-SC-108',
-    'lens': 'LENS',
-    'leps': 'LEPS',
-    'lhaaso': 'LHAASO',
-    'ligo': 'LIGO',
-    'lisa': 'LISA',
-    'lisa-pathfinder': 'LISA-PATHFINDER',
-    'lofar': 'LOFAR',
-    'loft': 'LOFT',
-    'lopes': 'LOPES',
-    'lsst': 'LSST',
-    'luci': 'LUCI',
-    'lucifer': 'LUCIFER',
-    'luna': 'LUNA',
-    'lux': 'LUX',
-    'lvd': 'LVD',
-    'lz': 'LZ',
-    'mace': 'MACE',
-    'macho': 'MACHO',
-    'magic': 'MAGIC',
-    'magic-ii': 'MAGIC-II',
-    'magnex': 'MAGNEX',
-    'magpie': 'MAGPIE',
-    'mainz-a1': 'MAINZ-A1',
-    'mainz-a2': 'MAINZ-A2',
-    'mainz-a4': 'MAINZ-A4',
-    'mainz-b1': 'MAINZ-B1',
-    'mainz-b2': 'MAINZ-B2',
-    'mainz-gdh': 'MAINZ-GDH',
-    'mainz-neutrino-mass': 'MAINZ-Neutrino-Mass',
-    'majorana': 'MAJORANA',
-    'mami': 'MAMI',
-    'map': 'MAP',
-    'mass-2': 'MASS-2',
-    'maxima': 'MAXIMA',
-    'memphys': 'MEMPHYS',
-    'merit': 'MERIT',
-    'merlin': 'MERLIN',
-    'mice': 'MICE',
-    'milagro': 'MILAGRO',
-    'miniclean': 'MINICLEAN',
-    'moller': 'MOLLER',
-    'mona': 'MONA',
-    'monolith': 'MONOLITH',
-    'moon': 'MOON',
-    'moon': 'MOON',
-    'mu3e': 'MU3E',
-    'mucap': 'MuCap',
-    'munu': 'MUNU',
-    'musyc': 'MUSYC',
-    'mwa': 'MWA',
-    'nanograv': 'NANOGRAV',
-    'nautilus': 'NAUTILUS',
-    'nedm': 'nEDM',
-    'nemo': 'NEMO',
-    'nemo3': 'NEMO3',
-    'nestor': 'NESTOR',
-    'nevod-decor': 'NEVOD-DECOR',
-    'nexo': 'nEXO',
-    'next': 'NEXT',
-    'nica': 'NICA',
-    'nimrod': 'NIMROD',
-    'noe': 'NOE',
-    'daedalus': 'DAEdALUS',
-    'non-acceleratorexperiments': 'Non-Accelerator Experiments',
-    'akari': 'AKARI',
-    'non-acceleratorexperiments': 'Non-Accelerator Experiments',
-    'nucifer': 'NUCIFER',
-    'non-acceleratorexperiments': 'Non-Accelerator Experiments',
-    'hawc': 'HAWC',
-    'non-acceleratorexperiments': 'Non-Accelerator Experiments',
-    'superb': 'SuperB',
-    'non-acceleratorexperiments': 'Non-Accelerator Experiments',
-    'larp': 'LARP',
-    'non-acceleratorexperiments': 'Non-Accelerator Experiments',
-    'macro': 'MACRO',
-    'non-acceleratorexperiments': 'Non-Accelerator Experiments',
-    'gransasso': 'Gran Sasso',
-    'novosibirsk-cmd': 'NOVOSIBIRSK-CMD',
-    'novosibirsk-cmd-2': 'NOVOSIBIRSK-CMD-2',
-    'novosibirsk-cmd-3': 'NOVOSIBIRSK-CMD-3',
-    'novosibirsk-kedr': 'NOVOSIBIRSK-KEDR',
-    'novosibirsk-md-1': 'NOVOSIBIRSK-MD-1',
-    'novosibirsk-nd': 'NOVOSIBIRSK-ND',
-    'novosibirsk-snd': 'NOVOSIBIRSK-SND',
-    'novosibirsk-vepp-3': 'NOVOSIBIRSK-VEPP-3',
-    'numoon': 'NuMoon',
-    'nusex': 'NUSEX',
-    'nustar': 'NUSTAR',
-    'odi': 'ODI',
-    'ogle': 'OGLE',
-    'oka': 'OKA',
-    'opera': 'OPERA',
-    'orsay-dci-dm1': 'ORSAY-DCI-DM1',
-    'orsay-dci-dm2': 'ORSAY-DCI-DM2',
-    'pact': 'PACT',
-    'palo-verde': 'PALO-VERDE',
-    'pamela': 'PAMELA',
-    'pan-starrs': 'PAN-STARRS',
-    'pan-starrs1': 'Pan-STARRS 1',
-    'pandax': 'PandaX',
-    'paper': 'PAPER',
-    'peanut': 'PEANUT',
-    'phoenix-deep': 'PHOENIX-DEEP',
-    'pibeta': 'PIBETA',
-    'picasso': 'PICASSO',
-    'pico': 'PICO',
-    'pisco': 'PISCO',
-    'plaia': 'PLAIA',
-    'planck': 'PLANCK',
-    'pnpi-sc-124': 'PNPI-SC-124',
-    'pnpi-sc-129': 'PNPI-SC-129',
-    'pnpi-sc-147': 'PNPI-SC-147',
-    'point-agape': 'POINT-AGAPE',
-    'polarbear': 'POLARBEAR',
-    'project-8': 'PROJECT-8',
-    'psi-r-08-01': 'PSI-R-08-01',
-    'psi-r-13-03': 'PSI-R-13-03',
-    'psi-r-71-07': 'PSI-R-71-07',
-    'psi-r-71-08': 'PSI-R-71-08',
-    'psi-r-71-12': 'PSI-R-71-12',
-    'psi-r-72-02': 'PSI-R-72-02',
-    'psi-r-73-01.2': 'PSI-R-73-01.2',
-    'psi-r-74-05': 'PSI-R-74-05',
-    'psi-r-75-07.2': 'PSI-R-75-07.2',
-    'psi-r-77-01': 'PSI-R-77-01',
-    'psi-r-78-02': 'PSI-R-78-02',
-    'psi-r-78-05.4': 'PSI-R-78-05.4',
-    'psi-r-78-06': 'PSI-R-78-06',
-    'psi-r-78-09': 'PSI-R-78-09',
-    'psi-r-78-13.1': 'PSI-R-78-13.1',
-    'psi-r-78-15.1': 'PSI-R-78-15.1',
-    'psi-r-78-18': 'PSI-R-78-18',
-    'psi-r-79-05': 'PSI-R-79-05',
-    'psi-r-79-07': 'PSI-R-79-07',
-    'psi-r-80-01': 'PSI-R-80-01',
-    'psi-r-80-10': 'PSI-R-80-10',
-    'psi-r-80-11': 'PSI-R-80-11',
-    'psi-r-81-01': 'PSI-R-81-01',
-    'psi-r-81-02': 'PSI-R-81-02',
-    'psi-r-81-06': 'PSI-R-81-06',
-    'psi-r-81-09': 'PSI-R-81-09',
-    'psi-r-82-01': 'PSI-R-82-01',
-    'psi-r-82-03.1': 'PSI-R-82-03.1',
-    'psi-r-82-04': 'PSI-R-82-04',
-    'psi-r-82-06': 'PSI-R-82-06',
-    'psi-r-82-10': 'PSI-R-82-10',
-    'psi-r-82-17': 'PSI-R-82-17',
-    'psi-r-83-20-2': 'PSI-R-83-20-2',
-    'psi-r-83-29': 'PSI-R-83-29',
-    'psi-r-85-10': 'PSI-R-85-10',
-    'psi-r-85-11': 'PSI-R-85-11',
-    'psi-r-85-13': 'PSI-R-85-13',
-    'psi-r-85-13-3': 'PSI-R-85-13-3',
-    'psi-r-85-14': 'PSI-R-85-14',
-    'psi-r-85-16': 'PSI-R-85-16',
-    'psi-r-86-02': 'PSI-R-86-02',
-    'psi-r-86-05': 'PSI-R-86-05',
-    'psi-r-86-14': 'PSI-R-86-14',
-    'psi-r-87-01': 'PSI-R-87-01',
-    'psi-r-87-03': 'PSI-R-87-03',
-    'psi-r-87-08': 'PSI-R-87-08',
-    'psi-r-87-12': 'PSI-R-87-12',
-    'psi-r-89-01': 'PSI-R-89-01',
-    'psi-r-89-03': 'PSI-R-89-03',
-    'psi-r-89-06': 'PSI-R-89-06',
-    'psi-r-91-08': 'PSI-R-91-08',
-    'psi-r-92-08': 'PSI-R-92-08',
-    'psi-r-93-06': 'PSI-R-93-06',
-    'psi-r-94-01': 'PSI-R-94-01',
-    'psi-r-94-10': 'PSI-R-94-10',
-    'psi-r-95-03': 'PSI-R-95-03',
-    'psi-r-95-08': 'PSI-R-95-08',
-    'psi-r-95-09': 'PSI-R-95-09',
-    'psi-r-96-05': 'PSI-R-96-05',
-    'psi-r-98-01': 'PSI-R-98-01',
-    'psi-r-99-05': 'PSI-R-99-05',
-    'psi-r-99-07': 'PSI-R-99-07',
-    'psi-z-75-02': 'PSI-Z-75-02',
-    'psi-z-80-01': 'PSI-Z-80-01',
-    'psi-z-84-02': 'PSI-Z-84-02',
-    'psi-z-85-06': 'PSI-Z-85-06',
-    'psi-z-89-02': 'PSI-Z-89-02',
-    'psi-z-89-06': 'PSI-Z-89-06',
-    'psi-z-89-07': 'PSI-Z-89-07',
-    'psi-z-90-07': 'PSI-Z-90-07',
-    'psi-z-90-12': 'PSI-Z-90-12',
-    'psi-z-91-02': 'PSI-Z-91-02',
-    'pvlas': 'PVLAS',
-    'python': 'PYTHON',
-    'quiet': 'QUIET',
-    'quijote': 'QUIJOTE',
-    'rampex': 'RAMPEX',
-    'rcnp-e232': 'RCNP-E232',
-    'rcnp-e233': 'RCNP-E233',
-    'rcnp-e234': 'RCNP-E234',
-    'rcnp-e236': 'RCNP-E236',
-    'rcnp-e237': 'RCNP-E237',
-    'rcnp-e240': 'RCNP-E240',
-    'rcnp-e241': 'RCNP-E241',
-    'rcnp-e242': 'RCNP-E242',
-    'rcnp-e243': 'RCNP-E243',
-    'rcnp-e244': 'RCNP-E244',
-    'rcnp-e246': 'RCNP-E246',
-    'rcnp-grand-raiden': 'RCNP-GRAND-RAIDEN',
-    'rcnp-q014': 'RCNP-Q014',
-    'rcnp-q017': 'RCNP-Q017',
-    'rcnp-q018': 'RCNP-Q018',
-    'rcs2': 'RCS2',
-    'reno': 'RENO',
-    'reverse': 'REVERSE',
-    'rhel-081': 'RHEL-081',
-    'rhel-083': 'RHEL-083',
-    'rhel-091': 'RHEL-091',
-    'rhel-101': 'RHEL-101',
-    'rhel-105': 'RHEL-105',
-    'rhel-112': 'RHEL-112',
-    'rhel-113': 'RHEL-113',
-    'rhel-114': 'RHEL-114',
-    'rhel-115': 'RHEL-115',
-    'rhel-117': 'RHEL-117',
-    'rhel-120': 'RHEL-120',
-    'rhel-128': 'RHEL-128',
-    'rhel-136': 'RHEL-136',
-    'rhel-144': 'RHEL-144',
-    'rhel-166': 'RHEL-166',
-    'rhel-168': 'RHEL-168',
-    'rhel-181': 'RHEL-181',
-    'rhel-193': 'RHEL-193',
-    'rice': 'RICE',
-    'rosat': 'ROSAT',
-    'rosebud': 'ROSEBUD',
-    'rotse': 'ROTSE',
-    'rxte': 'RXTE',
-    'sage': 'SAGE',
-    'sampex': 'SAMPEX',
-    'saturne-010': 'SATURNE-010',
-    'saturne-013': 'SATURNE-013',
-    'saturne-017': 'SATURNE-017',
-    'saturne-037': 'SATURNE-037',
-    'saturne-038-2': 'SATURNE-038-2',
-    'saturne-050': 'SATURNE-050',
-    'saturne-051': 'SATURNE-051',
-    'saturne-052': 'SATURNE-052',
-    'saturne-052-2': 'SATURNE-052-2',
-    'saturne-057': 'SATURNE-057',
-    'saturne-060': 'SATURNE-060',
-    'saturne-066': 'SATURNE-066',
-    'saturne-068': 'SATURNE-068',
-    'saturne-070': 'SATURNE-070',
-    'saturne-078': 'SATURNE-078',
-    'saturne-080': 'SATURNE-080',
-    'saturne-085': 'SATURNE-085',
-    'saturne-087': 'SATURNE-087',
-    'saturne-088': 'SATURNE-088',
-    'saturne-089': 'SATURNE-089',
-    'saturne-092': 'SATURNE-092',
-    'saturne-095': 'SATURNE-095',
-    'saturne-099': 'SATURNE-099',
-    'saturne-101': 'SATURNE-101',
-    'saturne-104': 'SATURNE-104',
-    'saturne-105': 'SATURNE-105',
-    'saturne-106': 'SATURNE-106',
-    'saturne-107': 'SATURNE-107',
-    'saturne-108': 'SATURNE-108',
-    'saturne-113': 'SATURNE-113',
-    'saturne-115': 'SATURNE-115',
-    'saturne-117': 'SATURNE-117',
-    'saturne-118': 'SATURNE-118',
-    'saturne-121': 'SATURNE-121',
-    'saturne-123': 'SATURNE-123',
-    'saturne-124': 'SATURNE-124',
-    'saturne-125': 'SATURNE-125',
-    'saturne-126': 'SATURNE-126',
-    'saturne-128': 'SATURNE-128',
-    'saturne-129': 'SATURNE-129',
-    'saturne-132': 'SATURNE-132',
-    'saturne-133': 'SATURNE-133',
-    'saturne-134': 'SATURNE-134',
-    'saturne-137': 'SATURNE-137',
-    'saturne-138': 'SATURNE-138',
-    'saturne-140': 'SATURNE-140',
-    'saturne-144': 'SATURNE-144',
-    'saturne-145': 'SATURNE-145',
-    'saturne-155': 'SATURNE-155',
-    'saturne-157': 'SATURNE-157',
-    'saturne-166': 'SATURNE-166',
-    'saturne-173': 'SATURNE-173',
-    'saturne-174': 'SATURNE-174',
-    'saturne-177': 'SATURNE-177',
-    'saturne-186': 'SATURNE-186',
-    'saturne-190': 'SATURNE-190',
-    'saturne-192': 'SATURNE-192',
-    'saturne-197': 'SATURNE-197',
-    'saturne-198': 'SATURNE-198',
-    'saturne-199': 'SATURNE-199',
-    'saturne-202': 'SATURNE-202',
-    'saturne-206': 'SATURNE-206',
-    'saturne-209': 'SATURNE-209',
-    'saturne-212': 'SATURNE-212',
-    'saturne-213': 'SATURNE-213',
-    'saturne-216': 'SATURNE-216',
-    'saturne-217': 'SATURNE-217',
-    'saturne-220': 'SATURNE-220',
-    'saturne-222': 'SATURNE-222',
-    'saturne-225': 'SATURNE-225',
-    'saturne-233': 'SATURNE-233',
-    'saturne-235': 'SATURNE-235',
-    'saturne-237': 'SATURNE-237',
-    'saturne-244': 'SATURNE-244',
-    'saturne-246': 'SATURNE-246',
-    'saturne-249': 'SATURNE-249',
-    'saturne-251': 'SATURNE-251',
-    'saturne-253': 'SATURNE-253',
-    'saturne-258': 'SATURNE-258',
-    'saturne-278': 'SATURNE-278',
-    'saturne-280': 'SATURNE-280',
-    'saturne-290': 'SATURNE-290',
-    'scp': 'SCP',
-    'sdss': 'SDSS',
-    'sdss-ii': 'SDSS-II',
-    'sdss-iii': 'SDSS-III',
-    'sdss-iv': 'SDSS-IV',
-    'serpukhov-028': 'SERPUKHOV-028',
-    'serpukhov-039': 'SERPUKHOV-039',
-    'serpukhov-040': 'SERPUKHOV-040',
-    'serpukhov-044': 'SERPUKHOV-044',
-    'serpukhov-045': 'SERPUKHOV-045',
-    'serpukhov-059': 'SERPUKHOV-059',
-    'serpukhov-060': 'SERPUKHOV-060',
-    'serpukhov-064': 'SERPUKHOV-064',
-    'serpukhov-067': 'SERPUKHOV-067',
-    'serpukhov-069': 'SERPUKHOV-069',
-    'serpukhov-071': 'SERPUKHOV-071',
-    'serpukhov-073': 'SERPUKHOV-073',
-    'serpukhov-074': 'SERPUKHOV-074',
-    'serpukhov-076': 'SERPUKHOV-076',
-    'serpukhov-077': 'SERPUKHOV-077',
-    'serpukhov-078': 'SERPUKHOV-078',
-    'serpukhov-079': 'SERPUKHOV-079',
-    'serpukhov-080': 'SERPUKHOV-080',
-    'serpukhov-083': 'SERPUKHOV-083',
-    'serpukhov-085': 'SERPUKHOV-085',
-    'serpukhov-086': 'SERPUKHOV-086',
-    'serpukhov-088': 'SERPUKHOV-088',
-    'serpukhov-089': 'SERPUKHOV-089',
-    'serpukhov-090': 'SERPUKHOV-090',
-    'serpukhov-091': 'SERPUKHOV-091',
-    'serpukhov-092': 'SERPUKHOV-092',
-    'serpukhov-093': 'SERPUKHOV-093',
-    'serpukhov-094': 'SERPUKHOV-094',
-    'serpukhov-096': 'SERPUKHOV-096',
-    'serpukhov-097': 'SERPUKHOV-097',
-    'serpukhov-098': 'SERPUKHOV-098',
-    'serpukhov-099': 'SERPUKHOV-099',
-    'serpukhov-100': 'SERPUKHOV-100',
-    'serpukhov-101': 'SERPUKHOV-101',
-    'serpukhov-102': 'SERPUKHOV-102',
-    'serpukhov-103': 'SERPUKHOV-103',
-    'serpukhov-104': 'SERPUKHOV-104',
-    'serpukhov-105': 'SERPUKHOV-105',
-    'serpukhov-106': 'SERPUKHOV-106',
-    'serpukhov-107': 'SERPUKHOV-107',
-    'serpukhov-108': 'SERPUKHOV-108',
-    'serpukhov-109': 'SERPUKHOV-109',
-    'serpukhov-110': 'SERPUKHOV-110',
-    'serpukhov-111': 'SERPUKHOV-111',
-    'serpukhov-112': 'SERPUKHOV-112',
-    'serpukhov-113': 'SERPUKHOV-113',
-    'serpukhov-114': 'SERPUKHOV-114',
-    'serpukhov-115': 'SERPUKHOV-115',
-    'serpukhov-116': 'SERPUKHOV-116',
-    'serpukhov-117': 'SERPUKHOV-117',
-    'serpukhov-119': 'SERPUKHOV-119',
-    'serpukhov-120': 'SERPUKHOV-120',
-    'serpukhov-121': 'SERPUKHOV-121',
-    'serpukhov-122': 'SERPUKHOV-122',
-    'serpukhov-127': 'SERPUKHOV-127',
-    'serpukhov-128': 'SERPUKHOV-128',
-    'serpukhov-130': 'SERPUKHOV-130',
-    'serpukhov-132': 'SERPUKHOV-132',
-    'serpukhov-133': 'SERPUKHOV-133',
-    'serpukhov-134': 'SERPUKHOV-134',
-    'serpukhov-135': 'SERPUKHOV-135',
-    'serpukhov-136': 'SERPUKHOV-136',
-    'serpukhov-138': 'SERPUKHOV-138',
-    'serpukhov-139': 'SERPUKHOV-139',
-    'serpukhov-140': 'SERPUKHOV-140',
-    'serpukhov-142': 'SERPUKHOV-142',
-    'serpukhov-143': 'SERPUKHOV-143',
-    'serpukhov-144': 'SERPUKHOV-144',
-    'serpukhov-145': 'SERPUKHOV-145',
-    'serpukhov-146': 'SERPUKHOV-146',
-    'serpukhov-147': 'SERPUKHOV-147',
-    'serpukhov-148': 'SERPUKHOV-148',
-    'serpukhov-149': 'SERPUKHOV-149',
-    'serpukhov-150': 'SERPUKHOV-150',
-    'serpukhov-151': 'SERPUKHOV-151',
-    'serpukhov-152': 'SERPUKHOV-152',
-    'serpukhov-153': 'SERPUKHOV-153',
-    'serpukhov-155': 'SERPUKHOV-155',
-    'serpukhov-157': 'SERPUKHOV-157',
-    'serpukhov-159': 'SERPUKHOV-159',
-    'serpukhov-161': 'SERPUKHOV-161',
-    'serpukhov-163': 'SERPUKHOV-163',
-    'serpukhov-164': 'SERPUKHOV-164',
-    'serpukhov-166': 'SERPUKHOV-166',
-    'serpukhov-167': 'SERPUKHOV-167',
-    'serpukhov-168': 'SERPUKHOV-168',
-    'serpukhov-169': 'SERPUKHOV-169',
-    'serpukhov-170': 'SERPUKHOV-170',
-    'serpukhov-171': 'SERPUKHOV-171',
-    'serpukhov-172': 'SERPUKHOV-172',
-    'serpukhov-173': 'SERPUKHOV-173',
-    'serpukhov-174': 'SERPUKHOV-174',
-    'serpukhov-175': 'SERPUKHOV-175',
-    'serpukhov-177': 'SERPUKHOV-177',
-    'serpukhov-178': 'SERPUKHOV-178',
-    'serpukhov-unk-001': 'SERPUKHOV-UNK-001',
-    'serpukhov-unk-002': 'SERPUKHOV-UNK-002',
-    'serpukhov-unk-003': 'SERPUKHOV-UNK-003',
-    'serpukhov-unk-004': 'SERPUKHOV-UNK-004',
-    'serpukhov-unk-005': 'SERPUKHOV-UNK-005',
-    'serpukhov-unk-007': 'SERPUKHOV-UNK-007',
-    'serpukhov-unk-008': 'SERPUKHOV-UNK-008',
-    'seti': 'SETI',
-    'shades': 'SHADES',
-    'simple': 'SIMPLE',
-    'ska': 'SKA',
-    'slac-bc-058': 'SLAC-BC-058',
-    'slac-bc-059': 'SLAC-BC-059',
-    'slac-bc-060': 'SLAC-BC-060',
-    'slac-bc-061': 'SLAC-BC-061',
-    'slac-bc-064': 'SLAC-BC-064',
-    'slac-bc-065': 'SLAC-BC-065',
-    'slac-bc-067': 'SLAC-BC-067',
-    'slac-bc-068': 'SLAC-BC-068',
-    'slac-bc-070': 'SLAC-BC-070',
-    'slac-bc-072': 'SLAC-BC-072',
-    'slac-bc-075': 'SLAC-BC-075',
-    'slac-bc-076': 'SLAC-BC-076',
-    'slac-e-080': 'SLAC-E-080',
-    'slac-e-095': 'SLAC-E-095',
-    'slac-e-101': 'SLAC-E-101',
-    'slac-e-103': 'SLAC-E-103',
-    'slac-e-114': 'SLAC-E-114',
-    'slac-e-119': 'SLAC-E-119',
-    'slac-e-121': 'SLAC-E-121',
-    'slac-e-122': 'SLAC-E-122',
-    'slac-e-123a': 'SLAC-E-123A',
-    'slac-e-123b': 'SLAC-E-123B',
-    'slac-e-127': 'SLAC-E-127',
-    'slac-e-128': 'SLAC-E-128',
-    'slac-e-129': 'SLAC-E-129',
-    'slac-e-130': 'SLAC-E-130',
-    'slac-e-131': 'SLAC-E-131',
-    'slac-e-132': 'SLAC-E-132',
-    'slac-e-133': 'SLAC-E-133',
-    'slac-e-135': 'SLAC-E-135',
-    'slac-e-136': 'SLAC-E-136',
-    'slac-e-137': 'SLAC-E-137',
-    'slac-e-139': 'SLAC-E-139',
-    'slac-e-140': 'SLAC-E-140',
-    'slac-e-140x': 'SLAC-E-140X',
-    'slac-e-141': 'SLAC-E-141',
-    'slac-e-142': 'SLAC-E-142',
-    'slac-e-143': 'SLAC-E-143',
-    'slac-e-144': 'SLAC-E-144',
-    'slac-e-146': 'SLAC-E-146',
-    'slac-e-150': 'SLAC-E-150',
-    'slac-e-154': 'SLAC-E-154',
-    'slac-e-155': 'SLAC-E-155',
-    'slac-e-155x': 'SLAC-E-155X',
-    'slac-e-157': 'SLAC-E-157',
-    'slac-e-158': 'SLAC-E-158',
-    'slac-e-159': 'SLAC-E-159',
-    'slac-e-160': 'SLAC-E-160',
-    'slac-e-161': 'SLAC-E-161',
-    'slac-e-162': 'SLAC-E-162',
-    'slac-e-163': 'SLAC-E-163',
-    'slac-e-164': 'SLAC-E-164',
-    'slac-e-165': 'SLAC-E-165',
-    'slac-e-166': 'SLAC-E-166',
-    'slac-e-167': 'SLAC-E-167',
-    'slac-mps': 'SLAC-MPS',
-    'slac-mq': 'SLAC-MQ',
-    'slac-ne-01': 'SLAC-NE-01',
-    'slac-ne-03': 'SLAC-NE-03',
-    'slac-ne-04': 'SLAC-NE-04',
-    'slac-ne-05': 'SLAC-NE-05',
-    'slac-ne-08': 'SLAC-NE-08',
-    'slac-ne-09': 'SLAC-NE-09',
-    'slac-ne-11': 'SLAC-NE-11',
-    'slac-ne-17': 'SLAC-NE-17',
-    'slac-ne-18': 'SLAC-NE-18',
-    'slac-ne-19': 'SLAC-NE-19',
-    'slac-nlc': 'SLAC-NLC',
-    'slac-pep-02': 'SLAC-PEP-02',
-    'slac-pep-04-09': 'SLAC-PEP-04-09',
-    'slac-pep-05': 'SLAC-PEP-05',
-    'slac-pep-06': 'SLAC-PEP-06',
-    'slac-pep-12': 'SLAC-PEP-12',
-    'slac-pep-14': 'SLAC-PEP-14',
-    'slac-pep-20': 'SLAC-PEP-20',
-    'slac-pep-21': 'SLAC-PEP-21',
-    'slac-pep2-babar': 'SLAC-PEP2-BABAR',
-    'slac-pprc': 'SLAC-PPRC',
-    'slac-slc-6': 'SLAC-SLC-6',
-    'slac-slc-sld': 'SLAC-SLC-SLD',
-    'slac-sp-007a': 'SLAC-SP-007A',
-    'slac-sp-007b': 'SLAC-SP-007B',
-    'slac-sp-010': 'SLAC-SP-010',
-    'slac-sp-014': 'SLAC-SP-014',
-    'slac-sp-016': 'SLAC-SP-016',
-    'slac-sp-017': 'SLAC-SP-017',
-    'slac-sp-019': 'SLAC-SP-019',
-    'slac-sp-024': 'SLAC-SP-024',
-    'slac-sp-025': 'SLAC-SP-025',
-    'slac-sp-026': 'SLAC-SP-026',
-    'slac-sp-027': 'SLAC-SP-027',
-    'slac-sp-028': 'SLAC-SP-028',
-    'slac-sp-029': 'SLAC-SP-029',
-    'slac-sp-030': 'SLAC-SP-030',
-    'slac-sp-031': 'SLAC-SP-031',
-    'slac-sp-032': 'SLAC-SP-032',
-    'slim': 'SLIM',
-    'slugs': 'SLUGS',
-    'smart1': 'SMART1',
-    'smili-ii': 'SMILI-II',
-    'snap': 'SNAP',
-    'snfactory': 'SNfactory',
-    'snls': 'SNLS',
-    'solid': 'SoLid',
-    'soudan-2': 'SOUDAN-2',
-    'spase-2': 'SPASE-2',
-    'sphinx': 'SPHINX',
-    'spider': 'SPIDER',
-    'spt': 'SPT',
-    'spt-3g': 'SPT-3G',
-    'sscl-gem': 'SSCL-GEM',
-    'sscl-sdc': 'SSCL-SDC',
-    'stacee': 'STACEE',
-    'sudbury-sno': 'SUDBURY-SNO',
-    'sudbury-sno+': 'SUDBURY-SNO+',
-    'sumire': 'SuMIRe',
-    'sunshine': 'SUNSHINE',
-    'super-cdms-snolab': 'SUPER-CDMS-SNOLAB',
-    'super-cdms-soudan': 'SUPER-CDMS-SOUDAN',
-    'super-kamiokande': 'SUPER-KAMIOKANDE',
-    'supernemo': 'SuperNEMO',
-    'superwasp': 'SUPERWASP',
-    'swift': 'SWIFT',
-    'swires': 'SWIRES',
-    'sxds': 'SXDS',
-    'tama': 'TAMA',
-    'telescope-array': 'TELESCOPE-ARRAY',
-    'tesla': 'TESLA',
-    'texono': 'TEXONO',
-    'theseus': 'THESEUS',
-    'tianlai': 'Tianlai',
-    'tibet-asg': 'TIBET-ASG',
-    'tiger': 'TIGER',
-    'triumf-009': 'TRIUMF-009',
-    'triumf-052': 'TRIUMF-052',
-    'triumf-074': 'TRIUMF-074',
-    'triumf-104': 'TRIUMF-104',
-    'triumf-1072': 'TRIUMF-1072',
-    'triumf-121': 'TRIUMF-121',
-    'triumf-132-192': 'TRIUMF-132-192',
-    'triumf-134': 'TRIUMF-134',
-    'triumf-137': 'TRIUMF-137',
-    'triumf-168': 'TRIUMF-168',
-    'triumf-171': 'TRIUMF-171',
-    'triumf-174': 'TRIUMF-174',
-    'triumf-182': 'TRIUMF-182',
-    'triumf-185': 'TRIUMF-185',
-    'triumf-190': 'TRIUMF-190',
-    'triumf-192': 'TRIUMF-192',
-    'triumf-205': 'TRIUMF-205',
-    'triumf-208': 'TRIUMF-208',
-    'triumf-217': 'TRIUMF-217',
-    'triumf-247': 'TRIUMF-247',
-    'triumf-248': 'TRIUMF-248',
-    'triumf-249': 'TRIUMF-249',
-    'triumf-277': 'TRIUMF-277',
-    'triumf-287': 'TRIUMF-287',
-    'triumf-297': 'TRIUMF-297',
-    'triumf-298': 'TRIUMF-298',
-    'triumf-300': 'TRIUMF-300',
-    'triumf-301': 'TRIUMF-301',
-    'triumf-304': 'TRIUMF-304',
-    'triumf-326': 'TRIUMF-326',
-    'triumf-332': 'TRIUMF-332',
-    'triumf-337': 'TRIUMF-337',
-    'triumf-360': 'TRIUMF-360',
-    'triumf-368': 'TRIUMF-368',
-    'triumf-369': 'TRIUMF-369',
-    'triumf-372': 'TRIUMF-372',
-    'triumf-375': 'TRIUMF-375',
-    'triumf-377': 'TRIUMF-377',
-    'triumf-387': 'TRIUMF-387',
-    'triumf-394': 'TRIUMF-394',
-    'triumf-399': 'TRIUMF-399',
-    'triumf-414': 'TRIUMF-414',
-    'triumf-441': 'TRIUMF-441',
-    'triumf-443': 'TRIUMF-443',
-    'triumf-445': 'TRIUMF-445',
-    'triumf-446': 'TRIUMF-446',
-    'triumf-452': 'TRIUMF-452',
-    'triumf-460': 'TRIUMF-460',
-    'triumf-466': 'TRIUMF-466',
-    'triumf-471': 'TRIUMF-471',
-    'triumf-478': 'TRIUMF-478',
-    'triumf-482': 'TRIUMF-482',
-    'triumf-496': 'TRIUMF-496',
-    'triumf-497': 'TRIUMF-497',
-    'triumf-498': 'TRIUMF-498',
-    'triumf-502': 'TRIUMF-502',
-    'triumf-503': 'TRIUMF-503',
-    'triumf-506': 'TRIUMF-506',
-    'triumf-508': 'TRIUMF-508',
-    'triumf-530': 'TRIUMF-530',
-    'triumf-537': 'TRIUMF-537',
-    'triumf-541': 'TRIUMF-541',
-    'triumf-544': 'TRIUMF-544',
-    'triumf-552': 'TRIUMF-552',
-    'triumf-556': 'TRIUMF-556',
-    'triumf-557': 'TRIUMF-557',
-    'triumf-560': 'TRIUMF-560',
-    'triumf-561': 'TRIUMF-561',
-    'triumf-566': 'TRIUMF-566',
-    'triumf-570': 'TRIUMF-570',
-    'triumf-592': 'TRIUMF-592',
-    'triumf-598': 'TRIUMF-598',
-    'triumf-612': 'TRIUMF-612',
-    'triumf-613': 'TRIUMF-613',
-    'triumf-614': 'TRIUMF-614',
-    'triumf-624': 'TRIUMF-624',
-    'triumf-630': 'TRIUMF-630',
-    'triumf-633': 'TRIUMF-633',
-    'triumf-643': 'TRIUMF-643',
-    'triumf-645': 'TRIUMF-645',
-    'triumf-653': 'TRIUMF-653',
-    'triumf-655': 'TRIUMF-655',
-    'triumf-661': 'TRIUMF-661',
-    'triumf-683': 'TRIUMF-683',
-    'triumf-689': 'TRIUMF-689',
-    'triumf-703': 'TRIUMF-703',
-    'triumf-704': 'TRIUMF-704',
-    'triumf-714': 'TRIUMF-714',
-    'triumf-715': 'TRIUMF-715',
-    'triumf-719': 'TRIUMF-719',
-    'triumf-766': 'TRIUMF-766',
-    'triumf-838': 'TRIUMF-838',
-    'triumf-864': 'TRIUMF-864',
-    'triumf-869': 'TRIUMF-869',
-    'triumf-ariel': 'TRIUMF-ARIEL',
-    'triumf-chaos': 'TRIUMF-CHAOS',
-    'triumf-dass': 'TRIUMF-DASS',
-    'triumf-emma': 'TRIUMF-EMMA',
-    'triumf-griffin': 'TRIUMF-GRIFFIN',
-    'triumf-isac': 'TRIUMF-ISAC',
-    'triumf-spice': 'TRIUMF-SPICE',
-    'triumf-tigress': 'TRIUMF-TIGRESS',
-    'triumf-tisol': 'TRIUMF-TISOL',
-    'triumf-ucn': 'TRIUMF-UCN',
-    'ts93': 'TS93',
-    'tunka-13': 'TUNKA-13',
-    'tus': 'TUS',
-    'ulysses': 'ULYSSES',
-    'umer': 'UMER',
-    'usa': 'USA',
-    'veritas': 'VERITAS',
-    'vimos': 'VIMOS',
-    'virgo': 'VIRGO',
-    'vladd': 'VLADD',
-    'vsop': 'VSOP',
-    'warp': 'WARP',
-    'warps': 'WARPS',
-    'wasa-cosy': 'WASA-COSY',
-    'washington-atomic': 'WASHINGTON-ATOMIC',
-    'wet': 'WET',
-    'wfirst': 'WFIRST',
-    'whipple': 'WHIPPLE',
-    'wise': 'WISE',
-    'wmap': 'WMAP',
-    'wombat': 'WOMBAT',
-    'xcs': 'XCS',
-    'xenon': 'XENON',
-    'xenon100': 'XENON100',
-    'xenon1t': 'XENON1T',
-    'xmass': 'XMASS',
-    'xmm': 'XMM',
-    'yakutskeasarray': 'Yakutsk EAS Array',
-    'zeplin-ii': 'ZEPLIN-II',
-    'zeplin-iii': 'ZEPLIN-III',
-}
+    return len(names)
@@ -0,0 +1,363 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of INSPIRE.
+# Copyright (C) 2014-2017 CERN.
+#
+# INSPIRE is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# INSPIRE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with INSPIRE. If not, see <http://www.gnu.org/licenses/>.
+#
+# In applying this license, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as an Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+"""Queue of the records waiting to be indexed.
+
+Committed records are not indexed one by one in the committing process.
+Their UUIDs are queued in Redis instead, along with the operation to perform
+on them, so that repeated changes to a record before the queue is processed
+only lead to one operation. A dedicated Celery task then indexes or deletes
+the queued records with bulk requests, claiming a chunk of operations at a
+time, which stays in Redis until it is performed.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import json
+import time
+
+from elasticsearch.helpers import bulk
+from flask import current_app
+from redis import StrictRedis
+
+from invenio_indexer.api import RecordIndexer, current_record_to_index
+from invenio_records.models import RecordMetadata
+from invenio_search import current_search_client as es
+
+from inspirehep.modules.search.cache import bump_generations
+
+from .api import InspireRecord
+from .citations import prefetched_citation_counts
+from .utils import indexing_records
+
+
+QUEUE_KEY = 'indexer_queue'
+"""Redis hash mapping the UUID of each queued record to its operation."""
+
+QUEUE_TIMES_KEY = 'indexer_queue_times'
+"""Redis hash mapping the UUID of each queued record to when it was queued."""
+
+PROCESSING_KEY = 'indexer_queue_processing'
+"""Redis hash of the operations being performed, until they are done."""
+
+SCHEDULED_KEY = 'indexer_queue_scheduled'
+"""Redis key set while the processing of the queue is scheduled."""
+
+CLAIM_OPERATIONS = """
+local claimed = {}
+for i = 1, #ARGV, 2 do
+    if redis.call('HGET', KEYS[1], ARGV[i]) == ARGV[i + 1] then
+        redis.call('HSET', KEYS[2], ARGV[i], ARGV[i + 1])
+        redis.call('HDEL', KEYS[1], ARGV[i])
+        table.insert(claimed, ARGV[i])
+    end
+end
+return claimed
+"""
+"""Move the given operations to the processing hash, unless they changed."""
+
+RELEASE_OPERATIONS = """
+for i = 1, #ARGV do
+    local operation = redis.call('HGET', KEYS[1], ARGV[i])
+    if operation then
+        redis.call('HSETNX', KEYS[2], ARGV[i], operation)
+        redis.call('HDEL', KEYS[1], ARGV[i])
+    end
+end
+"""
+"""Put back the given operations in the queue, unless they were replaced."""
+
+ACK_OPERATIONS = """
+for i = 1, #ARGV do
+    redis.call('HDEL', KEYS[1], ARGV[i])
+    if redis.call('HEXISTS', KEYS[2], ARGV[i]) == 0 then
+        redis.call('HDEL', KEYS[3], ARGV[i])
+    end
+end
+"""
+"""Forget the given operations, keeping the time of the requeued records."""
+
+
+def get_redis():
+    return StrictRedis.from_url(current_app.config['CACHE_REDIS_URL'])
+
+
+def queue_records(operations):
+    """Queue operations on records.
+
+    An operation replaces any other operation on the same record which is
+    still queued, but the record keeps its original queuing time.
+
+    :param operations: operation to perform on each record, by UUID. An
+        operation is a dict holding the ``op_type``, which is ``index`` or
+        ``delete``, and the ``index`` and ``doc_type`` of the record, as
+        deleted records can't be loaded when the queue is processed.
+    :type operations: dict
+    :returns: whether the caller must schedule the processing of the queue,
+        as it is not scheduled yet.
+    :rtype: bool
+    """
+    if not operations:
+        return False
+
+    r = get_redis()
+    now = time.time()
+
+    pipeline = r.pipeline()
+    pipeline.hmset(QUEUE_KEY, dict(
+        (uuid, json.dumps(operation))
+        for uuid, operation in operations.items()
+    ))
+    for uuid in operations:
+        pipeline.hsetnx(QUEUE_TIMES_KEY, uuid, now)
+    pipeline.execute()
+
+    return _set_scheduled(r)
+
+
+def _set_scheduled(r):
+    # Expire the flag in case the scheduled processing is lost.
+    timeout = current_app.config['RECORDS_INDEXER_DELAY'] * 10 + 60
+    return bool(r.set(SCHEDULED_KEY, 1, nx=True, ex=timeout))
+
+
+def schedule_queue():
+    """Tell whether operations are left in the queue, unscheduled.
+
+    This happens when the processing of the queue put back operations which
+    failed, or was interrupted, and no record was committed since.
+
+    :returns: whether the caller must schedule the processing of the queue.
+    :rtype: bool
+    """
+    r = get_redis()
+    pending = r.exists(QUEUE_KEY) or r.exists(PROCESSING_KEY)
+    return bool(pending) and _set_scheduled(r)
+
+
+def claim_operations(size):
+    """Claim the queued operations, ``size`` at a time.
+
+    Claimed operations are moved from the queue to a processing hash, where
+    they stay until they are acknowledged with ``ack_operations`` or put back
+    with ``requeue``, so that they are not lost if the worker dies meanwhile.
+
+    :param size: maximum number of operations claimed at once.
+    :type size: int
+    :returns: the claimed operations and their queuing times, by UUID.
+    :rtype: generator of tuples
+    """
+    r = get_redis()
+    claim = r.register_script(CLAIM_OPERATIONS)
+
+    def _claim(chunk):
+        args = [item for pair in chunk.items() for item in pair]
+        uuids = claim(keys=[QUEUE_KEY, PROCESSING_KEY], args=args)
+        times = r.hmget(QUEUE_TIMES_KEY, uuids) if uuids else []
+        return (
+            dict((uuid, json.loads(chunk[uuid])) for uuid in uuids),
+            dict((uuid, float(queued or time.time()))
+                 for uuid, queued in zip(uuids, times)),
+        )
+
+    chunk = {}
+    for uuid, operation in r.hscan_iter(QUEUE_KEY, count=size):
+        chunk[uuid] = operation
+        if len(chunk) >= size:
+            yield _claim(chunk)
+            chunk = {}
+    if chunk:
+        yield _claim(chunk)
+
+
+def ack_operations(uuids):
+    """Forget claimed operations which were performed."""
+    if not uuids:
+        return
+
+    r = get_redis()
+    ack = r.register_script(ACK_OPERATIONS)
+    ack(keys=[PROCESSING_KEY, QUEUE_KEY, QUEUE_TIMES_KEY], args=list(uuids))
+
+
+def requeue(uuids):
+    """Put back claimed operations which could not be performed.
+
+    Records queued again since they were claimed keep their new operation.
+    """
+    if not uuids:
+        return
+
+    r = get_redis()
+    release = r.register_script(RELEASE_OPERATIONS)
+    release(keys=[PROCESSING_KEY, QUEUE_KEY], args=list(uuids))
+
+
+def recover_queue():
+    """Put back the operations left claimed by an interrupted processing.
+
+    The queue is processed by a single worker process, so any claimed
+    operation left when processing starts belongs to a processing which
+    died before performing it.
+
+    :returns: the number of operations put back.
+    :rtype: int
+    """
+    uuids = get_redis().hkeys(PROCESSING_KEY)
+    requeue(uuids)
+    return len(uuids)
+
+
+def get_records_to_index(operations):
+    """Load the records which the given operations index."""
+    index_uuids = [
+        uuid for uuid, operation in operations.items()
+        if operation['op_type'] == 'index'
+    ]
+    if not index_uuids:
+        return []
+
+    models = RecordMetadata.query.filter(RecordMetadata.id.in_(index_uuids))
+    return [InspireRecord(model.json, model=model) for model in models]
+
+
+def get_bulk_actions(operations, records):
+    """Yield the bulk actions performing the given operations.
+
+    :param records: the records indexed by the operations, as returned by
+        ``get_records_to_index``.
+    """
+    if records:
+        with prefetched_citation_counts(records):
+            for record in records:
+                index, doc_type = current_record_to_index(record)
+                yield {
+                    '_op_type': 'index',
+                    '_index': index,
+                    '_type': doc_type,
+                    '_id': str(record.id),
+                    '_version': record.revision_id,
+                    '_version_type': 'external_gte',
+                    '_source': RecordIndexer._prepare_record(
+                        record, index, doc_type),
+                }
+
+    for uuid, operation in operations.items():
+        if operation['op_type'] == 'delete':
+            yield {
+                '_op_type': 'delete',
+                '_index': operation['index'],
+                '_type': operation['doc_type'],
+                '_id': uuid,
+            }
+
+
+def is_retryable(error):
+    """Tell whether a failed bulk operation may succeed later.
+
+    Conflicts mean that a newer version of the record is already indexed,
+    and other client errors would fail again.
+    """
+    return error['status'] == 429 or error['status'] >= 500
+
+
+def process_queue():
+    """Perform the queued operations with bulk requests.
+
+    Operations are claimed and performed ``RECORDS_INDEXER_BULK_SIZE`` at a
+    time. The ones which failed, if they may succeed later, are put back in
+    the queue at the end, as are the ones claimed when an error is raised.
+
+    :returns: the number of operations performed.
+    :rtype: int
+    """
+    r = get_redis()
+    # Operations queued from now on need a new processing.
+    r.delete(SCHEDULED_KEY)
+
+    recovered = recover_queue()
+    if recovered:
+        current_app.logger.warning(
+            'Put back %d operations left by an interrupted processing.',
+            recovered)
+
+    chunk_size = current_app.config['RECORDS_INDEXER_BULK_SIZE']
+    total = success = 0
+    oldest = None
+    failed = []
+    try:
+        for operations, times in claim_operations(chunk_size):
+            if not operations:
+                continue
+
+            try:
+                records = get_records_to_index(operations)
+                with indexing_records(operations, records):
+                    chunk_success, errors = bulk(
+                        es,
+                        get_bulk_actions(operations, records),
+                        raise_on_error=False,
+                        request_timeout=current_app.config['INDEXER_BULK_REQUEST_TIMEOUT'],
+                    )
+            except Exception:
+                failed.extend(operations)
+                raise
+
+            chunk_failed = set()
+            for error in errors:
+                op_type, result = error.popitem()
+                current_app.logger.warning(
+                    'Could not %s record %s: %s',
+                    op_type, result['_id'], result.get('error'))
+                if is_retryable(result):
+                    chunk_failed.add(result['_id'])
+
+            ack_operations(set(operations) - chunk_failed)
+            failed.extend(chunk_failed)
+            bump_generations(operation['index'] for operation in operations.values())
+
+            total += len(operations)
+            success += chunk_success
+            oldest = min([oldest or time.time()] + list(times.values()))
+    finally:
+        requeue(failed)
+
+    if total:
+        current_app.logger.info(
+            'Indexed %d of %d queued records, the oldest was queued %.1fs ago.',
+            success, total, time.time() - oldest)
+    return success
+
+
+def get_queue_stats():
+    """Return the length of the queue and how long its oldest record waited.
+
+    :returns: the ``backlog`` and ``lag``, in seconds, of the queue.
+    :rtype: dict
+    """
+    r = get_redis()
+    times = [float(queued) for queued in r.hvals(QUEUE_TIMES_KEY)]
+
+    return {
+        'backlog': r.hlen(QUEUE_KEY) + r.hlen(PROCESSING_KEY),
+        'lag': time.time() - min(times) if times else 0.0,
+    }
@@ -25,13 +25,16 @@
 from __future__ import absolute_import, division, print_function
 
 import re
+from collections import defaultdict
 
-from flask import current_app
+from flask import current_app, g, has_request_context
 from jsonref import JsonLoader, JsonRef
+from six import iteritems, itervalues, string_types
 from werkzeug.urls import url_parse
 
 import jsonresolver
 from jsonresolver.contrib.jsonref import json_loader_factory
+from invenio_cache import current_cache
 
 from inspirehep.modules.pidstore.utils import get_pid_type_from_endpoint
 from inspirehep.utils import record_getter
@@ -48,24 +51,15 @@ class AbstractRecordLoader(JsonLoader):
         raise NotImplementedError()
 
     def get_remote_json(self, uri, **kwargs):
-        parsed_uri = url_parse(uri)
-        # Add http:// protocol so uri.netloc is correctly parsed.
-        server_name = current_app.config.get('SERVER_NAME')
-        if not re.match('^https?://', server_name):
-            server_name = 'http://{}'.format(server_name)
-        parsed_server = url_parse(server_name)
-
-        if parsed_uri.netloc and parsed_uri.netloc != parsed_server.netloc:
+        if not is_local_uri(uri):
             return super(AbstractRecordLoader, self).get_remote_json(uri,
                                                                      **kwargs)
-        path_parts = parsed_uri.path.strip('/').split('/')
-        if len(path_parts) < 2:
+        pid = get_pid_from_uri(uri)
+        if not pid:
             current_app.logger.error('Bad JSONref URI: {0}'.format(uri))
             return None
 
-        endpoint = path_parts[-2]
-        pid_type = get_pid_type_from_endpoint(endpoint)
-        recid = path_parts[-1]
+        pid_type, recid = pid
         res = self.get_record(pid_type, recid)
         return res
 
@@ -80,6 +74,82 @@ class ESJsonLoader(AbstractRecordLoader):
             return None
 
 
+class BatchESJsonLoader(ESJsonLoader):
+    """Resolve resources from Elasticsearch, fetching them in batches.
+
+    The references found by ``prefetch`` are resolved with one query on
+    the persistent identifiers and one ``mget`` per ``pid_type``. Records
+    are kept for the lifetime of the loader and, if
+    ``RECORDS_JSON_REF_CACHE_TIMEOUT`` is set, in the application cache.
+    """
+
+    def __init__(self):
+        super(BatchESJsonLoader, self).__init__(cache_results=False)
+        self.records = {}
+
+    def get_record(self, pid_type, recid):
+        self.fetch([(pid_type, recid)])
+        return self.records[(pid_type, str(recid))]
+
+    def prefetch(self, obj):
+        """Fetch all the local records referenced in obj."""
+        pids = []
+        for uri in iter_refs(obj):
+            if not is_local_uri(uri):
+                continue
+            try:
+                pid = get_pid_from_uri(uri)
+            except KeyError:
+                continue
+            if pid:
+                pids.append(pid)
+
+        self.fetch(pids)
+
+    def fetch(self, pids):
+        """Fetch the records with the given (pid_type, recid) pairs."""
+        keys = set(
+            (pid_type, str(recid)) for pid_type, recid in pids
+        ).difference(self.records)
+        if not keys:
+            return
+
+        timeout = current_app.config.get('RECORDS_JSON_REF_CACHE_TIMEOUT')
+        if timeout:
+            keys = sorted(keys)
+            cached = current_cache.get_many(
+                *[_get_cache_key(*key) for key in keys])
+            for key, record in zip(keys, cached):
+                if record is not None:
+                    self.records[key] = record
+            keys = set(keys).difference(self.records)
+
+        recids_by_pid_type = defaultdict(list)
+        for pid_type, recid in keys:
+            recids_by_pid_type[pid_type].append(recid)
+
+        fetched = {}
+        for pid_type, recids in iteritems(recids_by_pid_type):
+            try:
+                records = record_getter.get_es_records_by_recid(
+                    pid_type, recids)
+            except Exception:
+                current_app.logger.exception(
+                    "Can't load %s records %s", pid_type, recids)
+                records = {}
+            for recid, record in iteritems(records):
+                fetched[(pid_type, recid)] = record
+
+        for key in keys:
+            self.records[key] = fetched.get(key)
+
+        if timeout and fetched:
+            current_cache.set_many({
+                _get_cache_key(*key): record
+                for key, record in iteritems(fetched)
+            }, timeout=timeout)
+
+
 class DatabaseJsonLoader(AbstractRecordLoader):
 
     def get_record(self, pid_type, recid):
@@ -89,6 +159,68 @@ class DatabaseJsonLoader(AbstractRecordLoader):
             return None
 
 
+def _get_cache_key(pid_type, recid):
+    return 'json_ref:{}:{}'.format(pid_type, recid)
+
+
+def is_local_uri(uri):
+    """Return whether the uri points to a resource of this server."""
+    parsed_uri = url_parse(uri)
+    # Add http:// protocol so uri.netloc is correctly parsed.
+    server_name = current_app.config.get('SERVER_NAME')
+    if not re.match('^https?://', server_name):
+        server_name = 'http://{}'.format(server_name)
+    parsed_server = url_parse(server_name)
+
+    return not parsed_uri.netloc or parsed_uri.netloc == parsed_server.netloc
+
+
+def get_pid_from_uri(uri):
+    """Return the (pid_type, recid) pair of a local uri.
+
+    Returns ``None`` if the uri does not point to a record.
+    """
+    path_parts = url_parse(uri).path.strip('/').split('/')
+    if len(path_parts) < 2:
+        return None
+
+    endpoint = path_parts[-2]
+    pid_type = get_pid_type_from_endpoint(endpoint)
+    recid = path_parts[-1]
+    return pid_type, recid
+
+
+def iter_refs(obj):
+    """Yield the uris of all the references in obj."""
+    if isinstance(obj, dict):
+        if isinstance(obj.get('$ref'), string_types):
+            yield obj['$ref']
+            return
+        for value in itervalues(obj):
+            for uri in iter_refs(value):
+                yield uri
+    elif isinstance(obj, (list, tuple)):
+        for value in obj:
+            for uri in iter_refs(value):
+                yield uri
+
+
+def get_es_batch_loader():
+    """Return the batch Elasticsearch loader of the current request.
+
+    Outside of a request a new loader is returned every time, as the
+    application context can outlive many changes of the records.
+    """
+    if not has_request_context():
+        return BatchESJsonLoader()
+
+    loader = getattr(g, 'inspire_es_batch_loader', None)
+    if loader is None:
+        loader = g.inspire_es_batch_loader = BatchESJsonLoader()
+
+    return loader
+
+
 es_record_loader = ESJsonLoader()
 db_record_loader = DatabaseJsonLoader()
 SCHEMA_LOADER_CLS = json_loader_factory(
@@ -110,7 +242,8 @@ def replace_refs(obj, source='db'):
     :param source:
         List of sources from which to resolve the references. It can be any of:
             * 'db' - resolve from Database
-            * 'es' - resolve from Elasticsearch
+            * 'es' - resolve from Elasticsearch, fetching all the references
+              of obj at once and caching them for the current request
             * 'http' - force using HTTP
 
     :returns:
@@ -118,12 +251,23 @@ def replace_refs(obj, source='db'):
         available at the given URI.
     """
     loaders = {
-        'db': db_record_loader,
-        'es': es_record_loader,
-        'http': None
+        'db': lambda: db_record_loader,
+        'es': get_es_batch_loader,
+        'http': lambda: None
     }
     if source not in loaders:
         raise ValueError('source must be one of {}'.format(loaders.keys()))
 
-    loader = loaders[source]
+    loader = loaders[source]()
+    if source == 'es':
+        loader.prefetch(obj)
     return JsonRef.replace_refs(obj, loader=loader, load_on_repr=False)
+
+
+def prefetch_refs(obj):
+    """Fetch from Elasticsearch all the records referenced in obj.
+
+    Later calls to ``replace_refs(..., 'es')`` in the same request resolve
+    these references without further queries.
+    """
+    get_es_batch_loader().prefetch(obj)
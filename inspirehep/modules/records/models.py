@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of INSPIRE.
+# Copyright (C) 2014-2017 CERN.
+#
+# INSPIRE is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# INSPIRE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with INSPIRE. If not, see <http://www.gnu.org/licenses/>.
+#
+# In applying this license, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as an Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+"""Records models."""
+
+from __future__ import absolute_import, division, print_function
+
+from invenio_db import db
+from invenio_records.models import RecordMetadata
+from sqlalchemy_utils.types import UUIDType
+
+
+class RecordCitations(db.Model):
+    """Citations between records, from the citing to the cited record.
+
+    The citing record is stored both by UUID and by recid, so that the
+    citers of a record can be listed without resolving their PIDs.
+    """
+    __tablename__ = 'records_citations'
+
+    citer_id = db.Column(
+        UUIDType,
+        db.ForeignKey(RecordMetadata.id, ondelete='CASCADE'),
+        primary_key=True,
+    )
+    citer_recid = db.Column(db.Integer, nullable=False, index=True)
+    cited_recid = db.Column(db.Integer, primary_key=True, index=True)
@@ -70,8 +70,13 @@ def load_user_collections(app, user):
 
 
 def load_restricted_collections():
+    """Return the collections restricted to some users or roles.
+
+    The result is cached until the access actions change, see
+    :func:`invalidate_restricted_collections`.
+    """
     restricted_collections = current_cache.get('restricted_collections')
-    if restricted_collections:
+    if restricted_collections is not None:
         return restricted_collections
     else:
         restricted_collections = set(
@@ -86,16 +91,20 @@ def load_restricted_collections():
                     action='view-restricted-collection').all()
             ]
         )
-        if restricted_collections:
-            current_cache.set(
-                'restricted_collections',
-                restricted_collections,
-                timeout=current_app.config.get(
-                    'INSPIRE_COLLECTIONS_RESTRICTED_CACHE_TIMEOUT', 120)
-            )
+        current_cache.set(
+            'restricted_collections',
+            restricted_collections,
+            timeout=current_app.config.get(
+                'INSPIRE_COLLECTIONS_RESTRICTED_CACHE_TIMEOUT', 0)
+        )
         return restricted_collections
 
 
+def invalidate_restricted_collections():
+    """Drop the cached restricted collections."""
+    current_cache.delete('restricted_collections')
+
+
 def record_read_permission_factory(record=None):
     """Record permission factory."""
     return RecordPermission.create(record=record, action='read')
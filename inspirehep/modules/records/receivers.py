@@ -24,34 +24,152 @@
 
 from __future__ import absolute_import, division, print_function
 
+from collections import Counter
 from itertools import chain
 
+from flask import current_app
 from flask_sqlalchemy import models_committed
 
-from invenio_indexer.api import RecordIndexer
+from invenio_access.models import ActionRoles, ActionUsers
+from invenio_indexer.api import RecordIndexer, current_record_to_index
 from invenio_indexer.signals import before_record_index
 from invenio_records.models import RecordMetadata
+from invenio_records.signals import (
+    after_record_insert,
+    after_record_update,
+    before_record_delete,
+    before_record_update,
+)
 
-from inspire_dojson.utils import get_recid_from_ref
 from inspire_utils.helpers import force_list
 from inspire_utils.record import get_value
 from inspirehep.modules.records.api import InspireRecord
+from inspirehep.modules.search.cache import bump_generations
+from inspirehep.modules.search.statistics import update_collection_counts
 from inspirehep.utils.date import create_earliest_date
 
-from .experiments import EXPERIMENTS_MAP
-from .signals import after_record_enhanced
+from .citations import (
+    delete_citations,
+    get_changed_cited_recids,
+    get_citation_count,
+    is_hep,
+    update_citations,
+)
+from .enhancers import (
+    get_ref_tree,
+    populate_all_recids,
+    populate_recids,
+)
+from .experiments import normalize_experiment_name, update_experiments_index
+from .indexer import queue_records
+from .permissions import invalidate_restricted_collections
+from .signals import after_record_enhanced, after_records_indexed
+from .tasks import process_indexer_queue, update_citation_counts
+from .utils import indexing_records
 
 
 @models_committed.connect
 def receive_after_model_commit(sender, changes):
-    """Perform actions after models committed to database."""
+    """Perform actions after models committed to database.
+
+    Records are indexed right away, or queued for indexing if
+    ``RECORDS_INDEXER_ASYNC`` is set.
+    """
     indexer = RecordIndexer()
+    is_async = current_app.config.get('RECORDS_INDEXER_ASYNC')
+    operations = {}
+    records = []
+    indices = set()
+    index_changes = Counter()
     for model_instance, change in changes:
         if isinstance(model_instance, RecordMetadata):
-            if change in ('insert', 'update'):
-                indexer.index(InspireRecord(model_instance.json, model_instance))
-            else:
-                indexer.delete(InspireRecord(model_instance.json, model_instance))
+            record = InspireRecord(model_instance.json, model_instance)
+            index, doc_type = current_record_to_index(record)
+            indices.add(index)
+            op_type = 'index' if change in ('insert', 'update') else 'delete'
+            operations[str(record.id)] = {
+                'op_type': op_type,
+                'index': index,
+                'doc_type': doc_type,
+            }
+            records.append(record)
+            if change == 'insert':
+                index_changes[index] += 1
+            elif change == 'delete':
+                index_changes[index] -= 1
+
+    if is_async:
+        if queue_records(operations):
+            process_indexer_queue.apply_async(
+                countdown=current_app.config['RECORDS_INDEXER_DELAY'])
+    elif records:
+        with indexing_records(operations, records):
+            for record in records:
+                if operations[str(record.id)]['op_type'] == 'index':
+                    indexer.index(record)
+                else:
+                    indexer.delete(record)
+
+    if indices:
+        if not is_async:
+            # Otherwise they are bumped once the records are indexed.
+            bump_generations(indices)
+        update_collection_counts(index_changes)
+
+    cited_recids = get_changed_cited_recids(changes)
+    if cited_recids:
+        update_citation_counts.delay(sorted(cited_recids))
+
+
+@models_committed.connect
+def receive_access_action_commit(sender, changes):
+    """Invalidate the restricted collections when access actions change."""
+    if any(isinstance(model_instance, (ActionUsers, ActionRoles))
+           for model_instance, change in changes):
+        invalidate_restricted_collections()
+
+
+@after_record_insert.connect
+@after_record_update.connect
+def update_record_citations(sender, *args, **kwargs):
+    """Keep the citations table in sync with the references of a record."""
+    update_citations(sender)
+
+
+@before_record_delete.connect
+def delete_record_citations(sender, *args, **kwargs):
+    """Remove the citations made by a record about to be deleted."""
+    delete_citations(sender)
+
+
+@after_records_indexed.connect
+def invalidate_indexed_citesummaries(sender, uuids, records=(), *args, **kwargs):
+    """Drop the cached citesummaries affected by the indexed records.
+
+    Records indexed without their JSON, like deleted records, are handled
+    when they are committed.
+    """
+    # Imported here, as the API uses this module.
+    from inspirehep.modules.api.utils import invalidate_citesummaries
+
+    invalidate_citesummaries(records)
+
+
+@before_record_update.connect
+@before_record_delete.connect
+def invalidate_previous_citesummaries(sender, *args, **kwargs):
+    """Drop the cached citesummaries affected by a record before a change.
+
+    They are found from the previous version of the record, which is still
+    in its model, so that its former authors, experiments, institutions and
+    journals are affected too.
+    """
+    # Imported here, as the API uses this module.
+    from inspirehep.modules.api.utils import invalidate_citesummaries
+
+    model = getattr(sender, 'model', None)
+    if model is not None:
+        invalidate_citesummaries([model.json])
 
 
 @before_record_index.connect
@@ -60,10 +178,12 @@ def enhance_record(sender, json, *args, **kwargs):
        to allow receivers work with a fully populated record."""
     populate_inspire_document_type(sender, json, *args, **kwargs)
     match_valid_experiments(sender, json, *args, **kwargs)
+    populate_experiments_index(sender, json, *args, **kwargs)
     populate_recid_from_ref(sender, json, *args, **kwargs)
     populate_abstract_source_suggest(sender, json, *args, **kwargs)
     populate_title_suggest(sender, json, *args, **kwargs)
     populate_affiliation_suggest(sender, json, *args, **kwargs)
+    populate_citation_count(sender, json, *args, **kwargs)
     after_record_enhanced.send(json)
     add_book_autocomplete(sender, json, *args, **kwargs)
 
@@ -110,28 +230,36 @@ def populate_inspire_document_type(sender, json, *args, **kwargs):
 def match_valid_experiments(sender, json, *args, **kwargs):
     """Normalize the experiment names before indexing.
 
-    FIXME: this is currently using a static Python dictionary, while it should
-    use the current dynamic state of the Experiments collection.
+    Names are normalized to the legacy names of the Experiments collection,
+    which also populate the ``facet_experiment`` field.
     """
-    def _normalize(experiment):
-        try:
-            result = EXPERIMENTS_MAP[experiment.lower().replace(' ', '')]
-        except KeyError:
-            result = experiment
-
-        return result
-
     if 'accelerator_experiments' in json:
         accelerator_exps = json['accelerator_experiments']
+        facet_experiments = []
         for accelerator_exp in accelerator_exps:
+            if 'legacy_name' in accelerator_exp:
+                facet_experiments.append(
+                    normalize_experiment_name(accelerator_exp['legacy_name']))
+
             facet_experiment = []
             if 'experiment' in accelerator_exp:
                 experiments = force_list(accelerator_exp['experiment'])
                 for experiment in experiments:
-                    normalized_experiment = _normalize(experiment)
+                    normalized_experiment = normalize_experiment_name(experiment)
                     facet_experiment.append(normalized_experiment)
                 accelerator_exp['facet_experiment'] = [facet_experiment]
 
+        if facet_experiments:
+            json['facet_experiment'] = facet_experiments
+
+
+def populate_experiments_index(sender, json, *args, **kwargs):
+    """Add the names of Experiment records to the experiments index."""
+
+    # FIXME: Use a dedicated method when #1355 will be resolved.
+    if 'experiments.json' in json.get('$schema', ''):
+        update_experiments_index(json)
+
 
 def populate_recid_from_ref(sender, json, *args, **kwargs):
     """Extracts recids from all reference fields and adds them to ES.
@@ -163,37 +291,15 @@ def populate_recid_from_ref(sender, json, *args, **kwargs):
 
         {"records": [{"$ref": "http://x/y/1"}, {"$ref": "http://x/y/2"}]
          "recids": [1, 2]}
+
+    The places where references can occur are compiled from the JSON schema
+    of the record. Records without a known schema are walked entirely.
     """
-    list_ref_fields_translations = {
-        'deleted_records': 'deleted_recids'
-    }
-
-    def _recusive_find_refs(json_root):
-        if isinstance(json_root, list):
-            items = enumerate(json_root)
-        elif isinstance(json_root, dict):
-            # Note that items have to be generated before altering the dict.
-            # In this case, iteritems might break during iteration.
-            items = json_root.items()
-        else:
-            items = []
-
-        for key, value in items:
-            if (isinstance(json_root, dict) and isinstance(value, dict) and
-                    '$ref' in value):
-                # Append '_recid' and remove 'record' from the key name.
-                key_basename = key.replace('record', '').rstrip('_')
-                new_key = '{}_recid'.format(key_basename).lstrip('_')
-                json_root[new_key] = get_recid_from_ref(value)
-            elif (isinstance(json_root, dict) and isinstance(value, list) and
-                    key in list_ref_fields_translations):
-                new_list = [get_recid_from_ref(v) for v in value]
-                new_key = list_ref_fields_translations[key]
-                json_root[new_key] = new_list
-            else:
-                _recusive_find_refs(value)
-
-    _recusive_find_refs(json)
+    tree = get_ref_tree(json['$schema']) if '$schema' in json else None
+    if tree is not None:
+        populate_recids(tree, json)
+    else:
+        populate_all_recids(json)
 
 
 def populate_abstract_source_suggest(sender, json, *args, **kwargs):
@@ -213,6 +319,12 @@ def populate_abstract_source_suggest(sender, json, *args, **kwargs):
                 })
 
 
+def populate_citation_count(sender, json, *args, **kwargs):
+    """Populate the ``citation_count`` field of HEP records."""
+    if is_hep(json) and 'control_number' in json:
+        json['citation_count'] = get_citation_count(int(json['control_number']))
+
+
 def populate_title_suggest(sender, json, *args, **kwargs):
     """Populate title_suggest field of Journals records."""
     if 'journals.json' in json.get('$schema'):
@@ -273,20 +385,21 @@ def populate_affiliation_suggest(sender, json, *args, **kwargs):
         })
 
 
+EARLIEST_DATE_PATHS = [
+    'preprint_date',
+    'thesis_info.date',
+    'thesis_info.defense_date',
+    'publication_info.year',
+    'legacy_creation_date',
+    'imprints.date',
+]
+
+
 @before_record_index.connect
 def earliest_date(sender, json, *args, **kwargs):
     """Find and assign the earliest date to a HEP paper."""
-    date_paths = [
-        'preprint_date',
-        'thesis_info.date',
-        'thesis_info.defense_date',
-        'publication_info.year',
-        'legacy_creation_date',
-        'imprints.date',
-    ]
-
     dates = list(chain.from_iterable(
-        [force_list(get_value(json, path)) for path in date_paths]))
+        [force_list(get_value(json, path)) for path in EARLIEST_DATE_PATHS]))
 
     earliest_date = create_earliest_date(dates)
     if earliest_date:
@@ -24,7 +24,10 @@
 
 from __future__ import absolute_import, division, print_function
 
+from flask import stream_with_context
+
 from inspirehep.utils.cv_latex_html_text import Cv_latex_html_text
+from inspirehep.utils.export import prefetch_export_data, stream_exports
 
 
 class CVFORMATHTMLSerializer(object):
@@ -46,10 +49,11 @@ class CVFORMATHTMLSerializer(object):
         :param search_result: Elasticsearch search result.
         :param links: Dictionary of links to add to response.
         """
-        records = []
-        for hit in search_result['hits']['hits']:
-            records.append(Cv_latex_html_text(hit['_source'],
-                                              'cv_latex_html',
-                                              '<br/>').format())
-
-        return "\n".join(records)
+        records = [hit['_source'] for hit in search_result['hits']['hits']]
+        export_data = prefetch_export_data(records)
+
+        return stream_with_context(stream_exports(
+            Cv_latex_html_text(
+                record, 'cv_latex_html', '<br/>', **export_data).format()
+            for record in records
+        ))
@@ -26,11 +26,16 @@ from __future__ import absolute_import, division, print_function
 
 import json
 
+from inspirehep.modules.records.citations import get_citers
 from inspirehep.utils.record import get_title
 from inspirehep.utils.record_getter import get_es_records
 from inspirehep.modules.search import LiteratureSearch
 
 
+CITERS_CHUNK_SIZE = 1000
+"""Maximum number of recids sent in a single ``terms`` query."""
+
+
 class ImpactGraphSerializer(object):
 
     """Impact Graph serializer for records."""
@@ -54,29 +59,30 @@ class ImpactGraphSerializer(object):
         # Get citations
         citations = []
 
-        record_citations = LiteratureSearch().query_from_iq(
-            'refersto:' + str(record['control_number'])
-        ).params(
-            size=9999,
-            _source=[
-                'control_number',
-                'citation_count',
-                'titles',
-                'earliest_date'
-            ]
-        ).execute().hits
-
-        for citation in record_citations:
-            try:
-                citation_count = citation.citation_count
-            except AttributeError:
-                citation_count = 0
-            citations.append({
-                "inspire_id": citation['control_number'],
-                "citation_count": citation_count,
-                "title": get_title(citation.to_dict()),
-                "year": citation['earliest_date'].split('-')[0]
-            })
+        citers = get_citers(record['control_number'])
+        for i in range(0, len(citers), CITERS_CHUNK_SIZE):
+            record_citations = LiteratureSearch().filter(
+                'terms', control_number=citers[i:i + CITERS_CHUNK_SIZE]
+            ).params(
+                _source=[
+                    'control_number',
+                    'citation_count',
+                    'titles',
+                    'earliest_date'
+                ]
+            ).scan()
+
+            for citation in record_citations:
+                try:
+                    citation_count = citation.citation_count
+                except AttributeError:
+                    citation_count = 0
+                citations.append({
+                    "inspire_id": citation['control_number'],
+                    "citation_count": citation_count,
+                    "title": get_title(citation.to_dict()),
+                    "year": citation['earliest_date'].split('-')[0]
+                })
 
         out['citations'] = citations
 
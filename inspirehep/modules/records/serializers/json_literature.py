@@ -26,6 +26,7 @@ from __future__ import absolute_import, division, print_function
 
 from invenio_records_rest.serializers.json import JSONSerializer
 
+from inspirehep.modules.records.json_ref_loader import prefetch_refs
 from inspirehep.modules.records.wrappers import LiteratureRecord
 from inspirehep.modules.theme.jinja2filters import format_date
 
@@ -70,6 +71,22 @@ def get_display_fields(record):
 class LiteratureJSONBriefSerializer(JSONSerializer):
     """JSON brief format serializer."""
 
+    def serialize_search(self, pid_fetcher, search_result, links=None,
+                         item_links_factory=None):
+        """Serialize a search result.
+
+        The records referenced by the ``publication_info`` of all the hits
+        are fetched at once before the hits are serialized.
+        """
+        prefetch_refs([
+            hit['_source'].get('publication_info', [])
+            for hit in search_result['hits']['hits']
+        ])
+
+        return super(LiteratureJSONBriefSerializer, self).serialize_search(
+            pid_fetcher, search_result, links=links,
+            item_links_factory=item_links_factory)
+
     @staticmethod
     def preprocess_search_hit(pid, record_hit, links_factory=None):
         """Prepare a record hit from Elasticsearch for serialization."""
@@ -24,7 +24,10 @@
 
 from __future__ import absolute_import, division, print_function
 
+from flask import stream_with_context
+
 from inspirehep.utils.latex import Latex
+from inspirehep.utils.export import prefetch_export_data, stream_exports
 
 
 class LATEXUSSerializer(object):
@@ -46,8 +49,10 @@ class LATEXUSSerializer(object):
         :param search_result: Elasticsearch search result.
         :param links: Dictionary of links to add to response.
         """
-        records = []
-        for hit in search_result['hits']['hits']:
-            records.append(Latex(hit['_source'], 'latex_us').format())
+        records = [hit['_source'] for hit in search_result['hits']['hits']]
+        export_data = prefetch_export_data(records)
 
-        return "\n".join(records)
+        return stream_with_context(stream_exports(
+            Latex(record, 'latex_us', **export_data).format()
+            for record in records
+        ))
@@ -32,3 +32,18 @@ after_record_enhanced = _signals.signal('after-record-enhanced')
 """Signal is sent before a record is indexed and after all the enchancers have
 populated it.
 """
+
+before_records_indexed = _signals.signal('before-records-indexed')
+"""Signal is sent before some records are indexed or deleted from
+Elasticsearch, with their ``uuids`` and, when they are at hand, the JSON of
+their ``records`` from the database.
+"""
+
+after_records_indexed = _signals.signal('after-records-indexed')
+"""Signal is sent after some records were indexed or deleted from
+Elasticsearch, with their ``uuids`` and, when they are at hand, the JSON of
+their ``records`` from the database.
+
+The documents can be read right away, but the searches only see them once
+the index is refreshed.
+"""
@@ -36,6 +36,8 @@ from invenio_search import current_search_client as es
 
 from inspire_dojson.utils import get_recid_from_ref
 from inspirehep.modules.records.api import InspireRecord
+from inspirehep.modules.records.citations import push_citation_counts
+from inspirehep.modules.records.indexer import process_queue, schedule_queue
 from inspirehep.modules.records.utils import get_endpoint_from_record
 from inspirehep.utils.record_getter import get_db_record
 
@@ -129,6 +131,39 @@ def get_records_to_update(old_ref):
     return records
 
 
+@shared_task(ignore_result=True)
+def process_indexer_queue():
+    """Index or delete all the records queued by the commits.
+
+    The processing is scheduled again if some operations were put back in
+    the queue, even if the queue could not be processed.
+    """
+    try:
+        process_queue()
+    finally:
+        if schedule_queue():
+            process_indexer_queue.apply_async(
+                countdown=current_app.config['RECORDS_INDEXER_DELAY'])
+
+
+@shared_task(ignore_result=True)
+def schedule_indexer_queue():
+    """Schedule the processing of the queue if operations were left in it.
+
+    Runs periodically, as the scheduled processing can be lost, for example
+    when the worker is restarted.
+    """
+    if schedule_queue():
+        process_indexer_queue.delay()
+
+
+@shared_task(ignore_result=True)
+def update_citation_counts(recids):
+    """Update the ``citation_count`` of the given records in Elasticsearch."""
+    success, failed = push_citation_counts(recids)
+    logger.info('Updated citation counts: %d records, %d failures', success, failed)
+
+
 @shared_task
 def merge_merged_records():
     """Merge all records that were marked as merged."""
@@ -24,6 +24,8 @@
 
 from __future__ import absolute_import, division, print_function
 
+from contextlib import contextmanager
+
 from flask import current_app
 
 from inspirehep.modules.pidstore.utils import (
@@ -31,6 +33,8 @@ from inspirehep.modules.pidstore.utils import (
     get_pid_type_from_schema
 )
 
+from .signals import after_records_indexed, before_records_indexed
+
 
 def get_endpoint_from_record(record):
     """Return the endpoint corresponding to a record."""
@@ -44,3 +48,20 @@ def get_detailed_template_from_record(record):
     """Return the detailed template corresponding to the given record."""
     endpoint = get_endpoint_from_record(record)
     return current_app.config['RECORDS_UI_ENDPOINTS'][endpoint]['template']
+
+
+@contextmanager
+def indexing_records(uuids, records=()):
+    """Send the signals around the indexing of the records with some UUIDs.
+
+    :param uuids: the UUIDs of the records.
+    :param records: the JSON of the records, as in the database, when the
+        caller has it.
+    """
+    uuids = [str(uuid) for uuid in uuids]
+    records = list(records)
+    app = current_app._get_current_object()
+
+    before_records_indexed.send(app, uuids=uuids, records=records)
+    yield
+    after_records_indexed.send(app, uuids=uuids, records=records)
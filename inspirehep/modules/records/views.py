@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of INSPIRE.
+# Copyright (C) 2014-2017 CERN.
+#
+# INSPIRE is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# INSPIRE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with INSPIRE. If not, see <http://www.gnu.org/licenses/>.
+#
+# In applying this license, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as an Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+"""INSPIRE records blueprint."""
+
+from __future__ import absolute_import, division, print_function
+
+import json
+from itertools import islice
+
+from flask import Blueprint, abort, current_app, request, stream_with_context
+from flask_login import current_user
+
+from invenio_records_rest.errors import InvalidQueryRESTError
+
+from inspirehep.modules.search import IQ, LiteratureSearch
+from inspirehep.utils.bibtex import Bibtex
+from inspirehep.utils.cv_latex import Cv_latex
+from inspirehep.utils.cv_latex_html_text import Cv_latex_html_text
+from inspirehep.utils.export import prefetch_export_data
+from inspirehep.utils.latex import Latex
+
+
+blueprint = Blueprint('inspirehep_records',
+                      __name__,
+                      url_prefix='/export',)
+
+
+EXPORT_CHUNK_SIZE = 500
+"""Number of search results formatted together while exporting."""
+
+EXPORT_FORMATS = {
+    'bibtex': (
+        'application/x-bibtex', 'bib',
+        lambda record, **kwargs: Bibtex(record, **kwargs).format()),
+    'latexeu': (
+        'application/x-latexeu', 'tex',
+        lambda record, **kwargs: Latex(record, 'latex_eu', **kwargs).format()),
+    'latexus': (
+        'application/x-latexus', 'tex',
+        lambda record, **kwargs: Latex(record, 'latex_us', **kwargs).format()),
+    'cvformatlatex': (
+        'application/x-cvformatlatex', 'tex',
+        lambda record, **kwargs: Cv_latex(record, **kwargs).format()),
+    'cvformathtml': (
+        'application/x-cvformathtml', 'html',
+        lambda record, **kwargs: Cv_latex_html_text(
+            record, 'cv_latex_html', '<br/>', **kwargs).format()),
+    'cvformattext': (
+        'application/x-cvformattext', 'txt',
+        lambda record, **kwargs: Cv_latex_html_text(
+            record, 'cv_latex_text', '\n', **kwargs).format()),
+    'jsonl': (
+        'application/x-ndjson', 'jsonl',
+        None),
+}
+"""Export formats, with their MIME type, file extension and formatter.
+
+JSON lines are written as they come from Elasticsearch.
+"""
+
+
+def export_search(search, formatter=None):
+    """Stream the formatted results of a search, one per line.
+
+    Results are scrolled through and formatted in chunks of
+    ``EXPORT_CHUNK_SIZE``, so memory use does not depend on their number.
+
+    :param search: the search to export.
+    :param formatter: function returning the export of a record, given the
+        record and the output of ``prefetch_export_data``. If ``None``,
+        records are exported as JSON.
+    """
+    results = (
+        result.to_dict() for result in
+        search.params(size=EXPORT_CHUNK_SIZE).scan()
+    )
+
+    while True:
+        records = list(islice(results, EXPORT_CHUNK_SIZE))
+        if not records:
+            break
+
+        if formatter is None:
+            for record in records:
+                yield json.dumps(record) + '\n'
+            continue
+
+        export_data = prefetch_export_data(records)
+        for record in records:
+            yield formatter(record, **export_data) + '\n'
+
+
+@blueprint.route('/literature', methods=['GET'])
+def export_literature():
+    """Export all the literature records matching a query.
+
+    The query is given in ``q`` and the format in ``format``, which is
+    one of the keys of ``EXPORT_FORMATS``. Exports are restricted to
+    logged in users, and queries matching more than
+    ``RECORDS_EXPORT_MAX_RESULTS`` records are rejected.
+    """
+    if not current_user.is_authenticated:
+        abort(401)
+
+    export_format = request.values.get('format', 'bibtex')
+    if export_format not in EXPORT_FORMATS:
+        abort(400)
+    mimetype, extension, formatter = EXPORT_FORMATS[export_format]
+
+    query_string = request.values.get('q', '').strip()
+    if not query_string:
+        abort(400, 'A query is required.')
+
+    search = LiteratureSearch()
+    try:
+        search = search.query(IQ(query_string, search))
+        total = search.count()
+    except SyntaxError:
+        current_app.logger.debug(
+            'Failed parsing query: {0}'.format(query_string), exc_info=True)
+        raise InvalidQueryRESTError()
+
+    max_results = current_app.config['RECORDS_EXPORT_MAX_RESULTS']
+    if total > max_results:
+        abort(400, 'At most {} records can be exported at once, the query '
+                   'matches {}.'.format(max_results, total))
+
+    response = current_app.response_class(
+        stream_with_context(export_search(search, formatter)),
+        mimetype=mimetype)
+    response.headers['Content-Disposition'] = \
+        'attachment; filename=literature.{}'.format(extension)
+
+    return response
@@ -25,7 +25,10 @@ from __future__ import absolute_import, division, print_function
 from flask_login import current_user
 
 from inspirehep.utils.record import get_title
-from inspirehep.modules.records.json_ref_loader import replace_refs
+from inspirehep.modules.records.json_ref_loader import (
+    prefetch_refs,
+    replace_refs,
+)
 from inspirehep.modules.records.api import ESRecord
 from inspirehep.modules.records.permissions import has_update_permission
 from inspirehep.modules.search import JobsSearch
@@ -56,6 +59,7 @@ class LiteratureRecord(ESRecord, AdminToolsMixin):
         record.
         """
         conf_info = []
+        prefetch_refs(self['publication_info'])
         for pub_info in self['publication_info']:
             conference_recid = None
             parent_recid = None
@@ -23,8 +23,9 @@
 from __future__ import absolute_import, division, print_function
 
 import logging
+from timeit import default_timer
 
-from flask import request
+from flask import g, request
 from flask_security import current_user
 
 from elasticsearch import RequestError
@@ -40,6 +41,11 @@ from inspirehep.modules.records.permissions import (
 
 from .query_factory import inspire_query_factory
 
+try:
+    from functools import lru_cache
+except ImportError:
+    from functools32 import lru_cache
+
 
 logger = logging.getLogger(__name__)
 IQ = inspire_query_factory()
@@ -79,7 +85,7 @@ class SearchMixin(object):
 
         :param uuids: uuids of documents to be retrieved.
         :type uuids: list of strings representing uuids
-        :returns: list of JSON documents
+        :returns: list of JSON documents, without the ones not found
         """
         results = []
 
@@ -90,16 +96,44 @@ class SearchMixin(object):
                 body={'ids': uuids},
                 **kwargs
             )
-            results = [document['_source'] for document in documents['docs']]
+            results = [
+                document['_source'] for document in documents['docs']
+                if document.get('found')
+            ]
         except RequestError as e:
             logger.exception(e)
 
         return results
 
 
+@lru_cache(maxsize=1000)
+def compile_collection_filter(collection, excluded_collections):
+    """Compile the filter of a collection hiding some restricted collections.
+
+    :param collection: name of the collection being searched.
+    :param excluded_collections: sorted tuple of the restricted collections
+        which the user can't see.
+    :returns: the filter as a dictionary, which must not be modified, as it
+        is shared by all the callers.
+    """
+    query = Q('match', _collections=collection)
+
+    for excluded_collection in excluded_collections:
+        query = query & ~Q('match', _collections=excluded_collection)
+
+    return query.to_dict()
+
+
+def get_anonymous_filter(collection='Literature'):
+    """Return the filter applied to the searches of anonymous users."""
+    excluded_collections = tuple(sorted(all_restricted_collections))
+    return Q(compile_collection_filter(collection, excluded_collections))
+
+
 def inspire_filter():
     """Filter applied to all queries."""
     if request:
+        start = default_timer()
         collection = request.values.get('cc', 'Literature')
 
         user_roles = [r.name for r in current_user.roles]
@@ -108,11 +142,12 @@ def inspire_filter():
         else:
             user_coll = user_collections
 
-        query = Q('match', _collections=collection)
-
-        for collection in list(all_restricted_collections - user_coll):
-            query = query & ~Q('match', _collections=collection)
+        excluded_collections = tuple(
+            sorted(all_restricted_collections - user_coll))
+        query = Q(compile_collection_filter(collection, excluded_collections))
 
+        g.inspire_filter_time = g.get('inspire_filter_time', 0) + \
+            default_timer() - start
         return query
 
 
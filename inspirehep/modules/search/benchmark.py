@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of INSPIRE.
+# Copyright (C) 2014-2017 CERN.
+#
+# INSPIRE is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# INSPIRE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with INSPIRE. If not, see <http://www.gnu.org/licenses/>.
+#
+# In applying this license, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as an Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+"""Measure the latency of the query parsers."""
+
+from __future__ import absolute_import, division, print_function
+
+import gc
+import io
+import json
+import math
+import resource
+from timeit import default_timer
+
+from .api import IQ, LiteratureSearch
+from .fast_parser import parse_spires_query
+from .query_factory import clear_query_cache, parse_pypeg_query
+
+
+def load_queries(path):
+    """Read a file containing one query per line."""
+    with io.open(path, encoding='utf-8') as f:
+        return [line.rstrip('\n') for line in f if line.strip()]
+
+
+def load_baseline(path):
+    """Read a baseline written by :func:`save_baseline`."""
+    with io.open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_baseline(path, baseline):
+    """Write the results of :func:`benchmark_queries` as a baseline."""
+    with io.open(path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(
+            baseline, ensure_ascii=False, indent=4, sort_keys=True,
+            separators=(',', ': ')) + u'\n')
+
+
+def measure(func, args, repeat):
+    """Return the sorted times, in seconds, of ``repeat`` calls."""
+    timings = []
+    for _ in range(repeat):
+        start = default_timer()
+        func(*args)
+        timings.append(default_timer() - start)
+
+    return sorted(timings)
+
+
+def count_objects(func, args):
+    """Return the number of objects created by a call and still alive.
+
+    Python 2 has no allocation counter, so this uses the number of objects
+    tracked by the garbage collector, which stays stable across machines.
+    It includes the returned value and, as the collector is disabled during
+    the call, the cyclic garbage.
+    """
+    gc.collect()
+    gc.disable()
+    try:
+        before = gc.get_count()[0]
+        result = func(*args)
+        count = gc.get_count()[0] - before
+        del result
+        return count
+    finally:
+        gc.enable()
+
+
+def get_maxrss():
+    """Return the peak resident set size of the process, in kilobytes."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def percentile(timings, percent):
+    """Return a percentile of sorted timings, using the nearest rank."""
+    rank = int(math.ceil(percent / 100 * len(timings)))
+    return timings[max(rank, 1) - 1]
+
+
+def time_parser(parser, query, repeat):
+    """Return the median time, in seconds, taken to parse a query."""
+    return percentile(measure(parser, (query,), repeat), 50)
+
+
+def benchmark_parsers(queries, repeat=20):
+    """Time the fast parser and ``pypeg2`` on every query.
+
+    Returns a list of ``(query, fast, pypeg)`` tuples, where ``fast`` is
+    ``None`` if the query is not handled by the fast parser.
+    """
+    results = []
+    for query in queries:
+        if parse_spires_query(query) is None:
+            fast = None
+        else:
+            fast = time_parser(parse_spires_query, query, repeat)
+        pypeg = time_parser(parse_pypeg_query, query, repeat)
+        results.append((query, fast, pypeg))
+
+    return results
+
+
+def _calibration_workload():
+    return sorted(str(i) for i in range(10000))
+
+
+def calibrate(repeat=20):
+    """Return the median time of a fixed workload.
+
+    Baselines store it next to the latencies, so that they can be compared
+    with runs on a faster or slower machine.
+    """
+    return percentile(measure(_calibration_workload, (), repeat), 50)
+
+
+def compile_uncached(query, search):
+    """Turn a query into Elastic Search DSL, bypassing the query cache."""
+    clear_query_cache()
+    return IQ(query, search)
+
+
+def benchmark_queries(queries, repeat=100):
+    """Time the conversion of every query to Elastic Search DSL.
+
+    Returns a dictionary with the time taken by :func:`calibrate`, the peak
+    memory usage in kilobytes and, for every query, the ``p50`` and ``p99``
+    latencies in seconds and the number of ``objects`` it creates.
+    """
+    search = LiteratureSearch()
+
+    results = {}
+    for query in queries:
+        timings = measure(compile_uncached, (query, search), repeat)
+        results[query] = {
+            'objects': count_objects(compile_uncached, (query, search)),
+            'p50': percentile(timings, 50),
+            'p99': percentile(timings, 99),
+        }
+
+    return {
+        'calibration': calibrate(),
+        'maxrss': get_maxrss(),
+        'queries': results,
+    }
+
+
+def find_missing(results, baseline):
+    """Return the queries of the results that are not in the baseline."""
+    return sorted(set(results['queries']) - set(baseline['queries']))
+
+
+def find_regressions(results, baseline, tolerance, min_delta=0.001):
+    """Compare the results of :func:`benchmark_queries` with a baseline.
+
+    The median latency of a query is a regression if it is more than
+    ``tolerance`` times its baseline value, scaled by the ratio of the
+    calibration times, and more than ``min_delta`` seconds slower, so that
+    the noise of sub-millisecond timings is ignored. The 99th percentile is
+    too noisy to be compared. The number of objects is a regression if it
+    is more than ``tolerance`` times its baseline value.
+
+    Queries that are not in the baseline are returned by
+    :func:`find_missing` instead.
+
+    Returns a list of ``(query, metric, expected, actual)`` tuples.
+    """
+    scale = results['calibration'] / baseline['calibration']
+
+    regressions = []
+    for query, metrics in sorted(results['queries'].items()):
+        expected = baseline['queries'].get(query)
+        if not expected:
+            continue
+
+        p50 = expected['p50'] * scale
+        if metrics['p50'] > max(p50 * tolerance, p50 + min_delta):
+            regressions.append((query, 'p50', p50, metrics['p50']))
+
+        objects = expected.get('objects')
+        if objects is not None and metrics['objects'] > objects * tolerance:
+            regressions.append((query, 'objects', objects, metrics['objects']))
+
+    return regressions
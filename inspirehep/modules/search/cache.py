@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of INSPIRE.
+# Copyright (C) 2014-2017 CERN.
+#
+# INSPIRE is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# INSPIRE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with INSPIRE. If not, see <http://www.gnu.org/licenses/>.
+#
+# In applying this license, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as an Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+"""Cache of the Elasticsearch responses to anonymous searches."""
+
+from __future__ import absolute_import, division, print_function
+
+import json
+from hashlib import sha1
+
+from flask import current_app, request
+from flask_login import current_user
+
+from invenio_cache import current_cache
+
+GENERATION_CACHE_TIMEOUTS = (
+    'SEARCH_RESPONSE_CACHE_TIMEOUT',
+    'SEARCH_FACETS_CACHE_TIMEOUT',
+)
+"""Settings enabling the caches which are invalidated by the generations."""
+
+
+def get_generation_key(index):
+    """Return the cache key of the generation counter of an index."""
+    return 'search_generation:{}'.format(index)
+
+
+def get_generations(indices):
+    """Return the generation counters of some indices."""
+    generations = current_cache.get_many(
+        *[get_generation_key(index) for index in indices])
+    return [generation or 0 for generation in generations]
+
+
+def increment_generations(indices):
+    """Increment the generation counters of some indices."""
+    for index in indices:
+        current_cache.cache.inc(get_generation_key(index))
+
+
+def bump_generations(indices):
+    """Invalidate the cached responses of the searches on some indices.
+
+    The generations are bumped right away, and a second time after
+    ``SEARCH_RESPONSE_CACHE_INVALIDATION_DELAY`` seconds, which also drops
+    the responses cached before the changes became visible to searches.
+    The generations also invalidate the cached facets.
+    """
+    if not any(current_app.config.get(timeout)
+               for timeout in GENERATION_CACHE_TIMEOUTS):
+        return
+
+    indices = sorted(set(indices))
+    if not indices:
+        return
+
+    # Imported here, as the tasks use this module.
+    from .tasks import increment_generations_later
+
+    increment_generations(indices)
+    increment_generations_later.apply_async(
+        args=(indices,),
+        countdown=current_app.config['SEARCH_RESPONSE_CACHE_INVALIDATION_DELAY'],
+    )
+
+
+def get_response_cache_key(search):
+    """Return the cache key of the response to a search.
+
+    It covers everything sent to Elasticsearch, so the query, the filters
+    on restricted collections, the sort, the page and the aggregations,
+    except the preference, which is specific to each user.
+    """
+    indices = sorted(search._index or [])
+    params = dict(
+        (key, value) for key, value in search._params.items()
+        if key != 'preference'
+    )
+    digest = sha1(json.dumps(
+        [indices, search._doc_type, search.to_dict(), params],
+        sort_keys=True,
+        default=str,
+    )).hexdigest()
+
+    generations = ':'.join(str(generation)
+                           for generation in get_generations(indices))
+    return 'search_response:{}:{}'.format(generations, digest)
+
+
+def is_response_cacheable():
+    """Tell whether the response to the current search can be cached."""
+    return bool(current_app.config.get('SEARCH_RESPONSE_CACHE_TIMEOUT')) and \
+        request.method == 'GET' and \
+        current_user.is_anonymous
+
+
+def execute_cached(search):
+    """Execute a search, reusing a cached response if there is one.
+
+    The response is attached to the search, so that calling its ``execute``
+    method later does not query Elasticsearch again.
+    """
+    cache_key = get_response_cache_key(search)
+
+    response = current_cache.get(cache_key)
+    if response is not None:
+        current_cache.cache.inc('search_response_cache:hits')
+        search._response = search._response_class(
+            response, callbacks=search._doc_type_map)
+        return search
+
+    current_cache.cache.inc('search_response_cache:misses')
+    response = search.execute().to_dict()
+    current_cache.set(
+        cache_key,
+        response,
+        timeout=current_app.config['SEARCH_RESPONSE_CACHE_TIMEOUT'],
+    )
+    return search
+
+
+def get_response_cache_stats():
+    """Return the hit and miss counters, shared by all processes."""
+    hits, misses = current_cache.get_many(
+        'search_response_cache:hits', 'search_response_cache:misses')
+
+    return {
+        'hits': hits or 0,
+        'misses': misses or 0,
+    }
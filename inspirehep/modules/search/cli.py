@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of INSPIRE.
+# Copyright (C) 2014-2017 CERN.
+#
+# INSPIRE is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# INSPIRE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with INSPIRE. If not, see <http://www.gnu.org/licenses/>.
+#
+# In applying this license, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as an Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+"""Search commands."""
+
+from __future__ import absolute_import, division, print_function
+
+import os
+
+import click
+
+from flask import current_app
+from flask_cli import with_appcontext
+
+from .benchmark import (
+    benchmark_parsers,
+    benchmark_queries,
+    find_missing,
+    find_regressions,
+    load_baseline,
+    load_queries,
+    save_baseline,
+)
+from .cache import get_response_cache_stats
+from .utils import (
+    generate_valid_keywords,
+    get_keywords_registry_path,
+    write_keywords_registry,
+)
+
+
+@click.group()
+def search():
+    """Commands related to searching INSPIRE."""
+
+
+@search.command('build-keywords')
+@click.option('--output', type=click.Path(dir_okay=False),
+              help='Defaults to SEARCH_KEYWORDS_REGISTRY.')
+@with_appcontext
+def build_keywords(output):
+    """Precompute the list of valid search keywords."""
+    output = output or get_keywords_registry_path(current_app)
+    keywords = generate_valid_keywords()
+
+    write_keywords_registry(
+        output,
+        keywords,
+        current_app.config['SEARCH_ELASTIC_KEYWORD_MAPPING'],
+    )
+    click.echo('{} keywords written to {}.'.format(len(keywords), output))
+
+
+@search.command()
+@click.argument('queries', type=click.Path(exists=True, dir_okay=False))
+@click.option('--repeat', default=20, help='Number of runs per query.')
+@with_appcontext
+def benchmark(queries, repeat):
+    """Compare the parse latency of the fast parser and of pypeg2.
+
+    QUERIES is a file containing one query per line.
+    """
+    click.echo('{:>10} {:>10}  {}'.format('fast (us)', 'pypeg (us)', 'query'))
+    for query, fast, pypeg in benchmark_parsers(load_queries(queries), repeat):
+        fast = '-' if fast is None else '{:.1f}'.format(fast * 1e6)
+        click.echo(u'{:>10} {:>10.1f}  {}'.format(fast, pypeg * 1e6, query))
+
+
+@search.command()
+@click.argument('queries', type=click.Path(exists=True, dir_okay=False))
+@click.option('--baseline', type=click.Path(dir_okay=False),
+              help='Baseline to compare the results with.')
+@click.option('--update-baseline', is_flag=True,
+              help='Write the results to the baseline instead.')
+@click.option('--require-baseline', is_flag=True,
+              help='Fail if the baseline does not exist or misses queries.')
+@click.option('--tolerance', default=1.5,
+              help='Allowed ratio between the results and the baseline.')
+@click.option('--min-delta', default=0.001,
+              help='Latency increase, in seconds, ignored as noise.')
+@click.option('--repeat', default=100, help='Number of runs per query.')
+@with_appcontext
+def latency(queries, baseline, update_baseline, require_baseline, tolerance,
+            min_delta, repeat):
+    """Measure the time taken to turn queries into Elastic Search DSL.
+
+    QUERIES is a file containing one query per line. Exits with an error if
+    a query is slower or allocates more objects than in the baseline.
+    """
+    results = benchmark_queries(load_queries(queries), repeat)
+
+    click.echo('{:>10} {:>10} {:>10}  {}'.format(
+        'p50 (us)', 'p99 (us)', 'objects', 'query'))
+    for query, metrics in sorted(results['queries'].items()):
+        click.echo(u'{:>10.1f} {:>10.1f} {:>10}  {}'.format(
+            metrics['p50'] * 1e6,
+            metrics['p99'] * 1e6,
+            metrics['objects'],
+            query,
+        ))
+    click.echo('maxrss: {} kB'.format(results['maxrss']))
+
+    if not baseline:
+        if require_baseline:
+            raise click.UsageError(
+                '--require-baseline needs a --baseline to compare with.')
+        return
+
+    if update_baseline:
+        save_baseline(baseline, results)
+        click.echo('Baseline written to {}.'.format(baseline))
+        return
+
+    if not os.path.exists(baseline):
+        if require_baseline:
+            raise click.ClickException(
+                'No baseline found at {}.'.format(baseline))
+        click.echo('No baseline found at {}.'.format(baseline))
+        return
+
+    expected = load_baseline(baseline)
+    missing = find_missing(results, expected)
+    for query in missing:
+        click.echo(u'{}: not in the baseline.'.format(query), err=True)
+
+    regressions = find_regressions(results, expected, tolerance, min_delta)
+    for query, metric, expected, actual in regressions:
+        click.echo(u'{}: {} went from {:.3g} to {:.3g}.'.format(
+            query, metric, expected, actual), err=True)
+    if regressions:
+        raise click.ClickException(
+            '{} regressions found.'.format(len(regressions)))
+    if missing and require_baseline:
+        raise click.ClickException(
+            '{} queries not in the baseline.'.format(len(missing)))
+
+
+@search.command('cache-stats')
+@with_appcontext
+def cache_stats():
+    """Show the hits and misses of the search response cache."""
+    stats = get_response_cache_stats()
+    click.echo('hits: {hits}\nmisses: {misses}'.format(**stats))
@@ -24,10 +24,18 @@
 
 from __future__ import absolute_import, division, print_function
 
+from flask import g
 from werkzeug.local import LocalProxy
 
+from .cli import search
+from .parser import build_keywords_grammar
+from .query_factory import get_keyword_mapping_version
 from .views import blueprint
-from .utils import generate_valid_keywords
+from .utils import (
+    generate_valid_keywords,
+    get_keywords_registry_path,
+    read_keywords_registry,
+)
 
 
 class INSPIRESearch(object):
@@ -40,13 +48,51 @@ class INSPIRESearch(object):
 
     def init_app(self, app, assets=None, **kwargs):
         """Initialize application object."""
+        self.init_keywords(app)
         self.init_config(app.config)
+        # Spare the first search from computing the digest.
+        get_keyword_mapping_version(
+            app.config.get('SEARCH_ELASTIC_KEYWORD_MAPPING', {}))
         app.register_blueprint(blueprint)
+        app.cli.add_command(search)
+        if app.config.get('SEARCH_SERVER_TIMING'):
+            app.after_request(add_server_timing)
         app.extensions['inspire-search'] = self
 
+    def init_keywords(self, app):
+        """Load the precomputed search keywords, if any.
+
+        This spares every new process from collecting them, and from
+        building the grammar, while serving its first search.
+        """
+        if 'SEARCH_ALLOWED_KEYWORDS' in app.config:
+            return
+
+        keywords = read_keywords_registry(
+            get_keywords_registry_path(app),
+            app.config.get('SEARCH_ELASTIC_KEYWORD_MAPPING', {}),
+        )
+        if keywords is not None:
+            app.config['SEARCH_ALLOWED_KEYWORDS'] = keywords
+            build_keywords_grammar(keywords)
+
     def init_config(self, config):
         """Initialize configuration."""
         config.setdefault(
             'SEARCH_ALLOWED_KEYWORDS',
             LocalProxy(generate_valid_keywords)
         )
+
+
+def add_server_timing(response):
+    """Report the time spent building the collection filters.
+
+    See https://www.w3.org/TR/server-timing/.
+    """
+    inspire_filter_time = g.get('inspire_filter_time')
+    if inspire_filter_time is not None:
+        response.headers.add(
+            'Server-Timing',
+            'inspire-filter;dur={:.3f}'.format(inspire_filter_time * 1000),
+        )
+    return response
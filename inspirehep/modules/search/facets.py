@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of INSPIRE.
+# Copyright (C) 2014-2017 CERN.
+#
+# INSPIRE is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# INSPIRE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with INSPIRE. If not, see <http://www.gnu.org/licenses/>.
+#
+# In applying this license, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as an Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+"""Aggregations computed apart from the search results."""
+
+from __future__ import absolute_import, division, print_function
+
+from flask import current_app
+
+from invenio_cache import current_cache
+
+from .cache import get_response_cache_key
+
+SAMPLER_AGGREGATION = 'sample'
+"""Name of the aggregation wrapping the facets when they are sampled."""
+
+
+def are_facets_deferred(index):
+    """Tell whether the searches on an index are returned without facets."""
+    return index in current_app.config.get('SEARCH_DEFERRED_FACETS', [])
+
+
+def without_aggregations(search):
+    """Return a copy of a search which does not compute aggregations."""
+    search = search._clone()
+    search.aggs._params = {'aggs': {}}
+    return search
+
+
+def sample_aggregations(search, shard_size):
+    """Compute the aggregations of a search on its best matching documents.
+
+    The aggregations are moved below a ``sampler`` aggregation, which only
+    considers the ``shard_size`` top scoring documents of every shard.
+    """
+    body = search.to_dict()
+    aggregations = body.pop('aggs', {})
+    body['aggs'] = {
+        SAMPLER_AGGREGATION: {
+            'sampler': {'shard_size': shard_size},
+            'aggs': aggregations,
+        },
+    }
+
+    return search.update_from_dict(body)
+
+
+def compute_facets(search):
+    """Return the aggregations of a search, without its hits.
+
+    If ``SEARCH_FACETS_CACHE_TIMEOUT`` is set, results are cached for that
+    many seconds and invalidated like the cached search responses.
+    """
+    search = search[0:0]
+    shard_size = current_app.config.get('SEARCH_FACETS_SAMPLE_SIZE')
+    if shard_size:
+        search = sample_aggregations(search, shard_size)
+
+    timeout = current_app.config.get('SEARCH_FACETS_CACHE_TIMEOUT')
+    if timeout:
+        cache_key = 'search_facets:' + get_response_cache_key(search)
+        facets = current_cache.get(cache_key)
+        if facets is not None:
+            return facets
+
+    facets = search.execute().to_dict().get('aggregations', {})
+    if shard_size:
+        facets = facets.get(SAMPLER_AGGREGATION, {})
+        facets.pop('doc_count', None)
+
+    if timeout:
+        current_cache.set(cache_key, facets, timeout=timeout)
+    return facets
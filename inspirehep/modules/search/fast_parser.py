@@ -0,0 +1,417 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of INSPIRE.
+# Copyright (C) 2014-2017 CERN.
+#
+# INSPIRE is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# INSPIRE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with INSPIRE. If not, see <http://www.gnu.org/licenses/>.
+#
+# In applying this license, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as an Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+"""Fast path for parsing the most common SPIRES queries.
+
+Parsing with ``pypeg2`` is slow, mostly because every value goes through
+``SpiresSmartValue``, which starts a nested parse. The parser below is a
+hand-written recursive descent parser for ``find`` queries made of
+SPIRES keywords, values, boolean operators, parentheses and comparisons.
+It mirrors the rules of ``parser.py`` one by one, in the same order, and
+returns the same AST as ``pypeg2`` followed by the walkers.
+
+Queries made of a single ``keyword:value`` in invenio syntax are handled
+too. Anything else (other ``keyword:value`` queries, ranges, wildcards,
+nested ``refersto`` and ``citedby`` queries, the rest of the invenio
+syntax...) makes it give up, so that the query is parsed by ``pypeg2``.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import re
+
+from invenio_query_parser import ast
+from invenio_query_parser.parser import KeywordRule
+
+from .ast import SpiresOp
+from .parser import SPIRES_KEYWORD_REGEX, init_keywords_grammar
+from .walkers.pypeg_to_ast import build_spires_query
+from .walkers.spires_to_invenio import SpiresToInvenio
+
+
+FIND_REGEX = re.compile(r"(find|fin|f)", re.I)
+WHITESPACE_REGEX = re.compile(r"\s+")
+VALUE_UNIT_REGEX = re.compile(r"[^\s\)\(]+")
+NUMBER_REGEX = re.compile(r"\d+")
+PLUS_REGEX = re.compile(r'\+(?=\s|\)|$)')
+MINUS_REGEX = re.compile(r'\-(?=\s|\)|$)')
+AFTER_REGEX = re.compile('after', re.I)
+BEFORE_REGEX = re.compile('before', re.I)
+AND_NOT_REGEX = re.compile(r"and\s+not", re.I)
+NOT_REGEX = re.compile(r"not", re.I)
+AND_REGEX = re.compile(r"and", re.I)
+OR_REGEX = re.compile(r"or", re.I)
+
+UNSUPPORTED_REGEX = re.compile(r"[:*?%#\n\r]|->|refersto|citedby", re.I)
+"""Queries matching this are left to ``pypeg2``.
+
+They could match rules that are not mirrored here: ``keyword:value``
+queries, ranges, wildcards and nested queries.
+"""
+
+UNSUPPORTED_VALUE_REGEX = re.compile(r"[*?%#]|->|refersto|citedby", re.I)
+
+KEYWORD_VALUE_REGEX = re.compile(
+    r'\s*(?P<keyword>[^\s:]+):\s*'
+    r'(?:"(?P<quoted_value>[^"\\]*)"|(?P<value>[^\s()\'"/\\:][^\s()"\\:]*))'
+    r'\s*\Z'
+)
+"""A ``keyword:value`` query in invenio syntax.
+
+Values are restricted to the ones ``SimpleValue`` and ``DoubleQuotedString``
+parse in a single unit, ranges and wildcards are excluded by
+``UNSUPPORTED_VALUE_REGEX``.
+"""
+
+spires_to_invenio = SpiresToInvenio()
+
+
+class UnsupportedQuery(Exception):
+
+    """The query must be parsed by ``pypeg2``."""
+
+
+class SpiresParser(object):
+
+    """Recursive descent parser for SPIRES ``find`` queries.
+
+    Every ``parse_*`` method takes the position at which the matching rule
+    of ``parser.py`` would be tried. It returns the converted node and the
+    position after it, or ``None`` if the rule does not match. It raises
+    ``UnsupportedQuery`` when ``pypeg2`` would try a rule which is not
+    mirrored here.
+    """
+
+    def __init__(self, text):
+        self.text = text
+
+    def parse(self):
+        pos = self.skip_whitespace(0)
+
+        find = FIND_REGEX.match(self.text, pos)
+        if not find:
+            raise UnsupportedQuery
+        whitespace = WHITESPACE_REGEX.match(self.text, find.end())
+        if not whitespace:
+            raise UnsupportedQuery
+
+        result = self.parse_query(whitespace.end())
+        if result is None:
+            raise UnsupportedQuery
+        query, pos = result
+
+        if self.skip_whitespace(pos) != len(self.text):
+            raise UnsupportedQuery
+        return query
+
+    def skip_whitespace(self, pos):
+        match = WHITESPACE_REGEX.match(self.text, pos)
+        return match.end() if match else pos
+
+    def parse_query(self, pos):
+        """Mirror ``SpiresQuery``."""
+        result = self.parse_parenthesized_query(pos) or \
+            self.parse_simple_query(pos)
+        if result is None:
+            return None
+        child, pos = result
+
+        children = [child]
+        while True:
+            start = self.skip_whitespace(pos)
+            result = self.parse_not_query(start) or \
+                self.parse_and_query(start) or \
+                self.parse_or_query(start)
+            if result is None:
+                break
+            child, pos = result
+            children.append(child)
+
+        return build_spires_query(children), pos
+
+    def parse_parenthesized_query(self, pos):
+        """Mirror ``SpiresParenthesizedQuery``."""
+        if not self.text.startswith('(', pos):
+            return None
+
+        result = self.parse_query(self.skip_whitespace(pos + 1))
+        if result is None:
+            return None
+        query, pos = result
+
+        pos = self.skip_whitespace(pos)
+        if not self.text.startswith(')', pos):
+            return None
+        return query, pos + 1
+
+    def parse_simple_query(self, pos):
+        """Mirror ``SpiresSimpleQuery``."""
+        return self.parse_keyword_query(pos) or self.parse_value_query(pos)
+
+    def parse_keyword_query(self, pos):
+        """Mirror ``SpiresKeywordQuery``.
+
+        Only the ``keyword value`` alternative is mirrored, the others need
+        a colon or a nestable keyword. So do ranges and wildcards, which are
+        tried before ``SpiresValue``.
+        """
+        keyword = SPIRES_KEYWORD_REGEX.match(self.text, pos)
+        if not keyword:
+            return None
+        whitespace = WHITESPACE_REGEX.match(self.text, keyword.end())
+        if not whitespace:
+            return None
+
+        pos = whitespace.end()
+        result = self.parse_greater_equal_query(pos) or \
+            self.parse_greater_query(pos) or \
+            self.parse_lower_equal_query(pos) or \
+            self.parse_lower_query(pos) or \
+            self.parse_value(pos)
+        if result is None:
+            return None
+        value, pos = result
+
+        return SpiresOp(ast.Keyword(keyword.group(0)), value), pos
+
+    def parse_value_query(self, pos):
+        """Mirror ``SpiresValueQuery``."""
+        result = self.parse_value(pos)
+        if result is None:
+            return None
+        value, pos = result
+        return ast.ValueQuery(value), pos
+
+    def parse_comparison(self, pos, operator, regex=None):
+        if self.text.startswith(operator, pos):
+            pos += len(operator)
+        else:
+            match = regex.match(self.text, pos) if regex else None
+            if not match:
+                return None
+            pos = match.end()
+        return self.parse_value(self.skip_whitespace(pos))
+
+    def parse_number(self, pos, suffix_regex):
+        number = NUMBER_REGEX.match(self.text, pos)
+        if not number:
+            return None
+        suffix = suffix_regex.match(self.text, number.end())
+        if not suffix:
+            return None
+        return ast.Value(number.group(0)), suffix.end()
+
+    def parse_greater_equal_query(self, pos):
+        """Mirror ``GreaterEqualQuery``."""
+        result = self.parse_comparison(pos, '>=') or \
+            self.parse_number(pos, PLUS_REGEX)
+        if result is None:
+            return None
+        value, pos = result
+        return ast.GreaterEqualOp(value), pos
+
+    def parse_greater_query(self, pos):
+        """Mirror ``GreaterQuery``."""
+        result = self.parse_comparison(pos, '>', AFTER_REGEX)
+        if result is None:
+            return None
+        value, pos = result
+        return ast.GreaterOp(value), pos
+
+    def parse_lower_equal_query(self, pos):
+        """Mirror ``LowerEqualQuery``."""
+        result = self.parse_comparison(pos, '<=') or \
+            self.parse_number(pos, MINUS_REGEX)
+        if result is None:
+            return None
+        value, pos = result
+        return ast.LowerEqualOp(value), pos
+
+    def parse_lower_query(self, pos):
+        """Mirror ``LowerQuery``."""
+        result = self.parse_comparison(pos, '<', BEFORE_REGEX)
+        if result is None:
+            return None
+        value, pos = result
+        return ast.LowerOp(value), pos
+
+    def parse_boolean_query(self, pos, regexes, allow_empty):
+        """Mirror the operands of ``SpiresNotQuery``, ``SpiresAndQuery``
+        and ``SpiresOrQuery``.
+        """
+        for regex in regexes:
+            operator = regex.match(self.text, pos)
+            if operator:
+                break
+        else:
+            return None
+        pos = operator.end()
+
+        whitespace = WHITESPACE_REGEX.match(self.text, pos)
+        if whitespace:
+            result = self.parse_simple_query(whitespace.end())
+            if result is not None:
+                return result
+
+        result = self.parse_parenthesized_query(self.skip_whitespace(pos))
+        if result is not None:
+            return result
+
+        if whitespace:
+            result = self.parse_value_query(whitespace.end())
+            if result is not None:
+                return result
+
+        if allow_empty:
+            # ``pypeg2`` would fall back to an ``EmptyQuery``.
+            raise UnsupportedQuery
+        return None
+
+    def parse_not_query(self, pos):
+        """Mirror ``SpiresNotQuery``."""
+        result = self.parse_boolean_query(
+            pos, (AND_NOT_REGEX, NOT_REGEX), allow_empty=False)
+        if result is None:
+            return None
+        query, pos = result
+        return ast.AndOp(None, ast.NotOp(query)), pos
+
+    def parse_and_query(self, pos):
+        """Mirror ``SpiresAndQuery``."""
+        result = self.parse_boolean_query(
+            pos, (AND_REGEX,), allow_empty=True)
+        if result is None:
+            return None
+        query, pos = result
+        return ast.AndOp(None, query), pos
+
+    def parse_or_query(self, pos):
+        """Mirror ``SpiresOrQuery``."""
+        result = self.parse_boolean_query(
+            pos, (OR_REGEX,), allow_empty=True)
+        if result is None:
+            return None
+        query, pos = result
+        return ast.OrOp(None, query), pos
+
+    def parse_value(self, pos):
+        """Mirror ``SpiresValue``.
+
+        The value is the text spanned by the smart values, including the
+        whitespace between them.
+        """
+        end = self.parse_smart_value(pos)
+        if end is None:
+            # ``Value`` is tried next: it can only match where a smart
+            # value was rejected for being a boolean operator.
+            if pos == len(self.text) or self.text[pos] in '()' or \
+                    WHITESPACE_REGEX.match(self.text, pos):
+                return None
+            raise UnsupportedQuery
+
+        while True:
+            whitespace = WHITESPACE_REGEX.match(self.text, end)
+            if not whitespace:
+                break
+            next_end = self.parse_smart_value(whitespace.end())
+            if next_end is None:
+                break
+            end = next_end
+
+        return ast.Value(self.text[pos:end]), end
+
+    def parse_smart_value(self, pos):
+        """Mirror ``SpiresSmartValue``, returning the end of the value."""
+        if not self.text[pos:].strip():
+            return None
+
+        end = self.parse_simple_value(pos)
+        if end is None:
+            return None
+        if self.text[pos:end].lower() in ('and', 'or', 'not'):
+            return None
+        return end
+
+    def parse_simple_value(self, pos):
+        """Mirror ``SpiresSimpleValue``, returning the end of the value."""
+        end = None
+        while True:
+            unit_end = self.parse_simple_value_unit(pos)
+            if unit_end is None:
+                return end
+            pos = end = unit_end
+
+    def parse_simple_value_unit(self, pos):
+        """Mirror ``SpiresSimpleValueUnit``, returning the end of the unit."""
+        unit = VALUE_UNIT_REGEX.match(self.text, pos)
+        if unit:
+            return unit.end()
+
+        if not self.text.startswith('(', pos):
+            return None
+        end = self.parse_simple_value(pos + 1)
+        if end is None or not self.text.startswith(')', end):
+            return None
+        return end + 1
+
+
+def parse_keyword_value_query(pattern):
+    """Mirror ``KeywordQuery`` with a ``Value``, as the whole query.
+
+    ``NotKeywordValue`` and ``KeywordQuery`` use the same list of allowed
+    keywords, so the first one fails exactly when the keyword is matched
+    by ``KeywordRule`` and followed by the colon.
+    """
+    match = KEYWORD_VALUE_REGEX.match(pattern)
+    if not match:
+        return None
+
+    init_keywords_grammar()
+    keyword = match.group('keyword')
+    keyword_match = KeywordRule.grammar.thing.match(keyword)
+    if not keyword_match or keyword_match.end() != len(keyword):
+        return None
+
+    if match.group('quoted_value') is not None:
+        value = ast.DoubleQuotedValue(match.group('quoted_value'))
+    else:
+        value = ast.Value(match.group('value'))
+    return ast.KeywordOp(ast.Keyword(keyword), value)
+
+
+def parse_spires_query(pattern):
+    """Parse a SPIRES query, or a single ``keyword:value``, without ``pypeg2``.
+
+    Returns the same AST as ``pypeg2`` followed by the walkers, or ``None``
+    if the query must be parsed by ``pypeg2``.
+    """
+    if UNSUPPORTED_REGEX.search(pattern):
+        if UNSUPPORTED_VALUE_REGEX.search(pattern):
+            return None
+        query = parse_keyword_value_query(pattern)
+        return query.accept(spires_to_invenio) if query else None
+
+    try:
+        query = SpiresParser(pattern).parse()
+    except UnsupportedQuery:
+        return None
+    return query.accept(spires_to_invenio)
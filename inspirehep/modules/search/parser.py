@@ -52,9 +52,12 @@ from invenio_query_parser.parser import (
 from .config import SPIRES_KEYWORDS
 
 
+SPIRES_KEYWORD_REGEX = re.compile(r"(%s)\b" % "|".join(
+    SPIRES_KEYWORDS.keys()), re.IGNORECASE)
+
+
 class SpiresKeywordRule(LeafRule):
-    grammar = attr('value', re.compile(r"(%s)\b" % "|".join(
-        SPIRES_KEYWORDS.keys()), re.IGNORECASE))
+    grammar = attr('value', SPIRES_KEYWORD_REGEX)
 
 
 class SpiresSimpleValue(LeafRule):
@@ -282,16 +285,27 @@ class Main(UnaryRule):
 
     def __init__(self):
         """Initialize list of allowed keywords on first call."""
-        if not Main.initialized:
-            from invenio_query_parser.utils import build_valid_keywords_grammar
-            from flask import current_app
-
-            build_valid_keywords_grammar(
-                current_app.config.get('SEARCH_ALLOWED_KEYWORDS', [])
-            )
-            Main.initialized = True
+        init_keywords_grammar()
 
     grammar = [
         (omit(_), attr('op', [FindQuery, Query]), omit(_)),
         attr('op', EmptyQueryRule),
     ]
+
+
+def build_keywords_grammar(keywords):
+    """Update the grammar with the list of allowed keywords."""
+    from invenio_query_parser.utils import build_valid_keywords_grammar
+
+    build_valid_keywords_grammar(keywords)
+    Main.initialized = True
+
+
+def init_keywords_grammar():
+    """Build the grammar of the allowed keywords, if not done yet."""
+    if not Main.initialized:
+        from flask import current_app
+
+        build_keywords_grammar(
+            current_app.config.get('SEARCH_ALLOWED_KEYWORDS', [])
+        )
@@ -32,6 +32,9 @@ from invenio_records_rest.errors import InvalidQueryRESTError
 
 from inspirehep.modules.search import IQ
 
+from .cache import execute_cached, is_response_cacheable
+from .facets import are_facets_deferred, without_aggregations
+
 
 def inspire_search_factory(self, search):
     """Parse query using Invenio-Query-Parser.
@@ -61,9 +64,15 @@ def inspire_search_factory(self, search):
 
     search_index = search._index[0]
     search, urlkwargs = default_facets_factory(search, search_index)
+    if are_facets_deferred(search_index):
+        search = without_aggregations(search)
     search, sortkwargs = default_sorter_factory(search, search_index)
     for key, value in sortkwargs.items():
         urlkwargs.add(key, value)
 
     urlkwargs.add('q', query_string)
+
+    if is_response_cacheable():
+        search = execute_cached(search)
+
     return search, urlkwargs
@@ -24,12 +24,22 @@
 
 from __future__ import absolute_import, division, print_function
 
+import json
+import re
+from collections import Counter
+from hashlib import sha1
+
 import pypeg2
 from elasticsearch_dsl import Q
+from elasticsearch_dsl.query import Query
 from flask import current_app
 
+from invenio_cache import current_cache
 from invenio_query_parser.ast import MalformedQuery
 
+from inspirehep.modules.records.experiments import get_experiments_index_version
+
+from .fast_parser import parse_spires_query
 from .parser import Main
 from .walkers.elasticsearch import ElasticSearchDSL
 from .walkers.elasticsearch_no_keywords import ElasticSearchNoKeywordsDSL
@@ -37,38 +47,188 @@ from .walkers.elasticsearch_no_keywords import QueryHasKeywords
 from .walkers.pypeg_to_ast import PypegConverter
 from .walkers.spires_to_invenio import SpiresToInvenio
 
+try:
+    from functools import lru_cache
+except ImportError:
+    from functools32 import lru_cache
+
 
 walkers = [PypegConverter(), SpiresToInvenio()]
 
+QUERY_CACHE_SIZE = 1000
+"""Number of compiled queries cached by each process."""
+
+shared_query_cache_stats = Counter()
+"""Hits and misses of the shared tier of the compiled-query cache."""
+
+
+NORMALIZE_QUERY_REGEX = re.compile(
+    r'"[^"]*"|\'[^\']*\'|\s+|(?<![^\s(])(?:and|or|not)(?![^\s)])', re.I)
+"""Quoted values, whitespace and boolean operators."""
+
+SPIRES_QUERY_REGEX = re.compile(r'\s*(find|fin|f)\s', re.I)
+
+_keyword_mapping_version = {}
+"""The last keyword mapping seen and its digest."""
+
+
+def get_keyword_mapping_version(keyword_mapping):
+    """Return a digest identifying the content of a keyword mapping.
+
+    The digest is only computed again when ``SEARCH_ELASTIC_KEYWORD_MAPPING``
+    is replaced by another mapping, so the mapping must not be modified in
+    place.
+    """
+    if _keyword_mapping_version.get('mapping') is not keyword_mapping:
+        _keyword_mapping_version.update(
+            mapping=keyword_mapping,
+            version=sha1(repr(sorted(keyword_mapping.items()))).hexdigest(),
+        )
+    return _keyword_mapping_version['version']
+
+
+def get_query_version(keyword_mapping):
+    """Return what a compiled query depends on, besides its pattern.
+
+    This is the content of the keyword mapping and the version of the
+    experiments index, used to normalize the experiment names.
+    """
+    return '{}:{}'.format(
+        get_keyword_mapping_version(keyword_mapping),
+        get_experiments_index_version(),
+    )
+
+
+def normalize_query(pattern):
+    """Return a query with the same meaning, in a canonical form.
+
+    Whitespace is collapsed, except in quoted values, so that variants of a
+    query share a cache entry. So is the case of the boolean operators of
+    SPIRES queries, the other ones only take uppercase operators.
+    """
+    is_spires = bool(SPIRES_QUERY_REGEX.match(pattern))
+
+    def _normalize(match):
+        part = match.group()
+        if part[0] in '"\'':
+            return part
+        if part.isspace():
+            return ' '
+        return part.lower() if is_spires else part
+
+    return NORMALIZE_QUERY_REGEX.sub(_normalize, pattern).strip()
+
+
+def parse_pypeg_query(pattern):
+    """Parse a query into an AST with ``pypeg2``."""
+    try:
+        query = pypeg2.parse(pattern, Main, whitespace='')
+
+        for walker in walkers:
+            query = query.accept(walker)
+
+    except SyntaxError:
+        query = MalformedQuery("")
+
+    return query
+
+
+def parse_query(pattern, default_fields, keyword_mapping):
+    """Parse a query into an Elastic Search DSL query instance."""
+    query = parse_spires_query(pattern)
+    if query is None:
+        query = parse_pypeg_query(pattern)
+
+    try:
+        search_walker = ElasticSearchNoKeywordsDSL()
+        query.accept(search_walker)
+        query = Q('multi_match',
+                  query=pattern,
+                  fields=default_fields,
+                  zero_terms_query="all")
+    except QueryHasKeywords:
+        query = query.accept(ElasticSearchDSL(keyword_mapping))
+    finally:
+        return query
+
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def compile_query(pattern, default_fields, version):
+    """Return the serialized Elastic Search DSL of a query.
+
+    Results are kept in a per-process LRU cache and, if
+    ``SEARCH_QUERY_CACHE_TIMEOUT`` is set, in the application cache. The
+    ``version`` returned by ``get_query_version`` is part of the key, so
+    that entries compiled with a different ``SEARCH_ELASTIC_KEYWORD_MAPPING``
+    or experiments index are never used.
+
+    :returns: the query serialized as JSON, or ``None`` if it could not be
+        converted to Elastic Search DSL.
+    """
+    timeout = current_app.config.get('SEARCH_QUERY_CACHE_TIMEOUT')
+    if timeout:
+        cache_key = 'search_query:{}'.format(sha1(json.dumps(
+            [pattern, default_fields, version])).hexdigest())
+        compiled = current_cache.get(cache_key)
+        if compiled is not None:
+            shared_query_cache_stats['hits'] += 1
+            return compiled
+        shared_query_cache_stats['misses'] += 1
+
+    query = parse_query(
+        pattern,
+        list(default_fields),
+        current_app.config.get("SEARCH_ELASTIC_KEYWORD_MAPPING", {}),
+    )
+    if not isinstance(query, Query):
+        return None
+
+    compiled = json.dumps(query.to_dict())
+    if timeout:
+        current_cache.set(cache_key, compiled, timeout=timeout)
+
+    return compiled
+
+
+def get_query_cache_stats():
+    """Return the hit and miss counters of the compiled-query cache."""
+    info = compile_query.cache_info()
+
+    return {
+        'hits': info.hits,
+        'misses': info.misses,
+        'maxsize': info.maxsize,
+        'size': info.currsize,
+        'shared_hits': shared_query_cache_stats['hits'],
+        'shared_misses': shared_query_cache_stats['misses'],
+    }
+
+
+def clear_query_cache():
+    """Empty the per-process compiled-query cache."""
+    compile_query.cache_clear()
+    shared_query_cache_stats.clear()
+
 
 def inspire_query_factory():
     """Create a parser returning Elastic Search DSL query instance."""
 
     def invenio_query(pattern, search):
+        keyword_mapping = current_app.config.get(
+            "SEARCH_ELASTIC_KEYWORD_MAPPING", {}
+        )
+        default_fields = search.default_fields()
+
+        pattern = normalize_query(pattern)
+
+        compiled = compile_query(
+            pattern,
+            tuple(default_fields),
+            get_query_version(keyword_mapping),
+        )
+        if compiled is None:
+            return parse_query(pattern, default_fields, keyword_mapping)
 
-        try:
-            query = pypeg2.parse(pattern, Main, whitespace='')
-
-            for walker in walkers:
-                query = query.accept(walker)
-
-        except SyntaxError:
-            query = MalformedQuery("")
-
-        try:
-            search_walker = ElasticSearchNoKeywordsDSL()
-            query.accept(search_walker)
-            query = Q('multi_match',
-                      query=pattern,
-                      fields=search.default_fields(),
-                      zero_terms_query="all")
-        except QueryHasKeywords:
-            query = query.accept(ElasticSearchDSL(
-                current_app.config.get(
-                    "SEARCH_ELASTIC_KEYWORD_MAPPING", {}
-                )
-            ))
-        finally:
-            return query
+        return Q(json.loads(compiled))
 
     return invenio_query
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of INSPIRE.
+# Copyright (C) 2014-2017 CERN.
+#
+# INSPIRE is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# INSPIRE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with INSPIRE. If not, see <http://www.gnu.org/licenses/>.
+#
+# In applying this license, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as an Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+"""Number of records of each collection, kept in the cache."""
+
+from __future__ import absolute_import, division, print_function
+
+from elasticsearch_dsl.query import Q
+from flask import current_app
+
+from invenio_cache import current_cache
+
+from .api import (
+    AuthorsSearch,
+    ConferencesSearch,
+    DataSearch,
+    ExperimentsSearch,
+    InstitutionsSearch,
+    JobsSearch,
+    JournalsSearch,
+    LiteratureSearch,
+    get_anonymous_filter,
+)
+
+COLLECTION_SEARCHES = [
+    AuthorsSearch,
+    ConferencesSearch,
+    DataSearch,
+    ExperimentsSearch,
+    InstitutionsSearch,
+    JobsSearch,
+    JournalsSearch,
+    LiteratureSearch,
+]
+"""Searches whose number of records is kept up to date."""
+
+INCREMENT_IF_CACHED = """
+if redis.call('exists', KEYS[1]) == 1 then
+    return redis.call('incrby', KEYS[1], ARGV[1])
+end
+"""
+"""Lua script incrementing a cached count, unless it expired."""
+
+
+def _get_cache_key(index):
+    return 'collection_count:{}'.format(index)
+
+
+def count_records(search_class):
+    """Count the records of a collection visible to anonymous users.
+
+    The default filter of the search, which depends on the current user, is
+    replaced by the one of anonymous users.
+    """
+    search = search_class()
+    if vars(search_class.Meta).get('default_filter') is not None:
+        search.query = Q('bool', filter=[get_anonymous_filter()])
+    return search.count()
+
+
+def refresh_collection_count(search_class):
+    """Count the records of a collection and cache the result."""
+    count = count_records(search_class)
+    current_cache.set(
+        _get_cache_key(search_class.Meta.index),
+        count,
+        timeout=current_app.config['SEARCH_COLLECTION_COUNTS_TIMEOUT'],
+    )
+    return count
+
+
+def get_collection_count(search_class):
+    """Return the number of records of a collection.
+
+    Counts are refreshed periodically by ``refresh_collection_counts``, so
+    Elasticsearch is only queried when the cache is empty.
+    """
+    count = current_cache.get(_get_cache_key(search_class.Meta.index))
+    if count is None:
+        count = refresh_collection_count(search_class)
+    return count
+
+
+def update_collection_counts(changes):
+    """Apply the changes to the cached counts of some indices.
+
+    :param changes: dictionary mapping indices to the number of records
+        added to them, which is negative if records were deleted.
+    """
+    cache = current_cache.cache
+    increment_if_cached = cache._client.register_script(INCREMENT_IF_CACHED)
+    for index, change in changes.items():
+        if change:
+            increment_if_cached(
+                keys=[cache.key_prefix + _get_cache_key(index)],
+                args=[change],
+            )
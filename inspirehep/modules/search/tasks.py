@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of INSPIRE.
+# Copyright (C) 2014-2017 CERN.
+#
+# INSPIRE is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# INSPIRE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with INSPIRE. If not, see <http://www.gnu.org/licenses/>.
+#
+# In applying this license, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as an Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+"""Search tasks."""
+
+from __future__ import absolute_import, division, print_function
+
+from celery import shared_task
+
+from .cache import increment_generations
+from .statistics import COLLECTION_SEARCHES, refresh_collection_count
+
+
+@shared_task(ignore_result=True)
+def refresh_collection_counts():
+    """Recount the records of every collection."""
+    for search_class in COLLECTION_SEARCHES:
+        refresh_collection_count(search_class)
+
+
+@shared_task(ignore_result=True)
+def increment_generations_later(indices):
+    """Invalidate the cached searches on some indices a second time."""
+    increment_generations(indices)
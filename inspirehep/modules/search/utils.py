@@ -24,9 +24,16 @@
 
 from __future__ import absolute_import, division, print_function
 
+import io
 import json
+import os
+from hashlib import sha1
+from operator import attrgetter
 
 from flask import current_app
+from pkg_resources import iter_entry_points, resource_filename
+
+from .query_factory import get_keyword_mapping_version
 
 try:
     from functools import lru_cache
@@ -91,3 +98,68 @@ def generate_valid_keywords():
     # Sort by longest string descending
     cleaned_keywords.sort(key=len, reverse=True)
     return cleaned_keywords
+
+
+def get_keywords_registry_path(app):
+    """Return the path of the precomputed list of valid search keywords."""
+    return os.path.join(
+        app.instance_path, app.config['SEARCH_KEYWORDS_REGISTRY'])
+
+
+KEYWORDS_SOURCES = ('invenio_jsonschemas.schemas', 'invenio_search.mappings')
+"""Entry points of the JSON schemas and mappings keywords are taken from."""
+
+
+def get_keywords_registry_version(keyword_mapping):
+    """Return a digest of all the sources of the valid search keywords.
+
+    Besides the keyword mapping, it covers the content of the JSON schemas
+    and Elastic Search mappings registered by the installed packages, so
+    that upgrading any of them invalidates the registry.
+    """
+    digest = sha1(get_keyword_mapping_version(keyword_mapping))
+    for group in KEYWORDS_SOURCES:
+        entry_points = sorted(iter_entry_points(group), key=attrgetter('name'))
+        for entry_point in entry_points:
+            directory = resource_filename(entry_point.module_name, '')
+            for root, dirs, files in os.walk(directory):
+                dirs.sort()
+                for name in sorted(files):
+                    if not name.endswith('.json'):
+                        continue
+                    path = os.path.join(root, name)
+                    digest.update(os.path.relpath(path, directory).encode('utf-8'))
+                    with open(path, 'rb') as f:
+                        digest.update(f.read())
+
+    return digest.hexdigest()
+
+
+def write_keywords_registry(path, keywords, keyword_mapping):
+    """Store the valid search keywords, as built by the application."""
+    registry = {
+        'version': get_keywords_registry_version(keyword_mapping),
+        'keywords': keywords,
+    }
+    with io.open(path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(registry, ensure_ascii=False) + u'\n')
+
+
+def read_keywords_registry(path, keyword_mapping):
+    """Load the valid search keywords stored by the registry.
+
+    Returns ``None`` if there is no registry, or if it was built with a
+    different ``SEARCH_ELASTIC_KEYWORD_MAPPING``, JSON schemas or Elastic
+    Search mappings.
+    """
+    if not os.path.exists(path):
+        return None
+
+    with io.open(path, encoding='utf-8') as f:
+        registry = json.load(f)
+
+    version = get_keywords_registry_version(keyword_mapping)
+    if registry.get('version') != version:
+        return None
+
+    return registry['keywords']
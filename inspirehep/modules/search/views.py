@@ -29,7 +29,11 @@ import json
 import six
 from flask import Blueprint, current_app, jsonify, request, render_template
 
-from inspirehep.modules.search import LiteratureSearch
+from invenio_records_rest.errors import InvalidQueryRESTError
+from invenio_records_rest.facets import default_facets_factory
+
+from inspirehep.modules.search import IQ, LiteratureSearch
+from inspirehep.modules.search.facets import compute_facets
 
 
 blueprint = Blueprint(
@@ -118,6 +122,27 @@ def suggest():
     })
 
 
+@blueprint.route('/search/facets', methods=['GET'])
+def facets():
+    """Compute the facets of a literature search.
+
+    Takes the same query and filters as the literature search API, and
+    returns the aggregations it would contain.
+    """
+    query_string = request.values.get('q', '')
+
+    search = LiteratureSearch()
+    try:
+        search = search.query(IQ(query_string, search))
+    except SyntaxError:
+        current_app.logger.debug(
+            'Failed parsing query: {0}'.format(query_string), exc_info=True)
+        raise InvalidQueryRESTError()
+    search, _ = default_facets_factory(search, search._index[0])
+
+    return jsonify({'aggregations': compute_facets(search)})
+
+
 def sorted_options(sort_options):
     """Sort sort options for display."""
     return [
@@ -37,6 +37,8 @@ from invenio_query_parser.ast import (AndOp, DoubleQuotedValue, EmptyQuery,
                                       ValueQuery, WildcardQuery)
 from invenio_query_parser.visitor import make_visitor
 
+from inspirehep.modules.records.experiments import normalize_experiment_name
+
 from ..ast import FilterOp
 
 
@@ -59,6 +61,18 @@ class ElasticSearchDSL(object):
             return field
         return [field]
 
+    def is_experiment_query(self, fields):
+        """Tell whether the fields are the ones of the experiment keyword."""
+        return fields == \
+            current_app.config['SEARCH_ELASTIC_KEYWORD_MAPPING']['experiment']
+
+    def experiment_query(self, value, query):
+        """Also match the records of the experiment named by the value."""
+        return Q('bool', should=[
+            query,
+            Q('term', facet_experiment=normalize_experiment_name(value)),
+        ])
+
     # pylint: disable=W0613,E0102
 
     @visitor(FilterOp)
@@ -130,12 +144,15 @@ class ElasticSearchDSL(object):
                         Q("match", authors__full_name=str(node.value))
                     ]
                 )
-            return Q({
+            result = Q({
                 'multi_match': {
                     'query': node.value,
                     'fields': fields
                 }
             })
+            if self.is_experiment_query(fields):
+                return self.experiment_query(node.value, result)
+            return result
         return query
 
     @visitor(SingleQuotedValue)
@@ -154,20 +171,23 @@ class ElasticSearchDSL(object):
                 return Q(
                     'bool',
                     must=Q('bool', should=[
-                        Q("match", authors__name_variations=str(node.value)),
-                        Q("term", authors__ids__value=str(node.value))
+                        Q("match", authors__name_variations=node.value),
+                        Q("term", authors__ids__value=node.value)
                     ]),
                     should=[
-                        Q("match", authors__full_name=str(node.value))
+                        Q("match", authors__full_name=node.value)
                     ]
                 )
 
             if (len(fields) > 1):
-                return Q({"bool":
-                          {"should": [{"term": {k: str(node.value)}}
-                                      for k in fields]}})
+                result = Q({"bool":
+                            {"should": [{"term": {k: node.value}}
+                                        for k in fields]}})
             else:
-                return Q({'term': {fields[0]: node.value}})
+                result = Q({'term': {fields[0]: node.value}})
+            if self.is_experiment_query(fields):
+                return self.experiment_query(node.value, result)
+            return result
         return query
 
     @visitor(RegexValue)
@@ -32,6 +32,46 @@ from .. import parser
 from ..ast import SpiresOp
 
 
+def build_spires_query(children):
+    """Build the tree of a SPIRES query from its converted children.
+
+    The first child is a query, the following ones are boolean operators
+    whose left operand is still missing.
+    """
+    # Assign implicit keyword
+    # find author x and y --> find author x and author y
+
+    def assign_implicit_keyword(implicit_keyword, node):
+        """
+        Note: this function has side effects on node content
+        """
+        if type(node) in [ast.AndOp, ast.OrOp] and \
+           type(node.right) == ast.ValueQuery:
+            node.right = SpiresOp(implicit_keyword, node.right.op)
+        if type(node) in [ast.AndOp, ast.OrOp] and \
+           type(node.right) == ast.NotOp:
+            assign_implicit_keyword(implicit_keyword, node.right)
+        if type(node) in [ast.NotOp] and \
+           type(node.op) == ast.ValueQuery:
+            node.op = SpiresOp(implicit_keyword, node.op.op)
+
+    implicit_keyword = None
+    for child in children:
+        new_keyword = getattr(child, 'keyword', None)
+        if new_keyword is not None:
+            implicit_keyword = new_keyword
+        if implicit_keyword is not None:
+            assign_implicit_keyword(implicit_keyword, child)
+
+    # Build the boolean expression, left to right
+    # x and y or z and ... --> ((x and y) or z) and ...
+    tree = children[0]
+    for booleanNode in children[1:]:
+        booleanNode.left = tree
+        tree = booleanNode
+    return tree
+
+
 class PypegConverter(pypeg_to_ast.PypegConverter):
     visitor = make_visitor(pypeg_to_ast.PypegConverter.visitor)
 
@@ -95,38 +135,7 @@ class PypegConverter(pypeg_to_ast.PypegConverter):
 
     @visitor(parser.SpiresQuery)
     def visit(self, node, children):
-        # Assign implicit keyword
-        # find author x and y --> find author x and author y
-
-        def assign_implicit_keyword(implicit_keyword, node):
-            """
-            Note: this function has side effects on node content
-            """
-            if type(node) in [ast.AndOp, ast.OrOp] and \
-               type(node.right) == ast.ValueQuery:
-                node.right = SpiresOp(implicit_keyword, node.right.op)
-            if type(node) in [ast.AndOp, ast.OrOp] and \
-               type(node.right) == ast.NotOp:
-                assign_implicit_keyword(implicit_keyword, node.right)
-            if type(node) in [ast.NotOp] and \
-               type(node.op) == ast.ValueQuery:
-                node.op = SpiresOp(implicit_keyword, node.op.op)
-
-        implicit_keyword = None
-        for child in children:
-            new_keyword = getattr(child, 'keyword', None)
-            if new_keyword is not None:
-                implicit_keyword = new_keyword
-            if implicit_keyword is not None:
-                assign_implicit_keyword(implicit_keyword, child)
-
-        # Build the boolean expression, left to right
-        # x and y or z and ... --> ((x and y) or z) and ...
-        tree = children[0]
-        for booleanNode in children[1:]:
-            booleanNode.left = tree
-            tree = booleanNode
-        return tree
+        return build_spires_query(children)
 
     @visitor(parser.FindQuery)
     def visit(self, node, child):
@@ -40,6 +40,36 @@
           experiment_name: ''
         });
 
+        /**
+         * Fetch the data of the panels of a detailed record in a single
+         * request, shared by all the tables which need it.
+         */
+        this.getPanels = function() {
+          if (!this.panelsRequest) {
+            this.panelsRequest = $.ajax({
+              "url": "/ajax/panels",
+              "data": {
+                recid: this.attr.recid,
+                endpoint: this.attr.endpoint,
+                panels: "references,citations"
+              },
+              "method": "GET"
+            });
+          }
+          return this.panelsRequest;
+        };
+
+        this.panelAjax = function(name) {
+          var that = this;
+          return function(data, callback, settings) {
+            that.getPanels().done(function(json) {
+              callback(json.panels[name]);
+            }).fail(function() {
+              callback({data: []});
+            });
+          };
+        };
+
         this.after('initialize', function() {
           var that = this;
 
@@ -49,14 +79,7 @@
               search: "_INPUT_",
               searchPlaceholder: "Filter references..."
             },
-            "ajax": {
-              "url": "/ajax/references",
-              "data": {
-                recid: that.attr.recid,
-                endpoint: that.attr.endpoint
-              },
-              "method": "GET"
-            },
+            "ajax": that.panelAjax("references"),
             "fnInitComplete": function(oSettings, json) {
               if ( json.data.length > 0 ) {
                 $("#references .datatables-loading").hide();
@@ -75,14 +98,7 @@
               info: "Showing _START_ to _END_ of " + that.attr.citation_count + " citations"
             },
             "bPaginate": false,
-            "ajax": {
-              "url": "/ajax/citations",
-              "data": {
-                recid: that.attr.recid,
-                endpoint: that.attr.endpoint
-              },
-              "method": "GET"
-            },
+            "ajax": that.panelAjax("citations"),
             "fnInitComplete": function(oSettings, json) {
               if ( json.data.length > 0 ) {
                 $("#citations .datatables-loading").hide();
@@ -24,12 +24,16 @@
 
 from __future__ import absolute_import, division, print_function
 
+import json
 from datetime import date
+from multiprocessing.pool import ThreadPool
+from timeit import default_timer
 
 from dateutil.relativedelta import relativedelta
 from flask import (
     Blueprint,
     abort,
+    copy_current_request_context,
     current_app,
     jsonify,
     redirect,
@@ -51,6 +55,9 @@ from inspirehep.modules.pidstore.utils import (
 from inspirehep.modules.records.conference_series import (
     CONFERENCE_CATEGORIES_TO_SERIES,
 )
+from inspirehep.modules.records.serializers.impactgraph_serializer import (
+    ImpactGraphSerializer,
+)
 from inspirehep.modules.search import (
     AuthorsSearch,
     ConferencesSearch,
@@ -60,6 +67,7 @@ from inspirehep.modules.search import (
     JournalsSearch,
     LiteratureSearch
 )
+from inspirehep.modules.search.statistics import get_collection_count
 from inspirehep.utils.citations import Citation
 from inspirehep.utils.conferences import (
     render_conferences_contributions,
@@ -93,7 +101,7 @@ blueprint = Blueprint(
 def index():
     """View for literature collection landing page."""
     if current_app.config['INSPIRE_FULL_THEME']:
-        number_of_records = LiteratureSearch().count()
+        number_of_records = get_collection_count(LiteratureSearch)
 
         return render_template(
             'inspirehep_theme/search/collection_literature.html',
@@ -108,7 +116,7 @@ def index():
 @blueprint.route('/collection/authors', methods=['GET', ])
 def hepnames():
     """View for authors collection landing page."""
-    number_of_records = AuthorsSearch().count()
+    number_of_records = get_collection_count(AuthorsSearch)
 
     return render_template(
         'inspirehep_theme/search/collection_authors.html',
@@ -120,7 +128,7 @@ def hepnames():
 @blueprint.route('/conferences', methods=['GET', ])
 def conferences():
     """View for conferences collection landing page."""
-    number_of_records = ConferencesSearch().count()
+    number_of_records = get_collection_count(ConferencesSearch)
     upcoming_conferences = _get_upcoming_conferences()
 
     return render_template(
@@ -141,7 +149,7 @@ def jobs():
 @blueprint.route('/institutions', methods=['GET', ])
 def institutions():
     """View for institutions collection landing page."""
-    number_of_records = InstitutionsSearch().count()
+    number_of_records = get_collection_count(InstitutionsSearch)
     some_institutions = _get_some_institutions()
 
     return render_template(
@@ -155,7 +163,7 @@ def institutions():
 @blueprint.route('/experiments', methods=['GET', ])
 def experiments():
     """View for experiments collection landing page."""
-    number_of_records = ExperimentsSearch().count()
+    number_of_records = get_collection_count(ExperimentsSearch)
 
     return render_template(
         'inspirehep_theme/search/collection_experiments.html',
@@ -167,7 +175,7 @@ def experiments():
 @blueprint.route('/journals', methods=['GET', ])
 def journals():
     """View for journals collection landing page."""
-    number_of_records = JournalsSearch().count()
+    number_of_records = get_collection_count(JournalsSearch)
 
     return render_template(
         'inspirehep_theme/search/collection_journals.html',
@@ -179,7 +187,7 @@ def journals():
 @blueprint.route('/data', methods=['GET', ])
 def data():
     """View for data collection landing page."""
-    number_of_records = DataSearch().count()
+    number_of_records = get_collection_count(DataSearch)
 
     return render_template(
         'inspirehep_theme/search/collection_data.html',
@@ -263,6 +271,82 @@ def ajax_citations():
     )
 
 
+DETAILED_RECORD_PANELS = {
+    'references': lambda record: Reference(record).references(),
+    'citations': lambda record: Citation(record).citations(),
+    'impactgraph': lambda record: json.loads(
+        ImpactGraphSerializer().serialize(None, record)
+    ),
+}
+"""Functions computing the data of each side panel of a detailed record."""
+
+
+def get_detailed_record_panels(record, panels):
+    """
+    Compute the data of several side panels of a detailed record.
+
+    The panels don't depend on each other, so each of them is computed in
+    its own thread, which mostly waits for the database or Elasticsearch.
+
+    :param record: source of the record.
+    :type record: dict
+    :param panels: names of the panels, from ``DETAILED_RECORD_PANELS``.
+    :type panels: list of strings
+    :returns: data of each panel, along with the milliseconds it took.
+    :rtype: dict
+    """
+    def get_panel(name):
+        start = default_timer()
+        data = DETAILED_RECORD_PANELS[name](record)
+        took = int((default_timer() - start) * 1000)
+        return name, {"data": data, "took": took}
+
+    if not panels:
+        return {}
+
+    pool = ThreadPool(len(panels))
+    try:
+        # Every thread needs its own copy of the request context.
+        results = [
+            pool.apply_async(copy_current_request_context(get_panel), (panel,))
+            for panel in panels
+        ]
+        return dict(result.get() for result in results)
+    finally:
+        # Don't leave the threads behind, even if a panel failed.
+        pool.terminate()
+        pool.join()
+
+
+@blueprint.route('/ajax/panels', methods=['GET'])
+def ajax_panels():
+    """Handler for all the side panels of a detailed record at once."""
+
+    recid = request.args.get('recid', '')
+    endpoint = request.args.get('endpoint', '')
+    panels = request.args.get('panels', ','.join(DETAILED_RECORD_PANELS))
+    panels = [panel for panel in panels.split(',') if panel]
+
+    if any(panel not in DETAILED_RECORD_PANELS for panel in panels):
+        abort(400)
+
+    pid_type = get_pid_type_from_endpoint(endpoint)
+    pid = PersistentIdentifier.get(pid_type, recid)
+
+    record = LiteratureSearch().get_source(pid.object_uuid)
+
+    start = default_timer()
+    result = get_detailed_record_panels(record, panels)
+    took = int((default_timer() - start) * 1000)
+
+    return jsonify(
+        {
+            "panels": result,
+            "took": took
+        }
+    )
+
+
 #
 # Handlers for AJAX requests regarding institution detailed view
 #
@@ -310,19 +394,64 @@ def get_institution_papers_from_es(recid):
     ).execute().hits
 
 
-def get_experiment_publications(experiment_name):
+def get_experiments_publications(experiment_names):
     """
-    Get paper count for a given experiment.
+    Get paper counts for the given experiments.
+
+    The counts are computed by a single request, with a ``filters``
+    aggregation holding one ``term`` filter per experiment.
 
-    :param experiment_name: canonical name of the experiment.
-    :type experiment_name: string
+    :param experiment_names: canonical names of the experiments.
+    :type experiment_names: list of strings
+    :returns: paper count of each experiment.
+    :rtype: dict
     """
-    query = {
-        "term": {"accelerator_experiments.experiment": experiment_name}
-    }
-    search = LiteratureSearch().query(query)
-    search = search.params(search_type="count")
-    return search.execute().hits.total
+    experiment_names = set(experiment_names)
+    if not experiment_names:
+        return {}
+
+    search = LiteratureSearch().params(search_type="count")
+    search.aggs.bucket('experiments', 'filters', filters={
+        experiment_name: {
+            "term": {"accelerator_experiments.experiment": experiment_name}
+        } for experiment_name in experiment_names
+    })
+
+    buckets = search.execute().to_dict()[
+        'aggregations'
+    ]['experiments']['buckets']
+    return dict(
+        (experiment_name, bucket['doc_count'])
+        for experiment_name, bucket in buckets.items()
+    )
+
+
+def get_authors_names(recids):
+    """
+    Get the names of the given authors.
+
+    The authors are fetched with a ``terms`` query, without going through
+    the query parser.
+
+    :param recids: ids of the authors.
+    :type recids: list of integers
+    :returns: name of each author.
+    :rtype: dict
+    """
+    if not recids:
+        return {}
+
+    results = AuthorsSearch().filter(
+        "terms",
+        control_number=recids
+    ).params(
+        size=len(recids),
+        _source=['control_number', 'name']
+    ).execute()
+
+    return dict(
+        [(result.control_number, result.name) for result in results]
+    )
 
 
 def get_institution_people_datatables_rows(recid):
@@ -352,23 +481,7 @@ def get_institution_people_datatables_rows(recid):
     ]['authors']['affiliated']['byrecid']['buckets']
     recids = [int(paper['key']) for paper in papers_per_author]
 
-    # Generate query to retrieve records from author index
-    query = ""
-    for i, recid in enumerate(recids):
-        query += "recid:{}".format(recid)
-        if i != len(recids) - 1:
-            query += " OR "
-
-    results = AuthorsSearch().query_from_iq(
-        query
-    ).params(
-        size=9999,
-        _source=['control_number', 'name']
-    ).execute()
-
-    recid_map = dict(
-        [(result.control_number, result.name) for result in results]
-    )
+    recid_map = get_authors_names(recids)
 
     result = []
     author_html_link = u"<a href='/authors/{recid}'>{name}</a>"
@@ -401,6 +514,10 @@ def get_institution_experiments_datatables_rows(hits):
 
     name_html = "<a href='/experiments/{id}'>{name}</a>"
 
+    publications = get_experiments_publications(
+        [hit.legacy_name for hit in hits]
+    )
+
     for hit in hits:
         row = []
         try:
@@ -412,7 +529,7 @@ def get_institution_experiments_datatables_rows(hits):
             )
         except ValueError:
             row.append(hit.collaboration)
-        row.append(get_experiment_publications(hit.legacy_name))
+        row.append(publications[hit.legacy_name])
         result.append(row)
     return result
 
@@ -28,7 +28,6 @@ from inspire_utils.helpers import force_list
 from inspire_utils.record import get_value
 from inspirehep.utils import bibtex_booktitle
 from inspirehep.utils.record import is_submitted_but_not_published
-from inspirehep.utils.record_getter import get_es_record
 
 from .export import MissingRequiredFieldError, Export
 
@@ -37,8 +36,8 @@ class Bibtex(Export):
 
     """Docstring for Bibtex"""
 
-    def __init__(self, record):
-        super(Bibtex, self).__init__(record)
+    def __init__(self, record, **kwargs):
+        super(Bibtex, self).__init__(record, **kwargs)
         self.entry_type, self.original_entry = self._get_entry_type()
 
     def format(self):
@@ -647,8 +646,7 @@ class Bibtex(Export):
                     pages = field.get('page_start', '') or field.get('artid', '')
                 try:
                     if journal and (volume != '' or pages != ''):
-                        recid = self.record['control_number', '']
-                        record = get_es_record('jou', recid)
+                        record = self._get_journal(field)
                         coden = ','.join(
                             [record['coden'][0], volume, pages])
                         return coden
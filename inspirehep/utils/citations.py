@@ -22,10 +22,15 @@
 
 from __future__ import absolute_import, division, print_function
 
+from inspirehep.modules.records.citations import get_citers
 from inspirehep.modules.search import LiteratureSearch
 from inspirehep.utils.jinja2 import render_template_to_string
 
 
+CITERS_CHUNK_SIZE = 1000
+"""Maximum number of recids sent in a single ``terms`` query."""
+
+
 class Citation(object):
     """Class used to output citations format in detailed record"""
 
@@ -39,30 +44,25 @@ class Citation(object):
         row = []
 
         # Get citations
-        record_citations = LiteratureSearch().query_from_iq(
-            'refersto:' + str(self.record['control_number'])
-        ).params(
-            _source=[
-                'control_number',
-                'citation_count',
-                'titles',
-                'earliest_date'
-            ]
-        ).execute().hits
-
-        for citation in record_citations:
+        citers = get_citers(self.record['control_number'])
+        if not citers:
+            return out
 
-            citation_from_es = LiteratureSearch().get_source(citation.meta.id)
+        for i in range(0, len(citers), CITERS_CHUNK_SIZE):
+            record_citations = LiteratureSearch().filter(
+                'terms', control_number=citers[i:i + CITERS_CHUNK_SIZE]
+            ).scan()
 
-            row.append(render_template_to_string(
-                "inspirehep_theme/citations.html",
-                record=citation_from_es))
-            try:
-                citation_count = citation.citation_count
-            except AttributeError:
-                citation_count = 0
-            row.append(citation_count)
-            out.append(row)
-            row = []
+            for citation in record_citations:
+                row.append(render_template_to_string(
+                    "inspirehep_theme/citations.html",
+                    record=citation.to_dict()))
+                try:
+                    citation_count = citation.citation_count
+                except AttributeError:
+                    citation_count = 0
+                row.append(citation_count)
+                out.append(row)
+                row = []
 
         return out
@@ -33,8 +33,8 @@ class Cv_latex(Export):
 
     """Class used to output CV LaTex format."""
 
-    def __init__(self, record):
-        super(Cv_latex, self).__init__(record)
+    def __init__(self, record, **kwargs):
+        super(Cv_latex, self).__init__(record, **kwargs)
 
     def format(self):
         """Return CV LaTex export for single record."""
@@ -34,8 +34,8 @@ class Cv_latex_html_text(Export):
 
     """Class used to output CV format(html) and CV format(text)."""
 
-    def __init__(self, record, format_type, separator):
-        super(Cv_latex_html_text, self).__init__(record)
+    def __init__(self, record, format_type, separator, **kwargs):
+        super(Cv_latex_html_text, self).__init__(record, **kwargs)
         self.record = record
         self.format_type = format_type
         self.separator = separator
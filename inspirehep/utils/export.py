@@ -24,7 +24,12 @@ from __future__ import absolute_import, division, print_function
 
 import time
 
-from inspirehep.utils.record_getter import get_es_record
+from inspire_dojson.utils import get_recid_from_ref
+from inspirehep.utils.record_getter import (
+    get_es_record,
+    get_es_records_by_recid,
+    RecordGetterError,
+)
 
 
 class MissingRequiredFieldError(LookupError):
@@ -41,11 +46,61 @@ class MissingRequiredFieldError(LookupError):
         return "Missing field: " + self.field
 
 
+def prefetch_export_data(records):
+    """Collect at once what the export formats need about many records.
+
+    Citation counts are taken from the records, which are expected to come
+    from Elasticsearch, and all the journals they refer to are fetched with
+    a single ``mget``.
+
+    :param records: records to export.
+    :returns: keyword arguments to pass to the export formats.
+    """
+    journal_recids = set()
+    for record in records:
+        for pub_info in record.get('publication_info', []):
+            recid = get_recid_from_ref(pub_info.get('journal_record'))
+            if recid:
+                journal_recids.add(recid)
+
+    return {
+        'citation_counts': {
+            record['control_number']: record.get('citation_count', 0)
+            for record in records
+        },
+        'journals': get_es_records_by_recid(
+            'jou', journal_recids) if journal_recids else {},
+    }
+
+
+def stream_exports(exports):
+    """Stream the given exports, separated by newlines."""
+    for i, export in enumerate(exports):
+        if i:
+            yield '\n'
+        yield export
+
+
 class Export(object):
     """Base class used for export formats."""
 
-    def __init__(self, record, *args, **kwargs):
+    def __init__(self, record, citation_counts=None, journals=None):
         self.record = record
+        self.citation_counts = citation_counts
+        self.journals = journals
+
+    def _get_journal(self, pub_info):
+        """Return the journal record referenced by a publication_info."""
+        recid = get_recid_from_ref(pub_info.get('journal_record'))
+        if not recid:
+            return None
+        if self.journals is not None:
+            return self.journals.get(str(recid))
+
+        try:
+            return get_es_record('jou', recid)
+        except RecordGetterError:
+            return None
 
     def _get_citation_key(self):
         """Returns citation keys."""
@@ -136,7 +191,13 @@ class Export(object):
     def _get_citation_number(self):
         """Returns how many times record was cited. If 0, returns nothing"""
         today = time.strftime("%d %b %Y")
-        record = get_es_record('lit', self.record['control_number'])
+        if self.citation_counts is not None:
+            record = {
+                'citation_count': self.citation_counts.get(
+                    self.record['control_number'], 0),
+            }
+        else:
+            record = get_es_record('lit', self.record['control_number'])
         citations = ''
         try:
             times_cited = record['citation_count']
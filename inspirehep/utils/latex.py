@@ -24,7 +24,6 @@ from __future__ import absolute_import, division, print_function
 
 import re
 
-from inspirehep.utils.record_getter import get_es_record
 from .export import MissingRequiredFieldError, Export
 
 
@@ -32,8 +31,8 @@ class Latex(Export):
 
     """Class used to output LaTex format."""
 
-    def __init__(self, record, latex_format):
-        super(Latex, self).__init__(record)
+    def __init__(self, record, latex_format, **kwargs):
+        super(Latex, self).__init__(record, **kwargs)
         self.latex_format = latex_format
 
     def format(self):
@@ -285,8 +284,7 @@ class Latex(Export):
                     pages = field.get('page_start') or field['artid']
                 try:
                     if journal and (volume != '' or pages != ''):
-                        recid = self.record['control_number']
-                        record = get_es_record('jou', recid)
+                        record = self._get_journal(field)
                         coden = ','.join(
                             [record['coden'][0], volume, pages])
                         return coden
@@ -89,6 +89,30 @@ def get_es_records(pid_type, recids, **kwargs):
     return search_class.mget(uuids, **kwargs)
 
 
+def get_es_records_by_recid(pid_type, recids, **kwargs):
+    """Get records from ElasticSearch, indexed by their recid as a string.
+
+    Recids without a corresponding record are missing from the result.
+    """
+    recids = [str(recid) for recid in recids]
+    pids = PersistentIdentifier.query.filter(
+        PersistentIdentifier.pid_value.in_(recids),
+        PersistentIdentifier.pid_type == pid_type
+    ).all()
+    if not pids:
+        return {}
+
+    endpoint = get_endpoint_from_pid_type(pid_type)
+    search_conf = current_app.config['RECORDS_REST_ENDPOINTS'][endpoint]
+    search_class = import_string(search_conf['search_class'])()
+
+    return {
+        str(record['control_number']): record
+        for record in search_class.mget(
+            [str(pid.object_uuid) for pid in pids], **kwargs)
+    }
+
+
 @raise_record_getter_error_and_log
 def get_es_record_by_uuid(uuid):
     pid = PersistentIdentifier.query.filter_by(object_uuid=uuid).one()
@@ -230,7 +230,8 @@ setup(
             'inspirehep_tools_authorlist_js = inspirehep.modules.tools.bundles:js'
         ],
         'invenio_base.api_blueprints': [
-            'inspirehep_editor = inspirehep.modules.editor:blueprint'
+            'inspirehep_editor = inspirehep.modules.editor:blueprint',
+            'inspirehep_records = inspirehep.modules.records.views:blueprint',
         ],
         'invenio_jsonschemas.schemas': [
             'inspire_records = inspire_schemas',
@@ -257,12 +258,15 @@ setup(
         'invenio_db.models': [
             'inspire_workflows_audit = inspirehep.modules.workflows.models',
             'inspire_disambiguation = inspirehep.modules.disambiguation.models',
+            'inspire_records = inspirehep.modules.records.models',
         ],
         'invenio_celery.tasks': [
             'inspire_refextract = inspirehep.modules.refextract.tasks',
             'inspire_authors = inspirehep.modules.authors.tasks',
             'inspire_disambiguation = inspirehep.modules.disambiguation.tasks',
             'inspire_records = inspirehep.modules.records.tasks',
+            'inspire_search = inspirehep.modules.search.tasks',
+            'inspire_api = inspirehep.modules.api.tasks',
         ],
     },
     tests_require=tests_require,
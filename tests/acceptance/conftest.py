@@ -43,7 +43,10 @@ from inspirehep.modules.workflows.models import (
 def app(request):
     """Flask application fixture."""
     app = create_app()
-    app.config.update({'DEBUG': True})
+    app.config.update({
+        'DEBUG': True,
+        'RECORDS_INDEXER_ASYNC': False,
+    })
 
     with app.app_context():
         # Imports must be local, otherwise tasks default to pickle serializer.
@@ -40,6 +40,7 @@ def app():
         CELERY_RESULT_BACKEND='cache',
         CELERY_CACHE_BACKEND='memory',
         CELERY_EAGER_PROPAGATES_EXCEPTIONS=True,
+        RECORDS_INDEXER_ASYNC=False,
         SECRET_KEY='secret!',
         TESTING=True,
     )
@@ -75,7 +76,10 @@ def app():
 def small_app():
     """Flask application fixture."""
     app = create_app()
-    app.config.update({'DEBUG': True})
+    app.config.update({
+        'DEBUG': True,
+        'RECORDS_INDEXER_ASYNC': False,
+    })
 
     with app.app_context():
         # Imports must be local, otherwise tasks default to pickle serializer.
@@ -22,9 +22,44 @@
 
 from __future__ import absolute_import, division, print_function
 
+import pytest
+
+from invenio_db import db
+from invenio_search import current_search_client as es
+
+from inspirehep.modules.records.api import InspireRecord
+from inspirehep.modules.records.citations import (
+    get_citation_count,
+    get_citers,
+    get_citers_by_recid,
+    get_references,
+    prefetched_citation_counts,
+)
 from inspirehep.utils.record_getter import get_es_record
 
 
+@pytest.fixture(scope='function')
+def citing_record(app):
+    record = InspireRecord.create({
+        '$schema': 'http://localhost:5000/schemas/records/hep.json',
+        '_collections': ['Literature'],
+        'control_number': 111,
+        'document_type': ['article'],
+        'titles': [{'title': 'A record citing 1496635'}],
+        'references': [
+            {'record': {'$ref': 'http://localhost:5000/api/literature/1496635'}},
+        ],
+    })
+    db.session.commit()
+    es.indices.refresh('records-hep')
+
+    yield record
+
+    record._delete(force=True)
+    db.session.commit()
+    es.indices.refresh('records-hep')
+
+
 def test_citation_counts_are_correct(app):
     def get_citation_count(recid):
         record = get_es_record('lit', recid)
@@ -37,3 +72,37 @@ def test_citation_counts_are_correct(app):
     assert get_citation_count(1430091) == 1
     assert get_citation_count(452060) == 1
     assert get_citation_count(1496635) == 1
+
+
+def test_citation_counts_are_updated_on_record_commit(app, citing_record):
+    assert get_es_record('lit', 1496635)['citation_count'] == 2
+
+    del citing_record['references']
+    citing_record.commit()
+    db.session.commit()
+    es.indices.refresh('records-hep')
+
+    assert get_es_record('lit', 1496635)['citation_count'] == 1
+
+
+def test_citation_graph(app, citing_record):
+    assert 111 in get_citers(1496635)
+    assert get_references(111) == [1496635]
+
+    citers = get_citers_by_recid([1496635, 712925])
+
+    assert set(get_citers(712925)) == citers[712925]
+    assert 111 in citers[1496635]
+
+
+def test_prefetched_citation_counts_match_the_single_counts(app):
+    records = [
+        {'$schema': 'http://localhost:5000/schemas/records/hep.json', 'control_number': recid}
+        for recid in (712925, 451647, 1496635, 1)
+    ]
+    expected = [get_citation_count(record['control_number']) for record in records]
+
+    with prefetched_citation_counts(records):
+        result = [get_citation_count(record['control_number']) for record in records]
+
+    assert expected == result
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of INSPIRE.
+# Copyright (C) 2014-2017 CERN.
+#
+# INSPIRE is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# INSPIRE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with INSPIRE. If not, see <http://www.gnu.org/licenses/>.
+#
+# In applying this license, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as an Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+from __future__ import absolute_import, division, print_function
+
+import json
+
+import pytest
+from flask_security.utils import hash_password
+from mock import patch
+
+from invenio_accounts.models import SessionActivity, User
+from invenio_accounts.testutils import login_user_via_session
+from invenio_db import db
+
+
+@pytest.fixture(scope='module')
+def users():
+    """Create users needed in this test module."""
+    scientist = User(
+        email='scientist@inspirehep.net',
+        password=hash_password('scientist'),
+        active=True,
+    )
+    db.session.add(scientist)
+    db.session.commit()
+
+    yield
+
+    User.query.filter_by(email='scientist@inspirehep.net').delete()
+    db.session.commit()
+
+
+@pytest.fixture(scope='function')
+def log_in_as_scientist(users, api_client):
+    """Ensure that we're logged in as an unprivileged user."""
+    login_user_via_session(api_client, email='scientist@inspirehep.net')
+
+    yield
+
+    SessionActivity.query.delete()
+    db.session.commit()
+
+
+def test_export_literature_as_json_lines(log_in_as_scientist, api_client):
+    response = api_client.get('/export/literature?q=control_number:4328&format=jsonl')
+
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+
+    lines = response.data.splitlines()
+
+    assert len(lines) == 1
+    assert json.loads(lines[0])['control_number'] == 4328
+
+
+def test_export_literature_as_bibtex(log_in_as_scientist, api_client):
+    response = api_client.get('/export/literature?q=control_number:4328')
+
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-bibtex'
+    assert 'attachment; filename=literature.bib' == response.headers['Content-Disposition']
+    assert response.data.startswith('@article{')
+
+
+def test_export_literature_returns_400_on_unknown_format(log_in_as_scientist, api_client):
+    response = api_client.get('/export/literature?q=control_number:4328&format=foo')
+
+    assert response.status_code == 400
+
+
+def test_export_literature_returns_400_on_empty_query(log_in_as_scientist, api_client):
+    response = api_client.get('/export/literature?q=&format=jsonl')
+
+    assert response.status_code == 400
+
+
+def test_export_literature_returns_400_when_too_many_records_match(log_in_as_scientist, api_client, api):
+    config = {'RECORDS_EXPORT_MAX_RESULTS': 0}
+
+    with patch.dict(api.config, config):
+        response = api_client.get('/export/literature?q=control_number:4328&format=jsonl')
+
+    assert response.status_code == 400
+
+
+def test_export_literature_requires_login(api_client):
+    response = api_client.get('/export/literature?q=control_number:4328&format=jsonl')
+
+    assert response.status_code == 401
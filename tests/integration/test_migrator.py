@@ -34,7 +34,7 @@ from invenio_db import db
 from invenio_pidstore.models import PersistentIdentifier
 
 from inspirehep.modules.migrator.models import InspireProdRecords
-from inspirehep.modules.migrator.tasks import continuous_migration
+from inspirehep.modules.migrator.tasks import continuous_migration, migrate_chunk
 from inspirehep.utils.record_getter import get_db_record
 
 
@@ -51,10 +51,14 @@ def _delete_record(pid_type, pid_value):
     db.session.commit()
 
 
-def push_to_redis(record_file):
-    record = pkg_resources.resource_string(
+def read_fixture(record_file):
+    return pkg_resources.resource_string(
         __name__, os.path.join('fixtures', record_file))
 
+
+def push_to_redis(record_file):
+    record = read_fixture(record_file)
+
     redis_url = current_app.config.get('CACHE_REDIS_URL')
     r = StrictRedis.from_url(redis_url)
     r.rpush('legacy_records', zlib.compress(record))
@@ -162,3 +166,27 @@ def test_continuous_migration_handles_record_updates(app, record_1502656_and_upd
     result = InspireProdRecords.query.get(1502656).marcxml
 
     assert expected == result
+
+
+@pytest.fixture(scope='function')
+def cleanup_1502656():
+    yield
+
+    _delete_record('lit', 1502656)
+
+
+def test_migrate_chunk_handles_record_updates_in_the_same_chunk(app, cleanup_1502656):
+    record = read_fixture('1502656.xml')
+    update = read_fixture('1502656_update.xml')
+
+    migrate_chunk([record, update])
+
+    expected = 1
+    result = len(get_db_record('lit', 1502656)['authors'])
+
+    assert expected == result
+
+    expected = update
+    result = InspireProdRecords.query.get(1502656).marcxml
+
+    assert expected == result
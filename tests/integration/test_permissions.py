@@ -246,6 +246,23 @@ def test_all_collections_are_cached(app, app_client):
         set([u'Another Restricted Collection', u'Restricted Collection', u'Role only collection'])
 
 
+@pytest.mark.usefixtures("users", "sample_record")
+def test_all_collections_cache_is_invalidated_when_actions_change(app, app_client):
+    """Test that changing the access actions drops the collection info."""
+    app_client.get("/literature/111")
+    assert current_cache.get('restricted_collections') is not None
+
+    role = Role.query.filter_by(name='restrictedcollmaintainer').one()
+    db.session.add(ActionRoles(
+        action='view-restricted-collection',
+        argument='New Restricted Collection',
+        role_id=role.id
+    ))
+    db.session.commit()
+
+    assert current_cache.get('restricted_collections') is None
+
+
 @pytest.mark.parametrize('user_info,status', [
     # anonymous user
     (None, 200),
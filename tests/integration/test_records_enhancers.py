@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of INSPIRE.
+# Copyright (C) 2014-2017 CERN.
+#
+# INSPIRE is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# INSPIRE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with INSPIRE. If not, see <http://www.gnu.org/licenses/>.
+#
+# In applying this license, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as an Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+from __future__ import absolute_import, division, print_function
+
+from copy import deepcopy
+
+from invenio_records.models import RecordMetadata
+
+from inspirehep.modules.records.enhancers import (
+    get_ref_tree,
+    populate_all_recids,
+    populate_recids,
+)
+
+
+def test_populate_recids_is_the_same_as_populate_all_recids_on_demo_records(app):
+    schemas = set()
+    for model in RecordMetadata.query.filter(RecordMetadata.json.isnot(None)):
+        tree = get_ref_tree(model.json['$schema'])
+        assert tree is not None
+
+        expected = deepcopy(model.json)
+        populate_all_recids(expected)
+        result = deepcopy(model.json)
+        populate_recids(tree, result)
+
+        assert expected == result
+        schemas.add(model.json['$schema'])
+
+    assert len(schemas) > 1
@@ -26,6 +26,7 @@ import pytest
 from elasticsearch import NotFoundError
 
 from inspirehep.modules.records.api import InspireRecord
+from inspirehep.modules.records.indexer import get_queue_stats
 from inspirehep.modules.search import LiteratureSearch
 from inspirehep.utils.record import get_title
 
@@ -63,3 +64,32 @@ def test_that_db_changes_are_mirrored_in_es(app):
 
     with pytest.raises(NotFoundError):
         es_record = search.get_source(record.id)
+
+
+def test_that_db_changes_are_mirrored_in_es_when_indexing_asynchronously(app):
+    search = LiteratureSearch()
+    json = {
+        '$schema': 'http://localhost:5000/schemas/records/hep.json',
+        'document_type': [
+            'article',
+        ],
+        'titles': [
+            {'title': 'foo'},
+        ],
+    }
+
+    app.config['RECORDS_INDEXER_ASYNC'] = True
+    try:
+        record = InspireRecord.create(json)
+        es_record = search.get_source(record.id)
+
+        assert get_title(es_record) == 'foo'
+
+        record._delete(force=True)
+
+        with pytest.raises(NotFoundError):
+            es_record = search.get_source(record.id)
+    finally:
+        app.config['RECORDS_INDEXER_ASYNC'] = False
+
+    assert get_queue_stats()['backlog'] == 0
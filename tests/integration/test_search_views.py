@@ -86,3 +86,22 @@ def test_search_logs(current_app_mock, api_client):
 
     current_app_mock.logger.debug.side_effect = _debug
     api_client.get('/literature/')
+
+
+def test_search_facets(app_client):
+    response = app_client.get('/search/facets?q=')
+
+    assert response.status_code == 200
+
+    aggregations = json.loads(response.data)['aggregations']
+
+    assert 'author' in aggregations
+    assert 'earliest_date' in aggregations
+
+
+def test_literature_search_defers_facets(api, api_client):
+    with patch.dict(api.config, {'SEARCH_DEFERRED_FACETS': ['records-hep']}):
+        response = api_client.get('/literature/')
+
+    assert response.status_code == 200
+    assert 'aggregations' not in json.loads(response.data)
@@ -74,6 +74,7 @@ def workflow_app():
             'http://localhost:1234'
         ),
         MAGPIE_API_URL="http://example.com/magpie",
+        RECORDS_INDEXER_ASYNC=False,
         WTF_CSRF_ENABLED=False,
     )
 
@@ -23,15 +23,21 @@
 from __future__ import absolute_import, division, print_function
 
 import pytest
+from flask import current_app
+from mock import patch
 
 from inspirehep.modules.api.utils import (
+    build_citesummary_entry,
+    get_citesummary_cache_keys,
     get_date,
     get_document_type,
     get_id,
     get_subject,
     is_collaboration,
     is_core,
+    invalidate_citesummaries,
     is_selfcite,
+    stream_citesummary,
 )
 
 
@@ -182,3 +188,133 @@ def test_is_selfcite_returns_false_when_no_authors_recids_are_in_common():
     }
 
     assert not is_selfcite(citee, citer)
+
+
+def test_build_citesummary_entry():
+    record = {
+        'collaborations': [{'value': 'ATLAS'}],
+        'control_number': 4328,
+        'core': True,
+        'earliest_date': '1993-02-02',
+        'facet_inspire_doc_type': ['peer reviewed'],
+        'inspire_categories': [{'term': 'Phenomenology-HEP'}],
+        'titles': [{'title': 'Partner choice and cooperation in networks'}],
+    }
+
+    expected = {
+        'collaboration': True,
+        'core': True,
+        'date': '1993-02-02',
+        'document_type': 'peer reviewed',
+        'id': 4328,
+        'subject': 'Phenomenology-HEP',
+        'title': 'Partner choice and cooperation in networks',
+    }
+    result = build_citesummary_entry(record)
+
+    assert expected == result
+
+
+@patch('inspirehep.modules.api.utils.current_cache')
+def test_stream_citesummary_is_cached_per_record(current_cache):
+    current_cache.get.return_value = '[]'
+    record = {
+        '$schema': 'http://localhost:5000/schemas/records/experiments.json',
+        'control_number': 1,
+    }
+
+    assert stream_citesummary(record, None) == ['[]']
+    current_cache.get.assert_called_once_with('citesummary:experiments:1')
+
+
+def test_get_citesummary_cache_keys_of_a_hep_record():
+    json = {
+        '$schema': 'http://localhost:5000/schemas/records/hep.json',
+        'accelerator_experiments': [
+            {'record': {'$ref': 'http://localhost:5000/api/experiments/3'}},
+        ],
+        'authors': [
+            {
+                'affiliations': [
+                    {'record': {'$ref': 'http://localhost:5000/api/institutions/2'}},
+                ],
+                'record': {'$ref': 'http://localhost:5000/api/authors/1'},
+            },
+            {'full_name': 'Doe, John'},
+        ],
+        'control_number': 5,
+        'publication_info': [
+            {'journal_record': {'$ref': 'http://localhost:5000/api/journals/4'}},
+        ],
+    }
+
+    expected = {
+        'citesummary:authors:1',
+        'citesummary:experiments:3',
+        'citesummary:institutions:2',
+        'citesummary:journals:4',
+    }
+    result = get_citesummary_cache_keys(json)
+
+    assert expected == result
+
+
+def test_get_citesummary_cache_keys_of_other_records():
+    author = {
+        '$schema': 'http://localhost:5000/schemas/records/authors.json',
+        'control_number': 1,
+    }
+    job = {
+        '$schema': 'http://localhost:5000/schemas/records/jobs.json',
+        'control_number': 2,
+    }
+
+    assert get_citesummary_cache_keys(author) == {'citesummary:authors:1'}
+    assert get_citesummary_cache_keys(job) == set()
+
+
+@patch('inspirehep.modules.api.tasks.invalidate_citesummaries_later')
+@patch('inspirehep.modules.api.utils.current_cache')
+def test_invalidate_citesummaries(current_cache, invalidate_citesummaries_later):
+    records = [
+        {
+            '$schema': 'http://localhost:5000/schemas/records/hep.json',
+            'authors': [
+                {'record': {'$ref': 'http://localhost:5000/api/authors/1'}},
+            ],
+        },
+        None,
+        {
+            '$schema': 'http://localhost:5000/schemas/records/journals.json',
+            'control_number': 2,
+        },
+    ]
+    config = {'API_CITESUMMARY_CACHE_TIMEOUT': 60}
+
+    with patch.dict(current_app.config, config):
+        invalidate_citesummaries(records)
+
+    current_cache.delete_many.assert_called_once_with(
+        'citesummary:authors:1', 'citesummary:journals:2')
+    invalidate_citesummaries_later.apply_async.assert_called_once_with(
+        args=[['citesummary:authors:1', 'citesummary:journals:2']],
+        countdown=current_app.config['API_CITESUMMARY_INVALIDATION_DELAY'],
+    )
+
+
+@patch('inspirehep.modules.api.tasks.invalidate_citesummaries_later')
+@patch('inspirehep.modules.api.utils.current_cache')
+def test_invalidate_citesummaries_when_they_are_not_cached(current_cache, invalidate_citesummaries_later):
+    records = [
+        {
+            '$schema': 'http://localhost:5000/schemas/records/journals.json',
+            'control_number': 2,
+        },
+    ]
+    config = {'API_CITESUMMARY_CACHE_TIMEOUT': None}
+
+    with patch.dict(current_app.config, config):
+        invalidate_citesummaries(records)
+
+    assert not current_cache.delete_many.called
+    assert not invalidate_citesummaries_later.apply_async.called
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of INSPIRE.
+# Copyright (C) 2014-2017 CERN.
+#
+# INSPIRE is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# INSPIRE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with INSPIRE. If not, see <http://www.gnu.org/licenses/>.
+#
+# In applying this license, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as an Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+from __future__ import absolute_import, division, print_function
+
+from flask import current_app
+from mock import MagicMock, call, patch
+
+from inspirehep.modules.authors.metrics import (
+    _build_publication,
+    get_author_metrics,
+    get_authors_recids,
+    invalidate_author_metrics,
+)
+
+
+def test_build_publication():
+    result_source = {
+        'accelerator_experiments': [{'experiment': 'CERN-LHC-CMS'}],
+        'citation_count': 3,
+        'control_number': 1,
+        'earliest_date': '2017-01-01',
+        'facet_inspire_doc_type': ['peer reviewed', 'article'],
+        'publication_info': [{'journal_title': 'Phys.Rev.'}],
+        'self': {'$ref': 'http://localhost:5000/api/literature/1'},
+        'titles': [{'title': 'A title'}],
+    }
+
+    expected = {
+        'citations': 3,
+        'collaborations': ['CERN-LHC-CMS'],
+        'date': '2017-01-01',
+        'id': 1,
+        'journal': {'title': 'Phys.Rev.'},
+        'record': {'$ref': 'http://localhost:5000/api/literature/1'},
+        'title': 'A title',
+        'type': 'peer reviewed',
+    }
+    result = _build_publication(result_source)
+
+    assert expected == result
+
+
+def test_build_publication_without_journal():
+    result_source = {
+        'control_number': 1,
+        'self': {'$ref': 'http://localhost:5000/api/literature/1'},
+        'titles': [{'title': 'A title'}],
+    }
+
+    expected = {
+        'id': 1,
+        'record': {'$ref': 'http://localhost:5000/api/literature/1'},
+        'title': 'A title',
+    }
+    result = _build_publication(result_source)
+
+    assert expected == result
+
+
+def test_get_authors_recids():
+    json = {
+        '$schema': 'http://localhost:5000/schemas/records/hep.json',
+        'authors': [
+            {'record': {'$ref': 'http://localhost:5000/api/authors/1'}},
+            {},
+            {'record': {'$ref': 'http://localhost:5000/api/authors/2'}},
+        ],
+    }
+
+    assert get_authors_recids(json) == {1, 2}
+
+
+def test_get_authors_recids_ignores_other_records():
+    json = {
+        '$schema': 'http://localhost:5000/schemas/records/jobs.json',
+        'authors': [
+            {'record': {'$ref': 'http://localhost:5000/api/authors/1'}},
+        ],
+    }
+
+    assert get_authors_recids(json) == set()
+
+
+@patch('inspirehep.modules.authors.metrics._get_filter_key', MagicMock(return_value='null'))
+@patch('inspirehep.modules.authors.metrics.compute_author_metrics')
+@patch('inspirehep.modules.authors.metrics.current_cache')
+def test_get_author_metrics_computes_them_holding_a_lock(current_cache, compute_author_metrics):
+    current_cache.get.side_effect = [3, None]
+    current_cache.cache.key_prefix = 'cache::'
+    current_cache.cache._client.set.return_value = True
+    compute_author_metrics.return_value = {'statistics': {}}
+
+    assert get_author_metrics('1') == {'statistics': {}}
+
+    cache_key = 'author_metrics:1:3:2be88ca4242c76e8253ac62474851065032d6833'
+    current_cache.set.assert_called_once_with(
+        cache_key,
+        {'statistics': {}},
+        timeout=current_app.config['AUTHORS_METRICS_CACHE_TIMEOUT'],
+    )
+    current_cache.cache._client.delete.assert_called_once_with(
+        'cache::' + cache_key + ':lock')
+
+
+@patch('inspirehep.modules.authors.metrics._get_filter_key', MagicMock(return_value='null'))
+@patch('inspirehep.modules.authors.metrics.time.sleep', MagicMock())
+@patch('inspirehep.modules.authors.metrics.compute_author_metrics')
+@patch('inspirehep.modules.authors.metrics.current_cache')
+def test_get_author_metrics_waits_for_the_holder_of_the_lock(current_cache, compute_author_metrics):
+    current_cache.get.side_effect = [None, None, None, {'statistics': {}}]
+    current_cache.cache.key_prefix = 'cache::'
+    current_cache.cache._client.set.return_value = None
+    current_cache.cache._client.exists.return_value = True
+
+    assert get_author_metrics(1) == {'statistics': {}}
+    assert not compute_author_metrics.called
+    assert not current_cache.cache._client.delete.called
+
+
+@patch('inspirehep.modules.authors.metrics.current_cache')
+def test_invalidate_author_metrics_increments_the_generations(current_cache):
+    current_cache.cache.key_prefix = 'cache::'
+    pipeline = current_cache.cache._client.pipeline.return_value
+
+    invalidate_author_metrics([1, 2])
+
+    assert pipeline.incr.call_args_list == [
+        call('cache::author_metrics_generation:1'),
+        call('cache::author_metrics_generation:2'),
+    ]
+    pipeline.execute.assert_called_once_with()
@@ -28,6 +28,7 @@ from flask import current_app
 
 from inspire_schemas.api import load_schema, validate
 from inspirehep.modules.authors import receivers
+from inspirehep.modules.records.api import InspireRecord
 
 
 def test_name_variations():
@@ -153,3 +154,69 @@ def test_uuid_generation():
 
     # Check if the author with no UUID got one.
     assert(json_dict['authors'][1]['uuid'] is not None)
+
+
+@mock.patch('inspirehep.modules.authors.receivers.invalidate_authors_metrics_later')
+@mock.patch('inspirehep.modules.authors.receivers.invalidate_author_metrics')
+def test_invalidate_authors_metrics_of_the_indexed_records(
+        invalidate_author_metrics, invalidate_authors_metrics_later):
+    records = [
+        {
+            '$schema': 'http://localhost:5000/schemas/records/hep.json',
+            'authors': [
+                {'record': {'$ref': 'http://localhost:5000/api/authors/1'}},
+                {'record': {'$ref': 'http://localhost:5000/api/authors/2'}},
+            ],
+        },
+        {
+            '$schema': 'http://localhost:5000/schemas/records/hep.json',
+            'authors': [
+                {'record': {'$ref': 'http://localhost:5000/api/authors/3'}},
+            ],
+        },
+        {
+            '$schema': 'http://localhost:5000/schemas/records/authors.json',
+            'control_number': 4,
+        },
+    ]
+
+    receivers.invalidate_authors_metrics(None, uuids=['a-uuid', 'another-uuid'], records=records)
+
+    invalidate_author_metrics.assert_called_once_with({1, 2, 3})
+    invalidate_authors_metrics_later.apply_async.assert_called_once_with(
+        args=[[1, 2, 3]],
+        countdown=current_app.config['AUTHORS_METRICS_INVALIDATION_DELAY'],
+    )
+
+
+@mock.patch('inspirehep.modules.authors.receivers.invalidate_authors_metrics_later')
+@mock.patch('inspirehep.modules.authors.receivers.invalidate_author_metrics')
+def test_invalidate_authors_metrics_without_records(
+        invalidate_author_metrics, invalidate_authors_metrics_later):
+    receivers.invalidate_authors_metrics(None, uuids=['a-uuid'], records=[])
+
+    assert not invalidate_author_metrics.called
+    assert not invalidate_authors_metrics_later.apply_async.called
+
+
+@mock.patch('inspirehep.modules.authors.receivers.invalidate_authors_metrics_later')
+@mock.patch('inspirehep.modules.authors.receivers.invalidate_author_metrics')
+def test_invalidate_removed_authors_metrics(
+        invalidate_author_metrics, invalidate_authors_metrics_later):
+    model = mock.Mock(json={
+        '$schema': 'http://localhost:5000/schemas/records/hep.json',
+        'authors': [
+            {'record': {'$ref': 'http://localhost:5000/api/authors/1'}},
+            {'record': {'$ref': 'http://localhost:5000/api/authors/2'}},
+        ],
+    })
+    record = InspireRecord({
+        '$schema': 'http://localhost:5000/schemas/records/hep.json',
+        'authors': [
+            {'record': {'$ref': 'http://localhost:5000/api/authors/2'}},
+        ],
+    }, model=model)
+
+    receivers.invalidate_removed_authors_metrics(record)
+
+    invalidate_author_metrics.assert_called_once_with({1})
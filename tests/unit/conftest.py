@@ -45,6 +45,7 @@ def app():
         CELERY_RESULT_BACKEND='cache',
         CELERY_CACHE_BACKEND='memory',
         CELERY_EAGER_PROPAGATES_EXCEPTIONS=True,
+        RECORDS_INDEXER_ASYNC=False,
         TESTING=True,
         PRODUCTION_MODE=True,
     )
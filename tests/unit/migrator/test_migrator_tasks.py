@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of INSPIRE.
+# Copyright (C) 2014-2017 CERN.
+#
+# INSPIRE is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# INSPIRE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with INSPIRE. If not, see <http://www.gnu.org/licenses/>.
+#
+# In applying this license, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as an Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+from __future__ import absolute_import, division, print_function
+
+import gzip
+
+import pytest
+from mock import MagicMock, Mock, call, patch
+
+from inspirehep.modules.migrator.tasks import (
+    decompress_source,
+    get_concrete_indices,
+    get_reindex_actions,
+    get_reindex_deletions,
+    iter_records,
+    open_source,
+    split_ranges,
+    split_uuid_range,
+    swap_index,
+)
+
+
+RECORDS = [
+    '<record>\n  <controlfield tag="001">{}</controlfield>\n</record>'.format(recid)
+    for recid in range(1, 21)
+]
+
+
+@pytest.fixture(params=['dump.xml', 'dump.xml.gz'])
+def dump(request, tmpdir):
+    data = '<collection>\n' + '\n'.join(RECORDS) + '\n</collection>\n'
+    path = str(tmpdir.join(request.param))
+    fd = gzip.open(path, 'wb') if path.endswith('.gz') else open(path, 'wb')
+    fd.write(data)
+    fd.close()
+
+    return path
+
+
+def test_split_ranges_covers_all_records(dump):
+    source = decompress_source(dump)
+    ranges = split_ranges(source, range_size=200)
+
+    assert len(ranges) > 1
+
+    result = []
+    for start, end in ranges:
+        result.extend(record for _, _, record in iter_records(open_source(source), start, end))
+
+    assert RECORDS == result
+
+
+def test_split_ranges_with_range_bigger_than_dump(dump):
+    ranges = split_ranges(decompress_source(dump), range_size=1024 * 1024)
+
+    assert len(ranges) == 1
+
+
+def test_iter_records_resumes_from_position(dump):
+    records = list(iter_records(open_source(dump)))
+    position = records[4][1]
+
+    expected = RECORDS[5:]
+    result = [record for _, _, record in iter_records(open_source(dump), position)]
+
+    assert expected == result
+
+
+def test_decompress_source(dump):
+    source = decompress_source(dump)
+
+    assert source == str(dump).replace('.gz', '')
+    with open(source, 'rb') as fd:
+        assert fd.read().count(b'</record>') == len(RECORDS)
+
+
+def test_split_uuid_range():
+    expected = [
+        (None, '40000000-0000-0000-0000-000000000000'),
+        ('40000000-0000-0000-0000-000000000000', '80000000-0000-0000-0000-000000000000'),
+        ('80000000-0000-0000-0000-000000000000', 'c0000000-0000-0000-0000-000000000000'),
+        ('c0000000-0000-0000-0000-000000000000', None),
+    ]
+    result = split_uuid_range(4)
+
+    assert expected == result
+
+
+def test_split_uuid_range_with_one_partition():
+    assert split_uuid_range(1) == [(None, None)]
+
+
+def _sort_actions(actions):
+    return sorted(actions, key=lambda action: sorted(action.items()))
+
+
+@patch('inspirehep.modules.migrator.tasks.es')
+def test_swap_index_replaces_an_index_by_an_alias(es):
+    es.indices.exists.return_value = True
+    es.indices.get_alias.return_value = {
+        'records-hep': {'aliases': {'hep': {}}},
+    }
+
+    swap_index('records-hep', 'records-hep-20170101')
+
+    expected = [
+        {'add': {'index': 'records-hep-20170101', 'alias': 'records-hep'}},
+        {'add': {'index': 'records-hep-20170101', 'alias': 'hep'}},
+    ]
+
+    assert es.indices.method_calls[-2:] == [
+        call.delete(index='records-hep'),
+        call.update_aliases(body={'actions': expected}),
+    ]
+
+
+@patch('inspirehep.modules.migrator.tasks.es')
+def test_swap_index_moves_the_aliases(es):
+    es.indices.exists.return_value = True
+    es.indices.get_alias.return_value = {
+        'records-hep-20160101': {'aliases': {'records-hep': {}, 'hep': {}}},
+    }
+
+    swap_index('records-hep', 'records-hep-20170101')
+
+    expected = [
+        {'add': {'index': 'records-hep-20170101', 'alias': 'records-hep'}},
+        {'add': {'index': 'records-hep-20170101', 'alias': 'hep'}},
+        {'remove': {'index': 'records-hep-20160101', 'alias': 'records-hep'}},
+        {'remove': {'index': 'records-hep-20160101', 'alias': 'hep'}},
+    ]
+    actions = es.indices.update_aliases.call_args[1]['body']['actions']
+
+    assert _sort_actions(expected) == _sort_actions(actions)
+    es.indices.delete.assert_called_once_with(index='records-hep-20160101')
+
+
+@patch('inspirehep.modules.migrator.tasks.es')
+def test_get_concrete_indices(es):
+    es.indices.exists.side_effect = lambda index: index != 'records-jobs'
+    es.indices.get_alias.side_effect = lambda index: {
+        'records-hep': {'records-hep': {'aliases': {}}},
+        'records-authors': {'records-authors-20170101': {'aliases': {'records-authors': {}}}},
+    }[index]
+
+    expected = ['records-hep']
+    result = get_concrete_indices(['records-hep', 'records-authors', 'records-jobs'])
+
+    assert expected == result
+
+
+@patch('inspirehep.modules.migrator.tasks.db')
+@patch('inspirehep.modules.migrator.tasks.prefetched_citation_counts', MagicMock())
+@patch('inspirehep.modules.migrator.tasks.RecordIndexer._prepare_record')
+@patch('inspirehep.modules.migrator.tasks.current_record_to_index')
+def test_get_reindex_actions(current_record_to_index, _prepare_record, db):
+    models = [
+        Mock(id='2fba2a2e-4c61-4f3b-9b8a-1a7a4f1a8d2d', version_id=3,
+             json={'control_number': 1}),
+        Mock(id='3fba2a2e-4c61-4f3b-9b8a-1a7a4f1a8d2d', version_id=1,
+             json=None),
+        Mock(id='4fba2a2e-4c61-4f3b-9b8a-1a7a4f1a8d2d', version_id=1,
+             json={'control_number': 2}),
+    ]
+    query = Mock()
+    query.order_by.return_value.limit.return_value.all.return_value = models[:2]
+    query.filter.return_value.order_by.return_value.limit.return_value.all.side_effect = [
+        models[2:],
+        [],
+    ]
+    current_record_to_index.side_effect = [
+        ('records-hep', 'hep'),
+        ('records-jobs', 'jobs'),
+    ]
+    _prepare_record.return_value = {'control_number': 1}
+
+    expected = [
+        {
+            '_op_type': 'index',
+            '_index': 'records-hep-20170101',
+            '_type': 'hep',
+            '_id': '2fba2a2e-4c61-4f3b-9b8a-1a7a4f1a8d2d',
+            '_version': 3,
+            '_version_type': 'external_gte',
+            '_source': {'control_number': 1},
+        },
+    ]
+    result = list(get_reindex_actions(
+        query, {'records-hep': 'records-hep-20170101'}, batch_size=2))
+
+    assert expected == result
+
+
+@patch('inspirehep.modules.migrator.tasks.db')
+@patch('inspirehep.modules.migrator.tasks.scan')
+def test_get_reindex_deletions(scan, db):
+    scan.return_value = [
+        {'_id': '2fba2a2e-4c61-4f3b-9b8a-1a7a4f1a8d2d', '_type': 'hep'},
+        {'_id': '3fba2a2e-4c61-4f3b-9b8a-1a7a4f1a8d2d', '_type': 'hep'},
+    ]
+    db.session.query.return_value.filter.return_value = [
+        ('2fba2a2e-4c61-4f3b-9b8a-1a7a4f1a8d2d',),
+    ]
+
+    expected = [
+        {
+            '_op_type': 'delete',
+            '_index': 'records-hep-20170101',
+            '_type': 'hep',
+            '_id': '3fba2a2e-4c61-4f3b-9b8a-1a7a4f1a8d2d',
+        },
+    ]
+    result = list(get_reindex_deletions({'records-hep': 'records-hep-20170101'}))
+
+    assert expected == result
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of INSPIRE.
+# Copyright (C) 2014-2017 CERN.
+#
+# INSPIRE is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# INSPIRE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with INSPIRE. If not, see <http://www.gnu.org/licenses/>.
+#
+# In applying this license, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as an Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+from __future__ import absolute_import, division, print_function
+
+from mock import patch
+
+from inspirehep.modules.records.benchmark import (
+    benchmark_dates,
+    benchmark_enhancers,
+    get_dates,
+)
+
+
+@patch('inspirehep.modules.records.benchmark.get_ref_tree')
+def test_benchmark_enhancers(get_ref_tree):
+    get_ref_tree.side_effect = [{'self': None}, None]
+    records = [
+        {
+            '$schema': 'http://localhost:5000/schemas/records/hep.json',
+            'control_number': 1,
+            'self': {'$ref': 'http://localhost:5000/api/literature/1'},
+        },
+        {
+            '$schema': 'http://localhost:5000/schemas/records/unknown.json',
+            'control_number': 2,
+        },
+    ]
+
+    result = benchmark_enhancers(records, repeat=3)
+
+    assert [recid for recid, _, _ in result] == [1, 2]
+    assert result[0][1] is not None
+    assert result[1][1] is None
+    assert all(walk is not None for _, _, walk in result)
+    assert 'self_recid' not in records[0]
+
+
+def test_get_dates():
+    records = [
+        {
+            'preprint_date': '2001-02-03',
+            'publication_info': [{'year': 2002}, {'year': 2003}],
+        },
+        {
+            'legacy_creation_date': '2004-05-06',
+        },
+    ]
+
+    expected = ['2001-02-03', 2002, 2003, '2004-05-06']
+    result = get_dates(records)
+
+    assert expected == result
+
+
+def test_benchmark_dates():
+    result = benchmark_dates(['2001-02-03', '2001', 'Feb 2001'], repeat=3)
+
+    assert sorted(result) == ['cached', 'strptime', 'uncached']
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of INSPIRE.
+# Copyright (C) 2014-2017 CERN.
+#
+# INSPIRE is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# INSPIRE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with INSPIRE. If not, see <http://www.gnu.org/licenses/>.
+#
+# In applying this license, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as an Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+from __future__ import absolute_import, division, print_function
+
+from flask import g
+from mock import patch
+
+from inspirehep.modules.records.citations import (
+    get_citation_count,
+    get_cited_recids,
+    is_self_citation,
+    prefetched_citation_counts,
+)
+
+
+def test_get_cited_recids():
+    record = {
+        '$schema': 'http://localhost:5000/schemas/records/hep.json',
+        'references': [
+            {'record': {'$ref': 'http://localhost:5000/api/literature/1'}},
+            {'record': {'$ref': 'http://localhost:5000/api/literature/2'}},
+            {'record': {'$ref': 'http://localhost:5000/api/literature/1'}},
+            {'reference': {'title': {'title': 'Not linked'}}},
+        ],
+    }
+
+    expected = {1, 2}
+    result = get_cited_recids(record)
+
+    assert expected == result
+
+
+def test_get_cited_recids_of_deleted_record_is_empty():
+    record = {
+        '$schema': 'http://localhost:5000/schemas/records/hep.json',
+        'deleted': True,
+        'references': [
+            {'record': {'$ref': 'http://localhost:5000/api/literature/1'}},
+        ],
+    }
+
+    assert get_cited_recids(record) == set()
+
+
+def test_get_cited_recids_of_non_hep_record_is_empty():
+    record = {
+        '$schema': 'http://localhost:5000/schemas/records/authors.json',
+        'references': [
+            {'record': {'$ref': 'http://localhost:5000/api/literature/1'}},
+        ],
+    }
+
+    assert get_cited_recids(record) == set()
+
+
+def test_is_self_citation_when_an_author_is_shared():
+    citee = {'authors': [{'recid': 1}, {'recid': 2}]}
+    citer = {'authors': [{'recid': 2}, {'recid': 3}]}
+
+    assert is_self_citation(citee, citer)
+
+
+def test_is_self_citation_when_no_author_is_shared():
+    citee = {'authors': [{'recid': 1}, {'full_name': 'Smith, J.'}]}
+    citer = {'authors': [{'full_name': 'Smith, J.'}]}
+
+    assert not is_self_citation(citee, citer)
+
+
+@patch('inspirehep.modules.records.citations.get_citation_counts')
+def test_prefetched_citation_counts(get_citation_counts):
+    get_citation_counts.return_value = {1: 5, 2: 0}
+    records = [
+        {'$schema': 'http://localhost:5000/schemas/records/hep.json', 'control_number': 1},
+        {'$schema': 'http://localhost:5000/schemas/records/hep.json', 'control_number': 2},
+        {'$schema': 'http://localhost:5000/schemas/records/authors.json', 'control_number': 3},
+    ]
+
+    with prefetched_citation_counts(records):
+        assert get_citation_count(1) == 5
+        assert get_citation_count(2) == 0
+
+    get_citation_counts.assert_called_once_with([1, 2])
+    assert g.get('citation_counts') is None
@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of INSPIRE.
+# Copyright (C) 2014-2017 CERN.
+#
+# INSPIRE is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# INSPIRE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with INSPIRE. If not, see <http://www.gnu.org/licenses/>.
+#
+# In applying this license, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as an Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+from __future__ import absolute_import, division, print_function
+
+from mock import patch
+
+from inspirehep.modules.records.enhancers import (
+    ANY_KEY,
+    _compile_ref_tree,
+    get_recid_key,
+    populate_all_recids,
+    populate_recids,
+)
+
+
+JSON_REFERENCE = {
+    'type': 'object',
+    'properties': {
+        '$ref': {'type': 'string'},
+    },
+}
+
+
+def test_get_recid_key():
+    assert get_recid_key('record') == 'recid'
+    assert get_recid_key('journal_record') == 'journal_recid'
+    assert get_recid_key('new_record') == 'new_recid'
+    assert get_recid_key('self') == 'self_recid'
+
+
+def test_compile_ref_tree():
+    schema = {
+        'type': 'object',
+        'properties': {
+            'self': JSON_REFERENCE,
+            'titles': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'title': {'type': 'string'},
+                    },
+                },
+            },
+            'authors': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'full_name': {'type': 'string'},
+                        'record': JSON_REFERENCE,
+                        'affiliations': {
+                            'type': 'array',
+                            'items': {
+                                'type': 'object',
+                                'properties': {
+                                    'record': JSON_REFERENCE,
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+            'deleted_records': {
+                'type': 'array',
+                'items': JSON_REFERENCE,
+            },
+        },
+    }
+
+    expected = {
+        'self': None,
+        'authors': {
+            'record': None,
+            'affiliations': {
+                'record': None,
+            },
+        },
+        'deleted_records': None,
+    }
+    result = _compile_ref_tree(schema, 'hep.json')
+
+    assert expected == result
+
+
+@patch('inspirehep.modules.records.enhancers.load_schema')
+def test_compile_ref_tree_follows_refs(load_schema):
+    load_schema.return_value = JSON_REFERENCE
+    schema = {
+        'type': 'object',
+        'properties': {
+            'publication_info': {
+                'type': 'array',
+                'items': {
+                    'anyOf': [
+                        {
+                            'type': 'object',
+                            'properties': {
+                                'journal_record': {
+                                    '$ref': 'elements/json_reference.json',
+                                },
+                            },
+                        },
+                    ],
+                },
+            },
+        },
+    }
+
+    expected = {
+        'publication_info': {
+            'journal_record': None,
+        },
+    }
+    result = _compile_ref_tree(schema, 'hep.json')
+
+    assert expected == result
+    load_schema.assert_called_once_with('elements/json_reference.json')
+
+
+@patch('inspirehep.modules.records.enhancers.load_schema')
+def test_compile_ref_tree_stops_on_cycles(load_schema):
+    load_schema.return_value = {
+        'type': 'object',
+        'properties': {
+            'children': {
+                'type': 'array',
+                'items': {'$ref': 'node.json'},
+            },
+        },
+    }
+    schema = {'$ref': 'node.json'}
+
+    assert _compile_ref_tree(schema, 'hep.json') == {}
+
+
+def test_compile_ref_tree_with_a_reference_in_a_combinator():
+    schema = {
+        'type': 'object',
+        'properties': {
+            'new_record': {
+                'oneOf': [JSON_REFERENCE, {'type': 'string'}],
+            },
+            'related': {
+                'anyOf': [
+                    JSON_REFERENCE,
+                    {
+                        'type': 'object',
+                        'properties': {'record': JSON_REFERENCE},
+                    },
+                ],
+            },
+        },
+    }
+
+    expected = {
+        'new_record': None,
+        'related': {
+            'record': None,
+        },
+    }
+    result = _compile_ref_tree(schema, 'hep.json')
+
+    assert expected == result
+
+
+def test_compile_ref_tree_with_additional_and_pattern_properties():
+    schema = {
+        'type': 'object',
+        'properties': {
+            'self': JSON_REFERENCE,
+        },
+        'patternProperties': {
+            '^x_': {
+                'type': 'object',
+                'properties': {'record': JSON_REFERENCE},
+            },
+        },
+        'additionalProperties': {
+            'type': 'object',
+            'properties': {'journal_record': JSON_REFERENCE},
+        },
+    }
+
+    expected = {
+        'self': None,
+        ANY_KEY: {
+            'record': None,
+            'journal_record': None,
+        },
+    }
+    result = _compile_ref_tree(schema, 'hep.json')
+
+    assert expected == result
+
+
+def test_populate_recids_with_any_key():
+    tree = {
+        'self': None,
+        ANY_KEY: {'record': None},
+    }
+    record = {
+        'self': {'$ref': 'http://x/api/literature/1'},
+        'x_foo': {'record': {'$ref': 'http://x/api/literature/2'}},
+        'x_bar': {'record': {'$ref': 'http://x/api/literature/3'}},
+    }
+
+    expected = {
+        'self': {'$ref': 'http://x/api/literature/1'},
+        'self_recid': 1,
+        'x_foo': {'record': {'$ref': 'http://x/api/literature/2'}, 'recid': 2},
+        'x_bar': {'record': {'$ref': 'http://x/api/literature/3'}, 'recid': 3},
+    }
+    populate_recids(tree, record)
+
+    assert expected == record
+
+
+def test_populate_recids():
+    tree = {
+        'self': None,
+        'authors': {
+            'record': None,
+        },
+        'deleted_records': None,
+    }
+    record = {
+        'self': {'$ref': 'http://x/api/literature/1'},
+        'authors': [
+            {'record': {'$ref': 'http://x/api/authors/2'}},
+            {'full_name': 'Smith, J.'},
+        ],
+        'deleted_records': [
+            {'$ref': 'http://x/api/literature/3'},
+        ],
+    }
+
+    expected = {
+        'self': {'$ref': 'http://x/api/literature/1'},
+        'self_recid': 1,
+        'authors': [
+            {'record': {'$ref': 'http://x/api/authors/2'}, 'recid': 2},
+            {'full_name': 'Smith, J.'},
+        ],
+        'deleted_records': [
+            {'$ref': 'http://x/api/literature/3'},
+        ],
+        'deleted_recids': [3],
+    }
+    populate_recids(tree, record)
+
+    assert expected == record
+
+
+def test_populate_recids_is_the_same_as_populate_all_recids():
+    tree = {
+        'references': {
+            'record': None,
+        },
+    }
+    record = {
+        'references': [
+            {
+                'record': {'$ref': 'http://x/api/literature/1'},
+                'reference': {'title': {'title': 'Foo'}},
+            },
+        ],
+    }
+    expected = {
+        'references': [
+            {
+                'record': {'$ref': 'http://x/api/literature/1'},
+                'recid': 1,
+                'reference': {'title': {'title': 'Foo'}},
+            },
+        ],
+    }
+
+    populate_recids(tree, record)
+    assert expected == record
+
+    populate_all_recids(record)
+    assert expected == record
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of INSPIRE.
+# Copyright (C) 2014-2017 CERN.
+#
+# INSPIRE is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# INSPIRE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with INSPIRE. If not, see <http://www.gnu.org/licenses/>.
+#
+# In applying this license, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as an Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+from __future__ import absolute_import, division, print_function
+
+from mock import call, patch
+
+from inspirehep.modules.records.experiments import (
+    EXPERIMENTS_INDEX_KEY,
+    EXPERIMENTS_INDEX_VERSION_KEY,
+    ExperimentsIndex,
+    build_experiments_index,
+    get_experiment_names,
+    update_experiments_index,
+)
+
+
+def test_get_experiment_names():
+    record = {
+        'legacy_name': 'CERN-LHC-CMS',
+        'name_variants': ['CMS', 'Compact Muon Solenoid'],
+    }
+
+    expected = ('CERN-LHC-CMS', ['cms', 'compactmuonsolenoid'])
+    result = get_experiment_names(record)
+
+    assert expected == result
+
+
+def test_get_experiment_names_without_legacy_name():
+    assert get_experiment_names({'name_variants': ['CMS']}) == (None, [])
+
+
+@patch('inspirehep.modules.records.experiments.get_redis')
+def test_experiments_index_normalizes_names(get_redis):
+    get_redis.return_value.get.return_value = b'1'
+    get_redis.return_value.hgetall.return_value = {
+        b'cern-lhc-cms': b'CERN-LHC-CMS',
+        b'cms': b'CERN-LHC-CMS',
+    }
+    index = ExperimentsIndex()
+
+    assert index.normalize('Cern-LHC-CMS') == 'CERN-LHC-CMS'
+    assert index.normalize('C M S') == 'CERN-LHC-CMS'
+    assert index.normalize('NOT-THERE') == 'NOT-THERE'
+    assert get_redis.return_value.hgetall.call_count == 1
+
+
+@patch('inspirehep.modules.records.experiments.get_redis')
+def test_experiments_index_reloads_new_versions(get_redis):
+    get_redis.return_value.get.side_effect = [b'1', b'1', b'2']
+    get_redis.return_value.hgetall.side_effect = [
+        {},
+        {b'cms': b'CERN-LHC-CMS'},
+    ]
+    index = ExperimentsIndex()
+
+    assert index.normalize('CMS') == 'CMS'
+
+    index.checked_at = 0
+    assert index.normalize('CMS') == 'CMS'
+
+    index.checked_at = 0
+    assert index.normalize('CMS') == 'CERN-LHC-CMS'
+
+
+@patch('inspirehep.modules.records.experiments.experiments_index')
+@patch('inspirehep.modules.records.experiments.get_redis')
+def test_update_experiments_index(get_redis, experiments_index):
+    pipe = get_redis.return_value.pipeline.return_value.__enter__.return_value
+    record = {
+        'legacy_name': 'CERN-LHC-CMS',
+        'name_variants': ['CMS'],
+    }
+
+    update_experiments_index(record)
+
+    assert pipe.mock_calls == [
+        call.hset(EXPERIMENTS_INDEX_KEY, 'cern-lhc-cms', 'CERN-LHC-CMS'),
+        call.hsetnx(EXPERIMENTS_INDEX_KEY, 'cms', 'CERN-LHC-CMS'),
+        call.incr(EXPERIMENTS_INDEX_VERSION_KEY),
+        call.execute(),
+    ]
+    experiments_index.add.assert_called_once_with('CERN-LHC-CMS', ['cms'])
+
+
+@patch('inspirehep.modules.records.experiments.get_redis')
+@patch('inspirehep.modules.records.experiments.db')
+def test_build_experiments_index_prefers_legacy_names(db, get_redis):
+    query = db.session.query.return_value.join.return_value.filter.return_value
+    query.yield_per.return_value = [
+        ({'legacy_name': 'CERN-LHC-CMS', 'name_variants': ['LHC']},),
+        ({'legacy_name': 'LHC'},),
+        ({'name_variants': ['Unnamed']},),
+    ]
+    pipe = get_redis.return_value.pipeline.return_value.__enter__.return_value
+
+    assert build_experiments_index() == 2
+
+    pipe.hmset.assert_called_once_with(EXPERIMENTS_INDEX_KEY, {
+        'cern-lhc-cms': 'CERN-LHC-CMS',
+        'lhc': 'LHC',
+    })
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of INSPIRE.
+# Copyright (C) 2014-2017 CERN.
+#
+# INSPIRE is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# INSPIRE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with INSPIRE. If not, see <http://www.gnu.org/licenses/>.
+#
+# In applying this license, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as an Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+from __future__ import absolute_import, division, print_function
+
+import pytest
+from mock import MagicMock, patch
+
+from inspirehep.modules.records.indexer import (
+    claim_operations,
+    get_bulk_actions,
+    process_queue,
+    queue_records,
+    recover_queue,
+    schedule_queue,
+)
+
+
+def _operations(*uuids):
+    return dict(
+        (uuid, {'op_type': 'index', 'index': 'records-hep', 'doc_type': 'hep'})
+        for uuid in uuids
+    )
+
+
+def test_get_bulk_actions_deletes_records():
+    operations = {
+        '2fba2a2e-4c61-4f3b-9b8a-1a7a4f1a8d2d': {
+            'op_type': 'delete',
+            'index': 'records-hep',
+            'doc_type': 'hep',
+        },
+    }
+
+    expected = [
+        {
+            '_op_type': 'delete',
+            '_index': 'records-hep',
+            '_type': 'hep',
+            '_id': '2fba2a2e-4c61-4f3b-9b8a-1a7a4f1a8d2d',
+        },
+    ]
+    result = list(get_bulk_actions(operations, []))
+
+    assert expected == result
+
+
+@patch('inspirehep.modules.records.indexer.get_redis')
+def test_queue_records_without_operations(get_redis):
+    assert not queue_records({})
+    assert not get_redis.called
+
+
+@patch('inspirehep.modules.records.indexer.get_redis')
+def test_queue_records_schedules_processing_once(get_redis):
+    operations = {
+        '2fba2a2e-4c61-4f3b-9b8a-1a7a4f1a8d2d': {
+            'op_type': 'index',
+            'index': 'records-hep',
+            'doc_type': 'hep',
+        },
+    }
+
+    get_redis.return_value.set.side_effect = [True, None]
+
+    assert queue_records(operations)
+    assert not queue_records(operations)
+
+
+@patch('inspirehep.modules.records.indexer.get_redis')
+def test_schedule_queue_with_an_empty_queue(get_redis):
+    get_redis.return_value.exists.return_value = False
+
+    assert not schedule_queue()
+    assert not get_redis.return_value.set.called
+
+
+@patch('inspirehep.modules.records.indexer.get_redis')
+def test_schedule_queue_with_requeued_operations(get_redis):
+    get_redis.return_value.exists.return_value = True
+    get_redis.return_value.set.side_effect = [True, None]
+
+    assert schedule_queue()
+    assert not schedule_queue()
+
+
+@patch('inspirehep.modules.records.indexer.get_redis')
+def test_claim_operations_in_chunks_skips_changed_operations(get_redis):
+    r = get_redis.return_value
+    r.hscan_iter.return_value = [
+        ('a', '{"op_type": "index"}'),
+        ('b', '{"op_type": "index"}'),
+        ('c', '{"op_type": "delete"}'),
+    ]
+    r.register_script.return_value.side_effect = [['a'], ['c']]
+    r.hmget.side_effect = [['1.0'], [None]]
+
+    with patch('inspirehep.modules.records.indexer.time.time', return_value=5.0):
+        result = list(claim_operations(2))
+
+    expected = [
+        ({'a': {'op_type': 'index'}}, {'a': 1.0}),
+        ({'c': {'op_type': 'delete'}}, {'c': 5.0}),
+    ]
+
+    assert expected == result
+
+
+@patch('inspirehep.modules.records.indexer.requeue')
+@patch('inspirehep.modules.records.indexer.get_redis')
+def test_recover_queue_puts_back_the_claimed_operations(get_redis, requeue):
+    get_redis.return_value.hkeys.return_value = ['a', 'b']
+
+    assert recover_queue() == 2
+    requeue.assert_called_once_with(['a', 'b'])
+
+
+@patch('inspirehep.modules.records.indexer.get_redis', MagicMock())
+@patch('inspirehep.modules.records.indexer.bump_generations')
+@patch('inspirehep.modules.records.indexer.indexing_records', MagicMock())
+@patch('inspirehep.modules.records.indexer.get_bulk_actions')
+@patch('inspirehep.modules.records.indexer.get_records_to_index', MagicMock(return_value=[]))
+@patch('inspirehep.modules.records.indexer.recover_queue')
+@patch('inspirehep.modules.records.indexer.ack_operations')
+@patch('inspirehep.modules.records.indexer.requeue')
+@patch('inspirehep.modules.records.indexer.bulk')
+@patch('inspirehep.modules.records.indexer.claim_operations')
+def test_process_queue_acks_chunks_and_requeues_retryable_failures(
+        claim_operations, bulk, requeue, ack_operations, recover_queue,
+        get_bulk_actions, bump_generations):
+    recover_queue.return_value = 0
+    claim_operations.return_value = [
+        (_operations('a', 'b'), {'a': 1.0, 'b': 2.0}),
+        (_operations('c'), {'c': 3.0}),
+    ]
+    bulk.side_effect = [
+        (1, [{'index': {'_id': 'b', 'status': 429, 'error': 'rejected'}}]),
+        (0, [{'index': {'_id': 'c', 'status': 400, 'error': 'mapping'}}]),
+    ]
+
+    assert process_queue() == 1
+
+    recover_queue.assert_called_once_with()
+    assert [call[0][0] for call in get_bulk_actions.call_args_list] == [
+        _operations('a', 'b'),
+        _operations('c'),
+    ]
+    assert [call[0][0] for call in ack_operations.call_args_list] == [
+        {'a'},
+        {'c'},
+    ]
+    requeue.assert_called_once_with(['b'])
+
+
+@patch('inspirehep.modules.records.indexer.get_redis', MagicMock())
+@patch('inspirehep.modules.records.indexer.bump_generations')
+@patch('inspirehep.modules.records.indexer.indexing_records', MagicMock())
+@patch('inspirehep.modules.records.indexer.get_bulk_actions')
+@patch('inspirehep.modules.records.indexer.get_records_to_index', MagicMock(return_value=[]))
+@patch('inspirehep.modules.records.indexer.recover_queue', MagicMock(return_value=0))
+@patch('inspirehep.modules.records.indexer.ack_operations')
+@patch('inspirehep.modules.records.indexer.requeue')
+@patch('inspirehep.modules.records.indexer.bulk')
+@patch('inspirehep.modules.records.indexer.claim_operations')
+def test_process_queue_requeues_the_claimed_operations_on_error(
+        claim_operations, bulk, requeue, ack_operations, get_bulk_actions,
+        bump_generations):
+    claim_operations.return_value = [
+        (_operations('a', 'b'), {'a': 1.0, 'b': 2.0}),
+        (_operations('c'), {'c': 3.0}),
+    ]
+    bulk.side_effect = [(2, []), ValueError]
+
+    with pytest.raises(ValueError):
+        process_queue()
+
+    ack_operations.assert_called_once_with({'a', 'b'})
+    requeue.assert_called_once_with(['c'])
@@ -28,7 +28,13 @@ from mock import patch
 from jsonref import JsonRef
 
 from inspirehep.modules.records.json_ref_loader import (
-    AbstractRecordLoader, DatabaseJsonLoader, ESJsonLoader, replace_refs)
+    AbstractRecordLoader,
+    BatchESJsonLoader,
+    DatabaseJsonLoader,
+    ESJsonLoader,
+    iter_refs,
+    replace_refs,
+)
 from inspirehep.utils.record_getter import RecordGetterError
 
 
@@ -39,13 +45,13 @@ def _build_url(endpoint='literature', recid='42'):
     return '{}/api/{}/{}'.format(server, endpoint, recid)
 
 
-@patch('inspirehep.modules.records.json_ref_loader.record_getter.get_es_record')
+@patch('inspirehep.modules.records.json_ref_loader.record_getter.get_es_records_by_recid')
 @patch('inspirehep.modules.records.json_ref_loader.record_getter.get_db_record')
-def test_replace_refs_correct_sources(get_db_rec, get_es_rec):
+def test_replace_refs_correct_sources(get_db_rec, get_es_recs):
     with_es_record = {'ES': 'ES'}
     with_db_record = {'DB': 'DB'}
 
-    get_es_rec.return_value = with_es_record
+    get_es_recs.return_value = {'42': with_es_record}
     get_db_rec.return_value = with_db_record
 
     db_rec = replace_refs({'$ref': _build_url()}, 'db')
@@ -182,3 +188,54 @@ def test_specific_loaders_return_none(get_db_rec, get_es_rec, g_p_t_f_e):
         assert expect_none == None  # noqa: E711
         assert get_db_rec.call_count == 1
         assert get_es_rec.call_count == 1
+
+
+def test_iter_refs():
+    obj = {
+        'publication_info': [
+            {
+                'conference_record': {'$ref': '/api/conferences/1'},
+                'parent_record': {'$ref': '/api/literature/2'},
+            },
+            {
+                'journal_record': {'$ref': '/api/journals/3'},
+            },
+        ],
+        'title': 'A title',
+    }
+
+    expected = [
+        '/api/conferences/1',
+        '/api/literature/2',
+        '/api/journals/3',
+    ]
+    result = list(iter_refs(obj))
+
+    assert sorted(expected) == sorted(result)
+
+
+@patch('inspirehep.modules.records.json_ref_loader.get_pid_type_from_endpoint')
+@patch('inspirehep.modules.records.json_ref_loader.record_getter.get_es_records_by_recid')
+def test_batch_es_loader_fetches_once_per_pid_type(get_es_recs, g_p_t_f_e):
+    g_p_t_f_e.side_effect = lambda endpoint: endpoint[:3]
+    get_es_recs.side_effect = lambda pid_type, recids: {
+        recid: {'control_number': int(recid)}
+        for recid in recids if recid != '4'
+    }
+
+    obj = [
+        {'$ref': '/api/conferences/1'},
+        {'$ref': '/api/conferences/2'},
+        {'$ref': '/api/literature/3'},
+        {'$ref': '/api/literature/4'},
+        {'$ref': 'http://otherhost.net/api/literature/5'},
+    ]
+
+    loader = BatchESJsonLoader()
+    loader.prefetch(obj)
+
+    assert get_es_recs.call_count == 2
+    assert loader.get_record('con', '1') == {'control_number': 1}
+    assert loader.get_record('lit', '3') == {'control_number': 3}
+    assert loader.get_record('lit', '4') is None
+    assert get_es_recs.call_count == 2
@@ -22,7 +22,11 @@
 
 from __future__ import absolute_import, division, print_function
 
+import pytest
+from mock import patch
+
 from inspire_schemas.api import load_schema, validate
+from inspirehep.modules.records.experiments import experiments_index
 from inspirehep.modules.records.receivers import (
     earliest_date,
     match_valid_experiments,
@@ -34,6 +38,20 @@ from inspirehep.modules.records.receivers import (
 )
 
 
+@pytest.fixture
+def known_experiments():
+    names = {
+        'cern-lhc-atlas': 'CERN-LHC-ATLAS',
+        'cern-lhc-cms': 'CERN-LHC-CMS',
+        'cms': 'CERN-LHC-CMS',
+        'jeffersonlab': 'Jefferson Lab',
+    }
+
+    with patch.object(experiments_index, 'refresh'), \
+            patch.object(experiments_index, 'names', names):
+        yield
+
+
 def test_earliest_date_from_preprint_date():
     schema = load_schema('hep')
     subschema = schema['properties']['preprint_date']
@@ -132,7 +150,7 @@ def test_earliest_date_from_imprints_date():
     assert expected == result
 
 
-def test_match_valid_experiments_adds_facet_experiment():
+def test_match_valid_experiments_adds_facet_experiment(known_experiments):
     json_dict = {
         'accelerator_experiments': [
             {'experiment': 'CERN-LHC-ATLAS'},
@@ -149,7 +167,7 @@ def test_match_valid_experiments_adds_facet_experiment():
     ]
 
 
-def test_match_valid_experiments_ignores_case():
+def test_match_valid_experiments_ignores_case(known_experiments):
     json_dict = {
         'accelerator_experiments': [
             {'experiment': 'cern-lhc-cms'},
@@ -166,7 +184,7 @@ def test_match_valid_experiments_ignores_case():
     ]
 
 
-def test_match_valid_experiments_ignores_spaces():
+def test_match_valid_experiments_ignores_spaces(known_experiments):
     json_dict = {
         'accelerator_experiments': [
             {'experiment': 'JeffersonLab'},
@@ -183,7 +201,7 @@ def test_match_valid_experiments_ignores_spaces():
     ]
 
 
-def test_match_valid_experiments_accepts_unknown_experiments():
+def test_match_valid_experiments_accepts_unknown_experiments(known_experiments):
     json_dict = {
         'accelerator_experiments': [
             {'experiment': 'NOT-THERE'},
@@ -200,7 +218,7 @@ def test_match_valid_experiments_accepts_unknown_experiments():
     ]
 
 
-def test_match_valid_experiments_accepts_lists_of_experiments():
+def test_match_valid_experiments_accepts_lists_of_experiments(known_experiments):
     json_dict = {
         'accelerator_experiments': [
             {
@@ -230,7 +248,7 @@ def test_match_valid_experiments_accepts_lists_of_experiments():
     ]
 
 
-def test_match_valid_experiments_accepts_lists_of_accelerator_experiments():
+def test_match_valid_experiments_accepts_lists_of_accelerator_experiments(known_experiments):
     json_dict = {
         'accelerator_experiments': [
             {'experiment': 'CERN-LHC-ATLAS'},
@@ -252,7 +270,20 @@ def test_match_valid_experiments_accepts_lists_of_accelerator_experiments():
     ]
 
 
-def test_match_valid_experiments_does_nothing_on_missing_key():
+def test_match_valid_experiments_adds_facet_experiment_from_legacy_name(known_experiments):
+    json_dict = {
+        'accelerator_experiments': [
+            {'legacy_name': 'CMS'},
+            {'legacy_name': 'NOT-THERE'},
+        ],
+    }
+
+    match_valid_experiments(None, json_dict)
+
+    assert json_dict['facet_experiment'] == ['CERN-LHC-CMS', 'NOT-THERE']
+
+
+def test_match_valid_experiments_does_nothing_on_missing_key(known_experiments):
     json_dict = {}
 
     match_valid_experiments(None, json_dict)
@@ -260,7 +291,7 @@ def test_match_valid_experiments_does_nothing_on_missing_key():
     assert 'accelerator_experiments' not in json_dict
 
 
-def test_match_valid_experiments_does_nothing_on_empty_list():
+def test_match_valid_experiments_does_nothing_on_empty_list(known_experiments):
     json_dict = {'accelerator_experiments': []}
 
     match_valid_experiments(None, json_dict)
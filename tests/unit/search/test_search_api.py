@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of INSPIRE.
+# Copyright (C) 2014-2017 CERN.
+#
+# INSPIRE is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# INSPIRE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with INSPIRE. If not, see <http://www.gnu.org/licenses/>.
+#
+# In applying this license, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as an Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+from __future__ import absolute_import, division, print_function
+
+from elasticsearch_dsl.query import Q
+from flask import Flask, g
+
+from inspirehep.modules.search.api import compile_collection_filter
+from inspirehep.modules.search.ext import add_server_timing
+
+
+def test_compile_collection_filter_without_excluded_collections():
+    expected = {'match': {'_collections': 'Literature'}}
+    result = compile_collection_filter('Literature', ())
+
+    assert expected == result
+
+
+def test_compile_collection_filter_with_excluded_collections():
+    expected = {
+        'bool': {
+            'must': [
+                {'match': {'_collections': 'Literature'}},
+            ],
+            'must_not': [
+                {'match': {'_collections': 'CDS Hidden'}},
+                {'match': {'_collections': 'HAL Hidden'}},
+            ],
+        },
+    }
+    result = compile_collection_filter(
+        'Literature', ('CDS Hidden', 'HAL Hidden'))
+
+    assert expected == result
+
+
+def test_compile_collection_filter_is_cached():
+    compile_collection_filter.cache_clear()
+
+    compile_collection_filter('Literature', ('HAL Hidden',))
+    compile_collection_filter('Literature', ('HAL Hidden',))
+
+    assert compile_collection_filter.cache_info().hits == 1
+
+
+def test_compile_collection_filter_is_not_modified_by_queries():
+    compile_collection_filter.cache_clear()
+
+    expected = {'match': {'_collections': 'Literature'}}
+    query = Q(compile_collection_filter('Literature', ()))
+    query &= Q('match', title='higgs')
+    query.to_dict()['bool']['must'].append({'match': {'title': 'boson'}})
+    result = compile_collection_filter('Literature', ())
+
+    assert expected == result
+
+
+def test_add_server_timing():
+    app = Flask(__name__)
+
+    with app.test_request_context():
+        g.inspire_filter_time = 0.0015
+        response = add_server_timing(app.response_class())
+
+    assert response.headers['Server-Timing'] == 'inspire-filter;dur=1.500'
+
+
+def test_add_server_timing_without_inspire_filter():
+    app = Flask(__name__)
+
+    with app.test_request_context():
+        response = add_server_timing(app.response_class())
+
+    assert 'Server-Timing' not in response.headers
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of INSPIRE.
+# Copyright (C) 2014-2017 CERN.
+#
+# INSPIRE is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# INSPIRE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with INSPIRE. If not, see <http://www.gnu.org/licenses/>.
+#
+# In applying this license, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as an Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+from __future__ import absolute_import, division, print_function
+
+from inspirehep.modules.search.benchmark import (
+    count_objects,
+    find_missing,
+    find_regressions,
+    percentile,
+)
+
+
+def test_percentile():
+    timings = [float(i) for i in range(1, 101)]
+
+    assert percentile(timings, 50) == 50.0
+    assert percentile(timings, 99) == 99.0
+    assert percentile(timings, 100) == 100.0
+    assert percentile([1.0], 99) == 1.0
+
+
+def test_count_objects():
+    class Node(object):
+        pass
+
+    def allocate(n):
+        return [Node() for _ in range(n)]
+
+    assert count_objects(allocate, (10,)) >= 10
+
+
+def test_find_missing():
+    baseline = {
+        'calibration': 1.0,
+        'queries': {
+            'find a ellis': {'objects': 10, 'p50': 1.0, 'p99': 2.0},
+        },
+    }
+    results = {
+        'calibration': 1.0,
+        'queries': {
+            'find a ellis': {'objects': 10, 'p50': 1.0, 'p99': 2.0},
+            'refersto:recid:1': {'objects': 10, 'p50': 1.0, 'p99': 2.0},
+            'find cn cms': {'objects': 10, 'p50': 1.0, 'p99': 2.0},
+        },
+    }
+
+    expected = ['find cn cms', 'refersto:recid:1']
+    result = find_missing(results, baseline)
+
+    assert expected == result
+
+
+def test_find_regressions():
+    baseline = {
+        'calibration': 1.0,
+        'queries': {
+            'find a ellis': {'objects': 10, 'p50': 1.0, 'p99': 2.0},
+            'find t higgs': {'objects': 10, 'p50': 1.0, 'p99': 2.0},
+        },
+    }
+    results = {
+        'calibration': 1.0,
+        'queries': {
+            'find a ellis': {'objects': 10, 'p50': 1.2, 'p99': 9.0},
+            'find t higgs': {'objects': 10, 'p50': 2.0, 'p99': 2.0},
+            'find cn cms': {'objects': 10, 'p50': 9.0, 'p99': 9.0},
+        },
+    }
+
+    expected = [('find t higgs', 'p50', 1.0, 2.0)]
+    result = find_regressions(results, baseline, 1.5)
+
+    assert expected == result
+
+
+def test_find_regressions_scales_latencies_by_calibration():
+    baseline = {
+        'calibration': 1.0,
+        'queries': {
+            'find a ellis': {'objects': 10, 'p50': 1.0, 'p99': 2.0},
+        },
+    }
+    results = {
+        'calibration': 2.0,
+        'queries': {
+            'find a ellis': {'objects': 10, 'p50': 2.5, 'p99': 5.0},
+        },
+    }
+
+    assert find_regressions(results, baseline, 1.5) == []
+
+
+def test_find_regressions_ignores_small_latency_increases():
+    baseline = {
+        'calibration': 1.0,
+        'queries': {
+            'find a ellis': {'objects': 10, 'p50': 0.0002, 'p99': 0.0003},
+        },
+    }
+    results = {
+        'calibration': 1.0,
+        'queries': {
+            'find a ellis': {'objects': 10, 'p50': 0.0008, 'p99': 0.0009},
+        },
+    }
+
+    assert find_regressions(results, baseline, 1.5, 0.001) == []
+
+
+def test_find_regressions_compares_objects():
+    baseline = {
+        'calibration': 1.0,
+        'queries': {
+            'find a ellis': {'objects': 10, 'p50': 1.0, 'p99': 2.0},
+        },
+    }
+    results = {
+        'calibration': 2.0,
+        'queries': {
+            'find a ellis': {'objects': 20, 'p50': 2.0, 'p99': 4.0},
+        },
+    }
+
+    expected = [('find a ellis', 'objects', 10, 20)]
+    result = find_regressions(results, baseline, 1.5)
+
+    assert expected == result
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of INSPIRE.
+# Copyright (C) 2014-2017 CERN.
+#
+# INSPIRE is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# INSPIRE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with INSPIRE. If not, see <http://www.gnu.org/licenses/>.
+#
+# In applying this license, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as an Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+from __future__ import absolute_import, division, print_function
+
+from elasticsearch_dsl import Search
+from flask import current_app
+from mock import call, patch
+
+from inspirehep.modules.search.cache import (
+    bump_generations,
+    get_response_cache_key,
+)
+
+
+@patch('inspirehep.modules.search.cache.current_cache')
+def test_response_cache_key_ignores_preference(current_cache):
+    current_cache.get_many.return_value = [None]
+    search = Search(index='records-hep').query('match', title='higgs')
+
+    first = get_response_cache_key(search.params(preference='a'))
+    second = get_response_cache_key(search.params(preference='b'))
+
+    assert first == second
+
+
+@patch('inspirehep.modules.search.cache.current_cache')
+def test_response_cache_key_depends_on_the_page(current_cache):
+    current_cache.get_many.return_value = [None]
+    search = Search(index='records-hep').query('match', title='higgs')
+
+    assert get_response_cache_key(search[0:10]) != \
+        get_response_cache_key(search[10:20])
+
+
+@patch('inspirehep.modules.search.cache.current_cache')
+def test_response_cache_key_depends_on_the_index_generation(current_cache):
+    search = Search(index='records-hep').query('match', title='higgs')
+
+    current_cache.get_many.return_value = [None]
+    first = get_response_cache_key(search)
+    current_cache.get_many.return_value = [1]
+    second = get_response_cache_key(search)
+
+    assert first != second
+    current_cache.get_many.assert_called_with('search_generation:records-hep')
+
+
+@patch('inspirehep.modules.search.tasks.increment_generations_later')
+@patch('inspirehep.modules.search.cache.current_cache')
+def test_bump_generations_bumps_again_once_the_indices_are_refreshed(current_cache, increment_generations_later):
+    config = {
+        'SEARCH_RESPONSE_CACHE_TIMEOUT': 60,
+        'SEARCH_FACETS_CACHE_TIMEOUT': None,
+        'SEARCH_RESPONSE_CACHE_INVALIDATION_DELAY': 5,
+    }
+
+    with patch.dict(current_app.config, config):
+        bump_generations(['records-hep', 'records-authors', 'records-hep'])
+
+    assert current_cache.cache.inc.call_args_list == [
+        call('search_generation:records-authors'),
+        call('search_generation:records-hep'),
+    ]
+    increment_generations_later.apply_async.assert_called_once_with(
+        args=(['records-authors', 'records-hep'],), countdown=5)
+
+
+@patch('inspirehep.modules.search.tasks.increment_generations_later')
+@patch('inspirehep.modules.search.cache.current_cache')
+def test_bump_generations_when_only_the_facets_are_cached(current_cache, increment_generations_later):
+    config = {
+        'SEARCH_RESPONSE_CACHE_TIMEOUT': None,
+        'SEARCH_FACETS_CACHE_TIMEOUT': 600,
+    }
+
+    with patch.dict(current_app.config, config):
+        bump_generations(['records-hep'])
+
+    current_cache.cache.inc.assert_called_once_with('search_generation:records-hep')
+    assert increment_generations_later.apply_async.called
+
+
+@patch('inspirehep.modules.search.tasks.increment_generations_later')
+@patch('inspirehep.modules.search.cache.current_cache')
+def test_bump_generations_when_nothing_is_cached(current_cache, increment_generations_later):
+    config = {
+        'SEARCH_RESPONSE_CACHE_TIMEOUT': None,
+        'SEARCH_FACETS_CACHE_TIMEOUT': None,
+    }
+
+    with patch.dict(current_app.config, config):
+        bump_generations(['records-hep'])
+
+    assert not current_cache.cache.inc.called
+    assert not increment_generations_later.apply_async.called
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of INSPIRE.
+# Copyright (C) 2014-2017 CERN.
+#
+# INSPIRE is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# INSPIRE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with INSPIRE. If not, see <http://www.gnu.org/licenses/>.
+#
+# In applying this license, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as an Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+from __future__ import absolute_import, division, print_function
+
+from elasticsearch_dsl import Search
+from flask import current_app
+from mock import MagicMock, patch
+
+from inspirehep.modules.search.facets import (
+    compute_facets,
+    sample_aggregations,
+    without_aggregations,
+)
+
+
+def test_without_aggregations():
+    search = Search().query('match', title='higgs')
+    search.aggs.bucket('author', 'terms', field='facet_author_name')
+
+    expected = {'query': {'match': {'title': 'higgs'}}}
+    result = without_aggregations(search).to_dict()
+
+    assert expected == result
+    assert 'aggs' in search.to_dict()
+
+
+def test_sample_aggregations():
+    search = Search().query('match', title='higgs')
+    search.aggs.bucket('author', 'terms', field='facet_author_name')
+
+    expected = {
+        'sample': {
+            'sampler': {'shard_size': 100},
+            'aggs': {
+                'author': {'terms': {'field': 'facet_author_name'}},
+            },
+        },
+    }
+    result = sample_aggregations(search, 100).to_dict()['aggs']
+
+    assert expected == result
+
+
+@patch('inspirehep.modules.search.facets.current_cache')
+def test_compute_facets_without_cache(current_cache):
+    search = MagicMock()
+    search.__getitem__.return_value = search
+    search.execute.return_value.to_dict.return_value = {
+        'aggregations': {'author': {'buckets': []}},
+    }
+    config = {
+        'SEARCH_FACETS_CACHE_TIMEOUT': None,
+        'SEARCH_FACETS_SAMPLE_SIZE': None,
+    }
+
+    with patch.dict(current_app.config, config):
+        assert compute_facets(search) == {'author': {'buckets': []}}
+
+    assert not current_cache.get.called
+    assert not current_cache.set.called
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of INSPIRE.
+# Copyright (C) 2014-2017 CERN.
+#
+# INSPIRE is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# INSPIRE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with INSPIRE. If not, see <http://www.gnu.org/licenses/>.
+#
+# In applying this license, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as an Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+from __future__ import absolute_import, division, print_function
+
+import os
+
+import pytest
+
+from inspirehep.modules.search.benchmark import load_queries
+from inspirehep.modules.search.fast_parser import parse_spires_query
+from inspirehep.modules.search.query_factory import parse_pypeg_query
+
+
+SPIRES_QUERIES = load_queries(os.path.join(
+    os.path.dirname(__file__), 'fixtures', 'spires_queries.txt'))
+
+
+@pytest.mark.parametrize('query', SPIRES_QUERIES)
+def test_fast_parser_builds_the_same_ast_as_pypeg2(query):
+    result = parse_spires_query(query)
+
+    if result is not None:
+        assert repr(result) == repr(parse_pypeg_query(query))
+
+
+@pytest.mark.parametrize('query', [
+    'find a ellis',
+    'FIND A W F CHANG',
+    'f a ostapchenko not olinto not haungs',
+    'find ea witten, edward',
+    'find a hatta and date after 2000',
+    'find a ellis and (t higgs or t boson) and date > 2000',
+    'find topcite 50+ and a ellis',
+    'find t "higgs boson"',
+    'author:ellis',
+    'title: higgs',
+    'control_number:4328',
+    'author:"E.Witten.1"',
+])
+def test_fast_parser_handles_common_queries(query):
+    result = parse_spires_query(query)
+
+    assert result is not None
+    assert repr(result) == repr(parse_pypeg_query(query))
+
+
+@pytest.mark.parametrize('query', [
+    'author:ellis and title:higgs',
+    'title:ellis*',
+    'title:/ellis/',
+    'find a ellis*',
+    'find a chkv#',
+    'find date 2000->2010',
+    'find refersto a ellis',
+    'find a ellis and',
+    'ellis',
+])
+def test_fast_parser_leaves_other_queries_to_pypeg2(query):
+    assert parse_spires_query(query) is None
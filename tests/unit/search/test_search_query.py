@@ -23,6 +23,7 @@
 from __future__ import absolute_import, division, print_function
 
 import pytest
+from mock import patch
 
 from inspirehep.modules.search import IQ, LiteratureSearch
 
@@ -1266,3 +1267,29 @@ def test_find_type_code():
     result = query.to_dict()
 
     assert expected == result
+
+
+@patch('inspirehep.modules.search.walkers.elasticsearch.normalize_experiment_name')
+def test_find_exp_matches_the_normalized_experiment(normalize_experiment_name):
+    normalize_experiment_name.return_value = 'CERN-LHC-CMS'
+    query = IQ('find exp cms', LiteratureSearch())
+
+    expected = {
+        'bool': {
+            'should': [
+                {
+                    'multi_match': {
+                        'query': 'cms',
+                        'fields': ['accelerator_experiments.experiment'],
+                    },
+                },
+                {
+                    'term': {'facet_experiment': 'CERN-LHC-CMS'},
+                },
+            ],
+        },
+    }
+    result = query.to_dict()
+
+    assert expected == result
+    normalize_experiment_name.assert_called_once_with('cms')
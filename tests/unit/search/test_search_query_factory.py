@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of INSPIRE.
+# Copyright (C) 2014-2017 CERN.
+#
+# INSPIRE is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# INSPIRE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with INSPIRE. If not, see <http://www.gnu.org/licenses/>.
+#
+# In applying this license, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as an Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+from __future__ import absolute_import, division, print_function
+
+import json
+
+from flask import current_app
+from mock import patch
+
+from inspirehep.modules.search import IQ, LiteratureSearch
+from inspirehep.modules.search.query_factory import (
+    clear_query_cache,
+    get_query_cache_stats,
+    normalize_query,
+)
+
+
+def test_compiled_queries_are_cached():
+    clear_query_cache()
+
+    first = IQ('find a ellis', LiteratureSearch())
+    second = IQ('find a ellis', LiteratureSearch())
+
+    assert first.to_dict() == second.to_dict()
+
+    stats = get_query_cache_stats()
+
+    assert stats['misses'] == 1
+    assert stats['hits'] == 1
+
+
+def test_compiled_queries_are_not_shared_between_objects():
+    clear_query_cache()
+
+    first = IQ('find a ellis', LiteratureSearch())
+    second = IQ('find a ellis', LiteratureSearch())
+
+    assert first is not second
+
+
+def test_query_cache_is_invalidated_when_keyword_mapping_changes():
+    clear_query_cache()
+
+    query = IQ('control_number:1', LiteratureSearch())
+
+    assert 'foo' not in json.dumps(query.to_dict())
+
+    keyword_mapping = dict(
+        current_app.config['SEARCH_ELASTIC_KEYWORD_MAPPING'],
+        control_number=['foo'],
+    )
+    config = {'SEARCH_ELASTIC_KEYWORD_MAPPING': keyword_mapping}
+
+    with patch.dict(current_app.config, config):
+        query = IQ('control_number:1', LiteratureSearch())
+
+    assert 'foo' in json.dumps(query.to_dict())
+    assert get_query_cache_stats()['misses'] == 2
+
+
+def test_query_cache_is_invalidated_when_experiments_index_changes():
+    clear_query_cache()
+
+    with patch('inspirehep.modules.search.query_factory.get_experiments_index_version', return_value='1'):
+        IQ('find a ellis', LiteratureSearch())
+    with patch('inspirehep.modules.search.query_factory.get_experiments_index_version', return_value='2'):
+        IQ('find a ellis', LiteratureSearch())
+
+    assert get_query_cache_stats()['misses'] == 2
+
+
+def test_normalize_query():
+    query = '  find a ellis   AND  t "Higgs  AND boson"  Or (NOT a smith) '
+
+    expected = 'find a ellis and t "Higgs  AND boson" or (not a smith)'
+    result = normalize_query(query)
+
+    assert expected == result
+
+
+def test_normalize_query_keeps_the_case_of_invenio_operators():
+    query = 'title:higgs  AND  author:ellis and'
+
+    expected = 'title:higgs AND author:ellis and'
+    result = normalize_query(query)
+
+    assert expected == result
+
+
+def test_normalize_query_keeps_operators_inside_values():
+    assert normalize_query('find t ANDROID and t Nothing') == 'find t ANDROID and t Nothing'
+
+
+def test_query_variants_share_the_cached_query():
+    clear_query_cache()
+
+    first = IQ('find a ellis AND t higgs', LiteratureSearch())
+    second = IQ('find  a ellis and   t higgs', LiteratureSearch())
+
+    assert first.to_dict() == second.to_dict()
+    assert get_query_cache_stats()['hits'] == 1
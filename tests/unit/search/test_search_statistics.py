@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of INSPIRE.
+# Copyright (C) 2014-2017 CERN.
+#
+# INSPIRE is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# INSPIRE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with INSPIRE. If not, see <http://www.gnu.org/licenses/>.
+#
+# In applying this license, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as an Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+from __future__ import absolute_import, division, print_function
+
+from elasticsearch_dsl.query import Q
+from mock import patch
+
+from inspirehep.modules.search import LiteratureSearch
+from inspirehep.modules.search.statistics import (
+    count_records,
+    get_collection_count,
+    update_collection_counts,
+)
+
+
+@patch('inspirehep.modules.search.statistics.count_records')
+@patch('inspirehep.modules.search.statistics.current_cache')
+def test_get_collection_count_uses_the_cache(current_cache, count_records):
+    current_cache.get.return_value = 42
+
+    assert get_collection_count(LiteratureSearch) == 42
+    current_cache.get.assert_called_once_with('collection_count:records-hep')
+    count_records.assert_not_called()
+
+
+@patch('inspirehep.modules.search.statistics.count_records')
+@patch('inspirehep.modules.search.statistics.current_cache')
+def test_get_collection_count_counts_on_cache_miss(current_cache, count_records):
+    current_cache.get.return_value = None
+    count_records.return_value = 42
+
+    assert get_collection_count(LiteratureSearch) == 42
+    current_cache.set.assert_called_once_with(
+        'collection_count:records-hep', 42, timeout=60 * 30)
+
+
+@patch('inspirehep.modules.search.statistics.current_cache')
+def test_update_collection_counts_increments_the_cached_counts(current_cache):
+    current_cache.cache.key_prefix = 'cache::'
+    increment_if_cached = current_cache.cache._client.register_script.return_value
+
+    update_collection_counts({'records-hep': 2, 'records-authors': 0})
+
+    increment_if_cached.assert_called_once_with(
+        keys=['cache::collection_count:records-hep'], args=[2])
+
+
+@patch('inspirehep.modules.search.statistics.LiteratureSearch.count', autospec=True)
+@patch('inspirehep.modules.search.statistics.get_anonymous_filter')
+def test_count_records_filters_as_an_anonymous_user(get_anonymous_filter, count):
+    get_anonymous_filter.return_value = Q('match', _collections='Literature')
+    count.return_value = 42
+
+    assert count_records(LiteratureSearch) == 42
+
+    search = count.call_args[0][0]
+    expected = {'bool': {'filter': [{'match': {'_collections': 'Literature'}}]}}
+
+    assert expected == search.to_dict()['query']
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of INSPIRE.
+# Copyright (C) 2014-2017 CERN.
+#
+# INSPIRE is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# INSPIRE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with INSPIRE. If not, see <http://www.gnu.org/licenses/>.
+#
+# In applying this license, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as an Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+from __future__ import absolute_import, division, print_function
+
+import os
+
+from mock import Mock, patch
+
+from inspirehep.modules.search.utils import (
+    read_keywords_registry,
+    write_keywords_registry,
+)
+
+
+def test_keywords_registry_roundtrip(tmpdir):
+    path = str(tmpdir.join('search-keywords.json'))
+    keyword_mapping = {'author': ['authors.full_name']}
+
+    write_keywords_registry(path, ['titles.title', 'author'], keyword_mapping)
+
+    expected = ['titles.title', 'author']
+    result = read_keywords_registry(path, keyword_mapping)
+
+    assert expected == result
+
+
+def test_keywords_registry_is_ignored_if_the_mapping_changed(tmpdir):
+    path = str(tmpdir.join('search-keywords.json'))
+
+    write_keywords_registry(path, ['author'], {'author': ['authors.full_name']})
+
+    assert read_keywords_registry(path, {'author': ['authors.ids']}) is None
+
+
+def test_keywords_registry_is_ignored_if_missing(tmpdir):
+    path = str(tmpdir.join('search-keywords.json'))
+
+    assert not os.path.exists(path)
+    assert read_keywords_registry(path, {}) is None
+
+
+def test_keywords_registry_is_ignored_if_a_mapping_file_changed(tmpdir):
+    path = str(tmpdir.join('search-keywords.json'))
+    mappings = tmpdir.mkdir('mappings')
+    mappings.join('records-hep.json').write('{"mappings": {}}')
+    entry_point = Mock(module_name='inspirehep.modules.records.mappings')
+    entry_point.name = 'records'
+
+    with patch('inspirehep.modules.search.utils.iter_entry_points', return_value=[entry_point]), \
+            patch('inspirehep.modules.search.utils.resource_filename', return_value=str(mappings)):
+        write_keywords_registry(path, ['author'], {})
+        assert read_keywords_registry(path, {}) == ['author']
+
+        mappings.join('records-hep.json').write('{"mappings": {"hep": {}}}')
+        assert read_keywords_registry(path, {}) is None
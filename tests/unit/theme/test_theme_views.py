@@ -25,9 +25,16 @@ from __future__ import absolute_import, division, print_function
 import json
 
 import mock
+import pytest
 
 from mocks import MockUser
 
+from inspirehep.modules.theme.views import (
+    get_authors_names,
+    get_detailed_record_panels,
+    get_experiments_publications,
+)
+
 
 user_with_email = MockUser('user@example.com')
 user_empty_email = MockUser('')
@@ -90,3 +97,79 @@ def test_postfeedback_send_email_failure(delay, app_client):
 
     assert response.status_code == 500
     assert json.loads(response.data) == {'success': False}
+
+
+@mock.patch('inspirehep.modules.theme.views.LiteratureSearch')
+def test_get_experiments_publications(search):
+    """Counts the papers of all the experiments in a single request."""
+    execute = search.return_value.params.return_value.execute
+    execute.return_value.to_dict.return_value = {
+        'aggregations': {
+            'experiments': {
+                'buckets': {
+                    'CERN-LHC-ATLAS': {'doc_count': 3},
+                    'CERN-LHC-CMS': {'doc_count': 0},
+                },
+            },
+        },
+    }
+
+    expected = {'CERN-LHC-ATLAS': 3, 'CERN-LHC-CMS': 0}
+    result = get_experiments_publications(
+        ['CERN-LHC-ATLAS', 'CERN-LHC-CMS', 'CERN-LHC-ATLAS'])
+
+    assert expected == result
+    assert execute.call_count == 1
+
+
+@mock.patch('inspirehep.modules.theme.views.LiteratureSearch')
+def test_get_experiments_publications_without_experiments(search):
+    """Doesn't query Elasticsearch when there are no experiments."""
+    assert get_experiments_publications([]) == {}
+    assert not search.called
+
+
+@mock.patch('inspirehep.modules.theme.views.AuthorsSearch')
+def test_get_authors_names_without_authors(search):
+    """Doesn't query Elasticsearch when there are no authors."""
+    assert get_authors_names([]) == {}
+    assert not search.called
+
+
+@mock.patch.dict('inspirehep.modules.theme.views.DETAILED_RECORD_PANELS', {
+    'first': lambda record: [record['control_number']],
+    'second': lambda record: [],
+})
+def test_get_detailed_record_panels(app):
+    """Computes the requested panels, with their timings."""
+    with app.test_request_context():
+        result = get_detailed_record_panels(
+            {'control_number': 1}, ['first', 'second'])
+
+    assert set(result) == {'first', 'second'}
+    assert result['first']['data'] == [1]
+    assert result['second']['data'] == []
+    assert all(isinstance(panel['took'], int) for panel in result.values())
+
+
+@mock.patch('inspirehep.modules.theme.views.ThreadPool')
+@mock.patch.dict('inspirehep.modules.theme.views.DETAILED_RECORD_PANELS', {
+    'first': lambda record: [],
+})
+def test_get_detailed_record_panels_stops_the_threads_on_error(ThreadPool, app):
+    """Terminates and joins the threads when a panel fails."""
+    pool = ThreadPool.return_value
+    pool.apply_async.return_value.get.side_effect = ValueError(1)
+
+    with app.test_request_context():
+        with pytest.raises(ValueError):
+            get_detailed_record_panels({'control_number': 1}, ['first'])
+
+    pool.terminate.assert_called_once_with()
+    pool.join.assert_called_once_with()
+
+
+def test_get_detailed_record_panels_without_panels(app):
+    """Doesn't compute anything when no panel is requested."""
+    with app.test_request_context():
+        assert get_detailed_record_panels({'control_number': 1}, []) == {}
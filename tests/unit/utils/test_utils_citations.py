@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of INSPIRE.
+# Copyright (C) 2014-2017 CERN.
+#
+# INSPIRE is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# INSPIRE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with INSPIRE. If not, see <http://www.gnu.org/licenses/>.
+#
+# In applying this license, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as an Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+from __future__ import absolute_import, division, print_function
+
+from mock import patch
+
+from inspirehep.utils.citations import CITERS_CHUNK_SIZE, Citation
+
+
+@patch('inspirehep.utils.citations.render_template_to_string', return_value='citation')
+@patch('inspirehep.utils.citations.LiteratureSearch')
+@patch('inspirehep.utils.citations.get_citers')
+def test_citations_are_fetched_in_chunks(get_citers, search, render):
+    citers = list(range(2 * CITERS_CHUNK_SIZE + 1))
+    get_citers.return_value = citers
+    search.return_value.filter.return_value.scan.return_value = []
+
+    Citation({'control_number': 1}).citations()
+
+    chunks = [
+        call[1]['control_number'] for call in search.return_value.filter.call_args_list
+    ]
+
+    assert [len(chunk) for chunk in chunks] == [CITERS_CHUNK_SIZE, CITERS_CHUNK_SIZE, 1]
+    assert sum(chunks, []) == citers
@@ -22,12 +22,42 @@
 
 from __future__ import absolute_import, division, print_function
 
+import random
+
 from inspirehep.utils.date import (
+    MONTH_ABBREVIATIONS,
+    MONTH_NAMES,
     create_earliest_date,
     create_valid_date,
+    create_valid_date_with_strptime,
 )
 
 
+def random_date(rand):
+    def number(low, high, width):
+        value = str(rand.randint(low, high))
+        return value.zfill(width) if rand.random() < 0.5 else value
+
+    def month():
+        name = rand.choice(MONTH_ABBREVIATIONS[1:] + MONTH_NAMES[1:])
+        return name.title() if rand.random() < 0.5 else name
+
+    parts = [
+        lambda: number(0, 35, 2),
+        lambda: ' ' + number(0, 9, 1),
+        lambda: number(0, 99, 2),
+        lambda: number(0, 3000, 4),
+        lambda: number(10000, 20000, 5),
+        month,
+    ]
+    separators = ['-', '-', ' ', '  ', '/', '.', 'T']
+
+    date = rand.choice(parts)()
+    for _ in range(rand.randint(0, 3)):
+        date += rand.choice(separators) + rand.choice(parts)()
+    return date
+
+
 def test_create_valid_date():
     assert create_valid_date(1877) == '1877'
     assert create_valid_date('1877') == '1877'
@@ -40,6 +70,46 @@ def test_create_valid_date():
     assert create_valid_date('1977-06-220') == '1977-06'
 
 
+def test_create_valid_date_with_other_formats():
+    assert create_valid_date('3 Feb 1877') == '1877-02-03'
+    assert create_valid_date('3 february 77') == '1977-02-03'
+    assert create_valid_date('02/03/68') == '2068-02-03'
+    assert create_valid_date('03 02  1977') == '1977-02-03'
+    assert create_valid_date('1977-06- 2') == '1977-06-02'
+    assert create_valid_date('JUNE 1977') == '1977-06'
+    assert create_valid_date('1977 Jun') == '1977-06'
+    assert create_valid_date('77-06') == '1977-06'
+    assert create_valid_date('69') == '1969'
+
+
+def test_create_valid_date_with_invalid_dates():
+    assert create_valid_date('1977-02-30') == '1977-02'
+    assert create_valid_date('1977-13') == '1977'
+    assert create_valid_date('0000') is None
+    assert create_valid_date('Jun') is None
+    assert create_valid_date('') is None
+    assert create_valid_date(None) is None
+
+
+def test_create_valid_date_is_the_same_as_with_strptime():
+    rand = random.Random(0)
+
+    for _ in range(2000):
+        date = random_date(rand)
+
+        expected = create_valid_date_with_strptime(date)
+        result = create_valid_date(date)
+
+        assert expected == result
+
+        expected = create_valid_date_with_strptime(
+            date, date_format_month="%Y-%m-99", date_format_year="%Y-99-99")
+        result = create_valid_date(
+            date, date_format_month="%Y-%m-99", date_format_year="%Y-99-99")
+
+        assert expected == result
+
+
 def test_create_earliest_date():
     assert create_earliest_date([1877, '2002-01-05']) == '1877'
     assert create_earliest_date(['1877-02-03', '1877']) == '1877-02-03'
@@ -27,7 +27,11 @@ from __future__ import absolute_import, division, print_function
 import mock
 
 from inspirehep.modules.records.api import InspireRecord
-from inspirehep.utils.export import Export
+from inspirehep.utils.export import (
+    Export,
+    prefetch_export_data,
+    stream_exports,
+)
 
 
 def test_get_citation_key_no_external_system_numbers():
@@ -452,3 +456,66 @@ def test_get_citation_number_no_citation_count(g_e_r):
     result = Export(no_citation_count)._get_citation_number()
 
     assert expected == result
+
+
+@mock.patch('inspirehep.utils.export.get_es_record')
+def test_get_citation_number_from_prefetched_citation_counts(g_e_r):
+    no_citations = InspireRecord({'control_number': 1})
+
+    expected = ''
+    result = Export(no_citations, citation_counts={1: 0})._get_citation_number()
+
+    assert expected == result
+    assert g_e_r.call_count == 0
+
+
+@mock.patch('inspirehep.utils.export.get_es_records_by_recid')
+def test_prefetch_export_data(g_e_r_b_r):
+    g_e_r_b_r.return_value = {'1214516': {'control_number': 1214516}}
+
+    records = [
+        {
+            'citation_count': 2,
+            'control_number': 1,
+            'publication_info': [
+                {'journal_record': {'$ref': 'http://localhost:5000/api/journals/1214516'}},
+            ],
+        },
+        {
+            'control_number': 2,
+            'publication_info': [
+                {'journal_record': {'$ref': 'http://localhost:5000/api/journals/1214516'}},
+            ],
+        },
+    ]
+
+    expected = {
+        'citation_counts': {1: 2, 2: 0},
+        'journals': {'1214516': {'control_number': 1214516}},
+    }
+    result = prefetch_export_data(records)
+
+    assert expected == result
+    g_e_r_b_r.assert_called_once_with('jou', {1214516})
+
+
+def test_get_journal_from_prefetched_journals():
+    record = InspireRecord({
+        'publication_info': [
+            {'journal_record': {'$ref': 'http://localhost:5000/api/journals/1214516'}},
+        ],
+    })
+    journals = {'1214516': {'control_number': 1214516}}
+
+    expected = {'control_number': 1214516}
+    result = Export(record, journals=journals)._get_journal(
+        record['publication_info'][0])
+
+    assert expected == result
+
+
+def test_stream_exports():
+    expected = 'foo\nbar'
+    result = ''.join(stream_exports(['foo', 'bar']))
+
+    assert expected == result